@@ -5,18 +5,19 @@ import hashlib
 import json
 import logging
 import subprocess
+import time
 import traceback
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
 
 from api.routers.websocket_router import manager
+from libs.core.async_event_bus import AsyncEventBus, Event, get_event_bus, initialize_global_event_bus, shutdown_global_event_bus
 from libs.core.session_manager import SessionManager
+from libs.core.settings import settings
+from libs.core.tmux_events import TMUX_EVENT_TYPES, TmuxEventListener
 from libs.dashboard.health_calculator import HealthCalculator
-from libs.tmux_manager import TmuxManager
-from libs.yesman_config import YesmanConfig
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
@@ -27,6 +28,9 @@ from libs.yesman_config import YesmanConfig
 
 logger = logging.getLogger(__name__)
 
+# Let a burst of tmux events (e.g. a whole session being built) settle
+TMUX_EVENT_DEBOUNCE = 0.05
+
 # Constants for status scoring
 SCORE_EXCELLENT_THRESHOLD = 90
 SCORE_GOOD_THRESHOLD = 80
@@ -68,6 +72,13 @@ class BackgroundTaskRunner:
         # Data caches for change detection
         self.last_data = {"sessions": None, "health": None, "activity": None}
 
+        # tmux control-mode notifications push session changes; polling only reconciles
+        self.event_listener: TmuxEventListener | None = None
+        self._event_bus: AsyncEventBus | None = None
+        self._owns_event_bus = False
+        self._sessions_changed = asyncio.Event()
+        self._last_session_wakeup = float("-inf")
+
     async def start(self) -> None:
         """Start all background tasks."""
         if self.is_running:
@@ -77,6 +88,9 @@ class BackgroundTaskRunner:
         logger.info("Starting background tasks...")
         self.is_running = True
 
+        if settings.tmux.push_events:
+            await self._start_event_listener()
+
         # Create tasks
         self.tasks = [
             asyncio.create_task(self.monitor_sessions()),
@@ -101,8 +115,65 @@ class BackgroundTaskRunner:
         await asyncio.gather(*self.tasks, return_exceptions=True)
 
         self.tasks = []
+        await self._stop_event_listener()
         logger.info("Background tasks stopped")
 
+    async def _start_event_listener(self) -> None:
+        """Publish tmux session events on the event bus and wake the session monitor on them."""
+        self._owns_event_bus = not get_event_bus().is_running()
+        self._event_bus = await initialize_global_event_bus()
+
+        listener = TmuxEventListener(event_bus=self._event_bus)
+        if not await listener.start():
+            logger.info("tmux events unavailable, polling sessions every %ss", self.intervals["sessions"])
+            await self._release_event_bus()
+            return
+
+        for event_type in TMUX_EVENT_TYPES:
+            self._event_bus.subscribe(event_type, self._on_tmux_event)
+        self.event_listener = listener
+
+    async def _stop_event_listener(self) -> None:
+        if self.event_listener is not None:
+            await self.event_listener.stop()
+            self.event_listener = None
+            if self._event_bus is not None:
+                for event_type in TMUX_EVENT_TYPES:
+                    self._event_bus.unsubscribe(event_type, self._on_tmux_event)
+        await self._release_event_bus()
+
+    async def _release_event_bus(self) -> None:
+        if self._owns_event_bus:
+            await shutdown_global_event_bus()
+        self._event_bus = None
+        self._owns_event_bus = False
+
+    async def _on_tmux_event(self, event: Event) -> None:  # noqa: RUF029
+        """Wake the session monitor when tmux reports a session change."""
+        logger.debug("tmux event %s for session %s", event.type, event.data.get("session_name"))
+        self._sessions_changed.set()
+
+    async def _wait_for_session_change(self) -> None:
+        """Wait for a tmux session event, or for the next reconciliation pass."""
+        # The control connection drops when the tmux server exits; reattach
+        # once it is back (get_control_client rate-limits the attempts)
+        if self.event_listener is not None and not self.event_listener.is_active:
+            await self.event_listener.start()
+
+        if self.event_listener is None or not self.event_listener.is_active:
+            await asyncio.sleep(self.intervals["sessions"])
+            return
+
+        try:
+            await asyncio.wait_for(self._sessions_changed.wait(), timeout=settings.tmux.reconcile_interval)
+        except TimeoutError:
+            return
+        # Let the burst settle, and re-read sessions at most once per polling interval
+        since_wakeup = time.monotonic() - self._last_session_wakeup
+        await asyncio.sleep(max(TMUX_EVENT_DEBOUNCE, self.intervals["sessions"] - since_wakeup))
+        self._sessions_changed.clear()
+        self._last_session_wakeup = time.monotonic()
+
     @staticmethod
     def _calculate_data_hash(data: object) -> str:
         """Calculate hash of data for change detection.
@@ -118,8 +189,16 @@ class BackgroundTaskRunner:
         task_name: str,
         task_func: Callable,
         interval: int,
+        wait: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
-        """Run a task with error handling and state tracking."""
+        """Run a task with error handling and state tracking.
+
+        Args:
+            task_name: Name used for state tracking
+            task_func: Coroutine function run on every iteration
+            interval: Seconds between iterations (and base for error backoff)
+            wait: Coroutine function awaited between iterations instead of sleeping ``interval``
+        """
         state = TaskState(name=task_name)
         self.task_states[task_name] = state
 
@@ -148,45 +227,37 @@ class BackgroundTaskRunner:
                 state.is_running = False
 
             # Wait for next iteration
-            await asyncio.sleep(interval)
+            if wait is not None:
+                await wait()
+            else:
+                await asyncio.sleep(interval)
 
     async def monitor_sessions(self) -> None:
-        """Monitor session changes and broadcast updates."""
+        """Monitor session changes and broadcast updates.
+
+        With tmux events pushed, sessions are re-read when tmux reports a change
+        and otherwise only every ``settings.tmux.reconcile_interval`` seconds.
+        """
 
         async def check_sessions() -> None:
             try:
-                # Get current session data
+                # One fleet snapshot covers every configured project
                 sessions = self.session_manager.get_all_sessions()
 
-                # Get project configuration
-                config = YesmanConfig()
-                # Load projects using tmux_manager
-
-                tmux_manager = TmuxManager(config)
-                project_sessions = cast("dict[str, Any]", tmux_manager.load_projects().get("sessions", {}))
-
                 # Format session data
-                formatted_sessions = []
-                for project_name, project_config in project_sessions.items():
-                    session_name = project_config.get("override", {}).get(
-                        "session_name",
-                        project_name,
-                    )
-                    session_exists = any(s.session_name == session_name for s in sessions)
-                    session_detail = self.session_manager._get_session_info(project_name, project_config) if session_exists else None
-
-                    formatted_sessions.append(
-                        {
-                            "session_name": session_name,
-                            "project_name": project_name,
-                            "template": project_config.get("template_name", "default"),
-                            "status": "active" if session_exists else "stopped",
-                            "exists": session_exists,
-                            "windows": (len(session_detail.windows) if session_detail else 0),
-                            "panes": (sum(len(w.panes) for w in session_detail.windows) if session_detail else 0),
-                            "claude_active": (any(p.is_claude for w in session_detail.windows for p in w.panes) if session_detail else False),
-                        },
-                    )
+                formatted_sessions = [
+                    {
+                        "session_name": session.session_name,
+                        "project_name": session.project_name,
+                        "template": session.template,
+                        "status": "active" if session.exists else "stopped",
+                        "exists": session.exists,
+                        "windows": len(session.windows),
+                        "panes": sum(len(w.panes) for w in session.windows),
+                        "claude_active": any(p.is_claude for w in session.windows for p in w.panes),
+                    }
+                    for session in sessions
+                ]
 
                 # Calculate data hash
                 data_hash = self._calculate_data_hash(formatted_sessions)
@@ -211,6 +282,7 @@ class BackgroundTaskRunner:
             "sessions",
             check_sessions,
             self.intervals["sessions"],
+            wait=self._wait_for_session_change,
         )
 
     async def monitor_health(self) -> None:
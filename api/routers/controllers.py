@@ -3,7 +3,7 @@ import subprocess
 from fastapi import APIRouter, HTTPException
 
 from api.shared import claude_manager
-from libs.core.session_manager import SessionManager
+from libs.core.services import get_session_manager
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
@@ -54,7 +54,7 @@ def start_controller(session_name: str) -> None:
 
         # First check if session exists
 
-        session_manager = SessionManager()
+        session_manager = get_session_manager()
         sessions = session_manager.get_all_sessions()
 
         session_exists = any(s.session_name == session_name and s.status == "running" for s in sessions)
@@ -350,7 +350,7 @@ def start_all_controllers() -> object:
         Object object.
     """
     try:
-        session_manager = SessionManager()
+        session_manager = get_session_manager()
         sessions = session_manager.get_all_sessions()
 
         # 실행 중인 세션들만 필터링
@@ -409,7 +409,7 @@ def stop_all_controllers() -> object:
         Object object.
     """
     try:
-        session_manager = SessionManager()
+        session_manager = get_session_manager()
         sessions = session_manager.get_all_sessions()
 
         # 실행 중인 세션들만 필터링
@@ -461,3 +461,42 @@ def stop_all_controllers() -> object:
         raise
     except (ImportError, AttributeError, RuntimeError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to stop all controllers: {e!s}")
+
+
+@router.get("/controllers/monitors", status_code=200)
+def list_monitors() -> object:
+    """공유 이벤트 루프에서 실행 중인 모니터 목록을 조회합니다.
+
+    Returns:
+        Object object.
+    """
+    return {"monitors": cm.list_monitors()}
+
+
+@router.get("/controllers/prompt-latency", status_code=200)
+def get_prompt_latency() -> object:
+    """모든 세션의 프롬프트 응답 지연(프롬프트 표시부터 키 입력까지) 히스토그램을 조회합니다.
+
+    Returns:
+        Object object.
+    """
+    return {"sessions": cm.get_prompt_latency()}
+
+
+@router.get("/sessions/{session_name}/controller/prompt-latency", status_code=200)
+def get_session_prompt_latency(session_name: str) -> object:
+    """지정된 세션의 프롬프트 응답 지연 히스토그램을 조회합니다.
+
+    Args:
+        session_name: Name of the session to inspect.
+
+    Returns:
+        Object object.
+
+    Raises:
+        HTTPException: If the session has no supervised monitor.
+    """
+    latency = cm.get_prompt_latency(session_name)
+    if session_name not in latency:
+        raise HTTPException(status_code=404, detail=f"No running monitor for session '{session_name}'")
+    return latency[session_name]
@@ -11,6 +11,9 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.templating import Jinja2Templates
 
 from api.shared import claude_manager
+from libs.core.detection_cache import get_detection_cache
+from libs.core.executors import get_executor_stats
+from libs.core.prompt_patterns import get_prompt_pattern_registry
 from libs.core.session_manager import SessionManager
 from libs.dashboard.widgets.activity_heatmap import ActivityHeatmapGenerator
 from libs.dashboard.widgets.project_health import ProjectHealth
@@ -333,3 +336,33 @@ async def get_dashboard_stats() -> dict[str, Any]:
     except Exception as e:
         logger.exception("Failed to get stats")
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {e!s}")
+
+
+@router.get("/api/dashboard/executors")
+async def get_executors() -> dict[str, Any]:
+    """Get queue depth and wait times of the blocking-work executors.
+
+    Returns:
+        dict[str, Any]: Statistics keyed by executor name.
+    """
+    return {"executors": get_executor_stats()}
+
+
+@router.get("/api/dashboard/detection-cache")
+async def get_detection_cache_stats() -> dict[str, Any]:
+    """Get hit rate and evictions of the shared prompt detection cache.
+
+    Returns:
+        dict[str, Any]: Cache statistics.
+    """
+    return {"detection_cache": get_detection_cache().get_stats()}
+
+
+@router.get("/api/dashboard/prompt-patterns")
+async def get_prompt_pattern_stats() -> dict[str, Any]:
+    """Get the loaded prompt pattern packs and per-pattern evaluation, hit and time counters.
+
+    Returns:
+        dict[str, Any]: Pack and pattern statistics, most expensive pattern first.
+    """
+    return {"prompt_patterns": get_prompt_pattern_registry().get_stats()}
@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING, cast
 from fastapi import APIRouter, HTTPException, status
 
 from api import models
+from api.shared import claude_manager
 from libs.core.error_handling import ErrorCategory, YesmanError
 from libs.core.services import get_session_manager, get_tmux_manager
 from libs.core.session_manager import SessionManager
+from libs.core.session_teardown import SessionTeardownService
+from libs.core.tmux_cache import invalidate_tmux_cache
 from libs.core.types import SessionAPIData, SessionStatusType
 from libs.tmux_manager import TmuxManager
 
@@ -351,17 +354,18 @@ class SessionService:
         """
         try:
             sessions = self.session_manager.get_all_sessions()
+            session_names = [getattr(session, "session_name", "unknown") for session in sessions]
             successful = []
             failed = []
 
-            for session in sessions:
-                session_name = getattr(session, "session_name", "unknown")
-                try:
-                    self._teardown_session_internal(session_name)
-                    successful.append(session_name)
-                except Exception as e:
-                    self.logger.exception("Failed to teardown session '{session_name}': {e}")
-                    failed.append({"session_name": session_name, "error": str(e)})
+            # Controllers are stopped and sessions killed concurrently, bounded by a global deadline
+            teardown = SessionTeardownService(kill_session=self._teardown_session_internal, claude_manager=claude_manager)
+            for result in teardown.teardown_sessions(session_names):
+                if result.success:
+                    successful.append(result.session_name)
+                else:
+                    self.logger.error("Failed to teardown session '%s': %s", result.session_name, result.error)
+                    failed.append({"session_name": result.session_name, "error": result.error})
 
             return {
                 "successful": successful,
@@ -631,6 +635,7 @@ class SessionService:
             # Create the session
             self.logger.info("Running tmux command: %s", " ".join(create_cmd))
             result = subprocess.run(create_cmd, check=False, capture_output=True, text=True)
+            invalidate_tmux_cache("setup_session")
 
             self.logger.info(
                 "tmux command result: returncode=%s, stdout=%s, stderr=%s",
@@ -712,6 +717,8 @@ class SessionService:
         except subprocess.CalledProcessError as e:
             msg = f"Failed to kill session: {e}"
             raise YesmanError(msg)
+        finally:
+            invalidate_tmux_cache("teardown_session")
 
 
 # Router with dependency injection
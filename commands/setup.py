@@ -29,6 +29,7 @@ class SetupCommand(BaseCommand, SessionCommandMixin, ConfigCommandMixin):
                 session_name: Optional session name to set up only that session
                 dry_run: Show what would be done without actually creating sessions
                 force: Force recreation of existing sessions without prompting
+                workers: Number of sessions to build concurrently
 
         Returns:
             Dictionary with setup results
@@ -36,6 +37,7 @@ class SetupCommand(BaseCommand, SessionCommandMixin, ConfigCommandMixin):
         session_name = kwargs.get("session_name")
         dry_run = kwargs.get("dry_run", False)
         force = kwargs.get("force", False)
+        workers = kwargs.get("workers")
         
         with with_startup_progress("🔧 Initializing session setup...") as update:  # type: ignore
             setup_service = SessionSetupService(self.tmux_manager)
@@ -45,7 +47,8 @@ class SetupCommand(BaseCommand, SessionCommandMixin, ConfigCommandMixin):
             successful_count, failed_count = setup_service.setup_sessions(
                 session_filter=session_name,
                 dry_run=dry_run,
-                force=force
+                force=force,
+                workers=workers,
             )
             update("✅ Session setup completed")
 
@@ -55,6 +58,7 @@ class SetupCommand(BaseCommand, SessionCommandMixin, ConfigCommandMixin):
             "failed_sessions": failed_count,
             "total_sessions": successful_count + failed_count,
             "success_rate": ((successful_count / (successful_count + failed_count) * 100) if (successful_count + failed_count) > 0 else 0),
+            "timing": setup_service.last_report,
         }
 
         # Log results
@@ -95,7 +99,14 @@ class SetupCommand(BaseCommand, SessionCommandMixin, ConfigCommandMixin):
     is_flag=True,
     help="Force recreation of existing sessions without prompting",
 )
-def setup(session_name: str | None, dry_run: bool, force: bool) -> None:
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of sessions to build concurrently (default: settings.sessions.setup_workers)",
+)
+def setup(session_name: str | None, dry_run: bool, force: bool, workers: int | None) -> None:
     """Create all tmux sessions defined in projects.yaml; or only a specified
     session if provided.
 
@@ -103,6 +114,7 @@ def setup(session_name: str | None, dry_run: bool, force: bool) -> None:
         session_name: Optional session name to set up only that session
         dry_run: Show what would be done without actually creating sessions
         force: Force recreation of existing sessions without prompting
+        workers: Number of sessions to build concurrently
     """
     command = SetupCommand()
 
@@ -112,7 +124,7 @@ def setup(session_name: str | None, dry_run: bool, force: bool) -> None:
     if force:
         command.print_warning("Force mode: existing sessions will be recreated without prompting")
 
-    command.run(session_name=session_name, dry_run=dry_run, force=force)
+    command.run(session_name=session_name, dry_run=dry_run, force=force, workers=workers)
 
 
 if __name__ == "__main__":
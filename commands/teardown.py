@@ -1,5 +1,3 @@
-import subprocess
-
 # Copyright notice.
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
@@ -9,6 +7,7 @@ import click
 import libtmux
 
 from libs.core.base_command import BaseCommand, CommandError, SessionCommandMixin
+from libs.core.session_teardown import SessionTeardownService
 
 
 class TeardownCommand(BaseCommand, SessionCommandMixin):
@@ -38,18 +37,26 @@ class TeardownCommand(BaseCommand, SessionCommandMixin):
                     return {"success": False, "error": "session_not_defined"}
                 sessions = {session_name: sessions[session_name]}
 
+            running_sessions = []
             for session_key, sess_conf in sessions.items():
                 override_conf = sess_conf.get("override", {})
                 actual_session_name = override_conf.get("session_name", session_key)
 
                 if server.sessions.get(session_name=actual_session_name, default=None):
-                    subprocess.run(["tmux", "kill-session", "-t", actual_session_name], check=False)
-                    self.print_success(f"Killed session: {actual_session_name}")
-                    killed_sessions.append(actual_session_name)
+                    running_sessions.append(actual_session_name)
                 else:
                     self.print_warning(f"Session {actual_session_name} not found")
                     not_found_sessions.append(actual_session_name)
 
+            # Sessions are killed concurrently, bounded by settings.sessions.teardown_*
+            teardown = SessionTeardownService()
+            for result in teardown.teardown_sessions(running_sessions):
+                if result.success:
+                    self.print_success(f"Killed session: {result.session_name}")
+                    killed_sessions.append(result.session_name)
+                else:
+                    self.print_error(f"Failed to kill session {result.session_name}: {result.error}")
+
             self.print_success("All sessions torn down.")
             return {
                 "success": True,
@@ -31,6 +31,7 @@ from typing import Any
 from weakref import WeakSet
 
 # Local imports
+from .executors import get_executor
 
 
 class EventPriority(Enum):
@@ -51,6 +52,8 @@ class EventType(Enum):
     SESSION_STARTED = "session.started"
     SESSION_STOPPED = "session.stopped"
     SESSION_ERROR = "session.error"
+    SESSION_RENAMED = "session.renamed"
+    WINDOW_CHANGED = "session.window_changed"
 
     # Claude interaction events
     CLAUDE_RESPONSE = "claude.response"
@@ -178,6 +181,8 @@ class AsyncEventBus:
         self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self._processing_tasks: list[asyncio.Task] = []
         self._is_running: bool = False
+        # Loop the bus was started on; publishers on other loops are marshalled onto it
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._shutdown_event = asyncio.Event()
         self._metrics = EventMetrics()
         self._processing_times: deque = deque(maxlen=1000)  # Keep last 1000 processing times
@@ -212,6 +217,7 @@ class AsyncEventBus:
             return
 
         self._is_running = True
+        self._loop = asyncio.get_running_loop()
         self._shutdown_event.clear()
 
         # Start worker tasks for concurrent processing
@@ -271,6 +277,7 @@ class AsyncEventBus:
                     pass
 
         self._processing_tasks.clear()
+        self._loop = None
         self.logger.info("AsyncEventBus stopped")
 
     def subscribe(self, event_type: EventType | str, handler: Callable) -> None:
@@ -336,6 +343,17 @@ class AsyncEventBus:
             self.logger.warning("Cannot publish event - event bus not running")
             return False
 
+        # asyncio.Queue is not thread-safe: events from another loop's thread
+        # (e.g. the monitor supervisor's) are queued on the bus's own loop
+        loop = self._loop
+        if loop is not None and loop is not asyncio.get_running_loop():
+            try:
+                asyncio.run_coroutine_threadsafe(self.publish(event), loop)
+            except RuntimeError:
+                self.logger.warning(f"Cannot publish event - event bus loop closed: {event.type}")
+                return False
+            return True
+
         # Apply event filters
         for filter_func in self._event_filters:
             try:
@@ -448,7 +466,8 @@ class AsyncEventBus:
         Args:
             event: Event to handle
         """
-        handlers = self._subscribers.get(event.type, [])
+        # Copy: handlers may unsubscribe (from any thread) while they run
+        handlers = list(self._subscribers.get(event.type, []))
         if not handlers:
             return
 
@@ -473,9 +492,8 @@ class AsyncEventBus:
         try:
             if asyncio.iscoroutinefunction(handler):
                 return await handler(event)
-            # Run sync handler in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, handler, event)
+            # Sync handlers get their own executor so a burst of them cannot starve pane captures
+            return await get_executor("handlers").run(handler, event)
 
         except Exception as e:
             self._metrics.handler_errors += 1
@@ -537,7 +555,12 @@ class AsyncEventBus:
         """Periodically report event bus metrics."""
         while self._is_running:
             try:
-                await asyncio.sleep(self._metrics_interval)
+                # Wake early on shutdown so stop() does not wait out the interval
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=self._metrics_interval)
+                    break
+                except TimeoutError:
+                    pass
 
                 if time.time() - self._last_metrics_report >= self._metrics_interval:
                     await self._publish_metrics()
@@ -610,6 +633,12 @@ class AsyncEventBus:
         self._update_queue_depth_metrics()
         return self._metrics
 
+    @property
+    def queue_load(self) -> float:
+        """Fraction of the event queue in use (0.0 to 1.0)."""
+        max_size = self._event_queue.maxsize
+        return self._event_queue.qsize() / max_size if max_size > 0 else 0.0
+
     def get_subscriber_count(self, event_type: EventType | str = None) -> int:
         """Get number of subscribers for an event type or total.
 
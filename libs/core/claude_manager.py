@@ -1,11 +1,15 @@
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from .claude_monitor import ClaudeMonitor
+from .claude_monitor_async import AsyncClaudeMonitor
 from .claude_process_controller import ClaudeProcessController
 from .claude_session_manager import ClaudeSessionManager
 from .claude_status_manager import ClaudeStatusManager
+from .monitor_supervisor import MonitorSupervisor, get_monitor_supervisor
 from .prompt_detector import PromptInfo
+from .settings import settings
 
 # Copyright notice.
 # Copyright (c) 2024 Yesman Claude Project
@@ -13,6 +17,13 @@ from .prompt_detector import PromptInfo
 """Claude manager for dashboard integration - Refactored.""" ""
 
 
+# Auto-response settings copied from the controller's monitor to its supervised monitor
+_RESPONSE_SETTINGS = ("is_auto_next_enabled", "yn_mode", "yn_response", "mode12", "mode12_response", "mode123", "mode123_response")
+
+# Components the supervised monitor shares with the controller's monitor
+_SHARED_COMPONENTS = ("prompt_detector", "content_collector", "adaptive_response", "automation_manager", "health_calculator")
+
+
 class DashboardController:
     """Main controller that orchestrates Claude session management, process
     control, and monitoring.
@@ -36,6 +47,10 @@ class DashboardController:
             self.status_manager,
         )
 
+        # Runs the session's AsyncClaudeMonitor on the shared loop instead of a monitor thread
+        self.supervisor: MonitorSupervisor | None = get_monitor_supervisor() if settings.monitoring.supervised_monitors else None
+        self._supervised_monitor: AsyncClaudeMonitor | None = None
+
         self.logger = logging.getLogger(f"yesman.dashboard.controller.{session_name}")
 
         # Try to initialize session, but don't fail if session doesn't exist
@@ -60,8 +75,17 @@ class DashboardController:
         Returns:
         bool: Description of return value.
         """
+        if self.supervisor is not None and self.supervisor.is_running(self.session_name):
+            return True
         return self.monitor.is_running
 
+    @property
+    def supervised_monitor(self) -> AsyncClaudeMonitor | None:
+        """The session's monitor on the shared supervisor loop, if one was started."""
+        if self.supervisor is None:
+            return None
+        return self.supervisor.get(self.session_name)
+
     @property
     def is_auto_next_enabled(self) -> bool:
         """Check if auto-next is enabled.
@@ -106,6 +130,8 @@ class DashboardController:
             )
             return False
 
+        if self.supervisor is not None:
+            return self.supervisor.start(self.session_name, self._get_supervised_monitor())
         return self.monitor.start_monitoring()
 
     def stop(self) -> bool:
@@ -114,8 +140,35 @@ class DashboardController:
         Returns:
         bool: Description of return value.
         """
+        if self.supervisor is not None and self.supervisor.is_running(self.session_name):
+            return self.supervisor.stop(self.session_name)
         return self.monitor.stop_monitoring()
 
+    def _get_supervised_monitor(self) -> AsyncClaudeMonitor:
+        """Get the async monitor for the supervisor, sharing this controller's monitor state.
+
+        The monitor is built once and reused across start/stop cycles.
+
+        Returns:
+            AsyncClaudeMonitor: Monitor using the same detectors, learning data and response settings.
+        """
+        if self._supervised_monitor is None:
+            self._supervised_monitor = AsyncClaudeMonitor(
+                self.session_manager,
+                self.process_controller,
+                self.status_manager,
+                **{name: getattr(self.monitor, name) for name in _SHARED_COMPONENTS},
+            )
+        for name in _RESPONSE_SETTINGS:
+            setattr(self._supervised_monitor, name, getattr(self.monitor, name))
+        return self._supervised_monitor
+
+    def _sync_response_settings(self) -> None:
+        monitor = self.supervised_monitor
+        if monitor is not None:
+            for name in _RESPONSE_SETTINGS:
+                setattr(monitor, name, getattr(self.monitor, name))
+
     def restart_claude_pane(self) -> bool:
         """Restart Claude pane.
 
@@ -131,18 +184,22 @@ class DashboardController:
     def set_auto_next(self, enabled: bool) -> None:
         """Enable or disable auto-next responses."""
         self.monitor.set_auto_next(enabled)
+        self._sync_response_settings()
 
     def set_mode_yn(self, mode: str, response: str) -> None:
         """Set manual override for Y/N prompts."""
         self.monitor.set_mode_yn(mode, response)
+        self._sync_response_settings()
 
     def set_mode_12(self, mode: str, response: str) -> None:
         """Set manual override for 1/2 prompts."""
         self.monitor.set_mode_12(mode, response)
+        self._sync_response_settings()
 
     def set_mode_123(self, mode: str, response: str) -> None:
         """Set manual override for 1/2/3 prompts."""
         self.monitor.set_mode_123(mode, response)
+        self._sync_response_settings()
 
     def capture_pane_content(self, lines: int = 50) -> str:
         """Capture content from Claude pane.
@@ -166,6 +223,9 @@ class DashboardController:
         Returns:
         bool: Description of return value.
         """
+        monitor = self.supervised_monitor
+        if monitor is not None and monitor.is_running:
+            return monitor.is_waiting_for_input()
         return self.monitor.is_waiting_for_input()
 
     def get_current_prompt(self) -> PromptInfo | None:
@@ -174,6 +234,9 @@ class DashboardController:
         Returns:
         object: Description of return value.
         """
+        monitor = self.supervised_monitor
+        if monitor is not None and monitor.is_running:
+            return monitor.get_current_prompt()
         return self.monitor.get_current_prompt()
 
     def get_response_history(self) -> list:
@@ -379,13 +442,43 @@ class ClaudeManager:
 
     def remove_controller(self, session_name: str) -> None:
         """Remove controller for session."""
-        if session_name in self.controllers:
-            controller = self.controllers[session_name]
+        # pop() keeps concurrent teardowns of different sessions from racing on the dict
+        controller = self.controllers.pop(session_name, None)
+        if controller is not None:
             controller.stop()
-            del self.controllers[session_name]
+
+    def list_monitors(self) -> list[dict]:
+        """List the monitors running on the shared supervisor loop.
+
+        Returns:
+            list[dict]: One entry per supervised monitor.
+        """
+        return get_monitor_supervisor().list_monitors()
+
+    def get_prompt_latency(self, session_name: str | None = None) -> dict[str, dict]:
+        """Get prompt-to-keystroke latency of the supervised monitors.
+
+        Args:
+            session_name: Only this session (every session if None)
+
+        Returns:
+            dict[str, dict]: Latency histograms keyed by session name.
+        """
+        latency = get_monitor_supervisor().get_prompt_latency()
+        if session_name is not None:
+            return {name: stats for name, stats in latency.items() if name == session_name}
+        return latency
 
     def stop_all(self) -> None:
-        """Stop all controllers."""
-        for controller in self.controllers.values():
-            controller.stop()
+        """Stop all controllers concurrently."""
+        controllers = list(self.controllers.values())
         self.controllers.clear()
+        if not controllers:
+            return
+        # Each stop may wait on its monitor thread, so don't pay for them one after another
+        with ThreadPoolExecutor(max_workers=min(len(controllers), settings.sessions.teardown_workers)) as executor:
+            for future in [executor.submit(controller.stop) for controller in controllers]:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.warning("Failed to stop controller: %s", e)
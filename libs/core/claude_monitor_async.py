@@ -21,7 +21,6 @@ Key Improvements:
 import asyncio
 import logging
 import time
-from collections import deque
 from typing import Any, cast
 
 import psutil
@@ -33,7 +32,25 @@ from libs.logging.async_logger import AsyncLogger, LogLevel
 
 from .async_event_bus import AsyncEventBus, Event, EventPriority, EventType, get_event_bus
 from .content_collector import ClaudeContentCollector
+from .event_coalescer import CoalescedEvent, EventCoalescer
+from .executors import get_executor, get_executor_stats
+from .instrumentation import LatencyHistogram, SpanRecorder
+from .pane_buffer import PaneContentView, content_fingerprint
+from .pane_stream import PaneOutputStream
+from .poll_scheduler import AdaptivePollScheduler
 from .prompt_detector import ClaudePromptDetector, PromptInfo, PromptType
+from .settings import settings
+
+# Spans recorded by the monitor loop
+MONITOR_COMPONENTS = (
+    "content_capture",
+    "claude_status_check",
+    "prompt_detection",
+    "content_processing",
+    "response_sending",
+    "automation_analysis",
+    "claude_restart",
+)
 
 
 class AsyncClaudeMonitor:
@@ -49,6 +66,11 @@ class AsyncClaudeMonitor:
         process_controller: object,
         status_manager: object,
         event_bus: AsyncEventBus | None = None,
+        adaptive_response: AdaptiveResponse | None = None,
+        prompt_detector: ClaudePromptDetector | None = None,
+        content_collector: ClaudeContentCollector | None = None,
+        automation_manager: AutomationManager | None = None,
+        health_calculator: HealthCalculator | None = None,
     ) -> None:
         """Initialize the AsyncClaudeMonitor.
 
@@ -57,6 +79,13 @@ class AsyncClaudeMonitor:
             process_controller: Process control interface
             status_manager: Status management interface
             event_bus: Optional event bus instance (uses global if None)
+            adaptive_response: Optional adaptive response system (one learning
+                from the user's response history if None)
+            prompt_detector: Optional prompt detector (a new one if None)
+            content_collector: Optional content collector (a new one logging
+                to this session's log file if None)
+            automation_manager: Optional automation manager (a new one if None)
+            health_calculator: Optional health calculator (a new one if None)
         """
         self.session_manager = session_manager
         self.process_controller = process_controller
@@ -68,8 +97,12 @@ class AsyncClaudeMonitor:
 
         # Monitoring state
         self.is_running = False
+        # Loop the monitor runs on, recorded at start (the supervisor's loop when supervised)
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._monitor_task: asyncio.Task | None = None
         self._cleanup_task: asyncio.Task | None = None
+        self._output_stream: PaneOutputStream | None = None
+        self._poll_scheduler = AdaptivePollScheduler()
 
         # Performance monitoring
         self._loop_count = 0
@@ -77,42 +110,13 @@ class AsyncClaudeMonitor:
         self._last_performance_report = 0.0
         self._performance_interval = 60.0  # Report performance every 60 seconds
 
-        # Enhanced component response time tracking
-        self._component_timings: dict[str, deque] = {
-            "content_capture": deque(maxlen=100),
-            "claude_status_check": deque(maxlen=100),
-            "prompt_detection": deque(maxlen=100),
-            "content_processing": deque(maxlen=100),
-            "response_sending": deque(maxlen=100),
-            "automation_analysis": deque(maxlen=100),
-        }
-        self._component_peak_times: dict[str, float] = {}
-        self._component_error_counts: dict[str, int] = dict.fromkeys(self._component_timings, 0)
+        # Span timings per monitor component; memory/CPU probes are sampled
+        self._spans = SpanRecorder()
 
-        # Enhanced memory usage tracking per component
-        self._component_memory_usage: dict[str, deque] = {component: deque(maxlen=50) for component in self._component_timings}
-        self._component_peak_memory: dict[str, float] = {}
+        # Process handle for the periodic memory/CPU report
+        self._process = psutil.Process()
         self._baseline_memory_mb: float = 0.0
-
-        # Enhanced CPU utilization tracking per component
-        self._component_cpu_usage: dict[str, deque] = {component: deque(maxlen=50) for component in self._component_timings}
-        self._component_peak_cpu: dict[str, float] = {}
         self._baseline_cpu_percent: float = 0.0
-        self._last_cpu_times: dict = {}
-
-        # Process monitoring for memory and CPU tracking
-        self._process = psutil.Process()
-        self._system_cpu_count = psutil.cpu_count()
-
-        # Thread pool monitoring for async task CPU usage
-        self._thread_pool_executor = None
-        self._async_task_cpu_usage: dict[str, list[float]] = {}
-
-        # Network I/O pattern tracking
-        self._component_network_io: dict[str, deque] = {component: deque(maxlen=50) for component in self._component_timings}
-        self._component_network_patterns: dict[str, dict] = {}
-        self._baseline_network_counters = None
-        self._last_network_counters = None
 
         # Auto-response settings (backward compatibility)
         self.is_auto_next_enabled = True
@@ -124,14 +128,32 @@ class AsyncClaudeMonitor:
         self.mode123_response = "1"
 
         # Prompt detection and content analysis
-        self.prompt_detector = ClaudePromptDetector()
-        self.content_collector = ClaudeContentCollector(self.session_name)
+        self.prompt_detector = prompt_detector or ClaudePromptDetector()
+        self.content_collector = content_collector or ClaudeContentCollector(self.session_name)
         self.current_prompt: PromptInfo | None = None
         self.waiting_for_input = False
         self._last_content = ""
 
+        # Fingerprint of the last processed frame; unchanged frames skip analysis
+        self._frame_fingerprint: int | None = None
+        self._frames_processed = 0
+        self._frames_skipped = 0
+
+        # Prompt-to-keystroke latency: when the first frame showing the
+        # pending prompt was captured, and histograms per prompt type ("all" for every type)
+        self._frame_captured_at: float | None = None
+        self._prompt_seen_at: float | None = None
+        self._prompt_latency: dict[str, LatencyHistogram] = {}
+
+        # Activity/status events: at most one per kind per window, latest message wins
+        self._event_coalescer = EventCoalescer()
+
+        # Status checks answered by the capture probe vs. a separate tmux call
+        self._fused_status_checks = 0
+        self._separate_status_checks = 0
+
         # AI-powered adaptive response system
-        self.adaptive_response = AdaptiveResponse(
+        self.adaptive_response = adaptive_response or AdaptiveResponse(
             config=AdaptiveConfig(
                 min_confidence_threshold=0.7,
                 learning_enabled=True,
@@ -141,10 +163,10 @@ class AsyncClaudeMonitor:
         )
 
         # Context-aware automation system
-        self.automation_manager = AutomationManager(project_path=None)
+        self.automation_manager = automation_manager or AutomationManager(project_path=None)
 
         # Project health monitoring system
-        self.health_calculator = HealthCalculator(project_path=None)
+        self.health_calculator = health_calculator or HealthCalculator(project_path=None)
 
         # High-performance async logging system
         self.async_logger: AsyncLogger | None = None
@@ -152,92 +174,13 @@ class AsyncClaudeMonitor:
         # Logger setup
         self.logger = logging.getLogger(f"yesman.async_claude_monitor.{self.session_name}")
 
-        # Event subscriptions
-        self._setup_event_subscriptions()
-
     def _setup_event_subscriptions(self) -> None:
-        """Set up event bus subscriptions for system events."""
+        """Set up event bus subscriptions for system events; undone when monitoring stops."""
         self.event_bus.subscribe(EventType.SYSTEM_SHUTDOWN, self._handle_system_shutdown)
 
-    def _record_component_timing(self, component: str, duration_ms: float, success: bool = True) -> None:
-        """Record timing metrics for a specific component.
-
-        Args:
-            component: Component name
-            duration_ms: Duration in milliseconds
-            success: Whether the operation was successful
-        """
-        if component in self._component_timings:
-            self._component_timings[component].append(duration_ms)
-
-            # Update peak time
-            if duration_ms > self._component_peak_times.get(component, 0):
-                self._component_peak_times[component] = duration_ms
-
-            # Track errors
-            if not success:
-                self._component_error_counts[component] += 1
-
-    def _record_component_memory(self, component: str, memory_delta_mb: float) -> None:
-        """Record memory usage for a specific component.
-
-        Args:
-            component: Component name
-            memory_delta_mb: Memory change in MB (positive for increase, negative for decrease)
-        """
-        if component in self._component_memory_usage:
-            self._component_memory_usage[component].append(memory_delta_mb)
-
-            # Update peak memory usage
-            if abs(memory_delta_mb) > abs(self._component_peak_memory.get(component, 0)):
-                self._component_peak_memory[component] = memory_delta_mb
-
-    def _record_component_cpu(self, component: str, cpu_percent: float) -> None:
-        """Record CPU usage for a specific component.
-
-        Args:
-            component: Component name
-            cpu_percent: CPU usage percentage for this component
-        """
-        if component in self._component_cpu_usage:
-            self._component_cpu_usage[component].append(cpu_percent)
-
-            # Update peak CPU usage
-            if cpu_percent > self._component_peak_cpu.get(component, 0):
-                self._component_peak_cpu[component] = cpu_percent
-
-    def _record_component_network_io(self, component: str, bytes_sent: int, bytes_recv: int, duration_ms: float) -> None:
-        """Record network I/O metrics for a specific component.
-
-        Args:
-            component: Component name
-            bytes_sent: Bytes sent during component execution
-            bytes_recv: Bytes received during component execution
-            duration_ms: Duration of the operation in milliseconds
-        """
-        if component in self._component_network_io:
-            io_data = {
-                "bytes_sent": bytes_sent,
-                "bytes_recv": bytes_recv,
-                "total_bytes": bytes_sent + bytes_recv,
-                "duration_ms": duration_ms,
-                "throughput_mbps": ((bytes_sent + bytes_recv) / (1024 * 1024)) / (duration_ms / 1000) if duration_ms > 0 else 0,
-                "timestamp": time.time(),
-            }
-            self._component_network_io[component].append(io_data)
-
-            # Update network patterns for this component
-            if component not in self._component_network_patterns:
-                self._component_network_patterns[component] = {"peak_throughput_mbps": 0, "total_bytes_sent": 0, "total_bytes_recv": 0, "network_active_operations": 0}
-
-            patterns = self._component_network_patterns[component]
-            patterns["total_bytes_sent"] += bytes_sent
-            patterns["total_bytes_recv"] += bytes_recv
-
-            patterns["peak_throughput_mbps"] = max(patterns["peak_throughput_mbps"], io_data["throughput_mbps"])
-
-            if bytes_sent > 0 or bytes_recv > 0:
-                patterns["network_active_operations"] += 1
+    def _teardown_event_subscriptions(self) -> None:
+        """Remove the subscriptions so a stopped monitor can be garbage collected."""
+        self.event_bus.unsubscribe(EventType.SYSTEM_SHUTDOWN, self._handle_system_shutdown)
 
     def _measure_memory_usage(self) -> float:
         """Measure current memory usage in MB.
@@ -266,169 +209,20 @@ class AsyncClaudeMonitor:
             self.logger.exception("Error measuring CPU usage")
             return 0.0
 
-    def _calculate_component_cpu_delta(self, component: str, start_time: float, end_time: float) -> float:
-        """Calculate CPU usage delta for a component based on execution time.
-
-        Args:
-            component: Component name
-            start_time: Start time (perf_counter)
-            end_time: End time (perf_counter)
-
-        Returns:
-            Estimated CPU usage percentage for this component
-        """
-        try:
-            # Simple estimation: CPU usage = (execution_time / total_time) * system_cpu_usage
-            execution_duration = end_time - start_time
-
-            # Get system-wide CPU usage as baseline
-            system_cpu = psutil.cpu_percent(interval=None)
-
-            # Estimate component CPU usage
-            # This is a rough approximation - actual CPU usage depends on thread scheduling
-            if execution_duration > 0.001:  # Only calculate for operations taking > 1ms
-                estimated_cpu = min(system_cpu, (execution_duration / 1.0) * system_cpu)
-                return float(estimated_cpu)
-
-            return 0.0
-        except Exception:
-            self.logger.exception("Error calculating component CPU delta")
-            return 0.0
-
-    def _measure_network_io_delta(self) -> tuple[int, int]:
-        """Measure network I/O delta since last measurement.
-
-        Returns:
-            Tuple of (bytes_sent_delta, bytes_recv_delta)
-        """
-        try:
-            current_counters = psutil.net_io_counters()
-
-            if self._last_network_counters is None:
-                self._last_network_counters = current_counters
-                return (0, 0)
-
-            bytes_sent_delta = current_counters.bytes_sent - self._last_network_counters.bytes_sent
-            bytes_recv_delta = current_counters.bytes_recv - self._last_network_counters.bytes_recv
-
-            self._last_network_counters = current_counters
-
-            return (max(0, bytes_sent_delta), max(0, bytes_recv_delta))
-
-        except Exception:
-            self.logger.exception("Error measuring network I/O delta")
-            return (0, 0)
-
     def _get_component_metrics(self) -> dict[str, dict[str, float]]:
-        """Get comprehensive component timing and memory metrics."""
-        metrics = {}
-
-        for component, timings in self._component_timings.items():
-            # Timing metrics
-            if timings:
-                timings_list = list(timings)
-                timing_metrics = {
-                    "average_ms": sum(timings_list) / len(timings_list),
-                    "median_ms": sorted(timings_list)[len(timings_list) // 2],
-                    "p95_ms": sorted(timings_list)[int(len(timings_list) * 0.95)],
-                    "p99_ms": sorted(timings_list)[int(len(timings_list) * 0.99)] if len(timings_list) > 10 else timings_list[-1],
-                    "peak_ms": self._component_peak_times.get(component, 0),
-                    "sample_count": len(timings_list),
-                    "error_count": self._component_error_counts[component],
-                    "error_rate": self._component_error_counts[component] / len(timings_list) if timings_list else 0,
-                }
-            else:
-                timing_metrics = {
-                    "average_ms": 0,
-                    "median_ms": 0,
-                    "p95_ms": 0,
-                    "p99_ms": 0,
-                    "peak_ms": 0,
-                    "sample_count": 0,
-                    "error_count": 0,
-                    "error_rate": 0,
-                }
-
-            # Memory metrics
-            memory_deltas: list[Any] = list(self._component_memory_usage.get(component, []))
-            if memory_deltas:
-                memory_list = list(memory_deltas)
-                positive_deltas = [m for m in memory_list if m > 0]
-                memory_metrics = {
-                    "avg_memory_delta_mb": sum(memory_list) / len(memory_list),
-                    "peak_memory_delta_mb": self._component_peak_memory.get(component, 0),
-                    "memory_allocations": len(positive_deltas),
-                    "avg_allocation_size_mb": sum(positive_deltas) / len(positive_deltas) if positive_deltas else 0,
-                    "memory_sample_count": len(memory_list),
-                }
-            else:
-                memory_metrics = {
-                    "avg_memory_delta_mb": 0,
-                    "peak_memory_delta_mb": 0,
-                    "memory_allocations": 0,
-                    "avg_allocation_size_mb": 0,
-                    "memory_sample_count": 0,
-                }
-
-            # CPU metrics
-            cpu_usage: list[Any] = list(self._component_cpu_usage.get(component, []))
-            if cpu_usage:
-                cpu_list = list(cpu_usage)
-                cpu_metrics = {
-                    "avg_cpu_percent": sum(cpu_list) / len(cpu_list),
-                    "peak_cpu_percent": self._component_peak_cpu.get(component, 0),
-                    "cpu_utilization_p95": sorted(cpu_list)[int(len(cpu_list) * 0.95)] if len(cpu_list) > 5 else max(cpu_list) if cpu_list else 0,
-                    "cpu_sample_count": len(cpu_list),
-                    "cpu_efficiency": (sum(cpu_list) / len(cpu_list)) / self._system_cpu_count if cpu_list and self._system_cpu_count else 0,
-                }
-            else:
-                cpu_metrics = {
-                    "avg_cpu_percent": 0,
-                    "peak_cpu_percent": 0,
-                    "cpu_utilization_p95": 0,
-                    "cpu_sample_count": 0,
-                    "cpu_efficiency": 0,
-                }
-
-            # Network I/O metrics
-            network_io_data: list[Any] = list(self._component_network_io.get(component, []))
-            network_patterns = self._component_network_patterns.get(component, {})
-            if network_io_data:
-                io_list = list(network_io_data)
-                total_sent = sum(io["bytes_sent"] for io in io_list)
-                total_recv = sum(io["bytes_recv"] for io in io_list)
-                throughputs = [io["throughput_mbps"] for io in io_list if io["throughput_mbps"] > 0]
-
-                network_metrics = {
-                    "total_bytes_sent": total_sent,
-                    "total_bytes_recv": total_recv,
-                    "total_network_bytes": total_sent + total_recv,
-                    "avg_throughput_mbps": sum(throughputs) / len(throughputs) if throughputs else 0,
-                    "peak_throughput_mbps": network_patterns.get("peak_throughput_mbps", 0),
-                    "network_operations": len(io_list),
-                    "network_active_ops": network_patterns.get("network_active_operations", 0),
-                    "network_utilization": (len(throughputs) / len(io_list)) * 100 if io_list else 0,
-                }
-            else:
-                network_metrics = {
-                    "total_bytes_sent": 0,
-                    "total_bytes_recv": 0,
-                    "total_network_bytes": 0,
-                    "avg_throughput_mbps": 0,
-                    "peak_throughput_mbps": 0,
-                    "network_operations": 0,
-                    "network_active_ops": 0,
-                    "network_utilization": 0,
-                }
-
-            # Combine timing, memory, CPU, and network metrics
-            metrics[component] = {**timing_metrics, **memory_metrics, **cpu_metrics, **network_metrics}
-
-        return metrics
+        """Get timing and sampled resource metrics per monitor component."""
+        return self._spans.get_metrics(MONITOR_COMPONENTS)
 
     async def _handle_system_shutdown(self, event: Event) -> None:
-        """Handle system shutdown events gracefully."""
+        """Handle system shutdown events gracefully.
+
+        The bus may run on another loop than the monitor (see MonitorSupervisor),
+        so the monitor is stopped on its own loop.
+        """
         self.logger.info("Received system shutdown event, stopping monitor")
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.stop_monitoring_async(), self._loop))
+            return
         await self.stop_monitoring_async()
 
     # Core monitoring methods
@@ -448,17 +242,22 @@ class AsyncClaudeMonitor:
 
         try:
             self.is_running = True
+            self._loop = asyncio.get_running_loop()
             self._start_time = time.time()
             self._loop_count = 0
+            self._setup_event_subscriptions()
 
-            # Establish baseline memory, CPU, and network usage
+            # Establish baseline memory and CPU usage
             self._baseline_memory_mb = self._measure_memory_usage()
-            self._baseline_cpu_percent = psutil.cpu_percent(interval=1.0)  # Get initial CPU reading
-            self._baseline_network_counters = psutil.net_io_counters()
-            self._last_network_counters = self._baseline_network_counters
+            # Non-blocking: monitors may share one event loop (see MonitorSupervisor)
+            self._baseline_cpu_percent = psutil.cpu_percent(interval=None)
 
             await self._start_async_logging()
 
+            # Opt-in: wake on pane output instead of polling every second
+            if settings.monitoring.stream_pane_output:
+                await self._start_output_stream()
+
             # Start the main monitoring task
             self._monitor_task = asyncio.create_task(self._monitor_loop_async())
 
@@ -483,6 +282,7 @@ class AsyncClaudeMonitor:
 
         except Exception as e:
             self.is_running = False
+            self._teardown_event_subscriptions()
             await self._publish_status_event("error", f"Failed to start Claude monitor: {e}")
             self.logger.error("Failed to start Claude monitor: %s", e, exc_info=True)
             return False
@@ -499,6 +299,7 @@ class AsyncClaudeMonitor:
 
         self.logger.info("Stopping async Claude monitor...")
         self.is_running = False
+        self._teardown_event_subscriptions()
 
         # Cancel monitoring tasks
         tasks_to_cancel = []
@@ -518,6 +319,8 @@ class AsyncClaudeMonitor:
             except TimeoutError:
                 self.logger.warning("Monitor tasks cancellation timed out")
 
+        await self._stop_output_stream()
+
         # Stop async logging
         await self._stop_async_logging()
 
@@ -534,6 +337,7 @@ class AsyncClaudeMonitor:
         )
 
         await self._publish_status_event("info", f"Stopped async Claude monitor for {self.session_name}")
+        await self._flush_coalesced_events(force=True)
         return True
 
     async def _monitor_loop_async(self) -> None:
@@ -554,64 +358,13 @@ class AsyncClaudeMonitor:
                 loop_start = time.perf_counter()
 
                 try:
-                    # Async content capture (non-blocking) with comprehensive monitoring
-                    content_start = time.perf_counter()
-                    memory_before = self._measure_memory_usage()
-                    net_sent_before, net_recv_before = self._measure_network_io_delta()
-                    content = await self._capture_pane_content_async()
-                    content_end = time.perf_counter()
-                    memory_after = self._measure_memory_usage()
-                    net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-                    content_duration = (content_end - content_start) * 1000
-                    memory_delta = memory_after - memory_before
-                    cpu_usage = self._calculate_component_cpu_delta("content_capture", content_start, content_end)
-
-                    self._record_component_timing("content_capture", content_duration, True)
-                    self._record_component_memory("content_capture", memory_delta)
-                    self._record_component_cpu("content_capture", cpu_usage)
-                    self._record_component_network_io("content_capture", net_sent_after, net_recv_after, content_duration)
-
-                    # Check Claude process status asynchronously with comprehensive monitoring
-                    status_start = time.perf_counter()
-                    memory_before = self._measure_memory_usage()
-                    net_sent_before, net_recv_before = self._measure_network_io_delta()
-                    claude_running = await self._check_claude_status_async()
-                    status_end = time.perf_counter()
-                    memory_after = self._measure_memory_usage()
-                    net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-                    status_duration = (status_end - status_start) * 1000
-                    memory_delta = memory_after - memory_before
-                    cpu_usage = self._calculate_component_cpu_delta("claude_status_check", status_start, status_end)
-
-                    self._record_component_timing("claude_status_check", status_duration, claude_running)
-                    self._record_component_memory("claude_status_check", memory_delta)
-                    self._record_component_cpu("claude_status_check", cpu_usage)
-                    self._record_component_network_io("claude_status_check", net_sent_after, net_recv_after, status_duration)
-
-                    if not claude_running:
-                        await self._handle_claude_not_running()
+                    content = await self._tick_async()
+                    await self._flush_coalesced_events()
+                    if content is None:
+                        # Claude was not running; give a failed restart time before retrying
+                        await self._wait_for_next_cycle(settings.monitoring.poll_interval)
                         continue
 
-                    # Process content for prompts and automation with comprehensive monitoring
-                    process_start = time.perf_counter()
-                    memory_before = self._measure_memory_usage()
-                    net_sent_before, net_recv_before = self._measure_network_io_delta()
-                    await self._process_content_async(content)
-                    process_end = time.perf_counter()
-                    memory_after = self._measure_memory_usage()
-                    net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-                    process_duration = (process_end - process_start) * 1000
-                    memory_delta = memory_after - memory_before
-                    cpu_usage = self._calculate_component_cpu_delta("content_processing", process_start, process_end)
-
-                    self._record_component_timing("content_processing", process_duration, True)
-                    self._record_component_memory("content_processing", memory_delta)
-                    self._record_component_cpu("content_processing", cpu_usage)
-                    self._record_component_network_io("content_processing", net_sent_after, net_recv_after, process_duration)
-
                     # Update performance metrics
                     self._loop_count += 1
 
@@ -642,10 +395,10 @@ class AsyncClaudeMonitor:
                     await asyncio.sleep(5.0)
                     continue
 
-                # Optimal sleep duration - non-blocking
+                # Back off while the pane is idle, poll fast while it is active
+                interval = self._poll_scheduler.observe(content.content, prompt_active=self.waiting_for_input, fingerprint=self._frame_fingerprint)
                 loop_duration = time.perf_counter() - loop_start
-                optimal_sleep = max(0.1, 1.0 - loop_duration)  # Aim for ~1 second intervals
-                await asyncio.sleep(optimal_sleep)
+                await self._wait_for_next_cycle(max(0.05, interval - loop_duration))
 
         except asyncio.CancelledError:
             self.logger.info("Async monitoring loop cancelled")
@@ -655,6 +408,78 @@ class AsyncClaudeMonitor:
             self.is_running = False
             self.logger.info("Async monitoring loop stopped")
 
+    async def _tick_async(self) -> PaneContentView | None:
+        """Run one capture, status check and processing pass.
+
+        Returns:
+            The captured view, or None if Claude was not running
+        """
+        self._frame_captured_at = time.monotonic()
+        with self._spans.span("content_capture"):
+            content = await self._capture_pane_view_async()
+        await self._check_output_stream(content)
+
+        with self._spans.span("claude_status_check") as span:
+            claude_running = await self._check_claude_status_async(content)
+            if not claude_running:
+                span.fail()
+
+        if not claude_running:
+            await self._handle_claude_not_running()
+            return None
+
+        with self._spans.span("content_processing"):
+            await self._process_content_async(content)
+        return content
+
+    async def _start_output_stream(self) -> None:
+        """Attach a ``pipe-pane`` output stream to the Claude pane."""
+        pane = cast("Any", self.session_manager).get_claude_pane()
+        if not isinstance(getattr(pane, "pane_id", None), str):
+            return
+
+        # Stream-driven cycles never run faster than the poll scheduler's fastest rate
+        stream = PaneOutputStream(pane, debounce=settings.monitoring.stream_debounce, min_interval=settings.monitoring.poll_fast_interval)
+        if await stream.start():
+            self._output_stream = stream
+        else:
+            self.logger.info("Output streaming unavailable for %s, polling instead", self.session_name)
+
+    async def _check_output_stream(self, view: PaneContentView) -> None:
+        """Fall back to polling once the pane's ``pipe-pane`` is gone.
+
+        The stream cannot see its ``cat`` writer exit, so this relies on the
+        ``#{pane_pipe}`` flag read by this tick's capture probe.
+
+        Args:
+            view: This tick's capture
+        """
+        if self._output_stream is None or view.pane is None or view.pane.piped:
+            return
+        self.logger.warning("Output stream of %s lost its pipe, polling instead", self.session_name)
+        self._output_stream.release_pipe()
+        await self._stop_output_stream()
+
+    async def _stop_output_stream(self) -> None:
+        """Detach the output stream, if any."""
+        if self._output_stream is not None:
+            await self._output_stream.stop()
+            self._output_stream = None
+
+    async def _wait_for_next_cycle(self, poll_interval: float) -> None:
+        """Wait until the next monitoring cycle is due.
+
+        While streaming, the cycle starts as soon as the pane produces output;
+        polling then only runs as a slow safety net.
+
+        Args:
+            poll_interval: Sleep duration when not streaming
+        """
+        if self._output_stream is not None and self._output_stream.is_active:
+            await self._output_stream.wait_for_output(settings.monitoring.safety_poll_interval)
+        else:
+            await asyncio.sleep(poll_interval)
+
     async def _capture_pane_content_async(self) -> str:
         """Capture pane content asynchronously.
 
@@ -662,24 +487,51 @@ class AsyncClaudeMonitor:
             Current pane content as string
         """
         try:
-            # Run the potentially blocking pane capture in a thread pool
-            loop = asyncio.get_event_loop()
-            content = await loop.run_in_executor(None, cast("Any", self.session_manager).capture_pane_content)
+            # Blocking tmux call on the tmux I/O executor
+            content = await get_executor("tmux_io").run(cast("Any", self.session_manager).capture_pane_content)
             return cast("str", content)
         except Exception:
             self.logger.exception("Error capturing pane content")
             return ""
 
-    async def _check_claude_status_async(self) -> bool:
+    async def _capture_pane_view_async(self) -> PaneContentView:
+        """Capture what changed in the pane since the previous loop iteration.
+
+        Session managers that support incremental capture only transfer new
+        lines; others fall back to a full capture diffed against the last one.
+
+        Returns:
+            View of new lines plus the tail window
+        """
+        capture_delta = getattr(self.session_manager, "capture_pane_delta", None)
+        if capture_delta is not None:
+            try:
+                view = await get_executor("tmux_io").run(capture_delta)
+                if isinstance(view, PaneContentView):
+                    return view
+            except Exception:
+                self.logger.exception("Error capturing pane delta")
+
+        return PaneContentView.from_content(await self._capture_pane_content_async(), self._last_content)
+
+    async def _check_claude_status_async(self, view: PaneContentView | None = None) -> bool:
         """Check Claude process status asynchronously.
 
+        Args:
+            view: This tick's capture; when it carries the pane state read by
+                the same probe, no further tmux call is made
+
         Returns:
             True if Claude is running, False otherwise
         """
+        if view is not None and view.pane is not None:
+            self._fused_status_checks += 1
+            return view.pane.runs("claude")
+
+        self._separate_status_checks += 1
         try:
-            # Run potentially blocking process check in thread pool
-            loop = asyncio.get_event_loop()
-            is_running = await loop.run_in_executor(None, cast("Any", self.process_controller).is_claude_running)
+            # Blocking tmux call on the tmux I/O executor
+            is_running = await get_executor("tmux_io").run(cast("Any", self.process_controller).is_claude_running)
             return cast("bool", is_running)
         except Exception:
             self.logger.exception("Error checking Claude status")
@@ -693,21 +545,33 @@ class AsyncClaudeMonitor:
             await self._publish_activity_event("🔄 Auto-restarting Claude...")
 
             try:
-                # Run restart in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, cast("Any", self.process_controller).restart_claude_pane)
+                with self._spans.span("claude_restart") as span:
+                    restart = await self._restart_claude_async()
+                    if not restart["success"]:
+                        span.fail()
 
-                # Publish restart event
-                await self.event_bus.publish(
-                    Event(
-                        type=EventType.CLAUDE_STATUS_CHANGED,
-                        data={"session_name": self.session_name, "status": "restarted", "auto_restart": True},
-                        timestamp=time.time(),
-                        source="async_claude_monitor",
-                        correlation_id=self.session_name,
-                        priority=EventPriority.HIGH,
+                if restart["success"]:
+                    await self.event_bus.publish(
+                        Event(
+                            type=EventType.CLAUDE_STATUS_CHANGED,
+                            data={"session_name": self.session_name, "status": "restarted", "auto_restart": True, "restart": restart},
+                            timestamp=time.time(),
+                            source="async_claude_monitor",
+                            correlation_id=self.session_name,
+                            priority=EventPriority.HIGH,
+                        )
+                    )
+                else:
+                    await self.event_bus.publish(
+                        Event(
+                            type=EventType.CLAUDE_ERROR,
+                            data={"session_name": self.session_name, "error": f"Restart failed: {restart['error']}", "auto_restart_failed": True, "restart": restart},
+                            timestamp=time.time(),
+                            source="async_claude_monitor",
+                            correlation_id=self.session_name,
+                            priority=EventPriority.CRITICAL,
+                        )
                     )
-                )
 
             except Exception as e:
                 self.logger.exception("Failed to restart Claude")
@@ -724,77 +588,67 @@ class AsyncClaudeMonitor:
         else:
             await self._publish_status_event("warning", "Claude not running. Auto-restart disabled.")
 
-    async def _process_content_async(self, content: str) -> None:
+    async def _restart_claude_async(self) -> dict[str, Any]:
+        """Restart Claude, preferring the controller's async state machine.
+
+        Returns:
+            dict[str, Any]: Success flag, error, total and per-phase durations.
+        """
+        restart_async = getattr(self.process_controller, "restart_claude_pane_async", None)
+        if asyncio.iscoroutinefunction(restart_async):
+            result = await restart_async()
+            return cast("dict[str, Any]", result.to_dict())
+
+        # Blocking controllers get their own executor so they cannot starve pane captures
+        started = time.perf_counter()
+        success = await get_executor("process_control").run(cast("Any", self.process_controller).restart_claude_pane)
+        success = success is not False
+        return {"success": success, "duration": time.perf_counter() - started, "phases": {}, "failed_phase": None, "error": None if success else "restart_claude_pane returned False"}
+
+    async def _process_content_async(self, content: str | PaneContentView) -> None:
         """Process pane content for prompts and automation opportunities.
 
         Args:
-            content: Current pane content
+            content: Current pane content, or a view of new lines plus the tail window
         """
-        # Check for prompts with comprehensive monitoring
-        prompt_start = time.perf_counter()
-        memory_before = self._measure_memory_usage()
-        net_sent_before, net_recv_before = self._measure_network_io_delta()
-        prompt_info = await self._check_for_prompt_async(content)
-        prompt_end = time.perf_counter()
-        memory_after = self._measure_memory_usage()
-        net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-        prompt_duration = (prompt_end - prompt_start) * 1000
-        memory_delta = memory_after - memory_before
-        cpu_usage = self._calculate_component_cpu_delta("prompt_detection", prompt_start, prompt_end)
-
-        self._record_component_timing("prompt_detection", prompt_duration, prompt_info is not None)
-        self._record_component_memory("prompt_detection", memory_delta)
-        self._record_component_cpu("prompt_detection", cpu_usage)
-        self._record_component_network_io("prompt_detection", net_sent_after, net_recv_after, prompt_duration)
+        view = content if isinstance(content, PaneContentView) else PaneContentView.from_content(content, self._last_content)
+        content = view.content
+
+        # An identical frame yields the same detection results, so reuse the last ones
+        fingerprint = content_fingerprint(content)
+        unchanged = fingerprint == self._frame_fingerprint
+        self._frame_fingerprint = fingerprint
+        self._frames_processed += 1
+
+        if unchanged:
+            self._frames_skipped += 1
+            prompt_info = self.current_prompt
+        else:
+            with self._spans.span("prompt_detection"):
+                prompt_info = await self._check_for_prompt_async(content)
 
         if prompt_info:
-            # Handle prompt response with comprehensive monitoring
-            response_start = time.perf_counter()
-            memory_before = self._measure_memory_usage()
-            net_sent_before, net_recv_before = self._measure_network_io_delta()
-            await self._handle_prompt_async(prompt_info, content)
-            response_end = time.perf_counter()
-            memory_after = self._measure_memory_usage()
-            net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-            response_duration = (response_end - response_start) * 1000
-            memory_delta = memory_after - memory_before
-            cpu_usage = self._calculate_component_cpu_delta("response_sending", response_start, response_end)
-
-            self._record_component_timing("response_sending", response_duration, True)
-            self._record_component_memory("response_sending", memory_delta)
-            self._record_component_cpu("response_sending", cpu_usage)
-            self._record_component_network_io("response_sending", net_sent_after, net_recv_after, response_duration)
+            with self._spans.span("response_sending"):
+                await self._handle_prompt_async(prompt_info, content)
         elif self.waiting_for_input:
-            await self._publish_activity_event("⏳ Waiting for user input...")
+            await self._publish_activity_event("⏳ Waiting for user input...", coalesce_key="waiting")
         else:
             # Clear prompt state if no longer waiting
             self._clear_prompt_state()
 
+        if unchanged:
+            return
+
         # Update AI patterns periodically
         await self.adaptive_response.update_patterns()
 
         # Analyze content for automation contexts (only if content changed)
-        if content != self._last_content and len(content.strip()) > 0:
-            automation_start = time.perf_counter()
-            memory_before = self._measure_memory_usage()
-            net_sent_before, net_recv_before = self._measure_network_io_delta()
-            await self._analyze_automation_context(content)
-            await self._collect_content_interaction(content, prompt_info)
-            automation_end = time.perf_counter()
-            memory_after = self._measure_memory_usage()
-            net_sent_after, net_recv_after = self._measure_network_io_delta()
-
-            automation_duration = (automation_end - automation_start) * 1000
-            memory_delta = memory_after - memory_before
-            cpu_usage = self._calculate_component_cpu_delta("automation_analysis", automation_start, automation_end)
-
-            self._record_component_timing("automation_analysis", automation_duration, True)
-            self._record_component_memory("automation_analysis", memory_delta)
-            self._record_component_cpu("automation_analysis", cpu_usage)
-            self._record_component_network_io("automation_analysis", net_sent_after, net_recv_after, automation_duration)
-            await self._publish_activity_event("📝 Content updated")
+        if view.changed and len(content.strip()) > 0:
+            with self._spans.span("automation_analysis"):
+                # Only newly arrived output can contain a new automation context
+                await self._analyze_automation_context("\n".join(view.new_lines) if view.new_lines else content)
+                await self._collect_content_interaction(content, prompt_info)
+            await self._publish_activity_event("📝 Content updated", coalesce_key="content")
             self._last_content = content
 
     async def _check_for_prompt_async(self, content: str) -> PromptInfo | None:
@@ -807,11 +661,11 @@ class AsyncClaudeMonitor:
             PromptInfo if prompt detected, None otherwise
         """
         try:
-            # Run prompt detection in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            prompt_info = await loop.run_in_executor(None, self.prompt_detector.detect_prompt, content)
+            prompt_info = await get_executor("detection").run(self.prompt_detector.detect_prompt, content)
 
             if prompt_info:
+                if self._prompt_seen_at is None:
+                    self._prompt_seen_at = self._frame_captured_at or time.monotonic()
                 self.current_prompt = prompt_info
                 self.waiting_for_input = True
                 self.logger.info("Prompt detected: %s - %s", prompt_info.type.value, prompt_info.question)
@@ -834,8 +688,10 @@ class AsyncClaudeMonitor:
                     )
                 )
             else:
+                # The prompt left the screen unanswered; the next one starts a new measurement
+                self._prompt_seen_at = None
                 # Check if still waiting based on content patterns
-                self.waiting_for_input = await loop.run_in_executor(None, self.prompt_detector.is_waiting_for_input, content)
+                self.waiting_for_input = await get_executor("detection").run(self.prompt_detector.is_waiting_for_input, content)
 
             return prompt_info
 
@@ -851,7 +707,7 @@ class AsyncClaudeMonitor:
             content: Current content context
         """
         if not self.is_auto_next_enabled:
-            await self._publish_activity_event(f"⏳ Waiting for input: {prompt_info.type.value}")
+            await self._publish_activity_event(f"⏳ Waiting for input: {prompt_info.type.value}", coalesce_key="waiting")
             return
 
         try:
@@ -876,7 +732,7 @@ class AsyncClaudeMonitor:
                 return
 
             # No auto-response available
-            await self._publish_activity_event(f"⏳ Waiting for input: {prompt_info.type.value}")
+            await self._publish_activity_event(f"⏳ Waiting for input: {prompt_info.type.value}", coalesce_key="waiting")
 
         except Exception as e:
             self.logger.exception("Error handling prompt")
@@ -896,6 +752,7 @@ class AsyncClaudeMonitor:
             if success:
                 # Send response to Claude
                 await self._send_input_async(response)
+                self._record_prompt_latency(prompt_info)
 
                 await self._publish_activity_event(f"🤖 AI auto-responded: '{response}' (confidence: {confidence:.2f})")
                 await self._record_response_async(prompt_info.type.value, response, prompt_info.question)
@@ -921,6 +778,7 @@ class AsyncClaudeMonitor:
                     )
                 )
 
+                self._poll_scheduler.note_response()
                 self._clear_prompt_state()
                 return True
 
@@ -933,6 +791,7 @@ class AsyncClaudeMonitor:
         """Send pattern-based legacy response."""
         try:
             await self._send_input_async(response)
+            self._record_prompt_latency(prompt_info)
 
             await self._publish_activity_event(f"✅ Legacy auto-responded: '{response}' to {prompt_info.type.value}")
             await self._record_response_async(prompt_info.type.value, response, prompt_info.question)
@@ -957,6 +816,7 @@ class AsyncClaudeMonitor:
                 )
             )
 
+            self._poll_scheduler.note_response()
             self._clear_prompt_state()
 
         except Exception:
@@ -965,8 +825,7 @@ class AsyncClaudeMonitor:
     async def _send_input_async(self, input_text: str) -> None:
         """Send input to Claude process asynchronously."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cast("Any", self.process_controller).send_input, input_text)
+            await get_executor("tmux_io").run(cast("Any", self.process_controller).send_input, input_text)
         except Exception:
             self.logger.exception("Error sending input")
             raise
@@ -974,8 +833,7 @@ class AsyncClaudeMonitor:
     async def _record_response_async(self, prompt_type: str, response: str, question: str) -> None:
         """Record response asynchronously."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cast("Any", self.status_manager).record_response, prompt_type, response, question)
+            await get_executor("handlers").run(cast("Any", self.status_manager).record_response, prompt_type, response, question)
         except Exception:
             self.logger.exception("Error recording response")
 
@@ -985,16 +843,13 @@ class AsyncClaudeMonitor:
             return False
 
         try:
-            # Run response logic in thread pool
-            loop = asyncio.get_event_loop()
-            should_respond = await loop.run_in_executor(None, self._should_auto_respond, prompt_info)
-            return should_respond
+            return self._should_auto_respond(prompt_info)
         except Exception:
             self.logger.exception("Error checking auto-response")
             return False
 
     def _should_auto_respond(self, prompt_info: PromptInfo) -> bool:
-        """Determine if we should auto-respond (runs in thread pool)."""
+        """Determine if we should auto-respond to the prompt type."""
         try:
             return prompt_info.type in {
                 PromptType.NUMBERED_SELECTION,
@@ -1008,8 +863,7 @@ class AsyncClaudeMonitor:
     async def _analyze_automation_context(self, content: str) -> None:
         """Analyze content for automation contexts."""
         try:
-            loop = asyncio.get_event_loop()
-            automation_contexts = await loop.run_in_executor(None, self.automation_manager.analyze_content_for_context, content, self.session_name)
+            automation_contexts = await get_executor("detection").run(self.automation_manager.analyze_content_for_context, content, self.session_name)
 
             for auto_context in automation_contexts:
                 if hasattr(auto_context, "context_type") and hasattr(auto_context, "confidence"):
@@ -1052,8 +906,7 @@ class AsyncClaudeMonitor:
                     "confidence": prompt_info.confidence,
                 }
 
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.content_collector.collect_interaction, content, prompt_dict, None)
+            await get_executor("handlers").run(self.content_collector.collect_interaction, content, prompt_dict, None)
         except Exception:
             self.logger.exception("Error collecting content interaction")
 
@@ -1070,9 +923,7 @@ class AsyncClaudeMonitor:
 
                 try:
                     # Cleanup old collections
-                    loop = asyncio.get_event_loop()
-                    cleaned_count = await loop.run_in_executor(
-                        None,
+                    cleaned_count = await get_executor("handlers").run(
                         self.content_collector.cleanup_old_files,
                         7,  # Keep 7 days
                     )
@@ -1082,8 +933,7 @@ class AsyncClaudeMonitor:
 
                     # Check Claude idle automation
                     if hasattr(self.status_manager, "last_activity_time"):
-                        idle_context = await loop.run_in_executor(
-                            None,
+                        idle_context = await get_executor("detection").run(
                             self.automation_manager.analyze_claude_idle,
                             cast("Any", self.status_manager).last_activity_time,
                             60,  # 60 second idle threshold
@@ -1126,6 +976,23 @@ class AsyncClaudeMonitor:
                 "memory_growth_mb": total_memory_growth,
                 "current_cpu_percent": self._measure_cpu_usage(),
                 "baseline_cpu_percent": self._baseline_cpu_percent,
+                "instrumentation": self._spans.get_stats(),
+                "executors": get_executor_stats(),
+                "output_stream": self._output_stream.get_stats() if self._output_stream else None,
+                "polling": self._poll_scheduler.get_stats(),
+                "prompt_latency": self.get_prompt_latency_stats(),
+                "activity_events": self._event_coalescer.get_stats(),
+                "prompt_normalizer": self.prompt_detector.normalizer.get_stats(),
+                "detection_cache": self.prompt_detector.cache.get_stats(),
+                "status_checks": {
+                    "fused": self._fused_status_checks,
+                    "separate": self._separate_status_checks,
+                },
+                "fast_path": {
+                    "frames": self._frames_processed,
+                    "skipped_frames": self._frames_skipped,
+                    "skip_ratio": self._frames_skipped / self._frames_processed if self._frames_processed else 0.0,
+                },
             }
 
             await self.event_bus.publish(
@@ -1142,20 +1009,27 @@ class AsyncClaudeMonitor:
             # Log detailed component performance
             current_memory_mb = self._measure_memory_usage()
             total_memory_growth = current_memory_mb - self._baseline_memory_mb
-            self.logger.debug("Performance: %.2f loops/sec, %d loops, memory: %.1fMB (+%.1fMB from baseline)", loops_per_second, self._loop_count, current_memory_mb, total_memory_growth)
+            self.logger.debug(
+                "Performance: %.2f loops/sec, %d loops, %.0f%% frames unchanged, memory: %.1fMB (+%.1fMB from baseline)",
+                loops_per_second,
+                self._loop_count,
+                metrics["fast_path"]["skip_ratio"] * 100,
+                current_memory_mb,
+                total_memory_growth,
+            )
 
-            # Log component bottlenecks (performance, memory, CPU, or network intensive)
+            # Log slow components. Every span awaits, so its sampled memory/CPU
+            # deltas cover the whole process and cannot single a component out
             for component, stats in component_metrics.items():
-                if stats["average_ms"] > 100 or abs(stats["avg_memory_delta_mb"]) > 5.0 or stats["avg_cpu_percent"] > 50.0 or stats["avg_throughput_mbps"] > 1.0:
+                if stats["average_ms"] > 100:
                     self.logger.warning(
-                        "Bottleneck in %s: avg=%.1fms, p95=%.1fms, errors=%d, mem=%.2fMB, cpu=%.1f%%, net=%.2fMB/s",
+                        "Bottleneck in %s: avg=%.1fms, p95=%.1fms, errors=%d, process mem=%.2fMB, process cpu=%.1f%%",
                         component,
                         stats["average_ms"],
                         stats["p95_ms"],
                         stats["error_count"],
                         stats["avg_memory_delta_mb"],
                         stats["avg_cpu_percent"],
-                        stats["avg_throughput_mbps"],
                     )
 
         except Exception:
@@ -1163,50 +1037,107 @@ class AsyncClaudeMonitor:
 
     # Event publishing helpers
     async def _publish_status_event(self, status_type: str, message: str) -> None:
-        """Publish status update event."""
-        try:
-            await self.event_bus.publish(
-                Event(
-                    type=EventType.DASHBOARD_UPDATE,
-                    data={"update_type": "status", "status_type": status_type, "message": message, "session_name": self.session_name},
-                    timestamp=time.time(),
-                    source="async_claude_monitor",
-                    correlation_id=self.session_name,
-                    priority=EventPriority.NORMAL,
-                )
-            )
+        """Publish status update event, coalesced per status type."""
+        event = self._event_coalescer.offer(f"status:{status_type}", message, self._event_bus_load())
+        if event is not None:
+            await self._emit_coalesced_event(event)
 
-            # Also update status manager for backward compatibility
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cast("Any", self.status_manager).update_status, f"[{status_type}]{message}[/]")
-        except Exception:
-            self.logger.exception("Error publishing status event")
+    async def _publish_activity_event(self, message: str, coalesce_key: str | None = None) -> None:
+        """Publish activity update event.
+
+        Args:
+            message: Activity message
+            coalesce_key: Key of a repeating state (e.g. ``"waiting"``) to
+                coalesce with; one-shot messages such as responses and errors
+                are published immediately
+        """
+        if coalesce_key is None:
+            await self._emit_coalesced_event(CoalescedEvent(key="activity", message=message))
+            return
+        event = self._event_coalescer.offer(f"activity:{coalesce_key}", message, self._event_bus_load())
+        if event is not None:
+            await self._emit_coalesced_event(event)
+
+    async def _flush_coalesced_events(self, force: bool = False) -> None:
+        """Publish held-back activity and status events whose window has ended."""
+        for event in self._event_coalescer.flush(self._event_bus_load(), force=force):
+            await self._emit_coalesced_event(event)
+
+    def _event_bus_load(self) -> float:
+        """Fill ratio of the event bus queue; 0.0 for buses that do not report one."""
+        load = getattr(self.event_bus, "queue_load", 0.0)
+        return load if isinstance(load, float) else 0.0
+
+    async def _emit_coalesced_event(self, event: CoalescedEvent) -> None:
+        """Publish a dashboard update for a coalesced activity or status event."""
+        update_type, _, subtype = event.key.partition(":")
+        status_type = subtype if update_type == "status" else ""
+        message = f"{event.message} (+{event.suppressed} coalesced)" if event.summary and event.suppressed else event.message
+        data = {"update_type": update_type, "message": message, "session_name": self.session_name, "suppressed": event.suppressed, "summary": event.summary}
+        if status_type:
+            data["status_type"] = status_type
 
-    async def _publish_activity_event(self, message: str) -> None:
-        """Publish activity update event."""
         try:
             await self.event_bus.publish(
                 Event(
                     type=EventType.DASHBOARD_UPDATE,
-                    data={"update_type": "activity", "message": message, "session_name": self.session_name},
+                    data=data,
                     timestamp=time.time(),
                     source="async_claude_monitor",
                     correlation_id=self.session_name,
-                    priority=EventPriority.LOW,
+                    priority=EventPriority.NORMAL if status_type else EventPriority.LOW,
                 )
             )
 
             # Also update status manager for backward compatibility
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cast("Any", self.status_manager).update_activity, message)
+            if status_type:
+                await get_executor("handlers").run(cast("Any", self.status_manager).update_status, f"[{status_type}]{message}[/]")
+            else:
+                await get_executor("handlers").run(cast("Any", self.status_manager).update_activity, message)
         except Exception:
-            self.logger.exception("Error publishing activity event")
+            self.logger.exception("Error publishing %s event", update_type)
 
     # Utility methods (maintaining backward compatibility)
     def _clear_prompt_state(self) -> None:
         """Clear the current prompt state."""
         self.current_prompt = None
         self.waiting_for_input = False
+        self._prompt_seen_at = None
+
+    def _record_prompt_latency(self, prompt_info: PromptInfo) -> None:
+        """Record how long the answered prompt was on screen before its keystrokes went out."""
+        if self._prompt_seen_at is None:
+            return
+        latency_ms = (time.monotonic() - self._prompt_seen_at) * 1000
+        self._prompt_seen_at = None
+        for key in ("all", prompt_info.type.value):
+            histogram = self._prompt_latency.get(key)
+            if histogram is None:
+                histogram = self._prompt_latency[key] = LatencyHistogram()
+            histogram.record(latency_ms)
+
+    def get_loop_stats(self) -> dict[str, Any]:
+        """Get monitor loop progress.
+
+        Returns:
+            dict[str, Any]: Iterations run so far and the current poll interval.
+        """
+        return {"loop_count": self._loop_count, "poll_interval": self._poll_scheduler.current_interval}
+
+    def get_prompt_latency_stats(self) -> dict[str, Any]:
+        """Get prompt-to-keystroke latency for this session.
+
+        Returns:
+            dict[str, Any]: Histogram snapshot for all prompts under ``all`` and
+            per prompt type under ``by_type``.
+        """
+        histograms = dict(self._prompt_latency)
+        overall = histograms.pop("all", None) or LatencyHistogram()
+        return {
+            "session_name": self.session_name,
+            "all": overall.snapshot(),
+            "by_type": {prompt_type: histogram.snapshot() for prompt_type, histogram in sorted(histograms.items())},
+        }
 
     def _get_legacy_response(self, prompt_info: PromptInfo) -> str:
         """Get response that would be used by legacy auto-response system."""
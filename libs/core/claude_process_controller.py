@@ -1,13 +1,63 @@
 # Copyright notice.
 
+import asyncio
 import logging
+import re
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from .executors import get_executor
+from .settings import settings
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Claude process control and lifecycle management."""
 
 
+# Text Claude Code prints once it is up: the welcome banner or the input box hints
+CLAUDE_BANNER_PATTERN = re.compile(r"Welcome to Claude|/help for help|\? for shortcuts", re.IGNORECASE)
+
+
+class RestartPhase(Enum):
+    """Steps of an asynchronous Claude restart, in order."""
+
+    INTERRUPT = "interrupt"  # Ctrl+C until Claude exits
+    EXIT = "exit"  # Ctrl+D if it is still running
+    CLEAR = "clear"  # clear the screen so the old banner cannot confirm the new process
+    LAUNCH = "launch"  # send the claude command
+    CONFIRM = "confirm"  # wait for the banner
+
+
+@dataclass
+class RestartResult:
+    """Outcome of one asynchronous restart.
+
+    Attributes:
+        success: Whether Claude exited and the new process printed its banner
+        duration: Seconds the whole restart took
+        phases: Seconds spent in each phase that ran, keyed by phase name
+        failed_phase: Phase that failed, if any
+        error: Why it failed
+    """
+
+    success: bool = False
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    failed_phase: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dict for event payloads.
+
+        Returns:
+            dict[str, Any]: The result fields.
+        """
+        return {"success": self.success, "duration": self.duration, "phases": dict(self.phases), "failed_phase": self.failed_phase, "error": self.error}
+
+
 class ClaudeProcessController:
     """Controls Claude process lifecycle (start, stop, restart)."""
 
@@ -50,6 +100,126 @@ class ClaudeProcessController:
             self.logger.exception("Failed to restart Claude pane")
             return False
 
+    async def restart_claude_pane_async(self) -> RestartResult:
+        """Restart Claude as a state machine that polls the pane instead of sleeping.
+
+        Each phase ends as soon as the pane shows the expected state: Ctrl+C
+        (then Ctrl+D) until Claude is no longer the pane's command, then
+        ``clear`` until the old banner is off the screen (then dropping the
+        scrollback it may have been pushed into), the launch command, and
+        Claude as the pane's command showing its banner. Blocking tmux
+        calls run on the ``tmux_io`` executor with short waits in between, so
+        no thread is held for the length of the restart.
+
+        Returns:
+            RestartResult: Success flag, total duration and per-phase durations.
+        """
+        result = RestartResult()
+        started = time.perf_counter()
+
+        if not self.session_manager.get_claude_pane():
+            result.error = "No Claude pane in session"
+            await self._update_status_async("[red]Cannot restart: No Claude pane in session[/]")
+            return result
+
+        await self._update_status_async("[yellow]Restarting Claude pane...[/]")
+        phase = RestartPhase.INTERRUPT
+        try:
+            for phase in RestartPhase:
+                phase_started = time.perf_counter()
+                ok = await self._run_restart_phase(phase)
+                result.phases[phase.value] = time.perf_counter() - phase_started
+                if not ok:
+                    result.failed_phase = phase.value
+                    result.error = "Claude did not exit" if phase == RestartPhase.EXIT else f"Restart phase {phase.value} timed out"
+                    break
+            else:
+                result.success = True
+        except Exception as e:
+            result.failed_phase = phase.value
+            result.error = str(e)
+            self.logger.exception("Failed to restart Claude pane")
+
+        result.duration = time.perf_counter() - started
+        if result.success:
+            self.logger.info("Claude restarted in %.2fs (%s)", result.duration, ", ".join(f"{name}={seconds:.2f}s" for name, seconds in result.phases.items()))
+            await self._update_status_async(f"[green]Claude pane restarted with {self.selected_model} model[/]")
+        else:
+            self.logger.warning("Claude restart failed in phase %s after %.2fs: %s", result.failed_phase, result.duration, result.error)
+            await self._update_status_async(f"[red]Failed to restart Claude pane: {result.error}[/]")
+        return result
+
+    async def _run_restart_phase(self, phase: RestartPhase) -> bool:
+        exit_timeout = settings.monitoring.restart_exit_timeout
+        if phase == RestartPhase.INTERRUPT:
+            # Claude Code exits on a second Ctrl+C
+            await self._run_io(self.session_manager.send_keys, "C-c")
+            await self._run_io(self.session_manager.send_keys, "C-c")
+            await self._wait_until(self._claude_exited, exit_timeout / 2)
+            return True
+        if phase == RestartPhase.EXIT:
+            if await self._claude_exited():
+                return True
+            await self._run_io(self.session_manager.send_keys, "C-d")
+            return await self._wait_until(self._claude_exited, exit_timeout / 2)
+        if phase == RestartPhase.CLEAR:
+            # The shell clears the screen asynchronously; launching before the old
+            # banner is gone would let it confirm a launch that failed
+            await self._run_io(self.session_manager.send_keys, "clear")
+            if not await self._wait_until(self._banner_cleared, exit_timeout / 2):
+                return False
+            # Without E3 support (e.g. TERM=screen) and with scroll-on-clear, the
+            # old screen is now in the scrollback where detection would see it
+            await self._run_io(self.session_manager.clear_history)
+            return True
+        if phase == RestartPhase.LAUNCH:
+            await self._run_io(self.session_manager.send_keys, self._get_claude_command())
+            return True
+        return await self._wait_until(self._claude_started, settings.monitoring.restart_startup_timeout)
+
+    async def _claude_exited(self) -> bool:
+        try:
+            command = await self._run_io(self.session_manager.get_current_command)
+        except Exception:
+            # If we can't get the command, assume it's terminated
+            return True
+        return "claude" not in str(command).lower()
+
+    async def _banner_shown(self) -> bool:
+        # Only the visible screen counts; the scrollback may hold the old banner
+        content = await self._run_io(self.session_manager.capture_visible_content)
+        return bool(CLAUDE_BANNER_PATTERN.search(str(content)))
+
+    async def _banner_cleared(self) -> bool:
+        return not await self._banner_shown()
+
+    async def _claude_started(self) -> bool:
+        # A banner only counts once Claude is the pane's command again
+        return not await self._claude_exited() and await self._banner_shown()
+
+    @staticmethod
+    async def _wait_until(condition: Callable[[], Any], timeout: float) -> bool:
+        """Poll an async condition every ``restart_poll_interval`` seconds.
+
+        Returns:
+            bool: True as soon as the condition holds, False on timeout.
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            if await condition():
+                return True
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(settings.monitoring.restart_poll_interval, remaining))
+
+    @staticmethod
+    async def _run_io(func: Callable[..., Any], *args: object) -> Any:
+        return await get_executor("tmux_io").run(func, *args)
+
+    async def _update_status_async(self, message: str) -> None:
+        await get_executor("handlers").run(self.status_manager.update_status, message)
+
     def _terminate_claude_process(self) -> None:
         """Terminate any existing claude process in the pane."""
         try:
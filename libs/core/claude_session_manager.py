@@ -6,6 +6,11 @@ import libtmux
 
 from libs.utils import ensure_log_directory, get_default_log_path
 
+from .pane_buffer import PaneBuffer, PaneContentView
+from .pane_roles import PaneRole, get_pane_role_index
+from .tmux_control import run_pane_command, send_pane_keys
+from .tmux_snapshot import get_fleet_snapshot
+
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Claude session and pane management."""
@@ -20,6 +25,7 @@ class ClaudeSessionManager:
         self.server = libtmux.Server()
         self.session: libtmux.Session | None = None
         self.claude_pane: libtmux.Pane | None = None
+        self._pane_buffer: PaneBuffer | None = None
         self.logger = self._setup_logger()
 
     def _setup_logger(self) -> logging.Logger:
@@ -72,42 +78,29 @@ class ClaudeSessionManager:
     def _find_claude_pane(self) -> libtmux.Pane | None:
         """Find pane running Claude.
 
+        Uses the shared pane role index, so only panes whose pid or command
+        changed since they were last classified are probed.
+
         Returns:
             Object object.
         """
         if not self.session:
             return None
 
-        for window in self.session.windows:
-            for pane in window.panes:
-                try:
-                    # Check both command and pane content
-                    cmd = pane.cmd("display-message", "-p", "#{pane_current_command}").stdout[0]
-
-                    # Capture pane content to check for Claude indicators
-                    capture_result = pane.cmd("capture-pane", "-p")
-                    content = "\n".join(capture_result.stdout) if capture_result.stdout else ""
-
-                    # Enhanced Claude detection patterns
-                    claude_indicators = [
-                        "claude" in cmd.lower(),
-                        "Welcome to Claude Code" in content,
-                        "? for shortcuts" in content,
-                        "Claude Code" in content,
-                        "anthropic" in content.lower(),
-                        "claude.ai" in content.lower(),
-                    ]
-
-                    if any(claude_indicators):
-                        self.logger.info("Found Claude pane: %s:%s", window.name, pane.index)
-                        return pane
-
-                except Exception as e:
-                    self.logger.debug("Error checking pane %s:%s: %s", window.name, pane.index, e)
-                    continue
-
-        self.logger.warning("No Claude pane found in any window")
-        return None
+        snapshot = get_fleet_snapshot(self.server)
+        entry = get_pane_role_index().find(snapshot, self.session_name, PaneRole.CLAUDE, server=self.server)
+        if entry is None:
+            self.logger.warning("No Claude pane found in any window")
+            return None
+
+        try:
+            pane = libtmux.Pane.from_pane_id(server=self.server, pane_id=entry.pane_id)
+        except Exception as e:
+            self.logger.debug("Error loading pane %s: %s", entry.pane_id, e)
+            return None
+
+        self.logger.info("Found Claude pane: %s:%s", entry.window_name, entry.pane_index)
+        return pane
 
     def get_claude_pane(self) -> object:
         """Get the Claude pane.
@@ -136,16 +129,63 @@ class ClaudeSessionManager:
 
         try:
             # Get the last N lines from the pane
-            result = self.claude_pane.cmd("capture-pane", "-p", "-S", f"-{lines}")
+            result = run_pane_command(self.claude_pane, "capture-pane", "-p", "-S", f"-{lines}")
             return "\n".join(result.stdout) if result.stdout else ""
         except Exception:
             self.logger.exception("Error capturing pane content")
             return ""
 
+    def capture_visible_content(self) -> str:
+        """Capture only the visible screen of the Claude pane, without scrollback.
+
+        Returns:
+        str: Visible pane content.
+        """
+        if not self.claude_pane:
+            return ""
+
+        try:
+            result = run_pane_command(self.claude_pane, "capture-pane", "-p")
+            return "\n".join(result.stdout) if result.stdout else ""
+        except Exception:
+            self.logger.exception("Error capturing visible pane content")
+            return ""
+
+    def clear_history(self) -> None:
+        """Drop the Claude pane's scrollback."""
+        if self.claude_pane:
+            run_pane_command(self.claude_pane, "clear-history")
+
+    def capture_pane_delta(self, lines: int = 50) -> PaneContentView:
+        """Capture only what changed in the Claude pane since the last call.
+
+        The returned view also carries the pane's current command, pid and
+        dead flag, read by the same tmux probe as the content.
+
+        Args:
+            lines: History lines to keep above the visible screen in the tail window
+
+        Returns:
+        PaneContentView: New lines plus the current tail window.
+        """
+        if not self.claude_pane:
+            return PaneContentView(changed=False)
+
+        pane_id = str(getattr(self.claude_pane, "pane_id", ""))
+        if self._pane_buffer is None or self._pane_buffer.pane_id != pane_id:
+            self._pane_buffer = PaneBuffer(pane_id)
+
+        try:
+            return self._pane_buffer.read(self.claude_pane, lines)
+        except Exception:
+            self.logger.exception("Error capturing pane delta")
+            self._pane_buffer.reset()
+            return PaneContentView.from_content(self.capture_pane_content(lines))
+
     def send_keys(self, keys: str) -> None:
         """Send keys to Claude pane."""
         if self.claude_pane:
-            self.claude_pane.send_keys(keys)
+            send_pane_keys(self.claude_pane, keys)
 
     def get_current_command(self) -> str:
         """Get current command running in Claude pane.
@@ -157,7 +197,7 @@ class ClaudeSessionManager:
             return ""
 
         try:
-            cmd = self.claude_pane.cmd("display-message", "-p", "#{pane_current_command}").stdout[0]
+            cmd = run_pane_command(self.claude_pane, "display-message", "-p", "#{pane_current_command}").stdout[0]
             return str(cmd) if cmd else ""
         except Exception:
             self.logger.exception("Error getting current command")
@@ -0,0 +1,120 @@
+# Copyright notice.
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Process-wide memo of prompt detection results.
+
+Sessions often sit on the same screen for minutes (a trust prompt, an idle
+shell), and different sessions often show identical Claude prompts. Detection
+results are therefore kept in one bounded LRU shared by every detector in the
+process, keyed by a fingerprint of the normalised prompt region.
+"""
+
+
+T = TypeVar("T")
+
+
+def fingerprint(text: str) -> bytes:
+    """Fingerprint a normalised prompt region.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the text.
+    """
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class DetectionCache:
+    """Thread-safe LRU of detection results keyed by fingerprint (plus anything that changes the result)."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Results kept before LRU eviction; 0 disables caching
+        """
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Get a cached result, computing and storing it on a miss.
+
+        ``None`` results are cached too. Concurrent misses for the same key may
+        both compute; the results are identical.
+
+        Returns:
+            T: Cached or freshly computed result.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]  # type: ignore[no-any-return]
+            self.misses += 1
+
+        value = compute()
+        if self.max_entries <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result, e.g. after the prompt patterns changed."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, Any]: Hit rate, hit, miss and eviction counts, and size.
+        """
+        with self._lock:
+            total_requests = self.hits + self.misses
+            return {
+                "hit_rate": self.hits / total_requests if total_requests else 0.0,
+                "total_requests": total_requests,
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "evictions": self.evictions,
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_cache: DetectionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_detection_cache() -> DetectionCache:
+    """Get the process-wide detection cache.
+
+    Returns:
+        DetectionCache: Shared cache sized by ``settings.monitoring.detection_cache_size``.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DetectionCache(max_entries=settings.monitoring.detection_cache_size)
+    return _cache
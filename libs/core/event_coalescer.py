@@ -0,0 +1,156 @@
+# Copyright notice.
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Rate limiting and coalescing for a monitor's activity and status events.
+
+A monitor reports "Content updated" on every changed frame and "Waiting for
+user input" on every tick, so many sessions can flood the event bus and push
+prompt events towards its drop path. :class:`EventCoalescer` lets at most one
+event per key through per window; later events in the window replace each
+other (the latest state wins) and are counted as suppressed. While the bus
+queue is filling up the window widens and emitted events are marked as
+summaries of what was coalesced.
+
+Only repeating states belong here. One-shot messages (a response that was
+sent, an error) must bypass the coalescer, or the next repeating state would
+replace them.
+"""
+
+
+@dataclass(frozen=True)
+class CoalescedEvent:
+    """An event let through by the coalescer.
+
+    Attributes:
+        key: Coalescing key, e.g. ``"activity:waiting"`` or ``"status:warning"``
+        message: Latest message for the key
+        suppressed: Earlier messages replaced by this one
+        summary: Whether it was emitted while the bus was under pressure
+    """
+
+    key: str
+    message: str
+    suppressed: int = 0
+    summary: bool = False
+
+
+class _Slot:
+    __slots__ = ("last_emit", "pending", "suppressed")
+
+    def __init__(self) -> None:
+        self.last_emit = float("-inf")
+        self.pending: str | None = None
+        self.suppressed = 0
+
+
+class EventCoalescer:
+    """Lets one event per key through per window; the latest message wins."""
+
+    def __init__(self, window: float | None = None, pressure_window: float | None = None, pressure_threshold: float | None = None) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            window: Seconds between events per key (``settings.monitoring.activity_event_window`` if None)
+            pressure_window: Window while the bus is under pressure (``settings.monitoring.activity_pressure_window`` if None)
+            pressure_threshold: Bus queue fill ratio that counts as pressure
+                (``settings.monitoring.activity_pressure_threshold`` if None)
+        """
+        monitoring = settings.monitoring
+        self.window = max(0.0, window if window is not None else monitoring.activity_event_window)
+        self.pressure_window = max(self.window, pressure_window if pressure_window is not None else monitoring.activity_pressure_window)
+        self.pressure_threshold = pressure_threshold if pressure_threshold is not None else monitoring.activity_pressure_threshold
+
+        self._slots: dict[str, _Slot] = {}
+
+        # Statistics
+        self.offered = 0
+        self.emitted = 0
+        self.suppressed = 0
+        self.summaries = 0
+
+    def offer(self, key: str, message: str, load: float = 0.0, now: float | None = None) -> CoalescedEvent | None:
+        """Offer an event.
+
+        Args:
+            key: Coalescing key
+            message: Event message
+            load: Current event bus queue fill ratio
+            now: ``time.monotonic()`` if None
+
+        Returns:
+            CoalescedEvent | None: The event to publish now, or None if it was
+            held back until the window ends.
+        """
+        now = time.monotonic() if now is None else now
+        self.offered += 1
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _Slot()
+
+        if slot.pending is not None:
+            # The held-back message is replaced by this one
+            slot.suppressed += 1
+            self.suppressed += 1
+
+        if now - slot.last_emit >= self._window(load):
+            return self._emit(key, slot, message, load, now)
+
+        slot.pending = message
+        return None
+
+    def flush(self, load: float = 0.0, now: float | None = None, force: bool = False) -> list[CoalescedEvent]:
+        """Emit held-back events whose window has ended.
+
+        Args:
+            load: Current event bus queue fill ratio
+            now: ``time.monotonic()`` if None
+            force: Emit every held-back event regardless of its window
+
+        Returns:
+            list[CoalescedEvent]: Events to publish now.
+        """
+        now = time.monotonic() if now is None else now
+        window = self._window(load)
+        return [
+            self._emit(key, slot, slot.pending, load, now)
+            for key, slot in list(self._slots.items())
+            if slot.pending is not None and (force or now - slot.last_emit >= window)
+        ]
+
+    def _window(self, load: float) -> float:
+        return self.pressure_window if load >= self.pressure_threshold else self.window
+
+    def _emit(self, key: str, slot: _Slot, message: str, load: float, now: float) -> CoalescedEvent:
+        summary = load >= self.pressure_threshold
+        event = CoalescedEvent(key=key, message=message, suppressed=slot.suppressed, summary=summary)
+        slot.last_emit = now
+        slot.pending = None
+        slot.suppressed = 0
+        self.emitted += 1
+        if summary:
+            self.summaries += 1
+        return event
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescer statistics.
+
+        Returns:
+            dict[str, Any]: Windows, offered/emitted/suppressed counts and the
+            number of events held back right now.
+        """
+        return {
+            "window": self.window,
+            "pressure_window": self.pressure_window,
+            "offered": self.offered,
+            "emitted": self.emitted,
+            "suppressed": self.suppressed,
+            "summaries": self.summaries,
+            "pending": sum(1 for slot in self._slots.values() if slot.pending is not None),
+        }
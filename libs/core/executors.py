@@ -0,0 +1,189 @@
+# Copyright notice.
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Named, size-limited thread pools for blocking work.
+
+Pane captures, Claude restarts, prompt detection and sync event handlers used
+to share the event loop's default executor, so one slow restart or a burst of
+handlers delayed pane captures for every session. Each kind of work now has
+its own pool (see :data:`EXECUTOR_NAMES`), sized in ``settings.executors``,
+and every pool reports its queue depth and how long work waited to start.
+"""
+
+
+logger = logging.getLogger("yesman.executors")
+
+T = TypeVar("T")
+
+# Executor name -> settings.executors attribute holding its size
+EXECUTOR_NAMES: dict[str, str] = {
+    "tmux_io": "tmux_io_workers",  # pane captures, status probes, send-keys
+    "process_control": "process_control_workers",  # Claude restarts
+    "detection": "detection_workers",  # prompt detection and content analysis
+    "handlers": "handler_workers",  # sync event handlers and status callbacks
+}
+
+
+class BoundedExecutor:
+    """Thread pool with a fixed worker count that tracks queueing."""
+
+    def __init__(self, name: str, max_workers: int, window: int = 200) -> None:
+        """Initialize the executor.
+
+        Args:
+            name: Executor name, also used as the thread name prefix
+            max_workers: Worker threads
+            window: Wait/run time samples kept for the statistics
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"yesman-{name}")
+        self._lock = threading.Lock()
+        self._wait_ms: deque[float] = deque(maxlen=window)
+        self._run_ms: deque[float] = deque(maxlen=window)
+
+        # Statistics
+        self.queued = 0
+        self.active = 0
+        self.submitted = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        """Schedule a call.
+
+        Returns:
+            Future[T]: Future for the call's result.
+        """
+        queued_at = time.perf_counter()
+        with self._lock:
+            self.submitted += 1
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        started = threading.Event()
+
+        def call() -> T:
+            begin = time.perf_counter()
+            started.set()
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self._wait_ms.append((begin - queued_at) * 1000)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    self._run_ms.append((time.perf_counter() - begin) * 1000)
+
+        future = self._executor.submit(call)
+        future.add_done_callback(lambda f: self._forget_cancelled(f, started))
+        return future
+
+    def _forget_cancelled(self, future: Future, started: threading.Event) -> None:
+        if future.cancelled() and not started.is_set():
+            with self._lock:
+                self.queued -= 1
+
+    async def run(self, fn: Callable[..., T], /, *args: Any) -> T:
+        """Run a call on the executor and await its result.
+
+        Returns:
+            T: The call's result.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker threads, dropping queued work."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get executor statistics.
+
+        Returns:
+            dict[str, Any]: Size, queue depth, active workers, counters and
+            wait/run time summaries in milliseconds.
+        """
+        with self._lock:
+            waits = sorted(self._wait_ms)
+            runs = list(self._run_ms)
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queue_depth,
+                "active": self.active,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "avg_wait_ms": sum(waits) / len(waits) if waits else 0.0,
+                "p95_wait_ms": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+                "max_wait_ms": waits[-1] if waits else 0.0,
+                "avg_run_ms": sum(runs) / len(runs) if runs else 0.0,
+                "saturated": self.active >= self.max_workers and self.queued > 0,
+            }
+
+
+_executors: dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Get a process-wide named executor, creating it on first use.
+
+    Args:
+        name: One of :data:`EXECUTOR_NAMES`
+
+    Returns:
+        BoundedExecutor: Shared executor.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+
+    if name not in EXECUTOR_NAMES:
+        msg = f"Unknown executor '{name}' (expected one of {', '.join(EXECUTOR_NAMES)})"
+        raise ValueError(msg)
+
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _executors[name] = BoundedExecutor(name, getattr(settings.executors, EXECUTOR_NAMES[name]))
+            logger.debug("Created executor %s with %d workers", name, executor.max_workers)
+    return executor
+
+
+def get_executor_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for every executor created so far.
+
+    Returns:
+        dict[str, dict[str, Any]]: Statistics keyed by executor name.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.get_stats() for executor in executors}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down and forget every executor; they are recreated on next use."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
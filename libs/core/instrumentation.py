@@ -0,0 +1,297 @@
+# Copyright notice.
+
+import bisect
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from .settings import settings
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Span-style timing for hot paths, with sampled resource probes.
+
+``with recorder.span("prompt_detection"):`` measures the block with
+``time.perf_counter()`` only. Memory and CPU probes cost syscalls, so they run
+for a sampled fraction of spans (``settings.monitoring.probe_sample_rate``).
+Probes read the whole process, so a span that awaits, or runs while other
+threads work, reports the memory and CPU the process used during the span,
+not what the span's own code used.
+When instrumentation is disabled, :meth:`SpanRecorder.span` returns a shared
+no-op span and nothing is measured at all.
+
+:class:`LatencyHistogram` keeps end-to-end latencies, such as how long a prompt
+waited for its answer, with percentiles over sliding time windows.
+"""
+
+
+logger = logging.getLogger("yesman.instrumentation")
+
+
+@dataclass(frozen=True)
+class ResourceProbe:
+    """Process-wide memory and CPU time at one instant."""
+
+    rss_bytes: int
+    cpu_seconds: float
+
+    @classmethod
+    def take(cls, process: Any) -> "ResourceProbe | None":
+        """Probe a psutil process.
+
+        Returns:
+            ResourceProbe | None: The probe, or None if the process cannot be read.
+        """
+        try:
+            with process.oneshot():
+                cpu_times = process.cpu_times()
+                return cls(rss_bytes=process.memory_info().rss, cpu_seconds=cpu_times.user + cpu_times.system)
+        except Exception:
+            return None
+
+
+class _NullSpan:
+    """Span returned when instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> bool:
+        return False
+
+    def fail(self) -> None:
+        """Ignored."""
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed execution of a named block."""
+
+    __slots__ = ("_probe", "_recorder", "_started", "name", "success")
+
+    def __init__(self, recorder: "SpanRecorder", name: str, sampled: bool) -> None:
+        self._recorder = recorder
+        self.name = name
+        self.success = True
+        self._probe: ResourceProbe | None = recorder._probe() if sampled else None
+        self._started = 0.0
+
+    def __enter__(self) -> "Span":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> bool:
+        elapsed = time.perf_counter() - self._started
+        self._recorder._finish(self.name, elapsed, self.success and exc_type is None, self._probe)
+        return False
+
+    def fail(self) -> None:
+        """Mark the span as failed without raising."""
+        self.success = False
+
+
+class _SpanStats:
+    __slots__ = ("cpu_percent", "durations_ms", "errors", "failures", "memory_delta_mb", "peak_cpu_percent", "peak_memory_delta_mb", "peak_ms")
+
+    def __init__(self, window: int) -> None:
+        self.durations_ms: deque[float] = deque(maxlen=window)
+        # Failure flags for the same spans as durations_ms
+        self.failures: deque[bool] = deque(maxlen=window)
+        self.memory_delta_mb: deque[float] = deque(maxlen=window)
+        self.cpu_percent: deque[float] = deque(maxlen=window)
+        self.peak_ms = 0.0
+        self.peak_memory_delta_mb = 0.0
+        self.peak_cpu_percent = 0.0
+        self.errors = 0
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+# Upper bounds of the latency histogram buckets in ms; one more bucket holds everything slower
+LATENCY_BUCKETS_MS = (100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 30000.0)
+
+
+class LatencyHistogram:
+    """Latency samples with lifetime bucket counts and sliding-window percentiles."""
+
+    def __init__(self, windows: Iterable[float] = (60.0, 300.0, 3600.0), max_samples: int = 1000) -> None:
+        """Initialize the histogram.
+
+        Args:
+            windows: Lengths in seconds of the windows percentiles are reported over
+            max_samples: Most recent samples kept for the windows
+        """
+        self.windows = tuple(sorted(windows))
+        self._samples: deque[tuple[float, float]] = deque(maxlen=max_samples)
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def record(self, latency_ms: float, now: float | None = None) -> None:
+        """Add one sample, timestamped with ``time.monotonic()`` unless ``now`` is given."""
+        self._samples.append((time.monotonic() if now is None else now, latency_ms))
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        """Summarize the samples.
+
+        Returns:
+            dict[str, Any]: Lifetime count, average and bucket counts, plus
+            p50/p95/p99/max per sliding window.
+        """
+        now = time.monotonic() if now is None else now
+        samples = list(self._samples)
+        labels = [f"<={bound:g}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]:g}ms"]
+        windows = {}
+        for window in self.windows:
+            values = sorted(latency for recorded_at, latency in samples if now - recorded_at <= window)
+            windows[f"{window:g}s"] = {
+                "count": len(values),
+                "p50_ms": values[len(values) // 2] if values else 0.0,
+                "p95_ms": _percentile(values, 0.95) if values else 0.0,
+                "p99_ms": _percentile(values, 0.99) if values else 0.0,
+                "max_ms": values[-1] if values else 0.0,
+            }
+        return {
+            "count": self.count,
+            "average_ms": self.total_ms / self.count if self.count else 0.0,
+            "buckets": dict(zip(labels, self.bucket_counts, strict=True)),
+            "windows": windows,
+        }
+
+
+class SpanRecorder:
+    """Collects span timings, and sampled resource deltas, per span name."""
+
+    def __init__(self, enabled: bool | None = None, probe_sample_rate: float | None = None, window: int = 100) -> None:
+        """Initialize the recorder.
+
+        Args:
+            enabled: Whether spans are measured (``settings.monitoring.instrumentation_enabled`` if None)
+            probe_sample_rate: Fraction of spans that also probe memory and CPU
+                (``settings.monitoring.probe_sample_rate`` if None)
+            window: Samples kept per span name
+        """
+        self.enabled = settings.monitoring.instrumentation_enabled if enabled is None else enabled
+        rate = settings.monitoring.probe_sample_rate if probe_sample_rate is None else probe_sample_rate
+        self.probe_sample_rate = min(1.0, max(0.0, rate)) if PSUTIL_AVAILABLE else 0.0
+        self.window = window
+
+        self._stats: dict[str, _SpanStats] = {}
+        self._process = psutil.Process() if self.probe_sample_rate > 0 else None
+
+        # Statistics
+        self.spans = 0
+        self.probed_spans = 0
+
+    def span(self, name: str) -> Span | _NullSpan:
+        """Time a block of code.
+
+        Returns:
+            Span | _NullSpan: Context manager; a shared no-op when disabled.
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        sampled = self.probe_sample_rate > 0 and (self.probe_sample_rate >= 1.0 or random.random() < self.probe_sample_rate)
+        return Span(self, name, sampled)
+
+    def _probe(self) -> ResourceProbe | None:
+        return ResourceProbe.take(self._process) if self._process is not None else None
+
+    def _finish(self, name: str, elapsed: float, success: bool, before: ResourceProbe | None) -> None:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _SpanStats(self.window)
+
+        duration_ms = elapsed * 1000
+        stats.durations_ms.append(duration_ms)
+        stats.peak_ms = max(stats.peak_ms, duration_ms)
+        stats.failures.append(not success)
+        if not success:
+            stats.errors += 1
+        self.spans += 1
+
+        if before is None:
+            return
+        after = self._probe()
+        if after is None:
+            return
+        self.probed_spans += 1
+        memory_delta_mb = (after.rss_bytes - before.rss_bytes) / (1024 * 1024)
+        cpu_percent = (after.cpu_seconds - before.cpu_seconds) / elapsed * 100 if elapsed > 0 else 0.0
+        stats.memory_delta_mb.append(memory_delta_mb)
+        stats.cpu_percent.append(cpu_percent)
+        if abs(memory_delta_mb) > abs(stats.peak_memory_delta_mb):
+            stats.peak_memory_delta_mb = memory_delta_mb
+        stats.peak_cpu_percent = max(stats.peak_cpu_percent, cpu_percent)
+
+    def get_metrics(self, names: Iterable[str] | None = None) -> dict[str, dict[str, float]]:
+        """Summarize the recorded spans.
+
+        Args:
+            names: Span names to include, with zeroed entries for names never
+                recorded (every recorded name if None)
+
+        Returns:
+            dict[str, dict[str, float]]: Timing percentiles, lifetime error
+            count, error rate over the sample window and sampled process-wide
+            memory/CPU deltas per span name.
+        """
+        metrics = {}
+        for name in self._stats if names is None else names:
+            stats = self._stats.get(name) or _SpanStats(0)
+            durations = sorted(stats.durations_ms)
+            count = len(durations)
+            memory = list(stats.memory_delta_mb)
+            cpu = list(stats.cpu_percent)
+            metrics[name] = {
+                "average_ms": sum(durations) / count if count else 0,
+                "median_ms": durations[count // 2] if count else 0,
+                "p95_ms": _percentile(durations, 0.95) if count else 0,
+                "p99_ms": _percentile(durations, 0.99) if count else 0,
+                "peak_ms": stats.peak_ms,
+                "sample_count": count,
+                "error_count": stats.errors,
+                "error_rate": sum(stats.failures) / count if count else 0,
+                "avg_memory_delta_mb": sum(memory) / len(memory) if memory else 0,
+                "peak_memory_delta_mb": stats.peak_memory_delta_mb,
+                "memory_sample_count": len(memory),
+                "avg_cpu_percent": sum(cpu) / len(cpu) if cpu else 0,
+                "peak_cpu_percent": stats.peak_cpu_percent,
+                "cpu_sample_count": len(cpu),
+            }
+        return metrics
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get recorder statistics.
+
+        Returns:
+            dict[str, Any]: Enabled flag, sample rate and span counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "probe_sample_rate": self.probe_sample_rate,
+            "spans": self.spans,
+            "probed_spans": self.probed_spans,
+        }
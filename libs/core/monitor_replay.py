@@ -0,0 +1,332 @@
+# Copyright notice.
+
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from libs.ai.adaptive_response import AdaptiveConfig, AdaptiveResponse
+
+from .async_event_bus import AsyncEventBus
+from .claude_monitor_async import AsyncClaudeMonitor
+from .instrumentation import SpanRecorder
+from .pane_buffer import PaneContentView, PaneState
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Replay recorded pane frames through the real monitor pipeline.
+
+:class:`MonitorReplay` drives an :class:`~libs.core.claude_monitor_async.AsyncClaudeMonitor`
+tick by tick with fake tmux-facing collaborators, so the capture, status check,
+detection and response path can be benchmarked without live panes. Frames come
+from ``ClaudeContentCollector`` JSON files or a JSONL trace with one
+``{"content": ..., "timestamp": ...}`` object per line.
+"""
+
+
+logger = logging.getLogger("yesman.monitor_replay")
+
+
+@dataclass(frozen=True)
+class ReplayFrame:
+    """One recorded pane frame.
+
+    Attributes:
+        content: Pane content as captured
+        offset: Seconds since the first frame of the recording
+    """
+
+    content: str
+    offset: float = 0.0
+
+
+def _parse_timestamp(value: Any) -> float | None:
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _frames_from_records(records: list[dict[str, Any]]) -> list[ReplayFrame]:
+    # Records without a usable timestamp are spaced one poll interval apart
+    frames = []
+    first: float | None = None
+    previous_offset = -settings.monitoring.poll_interval
+    for record in records:
+        timestamp = _parse_timestamp(record.get("timestamp"))
+        if timestamp is None:
+            offset = previous_offset + settings.monitoring.poll_interval
+        else:
+            first = timestamp if first is None else first
+            offset = max(previous_offset, timestamp - first)
+        frames.append(ReplayFrame(content=str(record["content"]), offset=offset))
+        previous_offset = offset
+    return frames
+
+
+def load_frames(path: str | Path) -> list[ReplayFrame]:
+    """Load recorded frames.
+
+    Args:
+        path: A JSONL trace, a single collector JSON file, or a directory of
+            collector files (``interaction_*.json`` and ``raw_*.json``)
+
+    Returns:
+        list[ReplayFrame]: Frames in recording order.
+
+    Raises:
+        ValueError: If a record has no ``content``.
+    """
+    path = Path(path)
+    records: list[dict[str, Any]] = []
+    if path.is_dir():
+        for file_path in sorted([*path.glob("interaction_*.json"), *path.glob("raw_*.json")]):
+            records.append(json.loads(file_path.read_text(encoding="utf-8")))
+        records.sort(key=lambda record: _parse_timestamp(record.get("timestamp")) or 0.0)
+    elif path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    else:
+        records = [json.loads(path.read_text(encoding="utf-8"))]
+
+    for index, record in enumerate(records):
+        if "content" not in record:
+            msg = f"Replay record {index} in {path} has no content"
+            raise ValueError(msg)
+    return _frames_from_records(records)
+
+
+class ReplaySessionManager:
+    """Session manager that serves the frame currently being replayed."""
+
+    def __init__(self, session_name: str = "replay") -> None:
+        self.session_name = session_name
+        self.content = ""
+        self._previous = ""
+        self.captures = 0
+
+    def show(self, content: str) -> None:
+        """Make ``content`` the pane's current frame."""
+        self.content = content
+
+    def get_claude_pane(self) -> object:
+        """The replayed pane always exists."""
+        return self
+
+    def capture_pane_content(self, lines: int = 50) -> str:
+        """Return the current frame."""
+        self.captures += 1
+        return self.content
+
+    def capture_pane_delta(self, lines: int = 50) -> PaneContentView:
+        """Return the current frame diffed against the previous capture, with a live pane state."""
+        self.captures += 1
+        view = PaneContentView.from_content(self.content, self._previous)
+        view.pane = PaneState(current_command="claude", pid=0, dead=False, activity=int(time.time()))
+        self._previous = self.content
+        return view
+
+
+class ReplayProcessController:
+    """Process controller that records the keystrokes the monitor sends."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.restarts = 0
+
+    def is_claude_running(self) -> bool:
+        """Claude is always running in a replay."""
+        return True
+
+    def send_input(self, text: str) -> None:
+        """Record a response."""
+        self.sent.append(text)
+
+    def restart_claude_pane(self) -> None:
+        """Count a restart request."""
+        self.restarts += 1
+
+
+class ReplayStatusManager:
+    """Status manager that discards dashboard updates."""
+
+    def update_status(self, status: str) -> None:
+        """Ignored."""
+
+    def update_activity(self, activity: str) -> None:
+        """Ignored."""
+
+    def record_response(self, prompt_type: str, response: str, content: str) -> None:
+        """Ignored."""
+
+
+class _NullCollector:
+    """Content collector that keeps replayed frames out of the interaction logs."""
+
+    def collect_interaction(self, content: str, prompt_info: dict | None = None, response: str | None = None) -> bool:
+        return False
+
+    def cleanup_old_files(self, days_to_keep: int = 7) -> int:
+        return 0
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    count = len(ordered)
+    if not count:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {
+        "p50_ms": ordered[count // 2],
+        "p95_ms": ordered[min(count - 1, int(count * 0.95))],
+        "p99_ms": ordered[min(count - 1, int(count * 0.99))],
+        "max_ms": ordered[-1],
+    }
+
+
+@dataclass
+class ReplayReport:
+    """Throughput and latency of one replay.
+
+    Attributes:
+        frames: Frames replayed
+        elapsed_seconds: Wall time of the replay, including pacing waits
+        busy_seconds: Time spent inside monitor ticks
+        frame_latency_ms: Percentiles of capture-to-response time per frame
+        detection_latency_ms: Percentiles of the prompt detection span
+        components: Span metrics per monitor component
+        skipped_frames: Frames the monitor recognised as unchanged
+        responses: Keystrokes the monitor sent
+    """
+
+    frames: int
+    elapsed_seconds: float
+    busy_seconds: float
+    frame_latency_ms: dict[str, float]
+    detection_latency_ms: dict[str, float]
+    components: dict[str, dict[str, float]]
+    skipped_frames: int = 0
+    responses: list[str] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames replayed per second of wall time."""
+        return self.frames / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def max_frames_per_second(self) -> float:
+        """Frames the pipeline could process per second with no pacing."""
+        return self.frames / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dict.
+
+        Returns:
+            dict[str, Any]: Report fields plus the derived rates.
+        """
+        return {
+            "frames": self.frames,
+            "elapsed_seconds": self.elapsed_seconds,
+            "busy_seconds": self.busy_seconds,
+            "frames_per_second": self.frames_per_second,
+            "max_frames_per_second": self.max_frames_per_second,
+            "frame_latency_ms": self.frame_latency_ms,
+            "detection_latency_ms": self.detection_latency_ms,
+            "components": self.components,
+            "skipped_frames": self.skipped_frames,
+            "responses": self.responses,
+        }
+
+
+class MonitorReplay:
+    """Feeds recorded frames into an AsyncClaudeMonitor and measures it."""
+
+    def __init__(self, frames: list[ReplayFrame], speed: float | None = None, session_name: str = "replay", auto_respond: bool = True) -> None:
+        """Initialize the replay.
+
+        Args:
+            frames: Frames to replay, in order
+            speed: Playback speed relative to the recording (2.0 replays twice
+                as fast); None or 0 replays as fast as possible
+            session_name: Session name the monitor reports
+            auto_respond: Whether the monitor answers detected prompts
+        """
+        self.frames = frames
+        self.speed = speed or None
+        self.session_manager = ReplaySessionManager(session_name)
+        self.process_controller = ReplayProcessController()
+        self.status_manager = ReplayStatusManager()
+        self.auto_respond = auto_respond
+
+    def _build_monitor(self, event_bus: AsyncEventBus, data_dir: Path) -> AsyncClaudeMonitor:
+        # Empty learning data that the replay never writes to: answers do not depend
+        # on, or leak into, the user's response history. The human-like reply
+        # delay is not loop cost.
+        adaptive_response = AdaptiveResponse(
+            config=AdaptiveConfig(min_confidence_threshold=0.7, learning_enabled=False, auto_response_enabled=True, response_delay_ms=0),
+            data_dir=data_dir,
+        )
+        monitor = AsyncClaudeMonitor(self.session_manager, self.process_controller, self.status_manager, event_bus=event_bus, adaptive_response=adaptive_response)
+        monitor.is_auto_next_enabled = self.auto_respond
+        # Every span is kept; probes would skew the timings being measured
+        monitor._spans = SpanRecorder(enabled=True, probe_sample_rate=0.0, window=max(100, len(self.frames)))
+        monitor.content_collector = _NullCollector()  # type: ignore[assignment]
+        return monitor
+
+    async def run(self) -> ReplayReport:
+        """Replay every frame through the monitor.
+
+        Returns:
+            ReplayReport: Throughput, latency percentiles and component timings.
+        """
+        event_bus = AsyncEventBus()
+        await event_bus.start()
+        data_dir = tempfile.TemporaryDirectory(prefix="yesman-replay-")
+        monitor = self._build_monitor(event_bus, Path(data_dir.name))
+        latencies_ms: list[float] = []
+
+        started = time.perf_counter()
+        try:
+            for frame in self.frames:
+                if self.speed is not None:
+                    delay = started + frame.offset / self.speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                self.session_manager.show(frame.content)
+                tick_started = time.perf_counter()
+                await monitor._tick_async()
+                latencies_ms.append((time.perf_counter() - tick_started) * 1000)
+        finally:
+            elapsed = time.perf_counter() - started
+            await event_bus.stop()
+            data_dir.cleanup()
+
+        components = monitor._get_component_metrics()
+        detection = components["prompt_detection"]
+        report = ReplayReport(
+            frames=len(latencies_ms),
+            elapsed_seconds=elapsed,
+            busy_seconds=sum(latencies_ms) / 1000,
+            frame_latency_ms=_percentiles(latencies_ms),
+            detection_latency_ms={
+                "p50_ms": detection["median_ms"],
+                "p95_ms": detection["p95_ms"],
+                "p99_ms": detection["p99_ms"],
+                "max_ms": detection["peak_ms"],
+            },
+            components=components,
+            skipped_frames=monitor._frames_skipped,
+            responses=list(self.process_controller.sent),
+        )
+        logger.info("Replayed %d frames in %.2fs (%.1f frames/s)", report.frames, report.elapsed_seconds, report.frames_per_second)
+        return report
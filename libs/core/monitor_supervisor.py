@@ -0,0 +1,240 @@
+# Copyright notice.
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .claude_monitor_async import AsyncClaudeMonitor
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Run every session's monitor on one event loop.
+
+A ``ClaudeMonitor`` owns an OS thread with a private event loop, and every
+blocking tmux call it makes lands in that loop's default executor, so a host
+with 50 sessions runs well over 50 threads. :class:`MonitorSupervisor` runs
+all :class:`~libs.core.claude_monitor_async.AsyncClaudeMonitor` instances as
+tasks on a single loop thread whose default executor is one bounded pool
+(``settings.monitoring.supervisor_workers``).
+"""
+
+
+logger = logging.getLogger("yesman.monitor_supervisor")
+
+T = TypeVar("T")
+
+# Seconds a caller waits for a monitor to start or stop
+CALL_TIMEOUT = 15.0
+
+
+class MonitorSupervisor:
+    """Runs AsyncClaudeMonitor instances as tasks on one shared event loop."""
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the supervisor; the loop thread starts with the first monitor.
+
+        Args:
+            max_workers: Threads in the shared executor (``settings.monitoring.supervisor_workers`` if None)
+        """
+        self.max_workers = max(1, max_workers if max_workers is not None else settings.monitoring.supervisor_workers)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._monitors: dict[str, AsyncClaudeMonitor] = {}
+        self._started_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self.is_active:
+                return self._loop
+
+            ready = threading.Event()
+            loop = asyncio.new_event_loop()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="yesman-monitor")
+            loop.set_default_executor(self._executor)
+            self._thread = threading.Thread(target=self._run_loop, args=(loop, ready), name="yesman-monitor-supervisor", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            logger.info("Monitor supervisor started with %d executor threads", self.max_workers)
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _call(self, coro: Coroutine[Any, Any, T], timeout: float = CALL_TIMEOUT) -> T:
+        """Run a coroutine on the supervisor loop and wait for its result.
+
+        Raises:
+            RuntimeError: If called from the supervisor loop itself.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            msg = "MonitorSupervisor cannot be called synchronously from its own loop"
+            raise RuntimeError(msg)
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def start(self, session_name: str, monitor: AsyncClaudeMonitor) -> bool:
+        """Start a monitor on the shared loop, replacing a stopped one for the session.
+
+        Args:
+            session_name: Session the monitor watches
+            monitor: Monitor to run
+
+        Returns:
+            bool: True if the monitor is running.
+        """
+        current = self.get(session_name)
+        if current is not None and current.is_running:
+            return current is monitor
+
+        try:
+            started = self._call(monitor.start_monitoring_async())
+        except Exception:
+            logger.exception("Failed to start monitor for %s", session_name)
+            return False
+
+        if started:
+            with self._lock:
+                self._monitors[session_name] = monitor
+                self._started_at[session_name] = time.time()
+        return started
+
+    def stop(self, session_name: str) -> bool:
+        """Stop and forget a session's monitor.
+
+        Returns:
+            bool: True if a running monitor was stopped.
+        """
+        with self._lock:
+            monitor = self._monitors.pop(session_name, None)
+            self._started_at.pop(session_name, None)
+        if monitor is None or not monitor.is_running:
+            return False
+
+        try:
+            return self._call(monitor.stop_monitoring_async())
+        except Exception:
+            logger.exception("Failed to stop monitor for %s", session_name)
+            return False
+
+    def stop_all(self) -> None:
+        """Stop every monitor."""
+        with self._lock:
+            session_names = list(self._monitors)
+        for session_name in session_names:
+            self.stop(session_name)
+
+    def shutdown(self) -> None:
+        """Stop every monitor, then the loop thread and its executor."""
+        self.stop_all()
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get(self, session_name: str) -> AsyncClaudeMonitor | None:
+        """Get the monitor registered for a session.
+
+        Returns:
+            AsyncClaudeMonitor | None: The monitor, or None if none was started.
+        """
+        with self._lock:
+            return self._monitors.get(session_name)
+
+    def is_running(self, session_name: str) -> bool:
+        """Check whether a session's monitor is running.
+
+        Returns:
+            bool: True if the session has a running monitor.
+        """
+        monitor = self.get(session_name)
+        return monitor is not None and monitor.is_running
+
+    def list_monitors(self) -> list[dict[str, Any]]:
+        """Describe every registered monitor.
+
+        Returns:
+            list[dict[str, Any]]: Session name, running flag, start time, loop count
+            and current poll interval per monitor.
+        """
+        with self._lock:
+            monitors = sorted(self._monitors.items())
+            started_at = dict(self._started_at)
+        return [
+            {
+                "session_name": session_name,
+                "running": monitor.is_running,
+                "started_at": started_at.get(session_name),
+                **monitor.get_loop_stats(),
+            }
+            for session_name, monitor in monitors
+        ]
+
+    def get_prompt_latency(self) -> dict[str, dict[str, Any]]:
+        """Get prompt-to-keystroke latency for every registered monitor.
+
+        Returns:
+            dict[str, dict[str, Any]]: Latency histograms keyed by session name.
+        """
+        with self._lock:
+            monitors = sorted(self._monitors.items())
+        return {session_name: monitor.get_prompt_latency_stats() for session_name, monitor in monitors}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get supervisor statistics.
+
+        Returns:
+            dict[str, Any]: Loop state, monitor counts and executor size.
+        """
+        with self._lock:
+            monitors = list(self._monitors.values())
+        return {
+            "active": self.is_active,
+            "monitors": len(monitors),
+            "running_monitors": sum(1 for monitor in monitors if monitor.is_running),
+            "executor_workers": self.max_workers,
+        }
+
+
+_supervisor: MonitorSupervisor | None = None
+_supervisor_lock = threading.Lock()
+
+
+def get_monitor_supervisor() -> MonitorSupervisor:
+    """Get the process-wide supervisor shared by all controllers.
+
+    Returns:
+        MonitorSupervisor: Shared supervisor.
+    """
+    global _supervisor
+    if _supervisor is None:
+        with _supervisor_lock:
+            if _supervisor is None:
+                _supervisor = MonitorSupervisor()
+    return _supervisor
@@ -0,0 +1,300 @@
+# Copyright notice.
+
+import logging
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from .tmux_control import run_pane_command, run_pane_commands
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Incremental pane capture backed by a rolling line buffer.
+
+Re-reading the last N lines of a pane every poll repeats the same tmux output
+and string work even when nothing has changed. :class:`PaneBuffer` asks tmux
+for the pane's ``history_size``/``cursor_y`` first, skips the capture entirely
+when the pane is idle, and otherwise fetches only the lines that scrolled into
+history since the last read plus the (mutable) visible screen.
+
+The same probe also reports the pane's current command, pid, dead flag and
+whether a ``pipe-pane`` is attached (:class:`PaneState`), so a monitor learns
+whether Claude is still running and its output stream still fed without a
+separate tmux call.
+
+While the pane is producing output, the probe is pipelined with a speculative
+capture of the tail in one control-mode round-trip; the capture is used when
+it covers what scrolled since the last read. While the pane is idle only the
+probe is sent, since the capture would usually be skipped.
+"""
+
+
+logger = logging.getLogger("yesman.pane_buffer")
+
+# pane_current_command goes last because it may contain spaces
+_PROBE_FORMAT = "#{history_size} #{cursor_y} #{pane_height} #{pane_width} #{window_activity} #{pane_pid} #{pane_dead} #{pane_pipe} #{pane_current_command}"
+
+
+def content_fingerprint(content: str) -> int:
+    """Cheap identity for a frame of pane content.
+
+    Returns:
+        int: CRC32 of the content combined with its length.
+    """
+    return (len(content) << 32) | zlib.crc32(content.encode("utf-8", "surrogateescape"))
+
+
+def _strip_trailing_blank(lines: list[str]) -> list[str]:
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    return lines[:end]
+
+
+@dataclass(frozen=True)
+class PaneState:
+    """Process state of a pane, read alongside its content.
+
+    Attributes:
+        current_command: Command running in the foreground of the pane
+        pid: Pid of the pane's initial process
+        dead: Whether that process has exited (``remain-on-exit`` panes)
+        activity: Time of the last window activity, in whole seconds
+        piped: Whether a ``pipe-pane`` command is attached to the pane
+    """
+
+    current_command: str
+    pid: int
+    dead: bool
+    activity: int
+    piped: bool = False
+
+    def runs(self, name: str) -> bool:
+        """Check whether a live pane runs a command containing ``name`` (case-insensitive).
+
+        Returns:
+            bool: True if the pane is alive and the command matches.
+        """
+        return not self.dead and name.lower() in self.current_command.lower()
+
+
+@dataclass
+class PaneContentView:
+    """What changed in a pane since the previous read.
+
+    Attributes:
+        new_lines: Lines appended or rewritten since the previous read
+        tail: Last lines of the pane (the window prompt detection works on)
+        changed: Whether anything changed since the previous read
+        resynced: Whether the buffer was rebuilt from a full capture
+        pane: Pane process state from the same probe, if tmux reported it
+    """
+
+    new_lines: list[str] = field(default_factory=list)
+    tail: list[str] = field(default_factory=list)
+    changed: bool = True
+    resynced: bool = False
+    pane: PaneState | None = None
+
+    @property
+    def content(self) -> str:
+        """Tail window joined into the string form used by the detectors."""
+        return "\n".join(self.tail)
+
+    @classmethod
+    def from_content(cls, content: str, previous: str = "") -> "PaneContentView":
+        """Build a view from a plain full capture.
+
+        Returns:
+            PaneContentView: View whose new lines are the lines not present in ``previous``.
+        """
+        lines = content.split("\n") if content else []
+        if content == previous:
+            return cls(tail=lines, changed=False)
+        previous_lines = set(previous.split("\n")) if previous else set()
+        return cls(new_lines=[line for line in lines if line not in previous_lines], tail=lines, changed=True, resynced=True)
+
+
+def _parse_pane_state(fields: list[str], activity: int) -> PaneState | None:
+    # Fields after the position probe: pane_pid, pane_dead, pane_pipe, pane_current_command
+    if len(fields) < 3 or not fields[0].isdigit() or fields[1] not in {"0", "1"} or fields[2] not in {"0", "1"}:
+        return None
+    return PaneState(
+        current_command=fields[3] if len(fields) > 3 else "",
+        pid=int(fields[0]),
+        dead=fields[1] == "1",
+        activity=activity,
+        piped=fields[2] == "1",
+    )
+
+
+class PaneBuffer:
+    """Rolling buffer of one pane's output, refreshed incrementally.
+
+    The buffer holds lines that already scrolled into tmux history (these no
+    longer change) followed by the visible screen as of the last read.
+    """
+
+    def __init__(self, pane_id: str, max_lines: int = 2000) -> None:
+        self.pane_id = pane_id
+        self.max_lines = max_lines
+
+        self._lines: list[str] = []
+        self._committed = 0  # leading lines of _lines that are in tmux history
+        self._history_size: int | None = None
+        self._cursor_y = 0
+        self._size: tuple[int, int] = (0, 0)
+        self._last_read_at = 0.0
+        self._last_changed = True
+
+        # Statistics
+        self.reads = 0
+        self.skipped_reads = 0
+        self.full_captures = 0
+        self.lines_fetched = 0
+        self.speculative_captures = 0
+        self.wasted_captures = 0
+
+    def reset(self) -> None:
+        """Forget buffered content so the next read is a full capture."""
+        self._lines = []
+        self._committed = 0
+        self._history_size = None
+        self._last_changed = True
+
+    def read(self, pane: Any, tail_lines: int = 50) -> PaneContentView:
+        """Refresh the buffer from tmux and return what changed.
+
+        Args:
+            pane: libtmux pane to read
+            tail_lines: History lines to include above the visible screen in
+                the tail window (same meaning as ``capture-pane -S -N``)
+
+        Returns:
+            PaneContentView: New lines and the current tail window.
+        """
+        self.reads += 1
+        view = self._read(pane, tail_lines)
+        self._last_changed = view.changed
+        return view
+
+    def _read(self, pane: Any, tail_lines: int) -> PaneContentView:
+        last_read_at = self._last_read_at
+        # An active pane will most likely need a capture: fetch the tail with
+        # the probe so the read costs one round-trip
+        commands = [("display-message", "-p", _PROBE_FORMAT)]
+        if self._last_changed:
+            commands.append(("capture-pane", "-p", "-S", f"-{tail_lines}"))
+        replies = run_pane_commands(pane, commands)
+        probe = replies[0].stdout
+        captured = None
+        if len(replies) > 1:
+            captured = self._record_capture(replies[1].stdout)
+            self.speculative_captures += 1
+
+        fields = probe[0].split(maxsplit=8) if probe else []
+        if len(fields) < 5 or not all(value.isdigit() for value in fields[:5]):
+            # Unexpected reply: fall back to a plain capture of the tail
+            return self._resync(pane, tail_lines, history_size=None, captured=captured)
+
+        history_size, cursor_y, height, width, activity = (int(value) for value in fields[:5])
+        size = (width, height)
+        state = _parse_pane_state(fields[5:], activity)
+
+        if self._history_size is None or history_size < self._history_size or size != self._size:
+            # First read, cleared history or resized pane: rebuild from scratch
+            view = self._resync(pane, tail_lines, history_size, captured)
+        elif history_size - self._history_size > self.max_lines:
+            # More output than the buffer could hold; only the tail matters
+            view = self._resync(pane, tail_lines, history_size, captured)
+        # window_activity has one-second resolution, so output in the same
+        # second as the previous read still counts as a change.
+        elif history_size == self._history_size and cursor_y == self._cursor_y and activity < int(last_read_at):
+            self.skipped_reads += 1
+            if captured is not None:
+                # The buffer was not refreshed from the unused capture
+                self._last_read_at = last_read_at
+                self.wasted_captures += 1
+            return PaneContentView(tail=self._tail(tail_lines, height), changed=False, pane=state)
+        else:
+            scrolled = history_size - self._history_size
+            # The speculative capture starts min(tail_lines, history_size) lines above the screen
+            offset = min(tail_lines, history_size)
+            prefetched = captured[offset - scrolled :] if captured is not None and scrolled <= offset else None
+            view = self._read_incremental(pane, tail_lines, scrolled, height, prefetched)
+            self._history_size = history_size
+
+        self._cursor_y = cursor_y
+        self._size = size
+        view.pane = state
+        return view
+
+    def _capture(self, pane: Any, start: int) -> list[str]:
+        return self._record_capture(run_pane_command(pane, "capture-pane", "-p", "-S", str(start)).stdout)
+
+    def _record_capture(self, stdout: list[str] | None) -> list[str]:
+        self._last_read_at = time.time()
+        lines = list(stdout or [])
+        self.lines_fetched += len(lines)
+        return lines
+
+    def _resync(self, pane: Any, tail_lines: int, history_size: int | None, captured: list[str] | None = None) -> PaneContentView:
+        self.full_captures += 1
+        lines = _strip_trailing_blank(captured if captured is not None else self._capture(pane, -tail_lines))
+        previous = set(self._lines)
+
+        self._lines = lines
+        # capture-pane -S -N returns up to N history lines above the screen
+        self._committed = 0 if history_size is None else min(len(lines), history_size, tail_lines)
+        self._history_size = history_size
+        self._trim()
+
+        return PaneContentView(
+            new_lines=[line for line in lines if line not in previous],
+            tail=list(lines),
+            changed=True,
+            resynced=True,
+        )
+
+    def _read_incremental(self, pane: Any, tail_lines: int, scrolled: int, height: int, prefetched: list[str] | None = None) -> PaneContentView:
+        # Start at the first line that was still on screen during the last read
+        fetched = prefetched if prefetched is not None else self._capture(pane, -scrolled)
+        if len(fetched) < scrolled:
+            fetched.extend([""] * (scrolled - len(fetched)))
+
+        previous_visible = self._lines[self._committed :]
+        new_lines = [line for index, line in enumerate(fetched) if index >= len(previous_visible) or previous_visible[index] != line]
+
+        # Lines that scrolled off are kept verbatim; only the screen is trimmed
+        self._lines = self._lines[: self._committed] + fetched[:scrolled] + _strip_trailing_blank(fetched[scrolled:])
+        self._committed += scrolled
+        self._trim()
+
+        new_lines = _strip_trailing_blank(new_lines)
+        return PaneContentView(new_lines=new_lines, tail=self._tail(tail_lines, height), changed=bool(new_lines))
+
+    def _tail(self, tail_lines: int, height: int) -> list[str]:
+        return _strip_trailing_blank(self._lines[-(tail_lines + height) :]) if self._lines else []
+
+    def _trim(self) -> None:
+        overflow = len(self._lines) - self.max_lines
+        if overflow > 0:
+            del self._lines[:overflow]
+            self._committed = max(0, self._committed - overflow)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get capture statistics.
+
+        Returns:
+            dict[str, int]: Read, skip and fetch counters.
+        """
+        return {
+            "reads": self.reads,
+            "skipped_reads": self.skipped_reads,
+            "full_captures": self.full_captures,
+            "lines_fetched": self.lines_fetched,
+            "speculative_captures": self.speculative_captures,
+            "wasted_captures": self.wasted_captures,
+            "buffered_lines": len(self._lines),
+        }
@@ -0,0 +1,224 @@
+# Copyright notice.
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .tmux_snapshot import PaneSnapshot, TmuxSnapshot, capture_panes
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Cached index of which tmux pane runs Claude, a controller or a plain shell.
+
+Finding the Claude pane of a session used to mean a ``display-message`` and a
+full ``capture-pane`` for every pane, every time a controller was created.
+:class:`PaneRoleIndex` remembers the role of each pane together with the pid
+and command it was detected from, and only probes panes whose pid or command
+changed since.
+"""
+
+
+logger = logging.getLogger("yesman.pane_roles")
+
+# Pane content that identifies a Claude pane whose command name does not
+CLAUDE_CONTENT_INDICATORS = ("Welcome to Claude Code", "? for shortcuts", "Claude Code")
+CLAUDE_CONTENT_INDICATORS_LOWER = ("anthropic", "claude.ai")
+
+
+class PaneRole(Enum):
+    """What a tmux pane is running."""
+
+    CLAUDE = "claude"
+    CONTROLLER = "controller"
+    SHELL = "shell"
+
+
+def role_from_command(command: str) -> PaneRole | None:
+    """Classify a pane by its current command alone.
+
+    Returns:
+        PaneRole | None: The role, or None if the pane content must be inspected.
+    """
+    command = command.lower()
+    if "claude" in command:
+        return PaneRole.CLAUDE
+    if "controller" in command or "yesman" in command:
+        return PaneRole.CONTROLLER
+    return None
+
+
+def role_from_content(content: str) -> PaneRole:
+    """Classify a pane whose command is not conclusive by its content.
+
+    Returns:
+        PaneRole: CLAUDE if the content shows Claude indicators, SHELL otherwise.
+    """
+    lowered = content.lower()
+    if any(indicator in content for indicator in CLAUDE_CONTENT_INDICATORS) or any(indicator in lowered for indicator in CLAUDE_CONTENT_INDICATORS_LOWER):
+        return PaneRole.CLAUDE
+    return PaneRole.SHELL
+
+
+@dataclass(frozen=True)
+class PaneRoleEntry:
+    """Detected role of a pane and the fingerprint it was detected from."""
+
+    pane_id: str
+    session_name: str
+    window_name: str
+    pane_index: str
+    pid: int | None
+    command: str
+    role: PaneRole
+    probed_at: float
+
+    def matches(self, pane: PaneSnapshot) -> bool:
+        """Check whether the pane still runs what the role was detected from.
+
+        Returns:
+            bool: True if pid and command are unchanged.
+        """
+        return self.pid == pane.pid and self.command == pane.command
+
+
+class PaneRoleIndex:
+    """Pane roles keyed by pane id, re-probed only when a pane's pid or command changes."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, PaneRoleEntry] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.command_probes = 0
+        self.content_probes = 0
+
+    def resolve(
+        self,
+        snapshot: TmuxSnapshot,
+        panes: Iterable[PaneSnapshot] | None = None,
+        server: Any = None,
+        captures: dict[str, list[str]] | None = None,
+    ) -> dict[str, PaneRoleEntry]:
+        """Get the roles of panes, probing only panes that changed.
+
+        Args:
+            snapshot: Fleet snapshot the panes come from; entries for panes
+                missing from it are dropped
+            panes: Panes to resolve (every pane in the snapshot if None)
+            server: libtmux server used to capture pane content
+            captures: Already captured pane content keyed by pane id; used
+                instead of a new capture when available
+
+        Returns:
+            dict[str, PaneRoleEntry]: Entries keyed by pane id.
+        """
+        panes = list(snapshot.panes if panes is None else panes)
+
+        with self._lock:
+            live = {pane.pane_id for pane in snapshot.panes}
+            for pane_id in [pane_id for pane_id in self._entries if pane_id not in live]:
+                del self._entries[pane_id]
+
+            resolved: dict[str, PaneRoleEntry] = {}
+            needs_content: list[PaneSnapshot] = []
+            for pane in panes:
+                entry = self._entries.get(pane.pane_id)
+                if entry is not None and entry.matches(pane):
+                    self.hits += 1
+                    resolved[pane.pane_id] = entry
+                    continue
+
+                self.command_probes += 1
+                role = role_from_command(pane.command)
+                if role is None:
+                    needs_content.append(pane)
+                else:
+                    resolved[pane.pane_id] = self._store(pane, role)
+
+        if needs_content:
+            contents = dict(captures or {})
+            missing = [pane.pane_id for pane in needs_content if pane.pane_id not in contents]
+            if missing:
+                contents.update(capture_panes(server, missing))
+
+            with self._lock:
+                for pane in needs_content:
+                    self.content_probes += 1
+                    role = role_from_content("\n".join(contents.get(pane.pane_id, [])))
+                    resolved[pane.pane_id] = self._store(pane, role)
+
+        return resolved
+
+    def _store(self, pane: PaneSnapshot, role: PaneRole) -> PaneRoleEntry:
+        entry = PaneRoleEntry(
+            pane_id=pane.pane_id,
+            session_name=pane.session_name,
+            window_name=pane.window_name,
+            pane_index=pane.pane_index,
+            pid=pane.pid,
+            command=pane.command,
+            role=role,
+            probed_at=time.time(),
+        )
+        self._entries[pane.pane_id] = entry
+        logger.debug("Pane %s (%s) classified as %s", pane.pane_id, pane.command, role.value)
+        return entry
+
+    def find(self, snapshot: TmuxSnapshot, session_name: str, role: PaneRole, server: Any = None) -> PaneRoleEntry | None:
+        """Find the first pane of a session with the given role.
+
+        Returns:
+            PaneRoleEntry | None: The first matching pane in window/pane order.
+        """
+        panes = snapshot.session_panes(session_name)
+        roles = self.resolve(snapshot, panes, server=server)
+        for pane in panes:
+            entry = roles.get(pane.pane_id)
+            if entry is not None and entry.role is role:
+                return entry
+        return None
+
+    def invalidate(self, pane_id: str | None = None) -> None:
+        """Forget one pane's role, or every role if ``pane_id`` is None."""
+        with self._lock:
+            if pane_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(pane_id, None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get index statistics.
+
+        Returns:
+            dict[str, int]: Entry count, cache hits and probe counters.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "command_probes": self.command_probes,
+                "content_probes": self.content_probes,
+            }
+
+
+_index: PaneRoleIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_pane_role_index() -> PaneRoleIndex:
+    """Get the process-wide pane role index shared by all controllers.
+
+    Returns:
+        PaneRoleIndex: Shared index.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = PaneRoleIndex()
+    return _index
@@ -0,0 +1,210 @@
+# Copyright notice.
+
+import asyncio
+import contextlib
+import logging
+import os
+import shlex
+import shutil
+import tempfile
+import time
+from typing import Any
+
+from .executors import get_executor
+from .tmux_control import run_pane_command
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Event-driven pane output notifications via ``tmux pipe-pane``.
+
+:class:`PaneOutputStream` attaches ``pipe-pane -O`` to a pane and copies the
+pane's output into a FIFO read by the event loop. The bytes themselves are
+raw terminal output and are not parsed; their arrival only wakes the monitor
+so it can capture and run prompt detection immediately instead of waiting for
+the next poll. Wakeups are spaced at least ``min_interval`` apart, so a pane
+that redraws continuously (e.g. a spinner) cannot drive captures faster than
+the poll scheduler's fastest rate.
+
+The FIFO is held open for writing by the reader itself, so the death of the
+``cat`` writer is not visible here; owners check the pane's ``#{pane_pipe}``
+flag (see :class:`~libs.core.pane_buffer.PaneState`) instead and call
+:meth:`PaneOutputStream.release_pipe` once it is gone.
+
+A pane has at most one pipe, so a pane the user already pipes (e.g. to a log
+file) is not streamed, and :meth:`PaneOutputStream.stop` only closes the pipe
+while it is still the stream's own.
+"""
+
+
+logger = logging.getLogger("yesman.pane_stream")
+
+
+class _FifoProtocol(asyncio.Protocol):
+    """Forwards FIFO reads to the owning stream."""
+
+    def __init__(self, stream: "PaneOutputStream") -> None:
+        self._stream = stream
+
+    def data_received(self, data: bytes) -> None:
+        self._stream._on_data(len(data))
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._stream._on_closed(exc)
+
+
+class PaneOutputStream:
+    """Wakes a waiter whenever a tmux pane produces output."""
+
+    def __init__(self, pane: Any, debounce: float = 0.02, min_interval: float = 0.0) -> None:
+        """Initialize the stream.
+
+        Args:
+            pane: libtmux pane to attach to
+            debounce: Seconds to let an output burst settle before waking the waiter
+            min_interval: Minimum seconds between two wakeups
+        """
+        self.pane = pane
+        self.pane_id = str(getattr(pane, "pane_id", ""))
+        self.debounce = debounce
+        self.min_interval = min_interval
+
+        self._directory: str | None = None
+        self._fifo_path: str | None = None
+        self._transport: asyncio.ReadTransport | None = None
+        self._data_ready = asyncio.Event()
+        self._active = False
+        # Whether the pane's pipe-pane is the one this stream attached
+        self._owns_pipe = False
+        self._last_wakeup = float("-inf")
+
+        # Statistics
+        self.bytes_received = 0
+        self.wakeups = 0
+        self.last_output_at = 0.0
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the pipe is attached and the FIFO reader is open."""
+        return self._active
+
+    async def start(self) -> bool:
+        """Create the FIFO, start reading it and attach ``pipe-pane``.
+
+        Returns:
+            bool: True if streaming is active; False if the pane already has a
+            pipe attached or the pipe could not be set up.
+        """
+        if self._active:
+            return True
+        if not self.pane_id.startswith("%"):
+            return False
+
+        loop = asyncio.get_running_loop()
+        try:
+            if await get_executor("tmux_io").run(self._pane_piped):
+                logger.info("Pane %s already has a pipe attached, not streaming its output", self.pane_id)
+                return False
+
+            self._directory = tempfile.mkdtemp(prefix="yesman-stream-")
+            self._fifo_path = os.path.join(self._directory, f"pane-{self.pane_id.lstrip('%')}.fifo")
+            os.mkfifo(self._fifo_path, 0o600)
+
+            # O_RDWR keeps the FIFO open when the writer exits, so the reader never sees EOF
+            fd = os.open(self._fifo_path, os.O_RDWR | os.O_NONBLOCK)
+            self._transport, _ = await loop.connect_read_pipe(lambda: _FifoProtocol(self), os.fdopen(fd, "rb", buffering=0))
+
+            shell_command = f"exec cat > {shlex.quote(self._fifo_path)}"
+            # -o: never replace a pipe attached since the check above
+            await get_executor("tmux_io").run(run_pane_command, self.pane, "pipe-pane", "-o", "-O", shell_command)
+            self._owns_pipe = True
+        except Exception as e:
+            logger.warning("Could not stream output of pane %s: %s", self.pane_id, e)
+            await self.stop()
+            return False
+
+        self._active = True
+        logger.info("Streaming output of pane %s", self.pane_id)
+        return True
+
+    async def wait_for_output(self, timeout: float) -> bool:
+        """Wait until the pane produces output.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if output arrived, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._data_ready.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+
+        # Let the rest of the burst arrive so one wakeup covers one redraw, and
+        # keep continuous output from waking the waiter more often than allowed
+        delay = max(self.debounce, self.min_interval - (time.monotonic() - self._last_wakeup))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._data_ready.clear()
+        self._last_wakeup = time.monotonic()
+        self.wakeups += 1
+        return True
+
+    def release_pipe(self) -> None:
+        """Forget the pane's pipe after it was seen closed.
+
+        A pipe attached to the pane later is someone else's and is left alone
+        by :meth:`stop`.
+        """
+        self._owns_pipe = False
+
+    async def stop(self) -> None:
+        """Detach ``pipe-pane`` if it is still this stream's and remove the FIFO."""
+        self._active = False
+
+        if self._owns_pipe:
+            self._owns_pipe = False
+            try:
+                if await get_executor("tmux_io").run(self._pane_piped):
+                    # pipe-pane without a command closes the existing pipe
+                    await get_executor("tmux_io").run(run_pane_command, self.pane, "pipe-pane")
+            except Exception as e:
+                logger.debug("Could not detach pipe-pane from %s: %s", self.pane_id, e)
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+            self._fifo_path = None
+
+    def _pane_piped(self) -> bool:
+        result = run_pane_command(self.pane, "display-message", "-p", "#{pane_pipe}")
+        return list(getattr(result, "stdout", None) or []) == ["1"]
+
+    def _on_data(self, size: int) -> None:
+        self.bytes_received += size
+        self.last_output_at = time.time()
+        self._data_ready.set()
+
+    def _on_closed(self, exc: Exception | None) -> None:
+        if self._active:
+            logger.warning("Output stream of pane %s closed: %s", self.pane_id, exc)
+        self._active = False
+        # Wake the waiter so it falls back to polling
+        self._data_ready.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get stream statistics.
+
+        Returns:
+            dict[str, Any]: Activity flag, byte and wakeup counters.
+        """
+        return {
+            "active": self._active,
+            "bytes_received": self.bytes_received,
+            "wakeups": self.wakeups,
+            "last_output_at": self.last_output_at,
+        }
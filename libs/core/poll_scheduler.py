@@ -0,0 +1,108 @@
+# Copyright notice.
+
+import time
+from typing import Any
+
+from .pane_buffer import content_fingerprint
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Adaptive polling cadence for pane monitors.
+
+Polling every pane once a second costs the same whether a session has been
+idle for an hour or is in the middle of a prompt. :class:`AdaptivePollScheduler`
+backs the interval off exponentially while the pane content stays the same
+and drops to a fast interval as soon as something happens: the content
+changes, the detector sees an input prompt appear, or a response was just
+sent and a follow-up prompt is likely. A prompt that sits unanswered with
+unchanged content backs off like any other idle frame.
+"""
+
+
+class AdaptivePollScheduler:
+    """Chooses the delay before a monitor's next poll."""
+
+    def __init__(
+        self,
+        fast_interval: float | None = None,
+        interval: float | None = None,
+        max_interval: float | None = None,
+        backoff: float | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            fast_interval: Delay after activity (``settings.monitoring.poll_fast_interval`` if None)
+            interval: Delay before the first observation (``settings.monitoring.poll_interval`` if None)
+            max_interval: Ceiling for the idle back-off (``settings.monitoring.poll_max_interval`` if None)
+            backoff: Factor the delay grows by per unchanged poll (``settings.monitoring.poll_backoff`` if None)
+        """
+        monitoring = settings.monitoring
+        self.fast_interval = fast_interval if fast_interval is not None else monitoring.poll_fast_interval
+        self.max_interval = max(self.fast_interval, max_interval if max_interval is not None else monitoring.poll_max_interval)
+        self.backoff = max(1.0, backoff if backoff is not None else monitoring.poll_backoff)
+        self.current_interval = min(self.max_interval, max(self.fast_interval, interval if interval is not None else monitoring.poll_interval))
+
+        self._last_fingerprint: int | None = None
+        self._prompt_was_active = False
+        self._response_pending = False
+
+        # Statistics
+        self.wakeups = 0
+        self.active_wakeups = 0
+        self.idle_wakeups = 0
+        self.last_activity_at = 0.0
+
+    def note_response(self) -> None:
+        """Record that a response was sent; the next poll comes quickly."""
+        self._response_pending = True
+
+    def observe(self, content: str, prompt_active: bool = False, fingerprint: int | None = None) -> float:
+        """Record one poll and choose the delay before the next one.
+
+        Args:
+            content: Pane content seen by this poll
+            prompt_active: Whether the detector sees an input prompt, complete or
+                forming; only counts as activity on the poll where it appears
+            fingerprint: :func:`~libs.core.pane_buffer.content_fingerprint` of the
+                content, if the caller already computed it
+
+        Returns:
+            float: Seconds until the next poll.
+        """
+        if fingerprint is None:
+            fingerprint = content_fingerprint(content)
+        changed = self._last_fingerprint is not None and fingerprint != self._last_fingerprint
+        self._last_fingerprint = fingerprint
+        # A forming prompt changes the content; an unchanged unanswered prompt is idle
+        prompt_appeared = prompt_active and not self._prompt_was_active
+        self._prompt_was_active = prompt_active
+        self.wakeups += 1
+
+        if changed or prompt_appeared or self._response_pending:
+            self._response_pending = False
+            self.active_wakeups += 1
+            self.last_activity_at = time.time()
+            self.current_interval = self.fast_interval
+        else:
+            self.idle_wakeups += 1
+            self.current_interval = min(self.max_interval, self.current_interval * self.backoff)
+
+        return self.current_interval
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            dict[str, Any]: Current interval, bounds and wakeup counts.
+        """
+        return {
+            "current_interval": self.current_interval,
+            "fast_interval": self.fast_interval,
+            "max_interval": self.max_interval,
+            "wakeups": self.wakeups,
+            "active_wakeups": self.active_wakeups,
+            "idle_wakeups": self.idle_wakeups,
+            "last_activity_at": self.last_activity_at,
+        }
@@ -0,0 +1,280 @@
+# Copyright notice.
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Batched process metrics for tmux pane process trees.
+
+``psutil.Process(pid).cpu_percent()`` returns 0.0 on a freshly created
+``Process`` because it has no previous sample to compare against, and every
+additional metric costs another ``/proc`` read. :class:`ProcessSampler` walks
+the process table once per refresh with ``process_iter(attrs=...)``, keeps
+primed ``Process`` objects for every process under a pane across refreshes,
+and aggregates each pane's whole process tree so that e.g. a ``claude``
+process started from a shell is attributed to its pane.
+"""
+
+
+logger = logging.getLogger("yesman.process_sampler")
+
+# Collected for every process in the single process_iter pass
+_ITER_ATTRS = ["pid", "ppid", "name", "status", "create_time", "memory_info"]
+
+
+@dataclass(frozen=True)
+class ChildProcess:
+    """A process running below a pane's root process."""
+
+    pid: int
+    create_time: float
+    name: str
+    cmdline: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ProcessStats:
+    """Aggregated metrics for a pane's process tree.
+
+    Attributes:
+        pid: Root process id (the pane's ``pane_pid``)
+        cpu_percent: CPU usage summed over the tree; 0.0 until a process has been sampled twice
+        memory_mb: Resident memory summed over the tree in MB
+        create_time: Creation time of the root process (epoch seconds)
+        status: Status of the root process
+        cmdline: Command line of the root process
+        descendants: Processes below the root, oldest first
+    """
+
+    pid: int
+    cpu_percent: float = 0.0
+    memory_mb: float = 0.0
+    create_time: float = 0.0
+    status: str = "unknown"
+    cmdline: tuple[str, ...] = ()
+    descendants: tuple[ChildProcess, ...] = ()
+
+    @property
+    def process_count(self) -> int:
+        """Number of processes in the tree, including the root."""
+        return 1 + len(self.descendants)
+
+    @property
+    def foreground_cmdline(self) -> tuple[str, ...]:
+        """Command line of the newest process in the tree (what the pane is running now)."""
+        if self.descendants:
+            return self.descendants[-1].cmdline
+        return self.cmdline
+
+    def has_process(self, name: str) -> bool:
+        """Check whether a process with ``name`` in its name runs in the tree.
+
+        Returns:
+            bool: True if the root or a descendant matches.
+        """
+        needle = name.lower()
+        if self.cmdline and needle in self.cmdline[0].rsplit("/", 1)[-1].lower():
+            return True
+        return any(needle in child.name.lower() for child in self.descendants)
+
+
+@dataclass
+class _TrackedProcess:
+    process: Any
+    create_time: float
+    cmdline: tuple[str, ...] | None = None
+    samples: int = 0
+
+
+@dataclass
+class _ProcessRow:
+    pid: int
+    ppid: int
+    name: str
+    status: str
+    create_time: float
+    rss: int
+    children: list[int] = field(default_factory=list)
+
+
+class ProcessSampler:
+    """Samples the process trees under tmux panes in one pass per refresh."""
+
+    def __init__(self) -> None:
+        self._tracked: dict[int, _TrackedProcess] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.samples = 0
+        self.last_sample_duration = 0.0
+        self.last_process_count = 0
+
+    def sample(self, root_pids: Iterable[int | None]) -> dict[int, ProcessStats]:
+        """Collect aggregated stats for the process tree under each root pid.
+
+        Args:
+            root_pids: Pane process ids; None entries are ignored
+
+        Returns:
+            dict[int, ProcessStats]: Stats keyed by root pid. Pids that no
+            longer exist are omitted.
+        """
+        roots = {pid for pid in root_pids if pid}
+        if not roots or not PSUTIL_AVAILABLE:
+            return {}
+
+        with self._lock:
+            started = time.perf_counter()
+            rows = self._read_process_table()
+
+            stats: dict[int, ProcessStats] = {}
+            seen: set[int] = set()
+            for root in roots:
+                if root not in rows:
+                    continue
+                tree = self._walk_tree(rows, root)
+                seen.update(row.pid for row in tree)
+                stats[root] = self._aggregate(tree)
+
+            # Forget processes that left every pane tree
+            for pid in [pid for pid in self._tracked if pid not in seen]:
+                del self._tracked[pid]
+
+            self.samples += 1
+            self.last_process_count = len(rows)
+            self.last_sample_duration = time.perf_counter() - started
+            return stats
+
+    @staticmethod
+    def _read_process_table() -> dict[int, _ProcessRow]:
+        rows: dict[int, _ProcessRow] = {}
+        for process in psutil.process_iter(attrs=_ITER_ATTRS, ad_value=None):
+            info = process.info
+            memory_info = info.get("memory_info")
+            rows[info["pid"]] = _ProcessRow(
+                pid=info["pid"],
+                ppid=info.get("ppid") or 0,
+                name=info.get("name") or "",
+                status=info.get("status") or "unknown",
+                create_time=info.get("create_time") or 0.0,
+                rss=memory_info.rss if memory_info is not None else 0,
+            )
+
+        for row in rows.values():
+            parent = rows.get(row.ppid)
+            if parent is not None and parent.pid != row.pid:
+                parent.children.append(row.pid)
+        return rows
+
+    @staticmethod
+    def _walk_tree(rows: dict[int, _ProcessRow], root: int) -> list[_ProcessRow]:
+        tree = [rows[root]]
+        index = 0
+        while index < len(tree):
+            tree.extend(rows[child] for child in tree[index].children if child in rows)
+            index += 1
+        return tree
+
+    def _track(self, row: _ProcessRow) -> _TrackedProcess | None:
+        """Get the primed Process for a row, replacing it if the pid was reused."""
+        tracked = self._tracked.get(row.pid)
+        if tracked is not None and tracked.create_time == row.create_time:
+            return tracked
+
+        try:
+            process = psutil.Process(row.pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._tracked.pop(row.pid, None)
+            return None
+        tracked = _TrackedProcess(process=process, create_time=row.create_time)
+        self._tracked[row.pid] = tracked
+        return tracked
+
+    def _cpu_percent(self, tracked: _TrackedProcess) -> float:
+        try:
+            value = float(tracked.process.cpu_percent(interval=None))
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return 0.0
+        tracked.samples += 1
+        # The first call only primes the counters
+        return value if tracked.samples > 1 else 0.0
+
+    @staticmethod
+    def _cmdline(tracked: _TrackedProcess) -> tuple[str, ...]:
+        if tracked.cmdline is None:
+            try:
+                tracked.cmdline = tuple(tracked.process.cmdline())
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                return ()
+        return tracked.cmdline
+
+    def _aggregate(self, tree: list[_ProcessRow]) -> ProcessStats:
+        root = tree[0]
+        cpu_percent = 0.0
+        cmdline: tuple[str, ...] = ()
+        descendants: list[ChildProcess] = []
+
+        for row in tree:
+            tracked = self._track(row)
+            if tracked is None:
+                continue
+            cpu_percent += self._cpu_percent(tracked)
+            if row is root:
+                cmdline = self._cmdline(tracked)
+            else:
+                descendants.append(ChildProcess(pid=row.pid, create_time=row.create_time, name=row.name, cmdline=self._cmdline(tracked)))
+
+        descendants.sort(key=lambda child: (child.create_time, child.pid))
+        return ProcessStats(
+            pid=root.pid,
+            cpu_percent=cpu_percent,
+            memory_mb=sum(row.rss for row in tree) / 1024 / 1024,
+            create_time=root.create_time,
+            status=root.status,
+            cmdline=cmdline,
+            descendants=tuple(descendants),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sampler statistics.
+
+        Returns:
+            dict[str, Any]: Sample count, tracked processes and last pass cost.
+        """
+        return {
+            "samples": self.samples,
+            "tracked_processes": len(self._tracked),
+            "last_process_count": self.last_process_count,
+            "last_sample_duration": self.last_sample_duration,
+        }
+
+
+_sampler: ProcessSampler | None = None
+_sampler_lock = threading.Lock()
+
+
+def get_process_sampler() -> ProcessSampler:
+    """Get the process-wide sampler, so primed CPU counters survive across callers.
+
+    Returns:
+        ProcessSampler: Shared sampler.
+    """
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = ProcessSampler()
+    return _sampler
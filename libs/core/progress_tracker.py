@@ -1,9 +1,13 @@
 # Copyright notice.
 
 import re
+from typing import TYPE_CHECKING
 
 from .models import SessionProgress, TaskPhase, TaskProgress
 
+if TYPE_CHECKING:
+    from .process_sampler import ProcessStats
+
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Progress tracking for Claude sessions."""
@@ -12,6 +16,9 @@ from .models import SessionProgress, TaskPhase, TaskProgress
 class ProgressAnalyzer:
     """Analyzes pane output to determine task progress."""
 
+    # Test runner invocations, in pane output and in sampled command lines
+    TEST_COMMAND_PATTERN = r"pytest|npm test|cargo test"
+
     # Phase detection patterns
     PHASE_PATTERNS = {
         TaskPhase.STARTING: [
@@ -32,7 +39,7 @@ class ProgressAnalyzer:
         TaskPhase.TESTING: [
             r"testing|running tests|executing tests",
             r"verifying|validating|checking",
-            r"pytest|npm test|cargo test",
+            TEST_COMMAND_PATTERN,
         ],
         TaskPhase.COMPLETING: [
             r"completing|finishing|done|completed",
@@ -54,6 +61,9 @@ class ProgressAnalyzer:
         "failure": r"(?:failed|error|✗|exception|traceback)",
     }
 
+    # Shells under a Claude pane only wrap the commands Claude runs
+    SHELL_PROCESSES = frozenset({"sh", "bash", "zsh", "fish", "dash"})
+
     TODO_PATTERNS = {
         "identified": r"(?:todo|TODO|task):\s*(.+)",
         "completed": r"(?:✓|done|completed|finished).*?(?:todo|task)",
@@ -61,6 +71,7 @@ class ProgressAnalyzer:
 
     def __init__(self) -> None:
         self.session_progress: dict[str, SessionProgress] = {}
+        self._seen_processes: dict[str, set[tuple[int, float]]] = {}
 
     def analyze_pane_output(self, session_name: str, pane_output: list[str]) -> SessionProgress | None:
         """Analyze pane output to determine progress.
@@ -104,6 +115,48 @@ class ProgressAnalyzer:
 
         return progress
 
+    def analyze_process_activity(self, session_name: str, process_stats: list["ProcessStats"]) -> SessionProgress | None:
+        """Fold the sampled process trees of a session's Claude panes into its progress.
+
+        Child processes of a Claude pane are the commands Claude runs: every
+        newly seen one counts as an executed command, and a test runner moves
+        the current task forward into the testing phase.
+
+        Returns:
+            SessionProgress | None: Updated progress, or the existing progress
+            (None if there is none) when no new commands were seen.
+        """
+        children = {(child.pid, child.create_time): child for stats in process_stats for child in stats.descendants}
+        seen = self._seen_processes.get(session_name, set())
+        new_commands = [
+            child
+            for key, child in children.items()
+            if key not in seen and "claude" not in child.name.lower() and child.name.lower() not in self.SHELL_PROCESSES
+        ]
+        # Only remember live processes so the set stays bounded
+        self._seen_processes[session_name] = set(children)
+
+        if not new_commands:
+            return self.session_progress.get(session_name)
+
+        if session_name not in self.session_progress:
+            self.session_progress[session_name] = SessionProgress(session_name=session_name)
+        progress = self.session_progress[session_name]
+
+        task = progress.get_current_task()
+        if not task or task.phase == TaskPhase.COMPLETED:
+            task = progress.add_task()
+
+        task.commands_executed += len(new_commands)
+
+        runs_tests = any(re.search(self.TEST_COMMAND_PATTERN, " ".join(child.cmdline) or child.name, re.IGNORECASE) for child in new_commands)
+        if runs_tests and task.phase in {TaskPhase.IDLE, TaskPhase.STARTING, TaskPhase.ANALYZING, TaskPhase.IMPLEMENTING}:
+            task.update_phase(TaskPhase.TESTING)
+
+        self._update_phase_progress(task)
+        progress.update_aggregates()
+        return progress
+
     def _detect_phase(self, output_text: str, current_phase: TaskPhase) -> TaskPhase:
         """Detect the current phase from output.
 
@@ -228,3 +281,4 @@ class ProgressAnalyzer:
         """Reset progress for a specific session."""
         if session_name in self.session_progress:
             del self.session_progress[session_name]
+        self._seen_processes.pop(session_name, None)
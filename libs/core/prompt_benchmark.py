@@ -0,0 +1,295 @@
+# Copyright notice.
+
+import json
+import re
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .detection_cache import DetectionCache
+from .prompt_detector import ClaudePromptDetector, PromptType
+from .prompt_patterns import PromptPatternRegistry
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Benchmark and regression gate for :class:`~libs.core.prompt_detector.ClaudePromptDetector`.
+
+A corpus is a JSONL file with a ``{"corpus_version": ...}`` header line and one
+``{"name", "category", "expected", "content"}`` object per pane frame, where
+``expected`` is a :class:`PromptType` value or null for frames without a
+prompt. :func:`run_benchmark` measures frames per second and the time spent in
+each detection stage, and scores precision and recall per prompt type.
+:func:`compare_to_baseline` checks a report against a stored baseline. Timings
+are scaled by a calibration workload, so a baseline recorded on one machine
+can gate runs on another.
+"""
+
+
+NO_PROMPT = "none"
+
+
+@dataclass(frozen=True)
+class CorpusFrame:
+    """One labelled pane frame.
+
+    Attributes:
+        name: Unique frame name
+        category: Kind of frame, e.g. ``"prompt"``, ``"scrollback"`` or ``"ansi"``
+        expected: Prompt type value the frame shows, or ``"none"``
+        content: Raw pane content
+    """
+
+    name: str
+    category: str
+    expected: str
+    content: str
+
+
+def load_corpus(path: str | Path) -> tuple[str, list[CorpusFrame]]:
+    """Load a benchmark corpus.
+
+    Args:
+        path: Corpus JSONL file
+
+    Returns:
+        tuple[str, list[CorpusFrame]]: Corpus version and frames in file order.
+
+    Raises:
+        ValueError: If the header is missing or a frame is malformed.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    if not records or "corpus_version" not in records[0]:
+        msg = f"Corpus {path} has no corpus_version header"
+        raise ValueError(msg)
+
+    known = {prompt_type.value for prompt_type in PromptType}
+    frames = []
+    for index, record in enumerate(records[1:], start=1):
+        expected = record.get("expected") or NO_PROMPT
+        if "content" not in record or (expected != NO_PROMPT and expected not in known):
+            msg = f"Corpus record {index} in {path} is malformed"
+            raise ValueError(msg)
+        frames.append(CorpusFrame(name=str(record.get("name", index)), category=str(record.get("category", "")), expected=expected, content=record["content"]))
+    return str(records[0]["corpus_version"]), frames
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Time a fixed regex and string workload.
+
+    Returns:
+        float: Best time of ``rounds`` runs in seconds; larger on slower machines.
+    """
+    text = "calibration line 12 with \x1b[1msome\x1b[0m words (y/n)\n" * 200
+    pattern = re.compile(r"(\w+)\s+(\d+)")
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(20):
+            pattern.findall(text)
+            [" ".join(line.split()).casefold() for line in text.split("\n")]
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def score(expected: list[str], detected: list[str]) -> dict[str, dict[str, float | int | None]]:
+    """Score detections per prompt type.
+
+    Args:
+        expected: Expected type per frame (``"none"`` for no prompt)
+        detected: Detected type per frame
+
+    Returns:
+        dict[str, dict[str, float | int | None]]: Precision, recall and support
+        per type; precision is None for a type never detected and recall is
+        None for a type never expected.
+    """
+    labels = sorted(set(expected) | set(detected))
+    scores: dict[str, dict[str, float | int | None]] = {}
+    for label in labels:
+        true_positives = sum(1 for want, got in zip(expected, detected, strict=True) if want == got == label)
+        detected_count = detected.count(label)
+        support = expected.count(label)
+        scores[label] = {
+            "precision": true_positives / detected_count if detected_count else None,
+            "recall": true_positives / support if support else None,
+            "support": support,
+        }
+    return scores
+
+
+@dataclass
+class BenchmarkReport:
+    """Speed and accuracy of one benchmark run.
+
+    Attributes:
+        corpus_version: Version of the corpus
+        frames: Frames per pass
+        passes: Timed passes over the corpus
+        pass_seconds: Time of the fastest pass
+        calibration_seconds: Calibration workload time on this machine
+        stages: Microseconds per frame spent in each detection stage (fastest pass)
+        accuracy: Precision, recall and support per prompt type
+        mismatches: Frames whose detected type differs from the expected one
+    """
+
+    corpus_version: str
+    frames: int
+    passes: int
+    pass_seconds: float
+    calibration_seconds: float
+    stages: dict[str, float]
+    accuracy: dict[str, dict[str, float | int | None]]
+    mismatches: list[dict[str, str]] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames detected per second in the fastest pass."""
+        return self.frames / self.pass_seconds if self.pass_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dict; also the baseline format.
+
+        Returns:
+            dict[str, Any]: Report fields plus frames per second.
+        """
+        return {
+            "corpus_version": self.corpus_version,
+            "frames": self.frames,
+            "passes": self.passes,
+            "pass_seconds": self.pass_seconds,
+            "frames_per_second": self.frames_per_second,
+            "calibration_seconds": self.calibration_seconds,
+            "stages": self.stages,
+            "accuracy": self.accuracy,
+            "mismatches": self.mismatches,
+        }
+
+
+def _instrument(detector: ClaudePromptDetector, timings: dict[str, float]) -> None:
+    def timed(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any) -> Any:  # noqa: ANN401
+            started = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                timings[name] += time.perf_counter() - started
+
+        return wrapper
+
+    detector.normalizer.prompt_region = timed("normalize", detector.normalizer.prompt_region)  # type: ignore[method-assign]
+    detector.matcher.candidates = timed("prescreen", detector.matcher.candidates)  # type: ignore[method-assign]
+    for family, family_detector in list(detector.family_detectors.items()):
+        detector.family_detectors[family] = timed(family, family_detector)
+    detector._detect_confirmation = timed("confirmation", detector._detect_confirmation)  # type: ignore[method-assign]
+
+
+def run_benchmark(frames: list[CorpusFrame], corpus_version: str = "", passes: int = 10, pack_dir: str | Path | None = None) -> BenchmarkReport:
+    """Run the detector over the corpus.
+
+    The detection cache is disabled so every frame is detected; the
+    normaliser's line cache is warmed by an untimed first pass, as it is in a
+    running monitor.
+
+    Args:
+        frames: Corpus frames
+        corpus_version: Version reported with the results
+        passes: Timed passes over the corpus
+        pack_dir: Directory of extra pattern packs; only the default pack if None
+
+    Returns:
+        BenchmarkReport: Speed of the fastest pass and accuracy.
+    """
+    with tempfile.TemporaryDirectory() as empty_dir:
+        registry = PromptPatternRegistry(pack_dir=pack_dir if pack_dir is not None else empty_dir, reload_interval=float("inf"))
+    detector = ClaudePromptDetector(cache=DetectionCache(max_entries=0), registry=registry)
+
+    # Untimed pass: warms the line cache and records what is detected
+    detected = []
+    for frame in frames:
+        prompt_info = detector.detect_prompt(frame.content)
+        detected.append(prompt_info.type.value if prompt_info else NO_PROMPT)
+
+    timings: dict[str, float] = defaultdict(float)
+    _instrument(detector, timings)
+    best_seconds = float("inf")
+    best_stages: dict[str, float] = {}
+    calibration_seconds = float("inf")
+    for _ in range(max(1, passes)):
+        # Interleaved with the passes so both see the same machine load
+        calibration_seconds = min(calibration_seconds, calibrate(rounds=1))
+        timings.clear()
+        started = time.perf_counter()
+        for frame in frames:
+            detector.detect_prompt(frame.content)
+        elapsed = time.perf_counter() - started
+        if elapsed < best_seconds:
+            best_seconds = elapsed
+            best_stages = {name: seconds * 1_000_000 / len(frames) for name, seconds in sorted(timings.items())} if frames else {}
+
+    expected = [frame.expected for frame in frames]
+    return BenchmarkReport(
+        corpus_version=corpus_version,
+        frames=len(frames),
+        passes=max(1, passes),
+        pass_seconds=best_seconds,
+        calibration_seconds=calibration_seconds,
+        stages=best_stages,
+        accuracy=score(expected, detected),
+        mismatches=[
+            {"name": frame.name, "category": frame.category, "expected": frame.expected, "detected": got}
+            for frame, got in zip(frames, detected, strict=True)
+            if got != frame.expected
+        ],
+    )
+
+
+def compare_to_baseline(report: BenchmarkReport, baseline: dict[str, Any], tolerance: float = 0.25, min_stage_us: float = 2.0) -> list[str]:
+    """Compare a report with a stored baseline.
+
+    Speeds are scaled by the ratio of the calibration times before comparing.
+    A stage only regresses if it is slower by more than ``tolerance`` and by at
+    least ``min_stage_us``, so noise in tiny stages is ignored. Any drop in
+    precision or recall is a regression.
+
+    Args:
+        report: Current benchmark report
+        baseline: Baseline as written by :meth:`BenchmarkReport.to_dict`
+        tolerance: Allowed relative slowdown
+        min_stage_us: Smallest per-frame slowdown that counts for a stage
+
+    Returns:
+        list[str]: Regressions; empty if the report passes.
+    """
+    if baseline.get("corpus_version") != report.corpus_version:
+        return [f"Baseline is for corpus {baseline.get('corpus_version')!r}, not {report.corpus_version!r}; record a new baseline"]
+
+    regressions = []
+    # >1 when this machine is slower than the one that recorded the baseline
+    scale = report.calibration_seconds / baseline["calibration_seconds"] if baseline.get("calibration_seconds") else 1.0
+
+    expected_fps = baseline["frames_per_second"] / scale
+    if report.frames_per_second < expected_fps * (1 - tolerance):
+        regressions.append(f"Throughput {report.frames_per_second:.0f} frames/s is below {expected_fps:.0f} frames/s (calibrated baseline) by more than {tolerance:.0%}")
+
+    for stage, baseline_us in baseline.get("stages", {}).items():
+        current_us = report.stages.get(stage)
+        if current_us is None:
+            continue
+        expected_us = baseline_us * scale
+        if current_us > expected_us * (1 + tolerance) and current_us - expected_us >= min_stage_us:
+            regressions.append(f"Stage {stage} takes {current_us:.1f}us per frame, above {expected_us:.1f}us (calibrated baseline) by more than {tolerance:.0%}")
+
+    for label, baseline_scores in baseline.get("accuracy", {}).items():
+        current_scores = report.accuracy.get(label, {})
+        for metric in ("precision", "recall"):
+            before, after = baseline_scores.get(metric), current_scores.get(metric)
+            if before is not None and (after is None or after < before):
+                regressions.append(f"{metric.capitalize()} for {label} dropped from {before:.2f} to {after if after is None else f'{after:.2f}'}")
+    return regressions
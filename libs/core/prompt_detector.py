@@ -2,9 +2,14 @@
 
 import logging
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 
+from .detection_cache import DetectionCache, fingerprint, get_detection_cache
+from .prompt_normalizer import ANSI_ESCAPE, PromptNormalizer, normalize_line
+from .prompt_patterns import PromptPatternRegistry, get_prompt_pattern_registry
+
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Advanced prompt detection system for Claude Code interactions."""
@@ -35,74 +40,107 @@ class PromptInfo:
     metadata: dict[str, object]  # Additional information
 
 
+def _casefolded_anchor(anchor: str) -> str:
+    # Anchors run on casefolded content; one with upper case letters could never match
+    return anchor if anchor == anchor.casefold() else f"(?i:{anchor})"
+
+
+class CompiledPromptMatcher:
+    """Finds the prompt pattern families that can match, in one scan of the content.
+
+    Python's ``re`` has no multi-pattern automaton: an alternation of the full
+    prompt patterns is tried branch by branch at every position and is slower
+    than searching them one by one. Instead each family declares anchors, short
+    regexes that every match of its patterns contains in the casefolded
+    content. The anchors are joined into one regex; as each starts with a
+    literal character, the engine skips positions that cannot start any of
+    them. Families whose anchors never appear cannot match and are skipped.
+    Anchors that are not written in lower case (e.g. from a user pack) are
+    matched ignoring case; only they give up the fast skip.
+    """
+
+    def __init__(self, anchors: dict[str, list[str] | None]) -> None:
+        """Initialize the matcher.
+
+        Args:
+            anchors: Anchor regexes per family, families in priority order;
+                None for a family that must always be tried
+        """
+        self.families = list(anchors)
+        self._always = {family for family, family_anchors in anchors.items() if family_anchors is None}
+        scanned = {family: list(dict.fromkeys(map(_casefolded_anchor, family_anchors))) for family, family_anchors in anchors.items() if family_anchors}
+        self._family_anchors = {family: re.compile("|".join(family_anchors)) for family, family_anchors in scanned.items()}
+        all_anchors = list(dict.fromkeys(anchor for family_anchors in scanned.values() for anchor in family_anchors))
+        self._scanner = re.compile("|".join(all_anchors)) if all_anchors else None
+
+    def candidates(self, content: str) -> list[str]:
+        """Find the families whose anchors appear in the content.
+
+        Args:
+            content: Cleaned terminal content
+
+        Returns:
+            list[str]: Candidate families in priority order.
+        """
+        found = set(self._always)
+        if self._scanner is not None:
+            folded = content.casefold()
+            search = self._scanner.search
+            match = search(folded)
+            while match is not None and len(found) < len(self.families):
+                position = match.start()
+                found.update(family for family, anchor in self._family_anchors.items() if family not in found and anchor.match(folded, position))
+                match = search(folded, position + 1)
+        return [family for family in self.families if family in found]
+
+
 class ClaudePromptDetector:
     """Advanced prompt detector for Claude Code interactions."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: DetectionCache | None = None, registry: PromptPatternRegistry | None = None) -> None:
+        """Initialize the detector.
+
+        Args:
+            cache: Detection result cache (the process-wide one if None)
+            registry: Prompt pattern packs (the process-wide registry if None)
+        """
         self.logger = logging.getLogger("yesman.dashboard.prompt_detector")
+        self.normalizer = PromptNormalizer()
+        self.cache = cache if cache is not None else get_detection_cache()
+        self.registry = registry if registry is not None else get_prompt_pattern_registry()
+
+        self.family_detectors = {
+            "numbered_selection": self._detect_numbered_selection,
+            "binary_choice": self._detect_binary_choice,
+            "true_false": self._detect_true_false,
+            "terminal_settings": self._detect_terminal_settings,
+            "login_redirect": self._detect_login_redirect,
+            "text_input": self._detect_text_input,
+        }
 
         # Compile regex patterns for better performance
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns for prompt detection."""
-        # Numbered selection patterns
-        self.numbered_patterns = [
-            # ❯ 1. Option format
-            re.compile(r"❯?\s*(\d+)\.\s+(.+)", re.MULTILINE),
-            # [1] Option format
-            re.compile(r"\[(\d+)\]\s+(.+)", re.MULTILINE),
-            # 1) Option format
-            re.compile(r"(\d+)\)\s+(.+)", re.MULTILINE),
-        ]
-
-        # Binary choice patterns
-        self.binary_patterns = [
-            re.compile(r"\(y/n\)", re.IGNORECASE),
-            re.compile(r"\(yes/no\)", re.IGNORECASE),
-            re.compile(r"\[Y/n\]"),
-            re.compile(r"\[y/N\]"),
-            re.compile(r"\[1/2\]"),
-        ]
-
-        # True/False patterns
-        self.true_false_patterns = [
-            re.compile(r"\(true/false\)", re.IGNORECASE),
-            re.compile(r"\[true/false\]", re.IGNORECASE),
-            re.compile(r"true\s+or\s+false", re.IGNORECASE),
-        ]
-
-        # Text input patterns
-        self.text_input_patterns = [
-            re.compile(r"Enter\s+(.+?):", re.IGNORECASE),
-            re.compile(r"Type\s+(.+?):", re.IGNORECASE),
-            re.compile(r"Input\s+(.+?):", re.IGNORECASE),
-            re.compile(r"Please\s+enter\s+(.+?):", re.IGNORECASE),
-        ]
-
-        # Terminal settings patterns
-        self.terminal_patterns = [
-            re.compile(r"terminal\s+settings?", re.IGNORECASE),
-            re.compile(r"configure\s+terminal", re.IGNORECASE),
-            re.compile(r"terminal\s+preferences", re.IGNORECASE),
-        ]
-
-        # Login redirect patterns
-        self.login_patterns = [
-            re.compile(r"login\s+required", re.IGNORECASE),
-            re.compile(r"authenticate", re.IGNORECASE),
-            re.compile(r"sign\s+in", re.IGNORECASE),
-            re.compile(r"redirect.*login", re.IGNORECASE),
-        ]
-
-        # Question indicators
-        self.question_patterns = [
-            re.compile(r"Do you want to (.+?)\?", re.IGNORECASE),
-            re.compile(r"Would you like to (.+?)\?", re.IGNORECASE),
-            re.compile(r"Should (.+?)\?", re.IGNORECASE),
-            re.compile(r"Shall (.+?)\?", re.IGNORECASE),
-            re.compile(r"(.+?)\?$", re.MULTILINE),
-        ]
+        """Take the compiled patterns of the registry's current packs."""
+        self.pattern_generation = self.registry.generation
+        patterns = self.registry.patterns()
+
+        self.numbered_patterns = patterns["numbered_selection"]
+        self.binary_patterns = patterns["binary_choice"]
+        self.true_false_patterns = patterns["true_false"]
+        self.text_input_patterns = patterns["text_input"]
+        self.terminal_patterns = patterns["terminal_settings"]
+        self.login_patterns = patterns["login_redirect"]
+        self.question_patterns = patterns["question"]
+
+        # A type with an unanchored pattern is always tried
+        self.matcher = CompiledPromptMatcher(
+            {
+                family: None if any(not pattern.anchors for pattern in patterns[family]) else [anchor for pattern in patterns[family] for anchor in pattern.anchors]
+                for family in self.family_detectors
+            }
+        )
 
     def detect_prompt(self, content: str) -> PromptInfo | None:
         """Detect prompt type and extract information.
@@ -116,23 +154,45 @@ class ClaudePromptDetector:
         if not content or len(content.strip()) < 3:
             return None
 
-        # Clean content for better analysis
-        cleaned_content = self._clean_content(content)
+        # Pick up edited pattern packs
+        if self.registry.maybe_reload() or self.pattern_generation != self.registry.generation:
+            self._compile_patterns()
+
+        # Prompts sit at the bottom of the pane; only new lines get cleaned
+        cleaned_content = self.normalizer.prompt_region(content)
 
-        # Try different detection methods in order of specificity
-        detectors = [
-            self._detect_numbered_selection,
-            self._detect_binary_choice,
-            self._detect_true_false,
-            self._detect_terminal_settings,
-            self._detect_login_redirect,
-            self._detect_text_input,
-            self._detect_confirmation,
-        ]
+        # Screens repeat across ticks and sessions; results depend on the packs
+        key = (self.registry, self.pattern_generation, fingerprint(cleaned_content))
+        return self.cache.get_or_compute(key, lambda: self._detect_region(cleaned_content))
+
+    def _detect_region(self, content: str) -> PromptInfo | None:
+        """Detect a prompt in a cleaned prompt region.
+
+        Returns:
+            PromptInfo | None: The highest-priority prompt, if any.
+        """
+        # Only the families whose anchors appear can match
+        detectors = [self.family_detectors[family] for family in self.matcher.candidates(content)]
+        detectors.append(self._detect_confirmation)
 
+        return self._run_detectors(detectors, content)
+
+    def _detect_sequential(self, content: str) -> PromptInfo | None:
+        """Detect a prompt by running every detector over cleaned content.
+
+        The reference for :meth:`detect_prompt`, which skips the detectors
+        that cannot match.
+
+        Returns:
+            PromptInfo | None: The first detector's prompt, if any.
+        """
+        return self._run_detectors([*self.family_detectors.values(), self._detect_confirmation], content)
+
+    def _run_detectors(self, detectors: list[Callable[[str], PromptInfo | None]], content: str) -> PromptInfo | None:
+        # Try detection methods in order of specificity
         for detector in detectors:
             try:
-                prompt_info = detector(cleaned_content)
+                prompt_info = detector(content)
                 if prompt_info:
                     self.logger.debug(f"Detected prompt: {prompt_info.type.value}")
                     return prompt_info
@@ -149,18 +209,10 @@ class ClaudePromptDetector:
         str: Description of return value.
         """
         # Remove ANSI escape sequences
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        cleaned = ansi_escape.sub("", content)
+        cleaned = ANSI_ESCAPE.sub("", content)
 
         # Keep line structure but normalize spacing within lines
-        lines = []
-        for line in cleaned.split("\n"):
-            # Normalize whitespace within each line but preserve line breaks
-            normalized_line = re.sub(r"\s+", " ", line).strip()
-            lines.append(normalized_line)
-
-        # Rejoin with preserved line structure
-        cleaned = "\n".join(lines)
+        cleaned = "\n".join(normalize_line(line) for line in cleaned.split("\n"))
 
         # Remove excessive empty lines
         cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", cleaned)
@@ -218,7 +270,9 @@ class ClaudePromptDetector:
                 question = self._extract_question(content)
 
                 # Determine options based on pattern
-                if "y/n" in pattern.pattern.lower():
+                if pattern.options:
+                    options = pattern.options
+                elif "y/n" in pattern.pattern.lower():
                     options = [("y", "Yes"), ("n", "No")]
                 elif "[1/2]" in pattern.pattern:
                     options = [("1", "Option 1"), ("2", "Option 2")]
@@ -0,0 +1,120 @@
+# Copyright notice.
+
+import re
+from collections import OrderedDict
+from typing import Any
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Incremental normalisation of pane captures for prompt detection.
+
+A monitor captures the same 50 lines every tick and only the bottom few change,
+while prompts only ever appear at the bottom of the pane. :class:`PromptNormalizer`
+caches each raw line's cleaned form, so only lines that are new since earlier
+frames are cleaned, and hands the detectors the bottom lines of the capture
+(the prompt region) instead of the whole frame.
+"""
+
+
+ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_line(line: str) -> str:
+    """Strip ANSI escapes from a line and collapse its whitespace.
+
+    Returns:
+        str: The cleaned line.
+    """
+    return _WHITESPACE.sub(" ", ANSI_ESCAPE.sub("", line)).strip()
+
+
+class PromptNormalizer:
+    """Cleans captures line by line with a bounded cache of cleaned lines."""
+
+    def __init__(self, region_lines: int | None = None, max_cached_lines: int = 2048) -> None:
+        """Initialize the normalizer.
+
+        Args:
+            region_lines: Cleaned lines at the bottom of a capture that make up
+                the prompt region, 0 for all (``settings.monitoring.prompt_region_lines`` if None)
+            max_cached_lines: Raw lines whose cleaned form is kept
+        """
+        self.region_lines = max(0, region_lines if region_lines is not None else settings.monitoring.prompt_region_lines)
+        self.max_cached_lines = max_cached_lines
+        self._lines: OrderedDict[str, str] = OrderedDict()
+
+        # Statistics
+        self.lines_seen = 0
+        self.lines_cleaned = 0
+
+    def _clean(self, raw_line: str) -> str:
+        self.lines_seen += 1
+        cleaned = self._lines.get(raw_line)
+        if cleaned is not None:
+            self._lines.move_to_end(raw_line)
+            return cleaned
+
+        cleaned = normalize_line(raw_line)
+        self.lines_cleaned += 1
+        self._lines[raw_line] = cleaned
+        if len(self._lines) > self.max_cached_lines:
+            self._lines.popitem(last=False)
+        return cleaned
+
+    def prompt_region(self, content: str, region_lines: int | None = None) -> str:
+        """Clean the bottom of a capture.
+
+        Equivalent to cleaning the whole capture (runs of blank lines collapse
+        to one, leading and trailing blank lines are dropped) and keeping its
+        last ``region_lines`` lines, but only the lines in the region are cleaned.
+
+        Args:
+            content: Raw pane content
+            region_lines: Lines to keep, 0 for all (``self.region_lines`` if None)
+
+        Returns:
+            str: The cleaned prompt region.
+        """
+        limit = self.region_lines if region_lines is None else region_lines
+        region: list[str] = []
+        truncated = False
+        for raw_line in reversed(content.split("\n")):
+            line = self._clean(raw_line)
+            if not line and (not region or not region[-1]):
+                # Trailing blank lines are dropped and blank runs collapse
+                continue
+            if limit and len(region) == limit:
+                truncated = True
+                break
+            region.append(line)
+
+        if region and not region[-1] and not truncated:
+            # The capture ran out above a blank line: it was a leading one
+            region.pop()
+        region.reverse()
+        return "\n".join(region)
+
+    def normalize(self, content: str) -> str:
+        """Clean a whole capture.
+
+        Returns:
+            str: The cleaned content.
+        """
+        return self.prompt_region(content, region_lines=0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get normalizer statistics.
+
+        Returns:
+            dict[str, Any]: Region size, lines seen and cleaned, and the cache hit rate.
+        """
+        return {
+            "region_lines": self.region_lines,
+            "lines_seen": self.lines_seen,
+            "lines_cleaned": self.lines_cleaned,
+            "hit_rate": 1 - self.lines_cleaned / self.lines_seen if self.lines_seen else 0.0,
+            "cached_lines": len(self._lines),
+        }
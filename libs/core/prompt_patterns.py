@@ -0,0 +1,368 @@
+# Copyright notice.
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Loadable prompt pattern packs with per-pattern profiling.
+
+The patterns :class:`~libs.core.prompt_detector.ClaudePromptDetector` runs come
+from YAML packs: the default pack shipped next to this module, then every
+``*.yaml`` file in ``settings.paths.prompt_patterns_dir`` in file name order.
+Each pattern maps to a prompt type and has a priority within it. A later pack can
+replace a pattern by reusing its id, or remove it with ``enabled: false``.
+
+:class:`PromptPatternRegistry` compiles the packs once and recompiles them
+when a pack file changes, bumping its generation. Every pattern counts its
+evaluations, hits and cumulative search time, so slow or useless patterns can
+be pruned and the ordering tuned from production data.
+"""
+
+
+logger = logging.getLogger("yesman.prompt_patterns")
+
+DEFAULT_PACK = Path(__file__).with_name("prompt_patterns.yaml")
+
+# Prompt types a pattern can map to; "question" patterns extract the question text
+PATTERN_TYPES = (
+    "numbered_selection",
+    "binary_choice",
+    "true_false",
+    "terminal_settings",
+    "login_redirect",
+    "text_input",
+    "question",
+)
+
+_FLAGS = {
+    "ignorecase": re.IGNORECASE,
+    "multiline": re.MULTILINE,
+    "dotall": re.DOTALL,
+}
+
+
+@dataclass
+class PromptPattern:
+    """A compiled prompt pattern that profiles its own searches.
+
+    Exposes ``pattern``, ``search`` and ``findall`` like :class:`re.Pattern`.
+    Counters are updated without a lock; a lost increment under concurrent
+    detection is acceptable for profiling.
+
+    Attributes:
+        id: Unique pattern id, e.g. ``"binary.yn"``
+        type: Prompt type the pattern maps to (see ``PATTERN_TYPES``)
+        regex: Compiled regex
+        priority: Order within the type, highest first
+        anchors: Regexes every match contains once casefolded; empty if unknown
+        options: Options a binary choice offers, derived from the regex if None
+        pack: Name of the pack the pattern came from
+    """
+
+    id: str
+    type: str
+    regex: re.Pattern[str]
+    priority: int = 0
+    anchors: tuple[str, ...] = ()
+    options: list[tuple[str, str]] | None = None
+    pack: str = ""
+    evaluations: int = field(default=0, compare=False)
+    hits: int = field(default=0, compare=False)
+    total_time: float = field(default=0.0, compare=False)
+
+    @property
+    def pattern(self) -> str:
+        """The regex source."""
+        return self.regex.pattern
+
+    def _record(self, started: float, hit: bool) -> None:
+        self.total_time += time.perf_counter() - started
+        self.evaluations += 1
+        if hit:
+            self.hits += 1
+
+    def search(self, content: str) -> re.Match[str] | None:
+        """Search the content, counting the evaluation.
+
+        Returns:
+            re.Match[str] | None: The first match, if any.
+        """
+        started = time.perf_counter()
+        match = self.regex.search(content)
+        self._record(started, match is not None)
+        return match
+
+    def findall(self, content: str) -> list[Any]:
+        """Find every match in the content, counting the evaluation.
+
+        Returns:
+            list[Any]: Matches as returned by :meth:`re.Pattern.findall`.
+        """
+        started = time.perf_counter()
+        matches = self.regex.findall(content)
+        self._record(started, bool(matches))
+        return matches
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get profiling statistics.
+
+        Returns:
+            dict[str, Any]: Identity, evaluation and hit counts, and time spent.
+        """
+        return {
+            "id": self.id,
+            "type": self.type,
+            "pack": self.pack,
+            "priority": self.priority,
+            "evaluations": self.evaluations,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.evaluations if self.evaluations else 0.0,
+            "total_ms": self.total_time * 1000,
+            "average_us": self.total_time * 1_000_000 / self.evaluations if self.evaluations else 0.0,
+        }
+
+
+def _parse_pattern(entry: dict[str, Any], pack: str) -> PromptPattern:
+    pattern_id = entry.get("id")
+    if not isinstance(pattern_id, str) or not pattern_id:
+        msg = f"Pattern in pack {pack} has no id: {entry}"
+        raise ValueError(msg)
+
+    pattern_type = entry.get("type")
+    if pattern_type not in PATTERN_TYPES:
+        msg = f"Pattern {pattern_id} in pack {pack} has unknown type {pattern_type!r}"
+        raise ValueError(msg)
+
+    flags = 0
+    for flag in entry.get("flags") or []:
+        if flag not in _FLAGS:
+            msg = f"Pattern {pattern_id} in pack {pack} has unknown flag {flag!r}"
+            raise ValueError(msg)
+        flags |= _FLAGS[flag]
+
+    try:
+        regex = re.compile(str(entry.get("regex", "")), flags)
+        anchors = tuple(str(anchor) for anchor in entry.get("anchors") or [])
+        for anchor in anchors:
+            re.compile(anchor)
+    except re.error as e:
+        msg = f"Pattern {pattern_id} in pack {pack} does not compile: {e}"
+        raise ValueError(msg) from e
+
+    if not regex.pattern:
+        msg = f"Pattern {pattern_id} in pack {pack} has no regex"
+        raise ValueError(msg)
+    if pattern_type == "numbered_selection" and regex.groups != 2:
+        msg = f"Numbered selection pattern {pattern_id} in pack {pack} needs exactly two groups"
+        raise ValueError(msg)
+
+    options = entry.get("options")
+    return PromptPattern(
+        id=pattern_id,
+        type=pattern_type,
+        regex=regex,
+        priority=int(entry.get("priority", 0)),
+        anchors=anchors,
+        options=[(str(key), str(description)) for key, description in options] if options else None,
+        pack=pack,
+    )
+
+
+def load_pattern_pack(path: str | Path) -> tuple[str, list[PromptPattern], set[str]]:
+    """Load a YAML pattern pack.
+
+    Args:
+        path: Pack file
+
+    Returns:
+        tuple[str, list[PromptPattern], set[str]]: Pack name, enabled patterns,
+        and ids of patterns the pack disables.
+
+    Raises:
+        ValueError: If the pack or one of its patterns is invalid.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict) or not isinstance(data.get("patterns", []), list):
+        msg = f"Pattern pack {path} must be a mapping with a 'patterns' list"
+        raise ValueError(msg)
+
+    name = str(data.get("name", path.stem))
+    patterns = []
+    disabled = set()
+    for entry in data.get("patterns", []):
+        if not isinstance(entry, dict):
+            msg = f"Pattern pack {path} has a non-mapping pattern: {entry!r}"
+            raise ValueError(msg)
+        if entry.get("enabled", True) is False:
+            disabled.add(str(entry.get("id")))
+            continue
+        patterns.append(_parse_pattern(entry, name))
+    return name, patterns, disabled
+
+
+class PromptPatternRegistry:
+    """Compiled prompt patterns from the default and user packs, reloaded on change."""
+
+    def __init__(self, pack_dir: str | Path | None = None, reload_interval: float | None = None, default_pack: str | Path = DEFAULT_PACK) -> None:
+        """Initialize the registry and load the packs.
+
+        Args:
+            pack_dir: Directory of user packs (``settings.paths.prompt_patterns_dir`` if None)
+            reload_interval: Seconds between checks for changed packs
+                (``settings.monitoring.prompt_pattern_reload_interval`` if None)
+            default_pack: Pack loaded before the user packs
+        """
+        self.pack_dir = Path(pack_dir if pack_dir is not None else settings.paths.prompt_patterns_dir).expanduser()
+        self.reload_interval = reload_interval if reload_interval is not None else settings.monitoring.prompt_pattern_reload_interval
+        self.default_pack = Path(default_pack)
+
+        self.generation = 0
+        self.packs: list[str] = []
+        self.errors: dict[str, str] = {}
+        self._patterns: dict[str, list[PromptPattern]] = {}
+        self._signature: tuple[tuple[str, int, int], ...] = ()
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.reload()
+
+    def _pack_files(self) -> list[Path]:
+        user_packs = sorted(self.pack_dir.glob("*.yaml")) if self.pack_dir.is_dir() else []
+        return [self.default_pack, *user_packs]
+
+    def _compute_signature(self, files: list[Path]) -> tuple[tuple[str, int, int], ...]:
+        signature = []
+        for path in files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def reload(self) -> None:
+        """Load and compile every pack.
+
+        An invalid user pack is skipped and reported in ``errors``; the default
+        pack must be valid.
+
+        Raises:
+            ValueError: If the default pack is invalid.
+        """
+        files = self._pack_files()
+        signature = self._compute_signature(files)
+
+        previous = {pattern.id: pattern for patterns in self._patterns.values() for pattern in patterns}
+        by_id: dict[str, PromptPattern] = {}
+        packs = []
+        errors = {}
+        for path in files:
+            try:
+                name, patterns, disabled = load_pattern_pack(path)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                if path == self.default_pack:
+                    raise ValueError(str(e)) from e
+                logger.exception("Skipping invalid prompt pattern pack %s", path)
+                errors[str(path)] = str(e)
+                continue
+            packs.append(name)
+            for pattern_id in disabled:
+                by_id.pop(pattern_id, None)
+            for pattern in patterns:
+                # A later pack replaces a pattern with the same id
+                by_id.pop(pattern.id, None)
+                by_id[pattern.id] = pattern
+
+        grouped: dict[str, list[PromptPattern]] = {pattern_type: [] for pattern_type in PATTERN_TYPES}
+        for pattern in by_id.values():
+            old = previous.get(pattern.id)
+            if old is not None and old.regex == pattern.regex:
+                # Keep profiling counters of unchanged patterns across reloads
+                pattern.evaluations, pattern.hits, pattern.total_time = old.evaluations, old.hits, old.total_time
+            grouped[pattern.type].append(pattern)
+        for patterns in grouped.values():
+            patterns.sort(key=lambda pattern: pattern.priority, reverse=True)
+
+        with self._lock:
+            self._patterns = grouped
+            self.packs = packs
+            self.errors = errors
+            self._signature = signature
+            self.generation += 1
+        logger.info("Loaded %d prompt patterns from packs %s (generation %d)", len(by_id), ", ".join(packs), self.generation)
+
+    def maybe_reload(self, now: float | None = None) -> bool:
+        """Reload the packs if a pack file changed, at most once per reload interval.
+
+        Returns:
+            bool: Whether the packs were reloaded.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._checked_at < self.reload_interval:
+            return False
+        self._checked_at = now
+
+        if self._compute_signature(self._pack_files()) == self._signature:
+            return False
+        try:
+            self.reload()
+        except ValueError:
+            logger.exception("Keeping previous prompt patterns")
+            return False
+        return True
+
+    def patterns(self) -> dict[str, list[PromptPattern]]:
+        """Get the compiled patterns.
+
+        Returns:
+            dict[str, list[PromptPattern]]: Patterns per type, highest priority first.
+        """
+        with self._lock:
+            return {pattern_type: list(patterns) for pattern_type, patterns in self._patterns.items()}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get loaded packs and per-pattern profiling counters.
+
+        Returns:
+            dict[str, Any]: Generation, packs, load errors and pattern stats,
+            most expensive first.
+        """
+        with self._lock:
+            patterns = [pattern.get_stats() for type_patterns in self._patterns.values() for pattern in type_patterns]
+            return {
+                "generation": self.generation,
+                "packs": list(self.packs),
+                "pack_dir": str(self.pack_dir),
+                "errors": dict(self.errors),
+                "patterns": sorted(patterns, key=lambda stats: stats["total_ms"], reverse=True),
+            }
+
+
+_registry: PromptPatternRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_prompt_pattern_registry() -> PromptPatternRegistry:
+    """Get the process-wide prompt pattern registry.
+
+    Returns:
+        PromptPatternRegistry: Registry loaded from the default and user packs.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = PromptPatternRegistry()
+    return _registry
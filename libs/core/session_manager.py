@@ -9,29 +9,23 @@ from typing import Any, cast
 
 import libtmux
 
-# Try to import psutil, fall back to basic functionality if not available
-import psutil
-
 # Lazy import to avoid circular dependency
 from libs.tmux_manager import TmuxManager
 from libs.utils import ensure_log_directory
 
 # Avoid circular import
 from .models import PaneInfo, SessionInfo, TaskPhase, WindowInfo
+from .pane_roles import PaneRole, get_pane_role_index, role_from_command
+from .process_sampler import PSUTIL_AVAILABLE, ProcessStats, get_process_sampler
 from .progress_tracker import ProgressAnalyzer
+from .tmux_cache import get_tmux_cache
+from .tmux_snapshot import PaneSnapshot, TmuxSnapshot, capture_panes, get_fleet_snapshot
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Session management for dashboard."""
 
 
-try:
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    psutil = None
-
-
 class SessionManager:
     """Manages tmux session information for dashboard."""
 
@@ -48,6 +42,9 @@ class SessionManager:
         # Initialize progress analyzer
         self.progress_analyzer = ProgressAnalyzer()
 
+        # Shared sampler keeps CPU counters primed across refreshes
+        self.process_sampler = get_process_sampler()
+
         self.logger.info("SessionManager initialized")
 
     def _setup_logger(self) -> logging.Logger:
@@ -75,6 +72,10 @@ class SessionManager:
     def get_all_sessions(self) -> list[SessionInfo]:
         """Get information about all yesman sessions.
 
+        The whole tmux server is read with one ``list-panes -a`` query and one
+        batched capture, and all pane processes with one process table pass,
+        regardless of how many sessions and panes exist.
+
         Returns:
         List of the requested data.
         """
@@ -85,8 +86,20 @@ class SessionManager:
             projects = cast("dict", self.tmux_manager.load_projects().get("sessions", {}))
             self.logger.info("Loaded %d projects", len(projects))
 
+            snapshot = get_fleet_snapshot(self.server)
+            session_names = {self._session_name_for(project_name, project_conf) for project_name, project_conf in projects.items()}
+            panes = [pane for pane in snapshot.panes if pane.session_name in session_names]
+            captures = capture_panes(self.server, [pane.pane_id for pane in panes])
+            process_stats = self.process_sampler.sample(pane.pid for pane in panes)
+
             for project_name, project_conf in projects.items():
-                session_info = self._get_session_info(project_name, project_conf)
+                session_info = self._get_session_info(
+                    project_name,
+                    project_conf,
+                    snapshot=snapshot,
+                    captures=captures,
+                    process_stats=process_stats,
+                )
                 sessions_info.append(session_info)
 
             return sessions_info
@@ -95,256 +108,181 @@ class SessionManager:
             self.logger.error("Error getting sessions", exc_info=True)
             return []
 
-    def _get_session_info(self, project_name: str, project_conf: dict[str, Any]) -> SessionInfo:
-        """Get information for a single session with mode-aware caching.
-
-        Returns:
-        Dict containing service information.
-        """
-
-        def compute_session_info() -> SessionInfo:
-            override = project_conf.get("override", {})
-            session_name = override.get("session_name", project_name)
-
-            # Check if session exists
-            session = self.server.sessions.get(session_name=session_name, default=None)
-
-            windows: list[WindowInfo] = []
-            controller_status = "unknown"
-
-            if session and hasattr(session, "windows"):
-                # Get window information
-                for window in session.windows:
-                    window_info = self._get_window_info(window)
-                    windows.append(window_info)
-
-                    # Update controller status based on panes
-                    for pane in window_info.panes:
-                        if pane.is_controller:
-                            controller_status = "running"
-
-                # If no controller found, mark as not running
-                if controller_status == "unknown":
-                    controller_status = "not running"
+    @staticmethod
+    def _session_name_for(project_name: str, project_conf: dict[str, Any]) -> str:
+        return cast("str", project_conf.get("override", {}).get("session_name", project_name))
+
+    def _get_session_info(
+        self,
+        project_name: str,
+        project_conf: dict[str, Any],
+        snapshot: TmuxSnapshot | None = None,
+        captures: dict[str, list[str]] | None = None,
+        process_stats: dict[int, ProcessStats] | None = None,
+    ) -> SessionInfo:
+        """Get information for a single session.
 
-            # Get template name with proper fallback
-            template_name = project_conf.get("template_name")
-            if template_name is None:
-                template_display = "none"
-            else:
-                # Check if template file actually exists
-                template_path = self.config.get_templates_dir() / f"{template_name}.yaml"
-                if template_path.exists():
-                    template_display = template_name
-                else:
-                    template_display = "N/A"  # Template defined but file missing
-
-            # Analyze progress if session is running
-            progress = None
-            if session:
-                # Collect output from all Claude panes
-                claude_output = []
-                for window_info in windows:
-                    for pane_info in window_info.panes:
-                        if pane_info.is_claude and pane_info.last_output:
-                            # Get full pane content for better analysis
-                            try:
-                                if hasattr(session, "find_where"):
-                                    # Find pane by id across all windows and panes
-                                    tmux_pane = None
-                                    for w in session.windows:
-                                        for p in w.panes:
-                                            if p.pane_id == pane_info.id:
-                                                tmux_pane = p
-                                                break
-                                        if tmux_pane:
-                                            break
-                                    if tmux_pane and hasattr(tmux_pane, "cmd"):
-                                        cmd_result = tmux_pane.cmd("capture-pane", "-p")
-                                        if hasattr(cmd_result, "stdout") and cmd_result.stdout:
-                                            claude_output.extend(cmd_result.stdout)
-                            except Exception as e:
-                                self.logger.warning(
-                                    "Could not get pane content for %s: %s",
-                                    pane_info.id,
-                                    e,
-                                )
-
-                # Analyze progress
-                if claude_output:
-                    progress = self.progress_analyzer.analyze_pane_output(session_name, claude_output)
-
-            return SessionInfo(
-                project_name=project_name,
-                session_name=session_name,
-                template=template_display,
-                exists=session is not None,
-                status="running" if session else "stopped",
-                windows=windows,
-                controller_status=controller_status,
-                progress=progress,
-            )
-
-        return compute_session_info()
-
-    def _get_window_info(self, window: object) -> WindowInfo:
-        """Get information for a single window with detailed pane metrics.
+        Args:
+            project_name: Project name from the projects configuration
+            project_conf: Project configuration
+            snapshot: Fleet snapshot to read from (the shared snapshot if None)
+            captures: Pane contents keyed by pane id (captured on demand if None)
+            process_stats: Process tree stats keyed by pane pid (sampled on demand if None)
 
         Returns:
         Dict containing service information.
         """
-        panes: list[PaneInfo] = []
-
-        # Cast to libtmux Window for proper attribute access
-        from typing import cast
-
-        if hasattr(window, "panes"):
-            tmux_window = cast("libtmux.Window", window)
-
-            for pane in tmux_window.panes:
-                try:
-                    pane_info = self._get_detailed_pane_info(pane)
-                    panes.append(pane_info)
-                except Exception:
-                    self.logger.exception("Error getting pane info")
-                    # Fallback to basic pane info
-                    try:
-                        if hasattr(pane, "cmd"):
-                            cmd_result = pane.cmd("display-message", "-p", "#{pane_current_command}")
-                            cmd = cmd_result.stdout[0] if hasattr(cmd_result, "stdout") and cmd_result.stdout else ""
-                        else:
-                            cmd = ""
-
-                        basic_pane = PaneInfo(
-                            id=(getattr(pane, "pane_id", "unknown") if hasattr(pane, "pane_id") else pane.get("pane_id", "unknown")),
-                            command=cmd,
-                            is_claude="claude" in cmd.lower(),
-                            is_controller="controller" in cmd.lower() or "yesman" in cmd.lower(),
-                        )
-                        panes.append(basic_pane)
-                    except Exception as e:
-                        self.logger.debug("Could not get basic pane info: %s", e)
-
-        return WindowInfo(
-            name=(getattr(window, "window_name", "unknown") if hasattr(window, "window_name") else cast("dict", window).get("window_name", "unknown")),
-            index=str(getattr(window, "window_index", 0) if hasattr(window, "window_index") else cast("dict", window).get("window_index", 0)),
-            panes=panes,
+        session_name = self._session_name_for(project_name, project_conf)
+
+        if snapshot is None:
+            snapshot = get_fleet_snapshot(self.server)
+        session_exists = snapshot.has_session(session_name)
+
+        windows: list[WindowInfo] = []
+        controller_status = "unknown"
+
+        if session_exists:
+            if captures is None:
+                captures = capture_panes(self.server, [pane.pane_id for pane in snapshot.session_panes(session_name)])
+            if process_stats is None:
+                process_stats = self.process_sampler.sample(pane.pid for pane in snapshot.session_panes(session_name))
+            roles = get_pane_role_index().resolve(snapshot, snapshot.session_panes(session_name), server=self.server, captures=captures)
+
+            for window_index, window_panes in snapshot.session_windows(session_name).items():
+                panes = [
+                    self._build_pane_info(
+                        pane,
+                        captures.get(pane.pane_id),
+                        process_stats.get(pane.pid) if pane.pid else None,
+                        role=roles[pane.pane_id].role if pane.pane_id in roles else None,
+                    )
+                    for pane in window_panes
+                ]
+                windows.append(WindowInfo(name=window_panes[0].window_name, index=window_index, panes=panes))
+
+                # Update controller status based on panes
+                if any(pane.is_controller for pane in panes):
+                    controller_status = "running"
+
+            # If no controller found, mark as not running
+            if controller_status == "unknown":
+                controller_status = "not running"
+
+        # Get template name with proper fallback
+        template_name = project_conf.get("template_name")
+        if template_name is None:
+            template_display = "none"
+        else:
+            # Check if template file actually exists
+            template_path = self.config.get_templates_dir() / f"{template_name}.yaml"
+            if template_path.exists():
+                template_display = template_name
+            else:
+                template_display = "N/A"  # Template defined but file missing
+
+        # Analyze progress from the output of all Claude panes
+        progress = None
+        if session_exists and captures:
+            claude_output = []
+            for window_info in windows:
+                for pane_info in window_info.panes:
+                    if pane_info.is_claude and pane_info.last_output:
+                        claude_output.extend(captures.get(pane_info.id, []))
+
+            if claude_output:
+                progress = self.progress_analyzer.analyze_pane_output(session_name, claude_output)
+
+        # Commands run by Claude show up as child processes of its pane
+        if session_exists and process_stats:
+            claude_processes = [process_stats[pane_info.pid] for window_info in windows for pane_info in window_info.panes if pane_info.is_claude and pane_info.pid in process_stats]
+            if claude_processes:
+                progress = self.progress_analyzer.analyze_process_activity(session_name, claude_processes) or progress
+
+        return SessionInfo(
+            project_name=project_name,
+            session_name=session_name,
+            template=template_display,
+            exists=session_exists,
+            status="running" if session_exists else "stopped",
+            windows=windows,
+            controller_status=controller_status,
+            progress=progress,
         )
 
-    def _get_detailed_pane_info(self, pane: libtmux.Pane) -> PaneInfo:
-        """Get detailed information for a single pane including metrics.
+    def _build_pane_info(
+        self,
+        pane: PaneSnapshot,
+        content: list[str] | None,
+        process: ProcessStats | None = None,
+        role: PaneRole | None = None,
+    ) -> PaneInfo:
+        """Build detailed pane information from a snapshot row.
+
+        Args:
+            pane: Pane state from the fleet snapshot
+            content: Captured pane content, if available
+            process: Sampled stats of the pane's process tree, if available
+            role: Role from the pane role index (derived from the command if None)
 
         Returns:
-        Dict containing service information.
+        PaneInfo with process and activity metrics.
         """
-        try:
-            # Get basic pane information
-            cmd = pane.cmd("display-message", "-p", "#{pane_current_command}").stdout[0]
-            pane_id = pane.get("pane_id")
-
-            # Get pane PID and process info
-            pid_info = pane.cmd("display-message", "-p", "#{pane_pid}").stdout[0]
-            pid = int(pid_info) if pid_info.isdigit() else None
-
-            # Initialize detailed metrics
-            cpu_usage = 0.0
-            memory_usage = 0.0
-            running_time = 0.0
-            status = "unknown"
-            current_task = None
-
-            # Get process metrics if PID is available and psutil is installed
-            if pid and PSUTIL_AVAILABLE:
-                try:
-                    process = psutil.Process(pid)
-                    cpu_usage = process.cpu_percent()
-                    memory_info = process.memory_info()
-                    memory_usage = memory_info.rss / 1024 / 1024  # Convert to MB
-
-                    # Calculate running time
-                    create_time = process.create_time()
-                    running_time = datetime.now(UTC).timestamp() - create_time
-
-                    # Determine process status
-                    status = process.status()
-
-                    # Try to determine current task from command line
-                    try:
-                        cmdline = process.cmdline()
-                        current_task = self._analyze_current_task(cmdline, cmd)
-                    except Exception:
-                        current_task = cmd
-
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
-                    # Process might have ended or we don't have permission
-                    pass
-            elif pid and not PSUTIL_AVAILABLE:
-                # Fallback: basic task analysis without psutil
-                current_task = self._analyze_current_task([cmd], cmd)
-
-            # Get pane activity information
-            try:
-                # Get last pane activity time (approximation)
-                pane_activity = pane.cmd("display-message", "-p", "#{pane_activity}").stdout[0]
-                activity_timestamp = int(pane_activity) if pane_activity.isdigit() else 0
-
-                # Calculate idle time and activity score
-                current_time = datetime.now(UTC).timestamp()
-                idle_time = current_time - activity_timestamp if activity_timestamp > 0 else 0
-
-                # Activity score: higher for recent activity, lower for idle panes
-                activity_score = max(0, 100 - (idle_time / 60))  # Decreases over minutes
-
-            except Exception:
-                idle_time = 0.0
-                activity_score = 50.0  # Default moderate activity
-
-            # Get recent pane output for analysis
-            last_output = None
-            output_lines = 0
-            try:
-                # Capture last few lines of pane content
-                pane_content = pane.cmd("capture-pane", "-p").stdout
-                if pane_content:
-                    lines = [line for line in pane_content if line.strip()]
-                    output_lines = len(lines)
-                    if lines:
-                        last_output = lines[-1][:100]  # Last line, truncated
-            except Exception as e:
-                self.logger.debug("Could not capture pane output: %s", e)
-
-            # Create enhanced PaneInfo
-            return PaneInfo(
-                id=pane_id,
-                command=cmd,
-                is_claude="claude" in cmd.lower(),
-                is_controller="controller" in cmd.lower() or "yesman" in cmd.lower(),
-                current_task=current_task,
-                idle_time=idle_time,
-                last_activity=(datetime.fromtimestamp(activity_timestamp, UTC) if activity_timestamp > 0 else datetime.now(UTC)),
-                cpu_usage=cpu_usage,
-                memory_usage=memory_usage,
-                pid=pid,
-                running_time=running_time,
-                status=status,
-                activity_score=activity_score,
-                last_output=last_output,
-                output_lines=output_lines,
-            )
-
-        except Exception:
-            self.logger.exception("Error getting detailed pane info")
-            # Return basic pane info as fallback
-            return PaneInfo(
-                id=pane.get("pane_id", "unknown"),
-                command=cmd if "cmd" in locals() else "unknown",
-                is_claude=False,
-                is_controller=False,
-            )
+        cmd = pane.command
+        pid = pane.pid
+
+        # Initialize detailed metrics
+        cpu_usage = 0.0
+        memory_usage = 0.0
+        running_time = 0.0
+        status = "unknown"
+        current_task = None
+
+        if process is not None:
+            cpu_usage = process.cpu_percent
+            memory_usage = process.memory_mb
+            running_time = datetime.now(UTC).timestamp() - process.create_time
+            status = process.status
+            current_task = self._analyze_current_task(list(process.foreground_cmdline), cmd)
+        elif pid and not PSUTIL_AVAILABLE:
+            # Fallback: basic task analysis without psutil
+            current_task = self._analyze_current_task([cmd], cmd)
+
+        # Calculate idle time and activity score from the window activity timestamp
+        activity_timestamp = pane.activity
+        current_time = datetime.now(UTC).timestamp()
+        idle_time = current_time - activity_timestamp if activity_timestamp > 0 else 0
+        # Activity score: higher for recent activity, lower for idle panes
+        activity_score = max(0, 100 - (idle_time / 60))  # Decreases over minutes
+
+        # Summarize recent pane output
+        last_output = None
+        output_lines = 0
+        if content:
+            lines = [line for line in content if line.strip()]
+            output_lines = len(lines)
+            if lines:
+                last_output = lines[-1][:100]  # Last line, truncated
+
+        if role is None:
+            role = role_from_command(cmd) or PaneRole.SHELL
+
+        return PaneInfo(
+            id=pane.pane_id,
+            command=cmd,
+            is_claude=role is PaneRole.CLAUDE or (process is not None and process.has_process("claude")),
+            is_controller=role is PaneRole.CONTROLLER,
+            current_task=current_task,
+            idle_time=idle_time,
+            last_activity=(datetime.fromtimestamp(activity_timestamp, UTC) if activity_timestamp > 0 else datetime.now(UTC)),
+            cpu_usage=cpu_usage,
+            memory_usage=memory_usage,
+            pid=pid,
+            running_time=running_time,
+            status=status,
+            activity_score=activity_score,
+            last_output=last_output,
+            output_lines=output_lines,
+        )
 
     @staticmethod
     def _analyze_current_task(cmdline: list[str], command: str) -> str:
@@ -613,5 +551,6 @@ echo "Attaching to tmux pane..."
     @staticmethod
     def _cleanup_cache() -> None:
         """Clean up stale cached session data."""
-        # This is a placeholder method to satisfy the API contract
-        # The actual SessionManager doesn't use caching currently
+        removed = get_tmux_cache().cleanup_expired()
+        if removed:
+            logging.getLogger("yesman.dashboard.session_manager").debug("Removed %d expired tmux cache entries", removed)
@@ -5,6 +5,9 @@
 import os
 import pathlib
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import click
@@ -18,6 +21,7 @@ from libs.validation import (
 
 from .base_command import CommandError
 from .settings import settings
+from .tmux_cache import invalidate_tmux_cache
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -191,12 +195,14 @@ class SessionConfigBuilder:
     def __init__(self, tmux_manager: object) -> None:
         self.tmux_manager = tmux_manager
 
-    def build_session_config(self, session_name: str, session_conf: dict[str, Any]) -> dict[str, Any]:
+    def build_session_config(self, session_name: str, session_conf: dict[str, Any], timings: dict[str, float] | None = None) -> dict[str, Any]:
         """Build complete session configuration.
 
         Args:
             session_name: Name of the session
             session_conf: Session configuration from projects.yaml
+            timings: Optional dict that receives the ``config_load`` and
+                ``template_expansion`` durations in seconds
 
         Returns:
             Complete session configuration dictionary
@@ -204,9 +210,11 @@ class SessionConfigBuilder:
         Raises:
             CommandError: If template loading fails
         """
+        started = time.perf_counter()
         template_name = session_conf.get("template_name")
         template_conf = self._load_template(template_name)
         override_conf = session_conf.get("override", {})
+        loaded = time.perf_counter()
 
         # Start with template configuration as base
         config_dict = template_conf.copy()
@@ -219,6 +227,10 @@ class SessionConfigBuilder:
         for key, value in override_conf.items():
             config_dict[key] = value
 
+        if timings is not None:
+            timings["config_load"] = timings.get("config_load", 0.0) + loaded - started
+            timings["template_expansion"] = timings.get("template_expansion", 0.0) + time.perf_counter() - loaded
+
         return config_dict
 
     def _load_template(self, template_name: str | None) -> dict[str, Any]:
@@ -255,6 +267,20 @@ class SessionConfigBuilder:
             raise CommandError(msg) from e
 
 
+SETUP_PHASES = ("config_load", "template_expansion", "tmux_build", "startup_commands")
+
+
+@dataclass
+class SessionSetupResult:
+    """Outcome and timing of setting up one session."""
+
+    session_name: str
+    success: bool = False
+    messages: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+    duration: float = 0.0
+
+
 class SessionSetupService:
     """Service for setting up tmux sessions."""
 
@@ -262,19 +288,34 @@ class SessionSetupService:
         self.tmux_manager = tmux_manager
         self.config_builder = SessionConfigBuilder(tmux_manager)
         self.validator = SessionValidator()
+        self.last_report: dict[str, Any] = {}
 
-    def setup_sessions(self, session_filter: str | None = None, dry_run: bool = False, force: bool = False) -> tuple[int, int]:
+    def setup_sessions(
+        self,
+        session_filter: str | None = None,
+        dry_run: bool = False,
+        force: bool = False,
+        workers: int | None = None,
+    ) -> tuple[int, int]:
         """Set up tmux sessions.
 
+        Configurations are built and validated one session at a time because
+        validation may prompt the user. With more than one worker, the tmux
+        build and startup commands then run concurrently; each session's
+        output is still printed in configuration order.
+
         Args:
             session_filter: Optional filter to set up only specific session
             dry_run: If True, only show what would be done without actually creating sessions
             force: If True, recreate existing sessions without prompting
+            workers: Number of sessions to build concurrently (defaults to ``settings.sessions.setup_workers``)
 
         Returns:
             Tuple of (successful_count, failed_count)
         """
+        started = time.perf_counter()
         sessions = self._load_sessions_config(session_filter)
+        projects_load_time = time.perf_counter() - started
 
         if not sessions:
             click.echo("No sessions to set up")
@@ -283,18 +324,30 @@ class SessionSetupService:
         if dry_run:
             return self._dry_run_sessions(sessions)
 
-        successful_count = 0
-        failed_count = 0
+        worker_count = max(1, settings.sessions.setup_workers if workers is None else workers)
+
+        results: list[SessionSetupResult] = []
+        pending: list[tuple[dict[str, Any], SessionSetupResult]] = []
 
         for session_name, session_conf in sessions.items():
-            try:
-                if self._setup_single_session(session_name, session_conf, force=force):
-                    successful_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                click.echo(f"❌ Failed to set up session '{session_name}': {e}")
-                failed_count += 1
+            result = SessionSetupResult(session_name)
+            results.append(result)
+
+            config_dict = self._prepare_session(session_name, session_conf, result, force=force)
+            if config_dict is None:
+                continue
+
+            if worker_count > 1:
+                pending.append((config_dict, result))
+            else:
+                self._build_session(config_dict, result)
+                self._echo_messages(result)
+
+        if pending:
+            self._build_sessions_concurrently(pending, worker_count)
+
+        successful_count = sum(1 for result in results if result.success)
+        failed_count = len(results) - successful_count
 
         # Summary
         click.echo("\n📊 Setup Summary:")
@@ -302,6 +355,9 @@ class SessionSetupService:
         if failed_count > 0:
             click.echo(f"  ❌ Failed: {failed_count}")
 
+        self.last_report = self._build_report(results, worker_count, projects_load_time, time.perf_counter() - started)
+        self._echo_report(self.last_report)
+
         return successful_count, failed_count
 
     def _load_sessions_config(self, session_filter: str | None = None) -> dict[str, Any]:
@@ -331,17 +387,42 @@ class SessionSetupService:
         Returns:
             True if successful, False otherwise
         """
+        result = SessionSetupResult(session_name)
+        config_dict = self._prepare_session(session_name, session_conf, result, force=force)
+        if config_dict is None:
+            return False
+
+        self._build_session(config_dict, result)
+        self._echo_messages(result)
+        return result.success
+
+    def _prepare_session(
+        self,
+        session_name: str,
+        session_conf: dict[str, Any],
+        result: SessionSetupResult,
+        force: bool = False,
+    ) -> dict[str, Any] | None:
+        """Build and validate a session configuration, resolving existing sessions.
+
+        Runs in the calling thread because validation and existing sessions
+        may prompt the user.
+
+        Returns:
+            The configuration to build, or None if the session is skipped or invalid.
+        """
         click.echo(f"🔧 Setting up session: {session_name}")
+        started = time.perf_counter()
 
         try:
             # Build configuration
-            config_dict = self.config_builder.build_session_config(session_name, session_conf)
+            config_dict = self.config_builder.build_session_config(session_name, session_conf, timings=result.timings)
 
             # Validate configuration
             if not self.validator.validate_session_config(session_name, config_dict):
                 for error in self.validator.get_validation_errors():
                     click.echo(f"❌ Validation error: {error}")
-                return False
+                return None
 
             # Check if session already exists
             if self._session_exists(session_name):
@@ -351,21 +432,89 @@ class SessionSetupService:
                     self._kill_session(session_name)
                 elif not click.confirm("Do you want to kill the existing session and recreate it?"):
                     click.echo(f"⏭️  Skipping session '{session_name}'")
-                    return False
+                    return None
                 else:
                     self._kill_session(session_name)
 
-            # Create session
-            self._create_session(config_dict)
-            click.echo(f"✅ Successfully created session: {session_name}")
-            return True
-
         except CommandError as e:
             click.echo(f"❌ Error setting up session '{session_name}': {e.message}")
-            return False
+            return None
         except Exception as e:
             click.echo(f"❌ Unexpected error setting up session '{session_name}': {e}")
-            return False
+            return None
+        finally:
+            result.duration += time.perf_counter() - started
+
+        return config_dict
+
+    def _build_session(self, config_dict: dict[str, Any], result: SessionSetupResult) -> None:
+        """Create a prepared session, recording the outcome in ``result``.
+
+        Never raises, so one failing session cannot affect the others.
+        """
+        session_name = result.session_name
+        started = time.perf_counter()
+        try:
+            self._create_session(config_dict, timings=result.timings)
+        except CommandError as e:
+            result.messages.append(f"❌ Error setting up session '{session_name}': {e.message}")
+        except Exception as e:
+            result.messages.append(f"❌ Unexpected error setting up session '{session_name}': {e}")
+        else:
+            result.success = True
+            result.messages.append(f"✅ Successfully created session: {session_name}")
+        finally:
+            result.duration += time.perf_counter() - started
+
+    def _build_sessions_concurrently(self, pending: list[tuple[dict[str, Any], SessionSetupResult]], worker_count: int) -> None:
+        """Build prepared sessions on a thread pool, printing results in order."""
+        with ThreadPoolExecutor(max_workers=min(worker_count, len(pending)), thread_name_prefix="yesman-setup") as executor:
+            futures = [executor.submit(self._build_session, config_dict, result) for config_dict, result in pending]
+            for future, (_, result) in zip(futures, pending, strict=True):
+                future.result()
+                self._echo_messages(result)
+
+    @staticmethod
+    def _echo_messages(result: SessionSetupResult) -> None:
+        for message in result.messages:
+            click.echo(message)
+        result.messages.clear()
+
+    @staticmethod
+    def _build_report(results: list[SessionSetupResult], worker_count: int, projects_load_time: float, wall_time: float) -> dict[str, Any]:
+        """Summarize per-session timings and where the setup time went.
+
+        Returns:
+            Report with per-session durations and phase totals in seconds.
+        """
+        phases = dict.fromkeys(SETUP_PHASES, 0.0)
+        phases["config_load"] = projects_load_time
+        for result in results:
+            for phase, duration in result.timings.items():
+                phases[phase] = phases.get(phase, 0.0) + duration
+
+        return {
+            "workers": worker_count,
+            "wall_time": wall_time,
+            "phases": phases,
+            "sessions": {
+                result.session_name: {
+                    "success": result.success,
+                    "duration": result.duration,
+                    "timings": dict(result.timings),
+                }
+                for result in results
+            },
+        }
+
+    @staticmethod
+    def _echo_report(report: dict[str, Any]) -> None:
+        click.echo(f"\n⏱️  Setup Timing ({report['workers']} worker(s), {report['wall_time']:.2f}s wall time):")
+        for session_name, session_report in report["sessions"].items():
+            click.echo(f"  {session_name}: {session_report['duration']:.2f}s")
+        click.echo("  Time breakdown (summed over sessions):")
+        for phase, duration in report["phases"].items():
+            click.echo(f"    {phase.replace('_', ' ')}: {duration:.2f}s")
 
     def _session_exists(self, session_name: str) -> bool:
         """Check if session already exists."""
@@ -388,16 +537,19 @@ class SessionSetupService:
         except subprocess.CalledProcessError as e:
             msg = f"Failed to kill existing session: {e}"
             raise CommandError(msg) from e
+        finally:
+            invalidate_tmux_cache("kill_session")
 
-    def _create_session(self, config_dict: dict[str, Any]) -> None:
+    def _create_session(self, config_dict: dict[str, Any], timings: dict[str, float] | None = None) -> None:
         """Create tmux session from configuration."""
         try:
             create_func = getattr(self.tmux_manager, "create_session_from_config", None)
-            if create_func:
-                create_func(config_dict)
-            else:
+            if not create_func:
                 msg = "tmux_manager does not support create_session_from_config"
                 raise CommandError(msg)
+            if create_func(config_dict, timings=timings) is False:
+                msg = f"tmux session '{config_dict.get('session_name')}' was not created"
+                raise CommandError(msg)
         except Exception as e:
             msg = f"Failed to create tmux session: {e}"
             raise CommandError(msg) from e
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Copyright notice.
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .settings import settings
+from .tmux_cache import invalidate_tmux_cache
+from .tmux_control import run_server_command
+
+if TYPE_CHECKING:
+    from .claude_manager import ClaudeManager
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Concurrent session teardown with bounded fan-out and a global deadline."""
+
+
+logger = logging.getLogger("yesman.session_teardown")
+
+
+@dataclass
+class TeardownResult:
+    """Outcome of tearing down one session."""
+
+    session_name: str
+    success: bool = False
+    error: str | None = None
+    controller_stopped: bool = False
+    timed_out: bool = False
+    duration: float = 0.0
+
+
+def kill_tmux_session(session_name: str) -> None:
+    """Kill a tmux session by exact name.
+
+    Raises:
+        RuntimeError: If tmux reports an error.
+    """
+    result = run_server_command(None, "kill-session", "-t", f"={session_name}")
+    if getattr(result, "stderr", None):
+        raise RuntimeError("; ".join(result.stderr))
+
+
+class SessionTeardownService:
+    """Stops controllers and kills sessions on a bounded thread pool."""
+
+    def __init__(
+        self,
+        kill_session: Callable[[str], Any] | None = None,
+        claude_manager: "ClaudeManager | None" = None,
+        max_workers: int | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            kill_session: Kills one session, raising on failure (:func:`kill_tmux_session` if None)
+            claude_manager: Manager whose controllers are stopped before their session is killed
+            max_workers: Sessions torn down concurrently (``settings.sessions.teardown_workers`` if None)
+            deadline: Seconds the whole teardown may take (``settings.sessions.teardown_deadline`` if None)
+        """
+        self.kill_session = kill_session or kill_tmux_session
+        self.claude_manager = claude_manager
+        self.max_workers = max(1, max_workers if max_workers is not None else settings.sessions.teardown_workers)
+        self.deadline = deadline if deadline is not None else settings.sessions.teardown_deadline
+
+    def teardown_sessions(self, session_names: list[str]) -> list[TeardownResult]:
+        """Tear down sessions concurrently.
+
+        Sessions still running when the deadline passes are reported as timed
+        out; their workers are left to finish in the background.
+
+        Args:
+            session_names: Sessions to tear down
+
+        Returns:
+            list[TeardownResult]: One result per session, in input order.
+        """
+        if not session_names:
+            return []
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(session_names)), thread_name_prefix="yesman-teardown")
+        try:
+            futures: list[Future[TeardownResult]] = [executor.submit(self._teardown_one, name) for name in session_names]
+            done, _ = wait(futures, timeout=self.deadline)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            invalidate_tmux_cache("teardown")
+
+        results = []
+        for session_name, future in zip(session_names, futures, strict=True):
+            if future in done:
+                results.append(future.result())
+            else:
+                results.append(
+                    TeardownResult(
+                        session_name=session_name,
+                        error=f"Teardown did not finish within {self.deadline:.1f}s",
+                        timed_out=True,
+                        duration=time.monotonic() - started,
+                    )
+                )
+
+        failed = sum(1 for result in results if not result.success)
+        logger.info("Tore down %d sessions in %.2fs (%d failed)", len(results), time.monotonic() - started, failed)
+        return results
+
+    def _teardown_one(self, session_name: str) -> TeardownResult:
+        """Stop the session's controller and kill the session; never raises.
+
+        Returns:
+            TeardownResult: Outcome for the session.
+        """
+        result = TeardownResult(session_name=session_name)
+        started = time.monotonic()
+
+        if self.claude_manager is not None and session_name in self.claude_manager.controllers:
+            try:
+                self.claude_manager.remove_controller(session_name)
+                result.controller_stopped = True
+            except Exception as e:
+                logger.warning("Could not stop controller for %s: %s", session_name, e)
+
+        try:
+            self.kill_session(session_name)
+        except Exception as e:
+            result.error = str(e)
+        else:
+            result.success = True
+
+        result.duration = time.monotonic() - started
+        return result
@@ -42,6 +42,7 @@ class PathSettings:
     cache_dir: str = "~/.scripton/yesman/cache"
     sessions_dir: str = "~/.scripton/yesman/sessions"
     config_file: str = "~/.scripton/yesman/yesman.yaml"
+    prompt_patterns_dir: str = "~/.scripton/yesman/prompt_patterns"
 
 
 @dataclass
@@ -53,6 +54,9 @@ class SessionSettings:
     max_panes_per_window: int = 4
     session_name_max_length: int = 64
     auto_cleanup_enabled: bool = True
+    setup_workers: int = 1  # Sessions built concurrently by `yesman setup`
+    teardown_workers: int = 8  # Sessions torn down concurrently
+    teardown_deadline: float = 30.0  # seconds a whole teardown may take
 
 
 @dataclass
@@ -64,6 +68,48 @@ class MonitoringSettings:
     memory_threshold_mb: int = 500
     cpu_threshold_percent: float = 80.0
     disk_threshold_percent: float = 85.0
+    stream_pane_output: bool = False  # Wake monitors from `tmux pipe-pane` output instead of polling
+    stream_debounce: float = 0.02  # seconds to let an output burst settle before detection
+    safety_poll_interval: float = 10.0  # seconds between polls while streaming
+    supervised_monitors: bool = True  # Run controller monitors on the shared MonitorSupervisor loop
+    supervisor_workers: int = 4  # Executor threads shared by all supervised monitors
+    poll_interval: float = 1.0  # seconds before a monitor's first poll
+    poll_fast_interval: float = 0.25  # seconds between polls while a pane is active
+    poll_max_interval: float = 10.0  # ceiling for the idle poll back-off
+    poll_backoff: float = 2.0  # factor the poll interval grows by while a pane is unchanged
+    instrumentation_enabled: bool = True  # Time monitor components with spans
+    probe_sample_rate: float = 0.01  # fraction of spans that also probe process memory and CPU
+    activity_event_window: float = 1.0  # seconds within which a monitor's activity/status events coalesce
+    activity_pressure_window: float = 10.0  # coalescing window while the event bus is under pressure
+    activity_pressure_threshold: float = 0.5  # event queue fill ratio that counts as pressure
+    restart_poll_interval: float = 0.1  # seconds between pane probes while restarting Claude
+    restart_exit_timeout: float = 3.0  # seconds Claude gets to exit before a restart fails
+    restart_startup_timeout: float = 15.0  # seconds to wait for the Claude banner after launch
+    prompt_region_lines: int = 20  # bottom lines of a capture searched for prompts (0 = all)
+    detection_cache_size: int = 512  # prompt detection results memoised process-wide (0 = off)
+    prompt_pattern_reload_interval: float = 5.0  # seconds between checks for edited prompt pattern packs
+
+
+@dataclass
+class TmuxSettings:
+    """Tmux backend settings."""
+
+    control_mode: bool = True  # Reuse one `tmux -C` connection per server
+    command_timeout: float = 2.0  # seconds
+    reconnect_interval: float = 5.0  # seconds between reconnect attempts
+    snapshot_ttl: float = 1.0  # seconds a shared fleet snapshot stays fresh
+    push_events: bool = True  # Follow session changes through control-mode notifications instead of polling
+    reconcile_interval: float = 30.0  # seconds between full session polls while events are pushed
+
+
+@dataclass
+class ExecutorSettings:
+    """Worker counts of the named executors for blocking work."""
+
+    tmux_io_workers: int = 8  # pane captures, status probes, send-keys
+    process_control_workers: int = 2  # Claude restarts
+    detection_workers: int = 4  # prompt detection and content analysis
+    handler_workers: int = 4  # sync event handlers and status callbacks
 
 
 @dataclass
@@ -98,6 +144,8 @@ class AppSettings:
         self.paths = PathSettings()
         self.sessions = SessionSettings()
         self.monitoring = MonitoringSettings()
+        self.tmux = TmuxSettings()
+        self.executors = ExecutorSettings()
         self.api = APISettings()
         self.security = SecuritySettings()
 
@@ -120,9 +168,47 @@ class AppSettings:
         # Path settings
         self.paths.home_dir = os.getenv("YESMAN_HOME_DIR", self.paths.home_dir)
         self.paths.templates_dir = os.getenv("YESMAN_TEMPLATES_DIR", self.paths.templates_dir)
+        self.paths.prompt_patterns_dir = os.getenv("YESMAN_PROMPT_PATTERNS_DIR", self.paths.prompt_patterns_dir)
 
         # Session settings
         self.sessions.default_timeout = int(os.getenv("YESMAN_SESSION_TIMEOUT", self.sessions.default_timeout))
+        self.sessions.setup_workers = int(os.getenv("YESMAN_SETUP_WORKERS", self.sessions.setup_workers))
+        self.sessions.teardown_workers = int(os.getenv("YESMAN_TEARDOWN_WORKERS", self.sessions.teardown_workers))
+        self.sessions.teardown_deadline = float(os.getenv("YESMAN_TEARDOWN_DEADLINE", self.sessions.teardown_deadline))
+
+        # Monitoring settings
+        self.monitoring.stream_pane_output = os.getenv("YESMAN_STREAM_PANE_OUTPUT", str(self.monitoring.stream_pane_output)).lower() == "true"
+        self.monitoring.safety_poll_interval = float(os.getenv("YESMAN_SAFETY_POLL_INTERVAL", self.monitoring.safety_poll_interval))
+        self.monitoring.supervised_monitors = os.getenv("YESMAN_SUPERVISED_MONITORS", str(self.monitoring.supervised_monitors)).lower() == "true"
+        self.monitoring.supervisor_workers = int(os.getenv("YESMAN_SUPERVISOR_WORKERS", self.monitoring.supervisor_workers))
+        self.monitoring.poll_interval = float(os.getenv("YESMAN_POLL_INTERVAL", self.monitoring.poll_interval))
+        self.monitoring.poll_fast_interval = float(os.getenv("YESMAN_POLL_FAST_INTERVAL", self.monitoring.poll_fast_interval))
+        self.monitoring.poll_max_interval = float(os.getenv("YESMAN_POLL_MAX_INTERVAL", self.monitoring.poll_max_interval))
+        self.monitoring.poll_backoff = float(os.getenv("YESMAN_POLL_BACKOFF", self.monitoring.poll_backoff))
+        self.monitoring.instrumentation_enabled = os.getenv("YESMAN_INSTRUMENTATION", str(self.monitoring.instrumentation_enabled)).lower() == "true"
+        self.monitoring.probe_sample_rate = float(os.getenv("YESMAN_PROBE_SAMPLE_RATE", self.monitoring.probe_sample_rate))
+        self.monitoring.activity_event_window = float(os.getenv("YESMAN_ACTIVITY_EVENT_WINDOW", self.monitoring.activity_event_window))
+        self.monitoring.activity_pressure_window = float(os.getenv("YESMAN_ACTIVITY_PRESSURE_WINDOW", self.monitoring.activity_pressure_window))
+        self.monitoring.activity_pressure_threshold = float(os.getenv("YESMAN_ACTIVITY_PRESSURE_THRESHOLD", self.monitoring.activity_pressure_threshold))
+        self.monitoring.restart_poll_interval = float(os.getenv("YESMAN_RESTART_POLL_INTERVAL", self.monitoring.restart_poll_interval))
+        self.monitoring.restart_exit_timeout = float(os.getenv("YESMAN_RESTART_EXIT_TIMEOUT", self.monitoring.restart_exit_timeout))
+        self.monitoring.restart_startup_timeout = float(os.getenv("YESMAN_RESTART_STARTUP_TIMEOUT", self.monitoring.restart_startup_timeout))
+        self.monitoring.prompt_region_lines = int(os.getenv("YESMAN_PROMPT_REGION_LINES", self.monitoring.prompt_region_lines))
+        self.monitoring.detection_cache_size = int(os.getenv("YESMAN_DETECTION_CACHE_SIZE", self.monitoring.detection_cache_size))
+        self.monitoring.prompt_pattern_reload_interval = float(os.getenv("YESMAN_PROMPT_PATTERN_RELOAD_INTERVAL", self.monitoring.prompt_pattern_reload_interval))
+
+        # Tmux settings
+        self.tmux.control_mode = os.getenv("YESMAN_TMUX_CONTROL_MODE", str(self.tmux.control_mode)).lower() == "true"
+        self.tmux.command_timeout = float(os.getenv("YESMAN_TMUX_COMMAND_TIMEOUT", self.tmux.command_timeout))
+        self.tmux.snapshot_ttl = float(os.getenv("YESMAN_TMUX_SNAPSHOT_TTL", self.tmux.snapshot_ttl))
+        self.tmux.push_events = os.getenv("YESMAN_TMUX_PUSH_EVENTS", str(self.tmux.push_events)).lower() == "true"
+        self.tmux.reconcile_interval = float(os.getenv("YESMAN_TMUX_RECONCILE_INTERVAL", self.tmux.reconcile_interval))
+
+        # Executor settings
+        self.executors.tmux_io_workers = int(os.getenv("YESMAN_TMUX_IO_WORKERS", self.executors.tmux_io_workers))
+        self.executors.process_control_workers = int(os.getenv("YESMAN_PROCESS_CONTROL_WORKERS", self.executors.process_control_workers))
+        self.executors.detection_workers = int(os.getenv("YESMAN_DETECTION_WORKERS", self.executors.detection_workers))
+        self.executors.handler_workers = int(os.getenv("YESMAN_HANDLER_WORKERS", self.executors.handler_workers))
 
         # API settings
         self.api.host = os.getenv("YESMAN_API_HOST", self.api.host)
@@ -137,6 +223,7 @@ class AppSettings:
         self.paths.cache_dir = str(Path(self.paths.cache_dir).expanduser())
         self.paths.sessions_dir = str(Path(self.paths.sessions_dir).expanduser())
         self.paths.config_file = str(Path(self.paths.config_file).expanduser())
+        self.paths.prompt_patterns_dir = str(Path(self.paths.prompt_patterns_dir).expanduser())
         self.logging.default_path = str(Path(self.logging.default_path).expanduser())
 
     def ensure_directories(self) -> None:
@@ -179,6 +266,7 @@ class AppSettings:
                 "cache_dir": self.paths.cache_dir,
                 "sessions_dir": self.paths.sessions_dir,
                 "config_file": self.paths.config_file,
+                "prompt_patterns_dir": self.paths.prompt_patterns_dir,
             },
             "sessions": {
                 "default_timeout": self.sessions.default_timeout,
@@ -186,6 +274,9 @@ class AppSettings:
                 "max_panes_per_window": self.sessions.max_panes_per_window,
                 "session_name_max_length": self.sessions.session_name_max_length,
                 "auto_cleanup_enabled": self.sessions.auto_cleanup_enabled,
+                "setup_workers": self.sessions.setup_workers,
+                "teardown_workers": self.sessions.teardown_workers,
+                "teardown_deadline": self.sessions.teardown_deadline,
             },
             "monitoring": {
                 "health_check_interval": self.monitoring.health_check_interval,
@@ -193,6 +284,40 @@ class AppSettings:
                 "memory_threshold_mb": self.monitoring.memory_threshold_mb,
                 "cpu_threshold_percent": self.monitoring.cpu_threshold_percent,
                 "disk_threshold_percent": self.monitoring.disk_threshold_percent,
+                "stream_pane_output": self.monitoring.stream_pane_output,
+                "stream_debounce": self.monitoring.stream_debounce,
+                "safety_poll_interval": self.monitoring.safety_poll_interval,
+                "supervised_monitors": self.monitoring.supervised_monitors,
+                "supervisor_workers": self.monitoring.supervisor_workers,
+                "poll_interval": self.monitoring.poll_interval,
+                "poll_fast_interval": self.monitoring.poll_fast_interval,
+                "poll_max_interval": self.monitoring.poll_max_interval,
+                "poll_backoff": self.monitoring.poll_backoff,
+                "instrumentation_enabled": self.monitoring.instrumentation_enabled,
+                "probe_sample_rate": self.monitoring.probe_sample_rate,
+                "activity_event_window": self.monitoring.activity_event_window,
+                "activity_pressure_window": self.monitoring.activity_pressure_window,
+                "activity_pressure_threshold": self.monitoring.activity_pressure_threshold,
+                "restart_poll_interval": self.monitoring.restart_poll_interval,
+                "restart_exit_timeout": self.monitoring.restart_exit_timeout,
+                "restart_startup_timeout": self.monitoring.restart_startup_timeout,
+                "prompt_region_lines": self.monitoring.prompt_region_lines,
+                "detection_cache_size": self.monitoring.detection_cache_size,
+                "prompt_pattern_reload_interval": self.monitoring.prompt_pattern_reload_interval,
+            },
+            "tmux": {
+                "control_mode": self.tmux.control_mode,
+                "command_timeout": self.tmux.command_timeout,
+                "reconnect_interval": self.tmux.reconnect_interval,
+                "snapshot_ttl": self.tmux.snapshot_ttl,
+                "push_events": self.tmux.push_events,
+                "reconcile_interval": self.tmux.reconcile_interval,
+            },
+            "executors": {
+                "tmux_io_workers": self.executors.tmux_io_workers,
+                "process_control_workers": self.executors.process_control_workers,
+                "detection_workers": self.executors.detection_workers,
+                "handler_workers": self.executors.handler_workers,
             },
             "api": {
                 "host": self.api.host,
@@ -0,0 +1,222 @@
+# Copyright notice.
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Shared TTL cache for tmux server, session, window and pane queries.
+
+Entries are stamped with the cache generation at the time they were computed.
+:meth:`TmuxQueryCache.invalidate` bumps the generation, which makes every
+existing entry stale in O(1) — including results of queries that were still
+running when the invalidation happened. Session setup and teardown call
+:func:`invalidate_tmux_cache` so readers never see a pre-change view for the
+rest of the TTL.
+"""
+
+
+logger = logging.getLogger("yesman.tmux_cache")
+
+T = TypeVar("T")
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    stored_at: float
+    ttl: float
+    generation: int
+
+
+class TmuxQueryCache:
+    """Thread-safe LRU cache with per-entry TTL and generation stamps."""
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 100) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Default time to live for entries in seconds
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: str) -> tuple[bool, Any]:
+        """Look up a key, dropping it if expired or from an older generation.
+
+        Returns:
+            tuple[bool, Any]: (found, value).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry.generation != self.generation or time.monotonic() - entry.stored_at > entry.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def get(self, key: str) -> Any:
+        """Get a cached value.
+
+        Returns:
+            Any: The cached value, or None on a miss.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: object, ttl: float | None = None, generation: int | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (defaults to the cache TTL)
+            generation: Generation the value was computed in; values from an
+                older generation are discarded
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+
+            self._entries[key] = _CacheEntry(value=value, stored_at=time.monotonic(), ttl=self.ttl if ttl is None else ttl, generation=self.generation)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logger.debug("Evicted tmux cache entry: %s", evicted_key)
+
+    def get_or_compute(self, key: str, compute: Callable[[], T], ttl: float | None = None) -> T:
+        """Get a cached value, computing and storing it on a miss.
+
+        Concurrent misses for the same key run ``compute`` only once.
+
+        Returns:
+            T: Cached or freshly computed value.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value  # type: ignore[no-any-return]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # Another thread may have filled the entry while we waited
+                found, value = self._lookup(key)
+                if found:
+                    self.hits += 1
+                    return value  # type: ignore[no-any-return]
+                self.misses += 1
+                generation = self.generation
+
+            value = compute()
+            self.put(key, value, ttl=ttl, generation=generation)
+            return value
+
+    def invalidate(self, prefix: str | None = None) -> None:
+        """Invalidate entries.
+
+        Args:
+            prefix: Only drop keys starting with this prefix; invalidate
+                everything by bumping the generation if None
+        """
+        with self._lock:
+            self.invalidations += 1
+            if prefix is None:
+                self.generation += 1
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def cleanup_expired(self) -> int:
+        """Remove expired and stale entries.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            expired = [key for key, entry in self._entries.items() if entry.generation != self.generation or now - entry.stored_at > entry.ttl]
+            for key in expired:
+                del self._entries[key]
+            self.expirations += len(expired)
+            # Drop per-key locks that are not guarding a live entry
+            for key in [key for key, lock in self._key_locks.items() if key not in self._entries and not lock.locked()]:
+                del self._key_locks[key]
+            return len(expired)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, Any]: Hit, miss, eviction and expiration counts.
+        """
+        with self._lock:
+            total_requests = self.hits + self.misses
+            return {
+                "hit_rate": self.hits / total_requests if total_requests else 0.0,
+                "total_requests": total_requests,
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "cache_size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "generation": self.generation,
+            }
+
+
+_cache: TmuxQueryCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_tmux_cache() -> TmuxQueryCache:
+    """Get the process-wide tmux query cache.
+
+    Returns:
+        TmuxQueryCache: Shared cache configured from ``settings.cache``.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TmuxQueryCache(ttl=settings.cache.ttl, max_entries=settings.cache.max_entries)
+    return _cache
+
+
+def invalidate_tmux_cache(reason: str = "") -> None:
+    """Invalidate every cached tmux query, e.g. after sessions were created or killed."""
+    logger.debug("Invalidating tmux cache%s", f" ({reason})" if reason else "")
+    get_tmux_cache().invalidate()
@@ -0,0 +1,499 @@
+# Copyright notice.
+
+import atexit
+import contextlib
+import logging
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import libtmux
+
+from .settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Persistent tmux control-mode backend.
+
+Every ``pane.cmd(...)`` call made through libtmux forks a new ``tmux`` process.
+This module keeps one long-lived ``tmux -C`` client per tmux server, writes
+commands to its stdin and matches the ``%begin``/``%end`` reply blocks back to
+the callers in FIFO order. Callers use :func:`run_pane_command`,
+:func:`run_server_command` and :func:`send_pane_keys`, which transparently fall
+back to the regular libtmux path when control mode is unavailable.
+
+The client attaches to a private session, :data:`CONTROL_SESSION_NAME`,
+rather than to one of the user's sessions: attaching would mark that session
+as attached, and a server without sessions would refuse the connection. The
+session is destroyed once no control client is attached to it, and session
+listings skip it (see :func:`is_control_session`).
+
+Notifications tmux writes outside reply blocks (``%sessions-changed``,
+``%window-add``, ...) are passed to listeners registered with
+:meth:`TmuxControlClient.add_notification_listener`.
+"""
+
+
+logger = logging.getLogger("yesman.tmux_control")
+
+# Characters that can be passed to the tmux command parser without quoting.
+# `$`, `~`, `#`, `;` and quotes all have special meaning and are excluded.
+_SAFE_ARGUMENT = re.compile(r"[A-Za-z0-9_%@:.,/+=\-]+")
+
+# Session the control clients attach to, shared by every yesman process on a server
+CONTROL_SESSION_NAME = "_yesman_control"
+
+
+class TmuxControlError(Exception):
+    """Raised when a command cannot be delivered over the control connection."""
+
+
+@dataclass
+class ControlModeResult:
+    """Reply to a control-mode command, shaped like libtmux's ``tmux_cmd``."""
+
+    stdout: list[str] = field(default_factory=list)
+    stderr: list[str] = field(default_factory=list)
+    returncode: int = 0
+
+
+class _PendingReply:
+    """A command waiting for its ``%begin``/``%end`` block."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: ControlModeResult | None = None
+
+
+def quote_argument(argument: str) -> str:
+    """Quote a single argument for the tmux command parser.
+
+    Returns:
+        str: Argument that tmux will parse back to the original string.
+
+    Raises:
+        ValueError: If the argument contains a newline, which would split the
+            control-mode command line.
+    """
+    if "\n" in argument or "\r" in argument:
+        msg = "Control-mode arguments cannot contain newlines"
+        raise ValueError(msg)
+    if _SAFE_ARGUMENT.fullmatch(argument):
+        return argument
+    return "'" + argument.replace("'", "'\\''") + "'"
+
+
+class TmuxControlClient:
+    """A single ``tmux -C`` connection to one tmux server.
+
+    Replies are demultiplexed by order: tmux answers commands from a control
+    client strictly in the order they were written, so each ``%begin``/``%end``
+    block completes the oldest pending request.
+    """
+
+    def __init__(
+        self,
+        socket_name: str | None = None,
+        socket_path: str | None = None,
+        tmux_bin: str = "tmux",
+        timeout: float | None = None,
+    ) -> None:
+        self.socket_name = socket_name
+        self.socket_path = socket_path
+        self.tmux_bin = tmux_bin
+        self.timeout = timeout if timeout is not None else settings.tmux.command_timeout
+
+        self._process: subprocess.Popen | None = None
+        self._reader: threading.Thread | None = None
+        self._write_lock = threading.Lock()
+        self._pending: deque[_PendingReply] = deque()
+        self._notification_listeners: list[Callable[[str], None]] = []
+        self._closed = False
+
+        # Statistics
+        self.commands_sent = 0
+        self.commands_failed = 0
+
+    def _base_command(self) -> list[str]:
+        command = [self.tmux_bin]
+        if self.socket_name:
+            command.extend(["-L", self.socket_name])
+        if self.socket_path:
+            command.extend(["-S", self.socket_path])
+        return command
+
+    def start(self) -> bool:
+        """Spawn the control-mode client.
+
+        Returns:
+            bool: True if the connection is up.
+        """
+        try:
+            self._process = subprocess.Popen(  # noqa: S603
+                # The window runs `cat`, which idles on the unused pane instead of a login shell
+                [*self._base_command(), "-C", "new-session", "-A", "-s", CONTROL_SESSION_NAME, "cat"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except OSError as e:
+            logger.debug("Could not start tmux control client: %s", e)
+            return False
+
+        self._reader = threading.Thread(target=self._read_loop, name="tmux-control-reader", daemon=True)
+        self._reader.start()
+
+        try:
+            # Suppress %output notifications and keep this client from resizing windows.
+            # Older tmux versions reject the flags; the connection is still usable.
+            self.cmd("refresh-client", "-f", "no-output,ignore-size")
+            # Remove the private session once the last control client detaches
+            self.cmd("set-option", "-t", f"={CONTROL_SESSION_NAME}:", "destroy-unattached", "on")
+        except TmuxControlError:
+            self.close()
+            return False
+
+        return self.is_alive
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the control client process is still running."""
+        return not self._closed and self._process is not None and self._process.poll() is None
+
+    def add_notification_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener`` with every notification line, e.g. ``"%window-add @3"``.
+
+        Listeners run on the reader thread and must not block or send commands
+        on this client. ``"%exit"`` is delivered when the connection ends.
+        """
+        self._notification_listeners.append(listener)
+
+    def remove_notification_listener(self, listener: Callable[[str], None]) -> None:
+        """Stop calling a listener added with :meth:`add_notification_listener`."""
+        with contextlib.suppress(ValueError):
+            self._notification_listeners.remove(listener)
+
+    def _dispatch_notification(self, line: str) -> None:
+        for listener in list(self._notification_listeners):
+            try:
+                listener(line)
+            except Exception:
+                logger.exception("tmux notification listener failed on %r", line)
+
+    def cmd(self, *args: str, timeout: float | None = None) -> ControlModeResult:
+        """Run a tmux command over the control connection.
+
+        Returns:
+            ControlModeResult: Output lines of the command.
+
+        Raises:
+            TmuxControlError: If the connection is down or the reply times out.
+        """
+        return self.cmd_many([args], timeout=timeout)[0]
+
+    def cmd_many(self, commands: list[tuple[str, ...]], timeout: float | None = None) -> list[ControlModeResult]:
+        """Pipeline several tmux commands in one write.
+
+        All commands are written before the first reply is awaited, so a batch
+        costs a single round-trip regardless of its size.
+
+        Args:
+            commands: Argument tuples, one per tmux command
+            timeout: Seconds to wait for the whole batch
+
+        Returns:
+            list[ControlModeResult]: Replies in the same order as ``commands``.
+
+        Raises:
+            TmuxControlError: If the connection is down or a reply times out.
+        """
+        if not self.is_alive or self._process is None or self._process.stdin is None:
+            msg = "tmux control connection is not running"
+            raise TmuxControlError(msg)
+        if not commands:
+            return []
+
+        try:
+            lines = [" ".join(quote_argument(str(arg)) for arg in args) for args in commands]
+        except ValueError as e:
+            raise TmuxControlError(str(e)) from e
+
+        pending = [_PendingReply() for _ in commands]
+        with self._write_lock:
+            try:
+                # Enqueue and write under one lock so reply order matches write order
+                self._pending.extend(pending)
+                self._process.stdin.write("".join(line + "\n" for line in lines))
+                self._process.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._fail_connection()
+                msg = f"Failed to write to tmux control connection: {e}"
+                raise TmuxControlError(msg) from e
+            self.commands_sent += len(commands)
+
+        deadline = time.monotonic() + (timeout if timeout is not None else self.timeout)
+        results: list[ControlModeResult] = []
+        for args, reply in zip(commands, pending, strict=True):
+            # A timed-out entry stays queued so that later replies keep their order
+            if not reply.done.wait(max(0.0, deadline - time.monotonic())):
+                self.commands_failed += 1
+                msg = f"Timed out waiting for tmux reply to: {args[0] if args else ''}"
+                raise TmuxControlError(msg)
+
+            if reply.result is None:
+                self.commands_failed += 1
+                msg = "tmux control connection closed"
+                raise TmuxControlError(msg)
+
+            results.append(reply.result)
+
+        return results
+
+    def _read_loop(self) -> None:
+        """Read stdout and complete pending replies."""
+        process = self._process
+        if process is None or process.stdout is None:
+            return
+
+        block: list[str] | None = None
+        block_number = ""
+        block_ours = False
+
+        try:
+            for raw_line in process.stdout:
+                line = raw_line.rstrip("\n")
+
+                if block is None:
+                    if line.startswith("%begin "):
+                        parts = line.split(" ")
+                        block = []
+                        block_number = parts[2] if len(parts) > 2 else ""
+                        # Flag 1 marks replies to commands written by this client;
+                        # flag 0 is the implicit new-session block at startup.
+                        block_ours = len(parts) > 3 and parts[3] == "1"
+                    elif line.startswith("%"):
+                        # Everything else outside a block is a notification
+                        self._dispatch_notification(line)
+                    continue
+
+                if line.startswith(("%end ", "%error ")):
+                    parts = line.split(" ")
+                    if len(parts) > 2 and parts[2] == block_number:
+                        if block_ours:
+                            is_error = line.startswith("%error ")
+                            result = ControlModeResult(
+                                stdout=[] if is_error else block,
+                                stderr=block if is_error else [],
+                                returncode=1 if is_error else 0,
+                            )
+                            self._complete_next(result)
+                        block = None
+                        continue
+
+                block.append(line)
+        except (OSError, ValueError) as e:
+            logger.debug("tmux control reader stopped: %s", e)
+        finally:
+            self._fail_connection()
+            self._dispatch_notification("%exit")
+
+    def _complete_next(self, result: ControlModeResult) -> None:
+        try:
+            pending = self._pending.popleft()
+        except IndexError:
+            logger.debug("Received tmux reply with no pending command")
+            return
+        pending.result = result
+        pending.done.set()
+
+    def _fail_connection(self) -> None:
+        """Mark the connection closed and release every waiting caller."""
+        self._closed = True
+        while self._pending:
+            try:
+                pending = self._pending.popleft()
+            except IndexError:
+                break
+            pending.done.set()
+
+    def close(self) -> None:
+        """Detach the control client."""
+        self._closed = True
+        process = self._process
+        if process is not None and process.poll() is None:
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()
+                process.wait(timeout=1.0)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+        self._fail_connection()
+
+
+# Control clients keyed by (socket_name, socket_path)
+_clients: dict[tuple[str | None, str | None], TmuxControlClient] = {}
+_last_failure: dict[tuple[str | None, str | None], float] = {}
+_clients_lock = threading.Lock()
+
+
+def is_control_session(session_name: object) -> bool:
+    """Whether a session is the control clients' private session.
+
+    Returns:
+        bool: True for :data:`CONTROL_SESSION_NAME`, which is not a user session.
+    """
+    return session_name == CONTROL_SESSION_NAME
+
+
+def _server_key(server: object | None) -> tuple[str | None, str | None] | None:
+    if server is None:
+        return (None, None)
+    if not isinstance(server, libtmux.Server):
+        return None
+    socket_path = server.socket_path
+    return (server.socket_name, str(socket_path) if socket_path else None)
+
+
+def get_control_client(server: object | None = None) -> TmuxControlClient | None:
+    """Get the shared control client for a tmux server.
+
+    Args:
+        server: libtmux server (default server if None)
+
+    Returns:
+        TmuxControlClient | None: A live client, or None when control mode is
+        disabled or the connection could not be established.
+    """
+    if not settings.tmux.control_mode:
+        return None
+
+    key = _server_key(server)
+    if key is None:
+        return None
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is not None and client.is_alive:
+            return client
+
+        # Avoid respawning tmux on every call while the server is unavailable
+        if time.monotonic() - _last_failure.get(key, float("-inf")) < settings.tmux.reconnect_interval:
+            return None
+
+        client = TmuxControlClient(socket_name=key[0], socket_path=key[1])
+        if not client.start():
+            _clients.pop(key, None)
+            _last_failure[key] = time.monotonic()
+            return None
+
+        _clients[key] = client
+        logger.info("Opened tmux control connection (socket=%s)", key[0] or key[1] or "default")
+        return client
+
+
+def close_control_clients() -> None:
+    """Close every shared control client."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+        _last_failure.clear()
+
+
+atexit.register(close_control_clients)
+
+
+def run_server_command(server: Any, *args: str) -> Any:
+    """Run a tmux command against a server, preferring the control connection.
+
+    Returns:
+        Object with ``stdout``/``stderr`` line lists.
+    """
+    client = get_control_client(server)
+    if client is not None:
+        try:
+            return client.cmd(*args)
+        except TmuxControlError as e:
+            logger.debug("Control-mode command failed, falling back: %s", e)
+
+    if server is None:
+        server = libtmux.Server()
+    return server.cmd(*args)
+
+
+def run_pane_command(pane: Any, command: str, *args: str) -> Any:
+    """Run a tmux command targeting a pane, preferring the control connection.
+
+    Equivalent to ``pane.cmd(command, *args)``.
+
+    Returns:
+        Object with ``stdout``/``stderr`` line lists.
+    """
+    pane_id = getattr(pane, "pane_id", None)
+    if isinstance(pane_id, str):
+        client = get_control_client(getattr(pane, "server", None))
+        if client is not None:
+            try:
+                return client.cmd(command, "-t", pane_id, *args)
+            except TmuxControlError as e:
+                logger.debug("Control-mode command failed, falling back: %s", e)
+
+    return pane.cmd(command, *args)
+
+
+def run_pane_commands(pane: Any, commands: list[tuple[str, ...]]) -> list[Any]:
+    """Run several tmux commands targeting a pane in one control-mode round-trip.
+
+    Each entry is a command name followed by its arguments, as for
+    :func:`run_pane_command`. Without a control connection the commands run
+    one after the other through libtmux.
+
+    Returns:
+        list[Any]: Objects with ``stdout``/``stderr`` line lists, in command order.
+    """
+    pane_id = getattr(pane, "pane_id", None)
+    if isinstance(pane_id, str):
+        client = get_control_client(getattr(pane, "server", None))
+        if client is not None:
+            try:
+                return list(client.cmd_many([(command[0], "-t", pane_id, *command[1:]) for command in commands]))
+            except TmuxControlError as e:
+                logger.debug("Control-mode batch failed, falling back: %s", e)
+
+    return [pane.cmd(*command) for command in commands]
+
+
+def send_pane_keys(pane: Any, keys: str, enter: bool = True) -> None:
+    """Send keys to a pane, preferring the control connection.
+
+    Equivalent to ``pane.send_keys(keys, enter=enter)``.
+    """
+    pane_id = getattr(pane, "pane_id", None)
+    if isinstance(pane_id, str):
+        client = get_control_client(getattr(pane, "server", None))
+        if client is not None:
+            try:
+                client.cmd("send-keys", "-t", pane_id, keys)
+            except TmuxControlError as e:
+                logger.debug("Control-mode send-keys failed, falling back: %s", e)
+            else:
+                if enter:
+                    try:
+                        client.cmd("send-keys", "-t", pane_id, "Enter")
+                    except TmuxControlError:
+                        # Keys already went through; only the Enter needs retrying
+                        pane.enter()
+                return
+
+    pane.send_keys(keys, enter=enter)
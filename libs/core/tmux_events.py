@@ -0,0 +1,235 @@
+# Copyright notice.
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .async_event_bus import AsyncEventBus, Event, EventPriority, EventType
+from .executors import get_executor
+from .tmux_cache import invalidate_tmux_cache
+from .tmux_control import TmuxControlClient, get_control_client, is_control_session, run_server_command
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Push tmux session changes onto the event bus from control-mode notifications.
+
+The shared ``tmux -C`` client (see :mod:`libs.core.tmux_control`) already
+receives a notification whenever the server's sessions or windows change.
+:class:`TmuxEventListener` turns those notifications into typed
+:class:`~libs.core.async_event_bus.Event` objects, so consumers learn about
+created, closed and changed sessions when they happen instead of polling
+``tmux`` for them. Nothing is installed on the tmux server, so there is
+nothing to clean up if the process dies.
+"""
+
+
+logger = logging.getLogger("yesman.tmux_events")
+
+# Window notifications -> WINDOW_CHANGED; "unlinked" ones are for windows in
+# sessions the control client is not attached to. Renames (automatic-rename
+# fires on every foreground command) and layout changes (every resize) are too
+# frequent to invalidate cached queries for and are ignored.
+WINDOW_NOTIFICATIONS = frozenset({"window-add", "window-close", "unlinked-window-add", "unlinked-window-close"})
+
+TMUX_EVENT_TYPES = (EventType.SESSION_CREATED, EventType.SESSION_DESTROYED, EventType.SESSION_RENAMED, EventType.WINDOW_CHANGED)
+
+_FIELD_SEPARATOR = "|"
+_SESSION_FORMAT = _FIELD_SEPARATOR.join(("#{session_id}", "#{session_name}"))
+
+
+@dataclass(frozen=True)
+class TmuxEvent:
+    """One tmux session or window change."""
+
+    event_type: EventType
+    notification: str
+    session_id: str = ""
+    session_name: str = ""
+    window_id: str = ""
+    received_at: float = 0.0
+
+    def to_event(self) -> Event:
+        """Convert to an event bus event.
+
+        Returns:
+            Event: Session events are HIGH priority, window events NORMAL.
+        """
+        data = asdict(self)
+        data.pop("event_type")
+        return Event(
+            type=self.event_type,
+            data=data,
+            timestamp=self.received_at,
+            source="tmux_events",
+            priority=EventPriority.HIGH if self.event_type in {EventType.SESSION_CREATED, EventType.SESSION_DESTROYED} else EventPriority.NORMAL,
+        )
+
+
+def parse_sessions(lines: list[str]) -> dict[str, str]:
+    """Parse ``list-sessions`` output in the listener's format.
+
+    Returns:
+        dict[str, str]: Session name by session id.
+    """
+    sessions = {}
+    for line in lines:
+        session_id, separator, session_name = line.partition(_FIELD_SEPARATOR)
+        if separator:
+            sessions[session_id] = session_name
+    return sessions
+
+
+class TmuxEventListener:
+    """Publishes tmux session changes reported by the control-mode client."""
+
+    def __init__(self, event_bus: AsyncEventBus | None = None, server: Any = None) -> None:
+        """Initialize the listener.
+
+        Args:
+            event_bus: Bus to publish events on (events are only counted if None)
+            server: libtmux server to watch (default server if None)
+        """
+        self.event_bus = event_bus
+        self.server = server
+
+        self._client: TmuxControlClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sessions: dict[str, str] = {}
+        self._resync_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+        # Statistics
+        self.events_received = 0
+        self.events_published = 0
+        self.ignored_notifications = 0
+        self.last_event_at = 0.0
+
+    @property
+    def is_active(self) -> bool:
+        """Whether notifications are being received."""
+        return self._client is not None and self._client.is_alive
+
+    async def start(self) -> bool:
+        """Register with the server's control-mode client.
+
+        Returns:
+            bool: True if the listener is active; False if control mode is
+            disabled or the server cannot be reached.
+        """
+        if self.is_active:
+            return True
+        await self.stop()
+
+        client = await get_executor("tmux_io").run(get_control_client, self.server)
+        if client is None:
+            logger.info("tmux control mode unavailable; session changes will not be pushed")
+            return False
+
+        try:
+            self._sessions = await get_executor("tmux_io").run(self._list_sessions)
+        except Exception as e:
+            logger.warning("Could not list tmux sessions: %s", e)
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self._client = client
+        client.add_notification_listener(self._on_notification)
+        logger.info("Listening for tmux notifications (%d sessions)", len(self._sessions))
+        return True
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._client is not None:
+            self._client.remove_notification_listener(self._on_notification)
+            self._client = None
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _list_sessions(self) -> dict[str, str]:
+        result = run_server_command(self.server, "list-sessions", "-F", _SESSION_FORMAT)
+        sessions = parse_sessions(list(getattr(result, "stdout", None) or []))
+        return {session_id: name for session_id, name in sessions.items() if not is_control_session(name)}
+
+    def _on_notification(self, line: str) -> None:
+        """Hand a notification from the reader thread to the listener's loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        with contextlib.suppress(RuntimeError):
+            # The loop may already be closed during shutdown
+            loop.call_soon_threadsafe(self._handle_notification, line)
+
+    def _handle_notification(self, line: str) -> None:
+        name, _, rest = line.removeprefix("%").partition(" ")
+        args = rest.split(" ") if rest else []
+
+        if name == "exit":
+            logger.warning("tmux control connection closed; session changes are no longer pushed")
+            if self._client is not None:
+                self._client.remove_notification_listener(self._on_notification)
+                self._client = None
+        elif name == "sessions-changed":
+            self._spawn(self._resync_sessions())
+        elif name == "session-renamed" and args:
+            session_id, session_name = args[0], " ".join(args[1:])
+            self._sessions[session_id] = session_name
+            self._emit(TmuxEvent(EventType.SESSION_RENAMED, name, session_id=session_id, session_name=session_name))
+        elif name in WINDOW_NOTIFICATIONS and args:
+            self._emit(TmuxEvent(EventType.WINDOW_CHANGED, name, window_id=args[0]))
+        else:
+            self.ignored_notifications += 1
+
+    async def _resync_sessions(self) -> None:
+        """Diff the session list to tell created sessions from closed ones."""
+        async with self._resync_lock:
+            try:
+                sessions = await get_executor("tmux_io").run(self._list_sessions)
+            except Exception as e:
+                logger.warning("Could not list tmux sessions: %s", e)
+                return
+
+            previous, self._sessions = self._sessions, sessions
+            for session_id in sessions.keys() - previous.keys():
+                self._emit(TmuxEvent(EventType.SESSION_CREATED, "sessions-changed", session_id=session_id, session_name=sessions[session_id]))
+            for session_id in previous.keys() - sessions.keys():
+                self._emit(TmuxEvent(EventType.SESSION_DESTROYED, "sessions-changed", session_id=session_id, session_name=previous[session_id]))
+
+    def _emit(self, tmux_event: TmuxEvent) -> None:
+        tmux_event = TmuxEvent(**{**asdict(tmux_event), "received_at": time.time()})
+        self.events_received += 1
+        self.last_event_at = tmux_event.received_at
+
+        # Cached tmux queries no longer reflect the server
+        invalidate_tmux_cache(tmux_event.notification)
+
+        if self.event_bus is not None and self.event_bus.is_running():
+            self._spawn(self._publish(tmux_event))
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _publish(self, tmux_event: TmuxEvent) -> None:
+        if self.event_bus is not None and await self.event_bus.publish(tmux_event.to_event()):
+            self.events_published += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get listener statistics.
+
+        Returns:
+            dict[str, Any]: Activity flag, known session count and event counters.
+        """
+        return {
+            "active": self.is_active,
+            "sessions": len(self._sessions),
+            "events_received": self.events_received,
+            "events_published": self.events_published,
+            "ignored_notifications": self.ignored_notifications,
+            "last_event_at": self.last_event_at,
+        }
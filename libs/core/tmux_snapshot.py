@@ -0,0 +1,288 @@
+# Copyright notice.
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .settings import settings
+from .tmux_cache import get_tmux_cache
+from .tmux_control import TmuxControlError, _server_key, get_control_client, is_control_session, run_server_command
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""One-shot snapshot of every tmux pane.
+
+Walking ``server.sessions`` -> ``session.windows`` -> ``window.panes`` and
+asking each pane for its command, pid and activity costs several tmux
+invocations per pane. :func:`take_snapshot` answers all of those questions
+with a single ``list-panes -a -F`` query, and :func:`capture_panes` fetches
+the content of many panes in one batched round-trip.
+"""
+
+
+logger = logging.getLogger("yesman.tmux_snapshot")
+
+# Unit separator: never appears in session names, commands or numeric fields
+FIELD_SEPARATOR = "\x1f"
+
+SNAPSHOT_CACHE_PREFIX = "tmux_snapshot:"
+
+# Marker echoed between captures when batching through a plain tmux invocation
+_CAPTURE_MARKER = "__yesman_capture__"
+
+_FIELDS = (
+    "session_name",
+    "window_index",
+    "window_name",
+    "pane_index",
+    "pane_id",
+    "pane_pid",
+    "pane_current_command",
+    "pane_dead",
+    "pane_active",
+    "window_activity",
+    "history_size",
+    "cursor_y",
+    "pane_height",
+)
+
+PANE_FORMAT = FIELD_SEPARATOR.join(f"#{{{name}}}" for name in _FIELDS)
+
+
+def _to_int(value: str, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class PaneSnapshot:
+    """State of one pane as reported by ``list-panes``."""
+
+    session_name: str
+    window_index: str
+    window_name: str
+    pane_index: str
+    pane_id: str
+    pid: int | None
+    command: str
+    dead: bool
+    active: bool
+    activity: int  # epoch seconds of the last activity in the pane's window
+    history_size: int
+    cursor_y: int
+    height: int
+
+    @classmethod
+    def from_line(cls, line: str) -> "PaneSnapshot | None":
+        """Parse one ``list-panes`` output line.
+
+        Returns:
+            PaneSnapshot | None: Parsed pane, or None for malformed lines.
+        """
+        values = line.split(FIELD_SEPARATOR)
+        if len(values) != len(_FIELDS):
+            return None
+        row = dict(zip(_FIELDS, values, strict=True))
+        pid = _to_int(row["pane_pid"])
+        return cls(
+            session_name=row["session_name"],
+            window_index=row["window_index"],
+            window_name=row["window_name"],
+            pane_index=row["pane_index"],
+            pane_id=row["pane_id"],
+            pid=pid or None,
+            command=row["pane_current_command"],
+            dead=row["pane_dead"] == "1",
+            active=row["pane_active"] == "1",
+            activity=_to_int(row["window_activity"]),
+            history_size=_to_int(row["history_size"]),
+            cursor_y=_to_int(row["cursor_y"]),
+            height=_to_int(row["pane_height"]),
+        )
+
+
+@dataclass
+class TmuxSnapshot:
+    """Every pane on a tmux server at one point in time."""
+
+    panes: list[PaneSnapshot] = field(default_factory=list)
+    taken_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.taken_at
+
+    @property
+    def session_names(self) -> set[str]:
+        """Names of all sessions that have at least one pane."""
+        return {pane.session_name for pane in self.panes}
+
+    def has_session(self, session_name: str) -> bool:
+        """Check whether a session exists in the snapshot.
+
+        Returns:
+            bool: True if the session has panes.
+        """
+        return any(pane.session_name == session_name for pane in self.panes)
+
+    def session_panes(self, session_name: str) -> list[PaneSnapshot]:
+        """Get all panes of a session in window/pane order.
+
+        Returns:
+            list[PaneSnapshot]: Panes of the session.
+        """
+        return [pane for pane in self.panes if pane.session_name == session_name]
+
+    def session_windows(self, session_name: str) -> dict[str, list[PaneSnapshot]]:
+        """Group a session's panes by window index.
+
+        Returns:
+            dict[str, list[PaneSnapshot]]: Panes keyed by window index, in window order.
+        """
+        windows: dict[str, list[PaneSnapshot]] = {}
+        for pane in self.session_panes(session_name):
+            windows.setdefault(pane.window_index, []).append(pane)
+        return windows
+
+    def get_pane(self, pane_id: str) -> PaneSnapshot | None:
+        """Look up a pane by id.
+
+        Returns:
+            PaneSnapshot | None: The pane, or None if it does not exist.
+        """
+        for pane in self.panes:
+            if pane.pane_id == pane_id:
+                return pane
+        return None
+
+
+def _strip_trailing_blank(lines: list[str]) -> list[str]:
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    return lines[:end]
+
+
+def parse_snapshot(lines: list[str]) -> TmuxSnapshot:
+    """Build a snapshot from ``list-panes -a -F PANE_FORMAT`` output.
+
+    Returns:
+        TmuxSnapshot: Parsed snapshot, without the control clients' private session.
+    """
+    panes = []
+    for line in lines:
+        pane = PaneSnapshot.from_line(line)
+        if pane is not None and not is_control_session(pane.session_name):
+            panes.append(pane)
+    return TmuxSnapshot(panes=panes)
+
+
+def take_snapshot(server: Any = None) -> TmuxSnapshot:
+    """Query every pane on the server with one ``list-panes -a`` call.
+
+    Args:
+        server: libtmux server (default server if None)
+
+    Returns:
+        TmuxSnapshot: Snapshot of the server; empty if no server is running.
+    """
+    try:
+        result = run_server_command(server, "list-panes", "-a", "-F", PANE_FORMAT)
+    except Exception as e:
+        logger.debug("list-panes failed: %s", e)
+        return TmuxSnapshot()
+    return parse_snapshot(list(getattr(result, "stdout", None) or []))
+
+
+def capture_panes(server: Any, pane_ids: list[str], start: int | None = None) -> dict[str, list[str]]:
+    """Capture the visible content of several panes in one round-trip.
+
+    Over the control connection the captures are pipelined in a single write;
+    otherwise they are chained with ``;`` into one tmux invocation.
+
+    Args:
+        server: libtmux server (default server if None)
+        pane_ids: Panes to capture
+        start: Optional ``-S`` start line (e.g. ``-50`` for the last 50 lines of history)
+
+    Returns:
+        dict[str, list[str]]: Captured lines per pane id, without trailing blank
+        lines. Panes that could not be captured are omitted.
+    """
+    if not pane_ids:
+        return {}
+
+    def capture_args(pane_id: str) -> tuple[str, ...]:
+        args: tuple[str, ...] = ("capture-pane", "-p", "-t", pane_id)
+        if start is not None:
+            args = (*args, "-S", str(start))
+        return args
+
+    client = get_control_client(server)
+    if client is not None:
+        try:
+            results = client.cmd_many([capture_args(pane_id) for pane_id in pane_ids])
+        except TmuxControlError as e:
+            logger.debug("Batched capture over control mode failed, falling back: %s", e)
+        else:
+            return {pane_id: _strip_trailing_blank(result.stdout) for pane_id, result in zip(pane_ids, results, strict=True) if result.returncode == 0}
+
+    # Each capture is preceded by a marker line naming its pane
+    args: list[str] = []
+    for pane_id in pane_ids:
+        if args:
+            args.append(";")
+        args.extend(["display-message", "-p", "-t", pane_id, f"{_CAPTURE_MARKER} {pane_id}", ";", *capture_args(pane_id)])
+
+    try:
+        result = run_server_command(server, *args)
+    except Exception as e:
+        logger.debug("Batched capture failed: %s", e)
+        return {}
+
+    captured: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in getattr(result, "stdout", None) or []:
+        if line.startswith(_CAPTURE_MARKER + " "):
+            current = captured.setdefault(line[len(_CAPTURE_MARKER) + 1 :], [])
+        elif current is not None:
+            current.append(line)
+    return {pane_id: _strip_trailing_blank(lines) for pane_id, lines in captured.items()}
+
+
+def get_fleet_snapshot(server: Any = None, max_age: float | None = None) -> TmuxSnapshot:
+    """Get a recent snapshot, taking a new one only when the cached one is stale.
+
+    Snapshots live in the shared tmux query cache, so every caller within the
+    TTL window reuses one list-panes query and session setup/teardown
+    invalidates them together with the other tmux queries.
+
+    Args:
+        server: libtmux server (default server if None)
+        max_age: Maximum acceptable age in seconds (defaults to ``settings.tmux.snapshot_ttl``)
+
+    Returns:
+        TmuxSnapshot: Shared snapshot of the server.
+    """
+    key = _server_key(server)
+    if key is None:
+        return take_snapshot(server)
+
+    ttl = settings.tmux.snapshot_ttl if max_age is None else max_age
+    cache = get_tmux_cache()
+    cache_key = f"{SNAPSHOT_CACHE_PREFIX}{key[0]}:{key[1]}"
+    snapshot = cache.get_or_compute(cache_key, lambda: take_snapshot(server), ttl=ttl)
+    if snapshot.age > ttl:
+        # Cached by a caller that tolerated an older snapshot
+        cache.invalidate(cache_key)
+        snapshot = cache.get_or_compute(cache_key, lambda: take_snapshot(server), ttl=ttl)
+    return snapshot
+
+
+def invalidate_fleet_snapshot() -> None:
+    """Drop all shared snapshots, e.g. after creating or killing sessions."""
+    get_tmux_cache().invalidate(SNAPSHOT_CACHE_PREFIX)
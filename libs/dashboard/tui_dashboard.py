@@ -1,8 +1,11 @@
 # Copyright notice.
 
+import asyncio
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+import requests
+from rich.table import Table
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
@@ -20,6 +23,8 @@ from textual.widgets import (
     TabPane,
 )
 
+from libs.core.settings import settings
+
 from .renderers import TUIRenderer, WidgetType
 from .renderers.widget_models import (
     ActivityData,
@@ -266,6 +271,70 @@ class LogsView(Static):
         logs_widget.write(formatted_log)
 
 
+class LatencyView(Static):
+    """Prompt-to-keystroke latency of the monitors running in the API server.
+
+    Monitors run in the API/controller process, not in the TUI, so the
+    histograms are fetched from ``GET /api/controllers/prompt-latency``.
+    """
+
+    REQUEST_TIMEOUT = 2.0
+
+    def compose(self) -> ComposeResult:
+        """Compose latency view."""
+        yield Label("Prompt Response Latency", classes="widget-title")
+        yield Static("No prompts answered yet", id="latency-table")
+
+    async def on_mount(self) -> None:
+        """Show the current latency right away."""
+        await self.auto_update()
+
+    @staticmethod
+    def latency_url() -> str:
+        """URL of the API's prompt latency endpoint."""
+        return f"http://{settings.api.host}:{settings.api.port}/api/controllers/prompt-latency"
+
+    @classmethod
+    def fetch_latency(cls) -> dict[str, dict[str, Any]]:
+        """Fetch latency histograms per session from the API.
+
+        Returns:
+            dict[str, dict[str, Any]]: Histograms keyed by session name.
+
+        Raises:
+            requests.RequestException: If the API cannot be reached or fails.
+        """
+        response = requests.get(cls.latency_url(), timeout=cls.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get("sessions", {})  # type: ignore[no-any-return]
+
+    async def auto_update(self) -> None:
+        """Render p50/p95/p99 over the last five minutes per session and prompt type."""
+        try:
+            sessions = await asyncio.to_thread(self.fetch_latency)
+        except (requests.RequestException, ValueError) as e:
+            self.query_one("#latency-table", Static).update(f"[yellow]Cannot reach the Yesman API at {self.latency_url()}: {e}[/yellow]")
+            return
+
+        table = Table(expand=True)
+        for column in ("Session", "Prompt type", "Answered", "p50 (5m)", "p95 (5m)", "p99 (5m)"):
+            table.add_column(column, justify="left" if column in {"Session", "Prompt type"} else "right")
+
+        for session_name, stats in sessions.items():
+            for prompt_type, snapshot in [("all", stats["all"]), *stats["by_type"].items()]:
+                window = snapshot["windows"].get("300s", {})
+                table.add_row(
+                    session_name,
+                    prompt_type,
+                    str(snapshot["count"]),
+                    f"{window.get('p50_ms', 0.0):.0f}ms",
+                    f"{window.get('p95_ms', 0.0):.0f}ms",
+                    f"{window.get('p99_ms', 0.0):.0f}ms",
+                )
+
+        self.query_one("#latency-table", Static).update(table if table.row_count else "No prompts answered yet")
+
+
 class SettingsView(Static):
     """Settings and configuration view."""
 
@@ -339,6 +408,7 @@ class TUIDashboard(App):
         Binding("3", "view_activity", "Activity", show=True),
         Binding("4", "view_logs", "Logs", show=True),
         Binding("5", "view_settings", "Settings", show=True),
+        Binding("6", "view_latency", "Latency", show=True),
         Binding("ctrl+c", "quit", "Quit", show=False),
     ]
 
@@ -359,6 +429,7 @@ class TUIDashboard(App):
         self.activity_view: ActivityView | None = None
         self.logs_view: LogsView | None = None
         self.settings_view: SettingsView | None = None
+        self.latency_view: LatencyView | None = None
 
         # Refresh timer
         self._refresh_timer: Timer | None = None
@@ -384,6 +455,9 @@ class TUIDashboard(App):
             with TabPane("Settings", id="settings-tab"):
                 yield Placeholder("Loading settings...", id="settings-content")
 
+            with TabPane("Latency", id="latency-tab"):
+                yield Placeholder("Loading latency...", id="latency-content")
+
         yield Footer()
 
     def on_mount(self) -> None:
@@ -399,6 +473,7 @@ class TUIDashboard(App):
         self.activity_view = ActivityView()
         self.logs_view = LogsView()
         self.settings_view = SettingsView()
+        self.latency_view = LatencyView()
 
         # Mount views to their respective containers
         sessions_container = self.query_one("#sessions-content")
@@ -421,6 +496,10 @@ class TUIDashboard(App):
         await settings_container.remove()
         await self.query_one("#settings-tab").mount(self.settings_view)
 
+        latency_container = self.query_one("#latency-content")
+        await latency_container.remove()
+        await self.query_one("#latency-tab").mount(self.latency_view)
+
         # Log initialization
         if self.logs_view:
             self.logs_view.add_log("INFO", "All dashboard views initialized")
@@ -451,6 +530,8 @@ class TUIDashboard(App):
                 await self.health_view.auto_update()
             elif current_tab and current_tab.id == "activity-tab" and self.activity_view:
                 await self.activity_view.auto_update()
+            elif current_tab and current_tab.id == "latency-tab" and self.latency_view:
+                await self.latency_view.auto_update()
 
             if self.logs_view:
                 self.logs_view.add_log(
@@ -512,6 +593,12 @@ class TUIDashboard(App):
         tabs.active = "settings-tab"
         self.current_view = "settings"
 
+    def action_view_latency(self) -> None:
+        """Switch to latency view."""
+        tabs = self.query_one(TabbedContent)
+        tabs.active = "latency-tab"
+        self.current_view = "latency"
+
     def on_settings_view_setting_changed(self, message: SettingsView.SettingChanged) -> None:
         """Handle settings changes."""
         if message.setting == "auto_refresh":
@@ -13,6 +13,9 @@ import libtmux
 from libtmux.exc import LibTmuxException
 
 from libs.core.error_handling import ErrorCategory, ErrorContext, YesmanError
+from libs.core.settings import CacheKeys
+from libs.core.tmux_cache import get_tmux_cache, invalidate_tmux_cache
+from libs.core.tmux_snapshot import get_fleet_snapshot
 from libs.validation import validate_session_name
 
 # Copyright (c) 2024 Yesman Claude Project
@@ -91,12 +94,15 @@ def check_session_exists(session_name: str, server: libtmux.Server | None = None
 
     Args:
         session_name: Name of the session to check
-        server: Optional tmux server instance (creates one if not provided)
+        server: Optional tmux server instance (uses the shared, cached fleet
+            snapshot of the default server if not provided)
 
     Returns:
         bool: True if session exists, False otherwise
     """
     try:
+        if server is None:
+            return get_fleet_snapshot().has_session(session_name)
         server = server or get_tmux_server()
         session = server.sessions.get(session_name=session_name, default=None)
         return session is not None
@@ -150,7 +156,8 @@ def get_session_info(session_name: str, server: libtmux.Server | None = None) ->
 
     Args:
         session_name: Name of the session
-        server: Optional tmux server instance
+        server: Optional tmux server instance (results for the default server
+            are served from the shared tmux cache)
 
     Returns:
         SessionInfo: Detailed session information
@@ -159,7 +166,17 @@ def get_session_info(session_name: str, server: libtmux.Server | None = None) ->
         SessionNotFoundError: If session doesn't exist
         YesmanError: For other errors
     """
-    server = server or get_tmux_server()
+    if server is None:
+        cached = get_tmux_cache().get_or_compute(
+            f"helpers:{CacheKeys.SESSION_INFO}:{session_name}",
+            lambda: _fetch_session_info(session_name, get_tmux_server()),
+        )
+        # Callers may modify the result; keep the cached copy intact
+        return copy.deepcopy(cached)
+    return _fetch_session_info(session_name, server)
+
+
+def _fetch_session_info(session_name: str, server: libtmux.Server) -> SessionInfo:
     session = server.sessions.get(session_name=session_name, default=None)
 
     if not session:
@@ -252,6 +269,7 @@ def create_session_windows(
                 start_directory=start_directory,
                 kill_session=False,
             )
+            invalidate_tmux_cache("create_session_windows")
         except LibTmuxException as e:
             msg = f"Failed to create session '{session_name}'"
             raise YesmanError(
@@ -5,6 +5,7 @@
 import logging
 import re
 import subprocess
+import time
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -18,12 +19,26 @@ from tmuxp.workspace.loader import expand
 
 # Avoid circular import
 if TYPE_CHECKING:
+    from libs.core.tmux_cache import TmuxQueryCache
     from libs.yesman_config import YesmanConfig
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 
 
+class _RecordingWorkspaceBuilder(WorkspaceBuilder):
+    """WorkspaceBuilder that remembers which pane was created for which pane config."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.created_panes: list[tuple[Any, dict[str, Any], dict[str, Any]]] = []
+
+    def iter_create_panes(self, window: Any, window_config: dict[str, Any]) -> Any:
+        for pane, pane_config in super().iter_create_panes(window, window_config):
+            self.created_panes.append((pane, pane_config, window_config))
+            yield pane, pane_config
+
+
 class TmuxManager:
     def __init__(self, config: "YesmanConfig") -> None:
         self.config = config
@@ -32,12 +47,23 @@ class TmuxManager:
         self.templates_path = config.get_templates_dir()
         self.sessions_path = config.get_sessions_dir()
 
-    def create_session(self, session_name: str, config_dict: dict) -> bool:
+    def create_session(self, session_name: str, config_dict: dict, timings: dict[str, float] | None = None) -> bool:
         """Create tmux session from a YAML config file in templates directory.
 
+        Pane startup commands are sent after the whole session layout has been
+        built, so the time spent building tmux objects and running startup
+        commands can be reported separately.
+
+        Args:
+            session_name: Name of the session
+            config_dict: Session configuration
+            timings: Optional dict that receives the durations (seconds) of the
+                ``template_expansion``, ``tmux_build`` and ``startup_commands`` phases
+
         Returns:
         Boolean indicating the created item.
         """
+        phase_timings = timings if timings is not None else {}
         try:
             server = libtmux.Server()
             session_name_from_config = config_dict.get("session_name", session_name)
@@ -46,16 +72,22 @@ class TmuxManager:
                 self.logger.warning(f"Session {session_name_from_config} already exists.")
                 return False
 
-            # print("--------------------------------")
-            # # print(config_dict)
-            # print(yaml.dump(config_dict))
-            # print("--------------------------------")
+            started = time.perf_counter()
             config_dict = expand(config_dict, cwd=self.templates_path)
-            # print(yaml.dump(config_dict))
-            # print("--------------------------------")
+            startup_commands = self._defer_startup_commands(config_dict)
+            phase_timings["template_expansion"] = time.perf_counter() - started
 
-            builder = WorkspaceBuilder(config_dict, server=server)
-            builder.build()
+            started = time.perf_counter()
+            builder = _RecordingWorkspaceBuilder(config_dict, server=server)
+            try:
+                builder.build()
+            finally:
+                self._invalidate_cache("create_session")
+            phase_timings["tmux_build"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            self._send_startup_commands(builder.created_panes, startup_commands)
+            phase_timings["startup_commands"] = time.perf_counter() - started
             self.logger.info(f"Session {session_name_from_config} created successfully.")
 
         except (OSError, RuntimeError, ValueError, AttributeError):
@@ -64,7 +96,56 @@ class TmuxManager:
         else:
             return True
 
-    def create_session_from_config(self, config_dict: dict) -> bool:
+    @staticmethod
+    def _defer_startup_commands(config_dict: dict) -> dict[int, list[dict[str, Any]]]:
+        """Remove pane startup commands from an expanded config.
+
+        Returns:
+        Commands keyed by the id of the pane config they were taken from.
+        """
+        deferred: dict[int, list[dict[str, Any]]] = {}
+        for window_config in config_dict.get("windows", []):
+            for pane_config in window_config.get("panes", []):
+                commands = pane_config.get("shell_command") or []
+                if commands:
+                    deferred[id(pane_config)] = list(commands)
+                    pane_config["shell_command"] = []
+        return deferred
+
+    @staticmethod
+    def _send_startup_commands(
+        created_panes: list[tuple[Any, dict[str, Any], dict[str, Any]]],
+        deferred: dict[int, list[dict[str, Any]]],
+    ) -> None:
+        """Send deferred startup commands the way tmuxp would have during build.
+
+        This mirrors the ``shell_command`` loop of tmuxp's
+        ``WorkspaceBuilder.iter_create_panes`` for the versions pyproject allows.
+        Versions that wait for the pane's shell prompt do so while building the
+        pane, before these commands are sent. A test compares both against the
+        installed tmuxp.
+        """
+        for pane, pane_config, window_config in created_panes:
+            commands = deferred.get(id(pane_config))
+            if not commands:
+                continue
+
+            suppress = pane_config.get("suppress_history", window_config.get("suppress_history", True))
+            enter = pane_config.get("enter", True)
+            sleep_before = pane_config.get("sleep_before")
+            sleep_after = pane_config.get("sleep_after")
+            for command in commands:
+                enter = command.get("enter", enter)
+                sleep_before = command.get("sleep_before", sleep_before)
+                sleep_after = command.get("sleep_after", sleep_after)
+
+                if sleep_before is not None:
+                    time.sleep(sleep_before)
+                pane.send_keys(command["cmd"], suppress_history=suppress, enter=enter)
+                if sleep_after is not None:
+                    time.sleep(sleep_after)
+
+    def create_session_from_config(self, config_dict: dict, timings: dict[str, float] | None = None) -> bool:
         """Create tmux session from configuration dictionary.
 
         This is an alias for create_session to maintain compatibility.
@@ -73,7 +154,7 @@ class TmuxManager:
         Boolean indicating the created item.
         """
         session_name = config_dict.get("session_name", "default")
-        return self.create_session(session_name, config_dict)
+        return self.create_session(session_name, config_dict, timings=timings)
 
     def get_templates(self) -> list[str]:
         """Get all available session templates.
@@ -327,8 +408,11 @@ class TmuxManager:
     @staticmethod
     def list_running_sessions() -> None:
         """List currently running tmux sessions."""
+        # Import at runtime to avoid circular import
+        from libs.core.tmux_control import is_control_session
+
         server = libtmux.Server()
-        sessions = list(server.sessions)
+        sessions = [sess for sess in server.sessions if not is_control_session(sess.get("session_name"))]
         if not sessions:
             click.echo("No running tmux sessions found")
             return
@@ -338,11 +422,13 @@ class TmuxManager:
             click.echo(f"  - {name}")
 
     def get_session_info(self, session_name: str) -> dict[str, object]:
-        """Get session information directly from tmux.
+        """Get session information from tmux, served from the shared tmux cache.
 
         Returns:
         Dict containing service information.
         """
+        # Import at runtime to avoid circular import
+        from libs.core.settings import CacheKeys
 
         def fetch_session_info() -> dict[str, object]:
             """Fetch session information from tmux.
@@ -350,60 +436,63 @@ class TmuxManager:
             Returns:
             Dict containing service information.
             """
-            try:
-                server = libtmux.Server()
-                session = server.sessions.get(session_name=session_name, default=None)
-                if not session:
-                    return {"exists": False, "session_name": session_name}
-
-                # Get session details
-                windows = []
-                if hasattr(session, "list_windows"):
-                    for window in session.windows:
-                        panes: list[dict[str, Any]] = []
-                        if hasattr(window, "list_panes"):
-                            panes.extend(
-                                {
-                                    "pane_id": (getattr(pane, "pane_id", None) or pane.get("pane_id", "unknown")),
-                                    "pane_current_command": (getattr(pane, "pane_current_command", "") or pane.get("pane_current_command", "")),
-                                    "pane_active": ((getattr(pane, "pane_active", "0") or pane.get("pane_active", "0")) == "1"),
-                                    "pane_width": (getattr(pane, "pane_width", 0) or pane.get("pane_width", 0)),
-                                    "pane_height": (getattr(pane, "pane_height", 0) or pane.get("pane_height", 0)),
-                                }
-                                for pane in window.panes
-                            )
-
-                        windows.append(
+            server = libtmux.Server()
+            session = server.sessions.get(session_name=session_name, default=None)
+            if not session:
+                return {"exists": False, "session_name": session_name}
+
+            # Get session details
+            windows = []
+            if hasattr(session, "list_windows"):
+                for window in session.windows:
+                    panes: list[dict[str, Any]] = []
+                    if hasattr(window, "list_panes"):
+                        panes.extend(
                             {
-                                "window_id": (getattr(window, "window_id", None) or window.get("window_id", "unknown")),
-                                "window_name": (getattr(window, "window_name", None) or window.get("window_name", "unknown")),
-                                "window_active": ((getattr(window, "window_active", "0") or window.get("window_active", "0")) == "1"),
-                                "panes": panes,
+                                "pane_id": (getattr(pane, "pane_id", None) or pane.get("pane_id", "unknown")),
+                                "pane_current_command": (getattr(pane, "pane_current_command", "") or pane.get("pane_current_command", "")),
+                                "pane_active": ((getattr(pane, "pane_active", "0") or pane.get("pane_active", "0")) == "1"),
+                                "pane_width": (getattr(pane, "pane_width", 0) or pane.get("pane_width", 0)),
+                                "pane_height": (getattr(pane, "pane_height", 0) or pane.get("pane_height", 0)),
                             }
+                            for pane in window.panes
                         )
 
-                return {
-                    "exists": True,
-                    "session_name": session_name,
-                    "session_id": (getattr(session, "session_id", None) or session.get("session_id", "unknown")),
-                    "session_created": (getattr(session, "session_created", None) or session.get("session_created", None)),
-                    "windows": windows,
-                }
-            except Exception as e:
-                self.logger.exception("Failed to get session info for {session_name}:")
-                return {"exists": False, "session_name": session_name, "error": str(e)}
+                    windows.append(
+                        {
+                            "window_id": (getattr(window, "window_id", None) or window.get("window_id", "unknown")),
+                            "window_name": (getattr(window, "window_name", None) or window.get("window_name", "unknown")),
+                            "window_active": ((getattr(window, "window_active", "0") or window.get("window_active", "0")) == "1"),
+                            "panes": panes,
+                        }
+                    )
 
-        return fetch_session_info()
+            return {
+                "exists": True,
+                "session_name": session_name,
+                "session_id": (getattr(session, "session_id", None) or session.get("session_id", "unknown")),
+                "session_created": (getattr(session, "session_created", None) or session.get("session_created", None)),
+                "windows": windows,
+            }
+
+        try:
+            return self._cache().get_or_compute(f"{CacheKeys.SESSION_INFO}:{session_name}", fetch_session_info)
+        except Exception as e:
+            self.logger.exception("Failed to get session info for {session_name}:")
+            return {"exists": False, "session_name": session_name, "error": str(e)}
 
     def get_cached_sessions_list(self) -> list[dict[str, object]]:
-        """Get list of all sessions directly from tmux.
+        """Get list of all sessions, served from the shared tmux cache.
 
         Returns:
         List of items.
         """
-        try:
+        # Import at runtime to avoid circular import
+        from libs.core.settings import CacheKeys
+        from libs.core.tmux_control import is_control_session
+
+        def fetch_sessions_list() -> list[dict[str, object]]:
             server = libtmux.Server()
-            sessions = list(server.sessions)
             return [
                 {
                     "session_name": (getattr(sess, "session_name", None) or sess.get("session_name", "unknown")),
@@ -411,26 +500,53 @@ class TmuxManager:
                     "session_created": (getattr(sess, "session_created", None) or sess.get("session_created", None)),
                     "session_windows": (getattr(sess, "session_windows", 0) or sess.get("session_windows", 0)),
                 }
-                for sess in sessions
+                for sess in server.sessions
+                if not is_control_session(getattr(sess, "session_name", None) or sess.get("session_name"))
             ]
+
+        try:
+            return self._cache().get_or_compute(CacheKeys.SESSION_LIST, fetch_sessions_list)
         except Exception:
             self.logger.exception("Failed to get sessions list:")
             return []
 
+    def run_command(self, *args: str) -> list[str]:
+        """Run a raw tmux command, reusing the shared control-mode connection.
+
+        Returns:
+        List of output lines.
+        """
+        # Import at runtime to avoid circular import
+        from libs.core.tmux_control import run_server_command
+
+        try:
+            result = run_server_command(None, *args)
+            return list(result.stdout or [])
+        except Exception:
+            self.logger.exception("Failed to run tmux command: %s", args[0] if args else "")
+            return []
+
     def get_cache_stats(self) -> dict[str, object]:
-        """Get cache statistics for performance monitoring.
+        """Get statistics of the shared tmux query cache.
 
         Returns:
         Dict containing cache statistics.
         """
-        # Simple implementation - in a real system this would track actual cache metrics
-        return {
-            "hit_rate": 0.85,  # 85% hit rate
-            "total_requests": 100,
-            "cache_hits": 85,
-            "cache_misses": 15,
-            "cache_size": 50,
-        }
+        return self._cache().get_stats()
+
+    @staticmethod
+    def _cache() -> "TmuxQueryCache":
+        # Import at runtime to avoid circular import
+        from libs.core.tmux_cache import get_tmux_cache
+
+        return get_tmux_cache()
+
+    @staticmethod
+    def _invalidate_cache(reason: str) -> None:
+        # Import at runtime to avoid circular import
+        from libs.core.tmux_cache import invalidate_tmux_cache
+
+        invalidate_tmux_cache(reason)
 
     def teardown_session(self, session_name: str) -> bool:
         """Teardown a specific tmux session.
@@ -443,6 +559,7 @@ class TmuxManager:
             session = server.find_where({"session_name": session_name})
             if session and hasattr(session, "kill_session"):
                 session.kill_session()
+                self._invalidate_cache("teardown_session")
                 self.logger.info("Session {session_name} terminated.")
                 return True
             self.logger.warning("Session {session_name} not found.")
@@ -459,6 +576,7 @@ class TmuxManager:
             server = libtmux.Server()
             if hasattr(server, "kill_server"):
                 server.kill_server()
+                self._invalidate_cache("teardown_all_sessions")
                 self.logger.info("All tmux sessions terminated.")
         except Exception:
             self.logger.exception("Failed to teardown all sessions:")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+
+"""Benchmark prompt detection on a labelled corpus and gate on a stored baseline.
+
+Runs ``ClaudePromptDetector`` over every frame of the corpus, prints frames per
+second, the time spent per detection stage, and precision/recall per prompt
+type, then compares the results with the baseline. Exits with status 1 if
+throughput, a stage or accuracy regressed beyond the tolerance.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path so we can import our modules
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from libs.core.prompt_benchmark import BenchmarkReport, compare_to_baseline, load_corpus, run_benchmark
+
+DEFAULT_CORPUS = project_root / "tests" / "data" / "prompt_benchmark" / "corpus_v1.jsonl"
+DEFAULT_BASELINE = project_root / "tests" / "data" / "prompt_benchmark" / "baseline.json"
+
+
+def _format_score(value: float | None) -> str:
+    return "   -" if value is None else f"{value:.2f}"
+
+
+def print_report(report: BenchmarkReport) -> None:
+    """Print a human-readable benchmark report."""
+    print("\n📊 Prompt Detection Benchmark")
+    print("=" * 40)
+    print(f"🗂️  Corpus: v{report.corpus_version}, {report.frames} frames, best of {report.passes} passes")
+    print(f"🚀 Throughput: {report.frames_per_second:.0f} frames/s ({report.pass_seconds * 1000:.2f}ms per pass)")
+
+    print("\n⏱️  Stages (us per frame)")
+    for stage, microseconds in sorted(report.stages.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {stage:<22} {microseconds:8.1f}")
+
+    print("\n🎯 Accuracy")
+    print(f"  {'type':<22} {'precision':>9} {'recall':>7} {'support':>8}")
+    for label, scores in report.accuracy.items():
+        print(f"  {label:<22} {_format_score(scores['precision']):>9} {_format_score(scores['recall']):>7} {scores['support']:>8}")
+
+    if report.mismatches:
+        print("\n❓ Mismatches")
+        for mismatch in report.mismatches:
+            print(f"  {mismatch['name']:<28} expected={mismatch['expected']} detected={mismatch['detected']}")
+
+
+def main() -> None:
+    """Main entry point for the prompt detection benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark prompt detection against a labelled corpus")
+
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Corpus JSONL file")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown (default: 0.25)")
+    parser.add_argument("--passes", type=int, default=10, help="Timed passes over the corpus; the fastest counts (default: 10)")
+    parser.add_argument("--packs", type=Path, help="Directory of extra prompt pattern packs to benchmark")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline instead of comparing")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        corpus_version, frames = load_corpus(args.corpus)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot load corpus: {e}")
+        sys.exit(1)
+
+    report = run_benchmark(frames, corpus_version=corpus_version, passes=args.passes, pack_dir=args.packs)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+        regressions = None
+    elif args.baseline.exists():
+        regressions = compare_to_baseline(report, json.loads(args.baseline.read_text(encoding="utf-8")), tolerance=args.tolerance)
+    else:
+        regressions = None
+
+    if args.json:
+        print(json.dumps({**report.to_dict(), "regressions": regressions}, indent=2))
+    else:
+        print_report(report)
+        if args.update_baseline:
+            print(f"\n💾 Baseline written to {args.baseline}")
+        elif regressions is None:
+            print(f"\n❓ No baseline at {args.baseline}; run with --update-baseline to record one")
+        elif regressions:
+            print("\n❌ Regressions against the baseline:")
+            for regression in regressions:
+                print(f"  • {regression}")
+        else:
+            print("\n✅ No regressions against the baseline")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+
+"""Benchmark the Claude monitor loop by replaying recorded pane frames.
+
+Frames come from a ``ClaudeContentCollector`` session directory
+(``~/.scripton/yesman/logs/claude_interactions/<session>``), a single collector
+JSON file, or a JSONL trace with one ``{"content": ..., "timestamp": ...}``
+object per line.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path so we can import our modules
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from libs.core.executors import shutdown_executors
+from libs.core.monitor_replay import MonitorReplay, ReplayReport, load_frames
+
+
+def print_report(report: ReplayReport) -> None:
+    """Print a human-readable replay report."""
+    print("\n📊 Monitor Replay")
+    print("=" * 40)
+    print(f"🎞️  Frames: {report.frames} ({report.skipped_frames} unchanged)")
+    print(f"⏱️  Elapsed: {report.elapsed_seconds:.2f}s, busy: {report.busy_seconds:.2f}s")
+    print(f"🚀 Throughput: {report.frames_per_second:.1f} frames/s (max {report.max_frames_per_second:.1f} frames/s)")
+    for label, latency in (("Frame latency", report.frame_latency_ms), ("Detection latency", report.detection_latency_ms)):
+        print(f"📈 {label}: p50={latency['p50_ms']:.2f}ms p95={latency['p95_ms']:.2f}ms p99={latency['p99_ms']:.2f}ms max={latency['max_ms']:.2f}ms")
+
+    print("\n🔍 Components")
+    for name, stats in report.components.items():
+        print(f"  {name:<22} avg={stats['average_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms n={stats['sample_count']}")
+    print(f"\n⌨️  Responses sent: {len(report.responses)}")
+
+
+def main() -> None:
+    """Main entry point for the monitor replay benchmark."""
+    parser = argparse.ArgumentParser(description="Replay recorded pane frames through the Claude monitor")
+
+    parser.add_argument("source", type=Path, help="JSONL trace, collector JSON file, or collector session directory")
+    parser.add_argument("--speed", type=float, default=0.0, help="Playback speed relative to the recording (default: 0, as fast as possible)")
+    parser.add_argument("--no-respond", action="store_true", help="Detect prompts without answering them")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        frames = load_frames(args.source)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot load frames: {e}")
+        sys.exit(1)
+
+    if not frames:
+        print(f"❓ No frames found in {args.source}")
+        sys.exit(1)
+
+    try:
+        report = asyncio.run(MonitorReplay(frames, speed=args.speed, auto_respond=not args.no_respond).run())
+    except KeyboardInterrupt:
+        print("\n⛔ Replay interrupted by user")
+        sys.exit(1)
+    finally:
+        shutdown_executors()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Performance tests package."""
@@ -0,0 +1,33 @@
+# Copyright notice.
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from libs.core.prompt_benchmark import compare_to_baseline, load_corpus, run_benchmark
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Regression gate for prompt detection speed and accuracy.
+
+Compares a benchmark run on the shipped corpus with the stored baseline.
+Accuracy must not drop at all; the speed tolerance defaults to 50% to absorb
+noisy CI machines and can be set with ``YESMAN_BENCHMARK_TOLERANCE``. Record a
+new baseline with ``scripts/benchmark_prompt_detection.py --update-baseline``.
+"""
+
+
+DATA_DIR = Path(__file__).parents[1] / "data" / "prompt_benchmark"
+
+
+@pytest.mark.performance
+def test_prompt_detection_has_not_regressed() -> None:
+    version, frames = load_corpus(DATA_DIR / "corpus_v1.jsonl")
+    baseline = json.loads((DATA_DIR / "baseline.json").read_text(encoding="utf-8"))
+
+    report = run_benchmark(frames, corpus_version=version)
+
+    regressions = compare_to_baseline(report, baseline, tolerance=float(os.environ.get("YESMAN_BENCHMARK_TOLERANCE", "0.5")))
+    assert not regressions, "\n".join(regressions)
@@ -54,8 +54,8 @@ class TestTeardownCommand:
         mock_command.run.assert_called_once_with(session_name="test-session")
 
     @patch("commands.teardown.libtmux.Server")
-    @patch("commands.teardown.subprocess.run")
-    def test_execute_with_no_sessions_defined(self, mock_subprocess: MagicMock, mock_server: MagicMock) -> None:
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_with_no_sessions_defined(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
         """Test execute when no sessions are defined in projects.yaml."""
         with patch.object(TeardownCommand, '__init__', lambda x: None):
             command = TeardownCommand()
@@ -69,8 +69,8 @@ class TestTeardownCommand:
             command.print_warning.assert_called_once_with("No sessions defined in projects.yaml")
 
     @patch("commands.teardown.libtmux.Server")
-    @patch("commands.teardown.subprocess.run")
-    def test_execute_kills_all_sessions_successfully(self, mock_subprocess: MagicMock, mock_server: MagicMock) -> None:
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_kills_all_sessions_successfully(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
         """Test execute kills all sessions successfully."""
         # Setup mocks
         mock_server_instance = MagicMock()
@@ -100,12 +100,12 @@ class TestTeardownCommand:
             assert result["killed_sessions"] == ["actual-test-session"]
             assert result["not_found_sessions"] == []
             assert result["total_sessions"] == 1
-            mock_subprocess.assert_called_once_with(["tmux", "kill-session", "-t", "actual-test-session"], check=False)
+            mock_kill.assert_called_once_with("actual-test-session")
             command.print_success.assert_called_with("Killed session: actual-test-session")
 
     @patch("commands.teardown.libtmux.Server")
-    @patch("commands.teardown.subprocess.run")
-    def test_execute_with_specific_session_not_defined(self, mock_subprocess: MagicMock, mock_server: MagicMock) -> None:
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_with_specific_session_not_defined(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
         """Test execute with specific session that's not defined in projects.yaml."""
         with patch.object(TeardownCommand, '__init__', lambda x: None):
             command = TeardownCommand()
@@ -123,8 +123,8 @@ class TestTeardownCommand:
             command.print_error.assert_called_once_with("Session non-existent-session not defined in projects.yaml")
 
     @patch("commands.teardown.libtmux.Server")
-    @patch("commands.teardown.subprocess.run")
-    def test_execute_with_session_not_running(self, mock_subprocess: MagicMock, mock_server: MagicMock) -> None:
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_with_session_not_running(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
         """Test execute when target session is not currently running."""
         # Setup mocks
         mock_server_instance = MagicMock()
@@ -152,7 +152,7 @@ class TestTeardownCommand:
             assert result["success"] is True
             assert result["killed_sessions"] == []
             assert result["not_found_sessions"] == ["not-running-session"]
-            mock_subprocess.assert_not_called()
+            mock_kill.assert_not_called()
             command.print_warning.assert_called_with("Session not-running-session not found")
 
     def test_execute_handles_exceptions(self) -> None:
@@ -168,8 +168,8 @@ class TestTeardownCommand:
             assert "Error tearing down sessions: Test error" in str(exc_info.value)
 
     @patch("commands.teardown.libtmux.Server")
-    @patch("commands.teardown.subprocess.run")
-    def test_execute_uses_session_key_as_default_name(self, mock_subprocess: MagicMock, mock_server: MagicMock) -> None:
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_uses_session_key_as_default_name(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
         """Test execute uses session key as default name when override is not provided."""
         # Setup mocks
         mock_server_instance = MagicMock()
@@ -196,4 +196,23 @@ class TestTeardownCommand:
 
             # Should use session key as the actual session name
             assert result["killed_sessions"] == ["default-session-name"]
-            mock_subprocess.assert_called_once_with(["tmux", "kill-session", "-t", "default-session-name"], check=False)
\ No newline at end of file
+            mock_kill.assert_called_once_with("default-session-name")
+
+    @patch("commands.teardown.libtmux.Server")
+    @patch("libs.core.session_teardown.kill_tmux_session")
+    def test_execute_reports_sessions_tmux_failed_to_kill(self, mock_kill: MagicMock, mock_server: MagicMock) -> None:
+        """Test execute reports a session tmux could not kill instead of counting it as killed."""
+        mock_server.return_value.sessions.get.return_value = MagicMock()
+        mock_kill.side_effect = RuntimeError("can't find session: =gone")
+
+        with patch.object(TeardownCommand, '__init__', lambda x: None):
+            command = TeardownCommand()
+            command.tmux_manager = MagicMock()
+            command.tmux_manager.load_projects.return_value = {"sessions": {"gone": {}}}
+            command.print_success = MagicMock()
+            command.print_error = MagicMock()
+
+            result = command.execute()
+
+            assert result["killed_sessions"] == []
+            command.print_error.assert_called_once_with("Failed to kill session gone: can't find session: =gone")
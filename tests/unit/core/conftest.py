@@ -0,0 +1,47 @@
+# Copyright notice.
+
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from libs.ai.adaptive_response import AdaptiveConfig, AdaptiveResponse
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.executors import shutdown_executors
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Shared fixtures for core unit tests."""
+
+
+@pytest.fixture
+def async_monitor(tmp_path: Path) -> Iterator[AsyncClaudeMonitor]:
+    """AsyncClaudeMonitor with a mocked event bus, prompt detector and analysis steps.
+
+    Auto-responding starts disabled and no prompt is detected. Learning data
+    starts empty under ``tmp_path`` and is never written.
+    """
+    event_bus = MagicMock()
+    event_bus.publish = AsyncMock(return_value=True)
+    monitor = AsyncClaudeMonitor(
+        SimpleNamespace(session_name="test-session"),
+        MagicMock(),
+        MagicMock(),
+        event_bus=event_bus,
+        adaptive_response=AdaptiveResponse(config=AdaptiveConfig(learning_enabled=False, response_delay_ms=0), data_dir=tmp_path),
+        prompt_detector=MagicMock(),
+        content_collector=MagicMock(),
+    )
+    monitor.is_auto_next_enabled = False
+    monitor.prompt_detector.detect_prompt.return_value = None
+    monitor.prompt_detector.is_waiting_for_input.return_value = False
+    monitor.adaptive_response.should_auto_respond = AsyncMock(return_value=(False, "", 0.0))
+    monitor.adaptive_response.update_patterns = AsyncMock()
+    monitor._analyze_automation_context = AsyncMock()
+    monitor._collect_content_interaction = AsyncMock()
+
+    yield monitor
+
+    shutdown_executors()
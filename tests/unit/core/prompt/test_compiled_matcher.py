@@ -0,0 +1,142 @@
+# Copyright notice.
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from libs.core.prompt_benchmark import load_corpus
+from libs.core.prompt_detector import ClaudePromptDetector, PromptType
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Golden equivalence tests for the single-pass compiled prompt matcher."""
+
+
+GOLDEN_CONTENTS = [
+    "Do you want to make this edit to VideoProcessingService.kt?\n❯ 1. Yes\n  2. Yes, and don't ask again this session (shift+tab)\n  3. No, and tell Claude what to do differently (esc)",
+    "Choose a model:\n[1] Opus\n[2] Sonnet\n[3] Haiku",
+    "Pick one\n1) first\n2) second",
+    "1. only one option here",
+    "Steps:\n1. build\n2) test 3. ship\n[4] deploy",
+    "Do you want to continue? (y/n)",
+    "Overwrite file? (yes/no)",
+    "Install dependencies? [Y/n]",
+    "Delete branch? [y/N]",
+    "Which one? [1/2]",
+    "Continue? (Y/N) or [y/N]",
+    "Enable advanced features? (true/false)",
+    "Strict mode [TRUE/FALSE]",
+    "Answer true or false: is the sky blue",
+    "Please configure terminal settings before continuing",
+    "Open terminal preferences?",
+    "Login required to continue",
+    "Please authenticate with your account",
+    "Sign in to Anthropic",
+    "Redirecting you to the login page...",
+    "Enter your API key:",
+    "Please enter the project name: ",
+    "Type a commit message: fix",
+    "Input file path:",
+    "Enter value (y/n):",
+    "Do you want to save the changes?",
+    "Are you sure?",
+    "Would you like to proceed with the installation?",
+    "Just some regular output\nwith several lines\nand no prompt",
+    "\x1b[32m❯ 1. Yes\x1b[0m\n\x1b[32m  2. No\x1b[0m",
+    "Compiling...\n\n\n\nDone in 1.2s",
+    "Enter\nname: x",
+    "Should we commit this?\n1. Yes\n2. No",
+    "Version 1.2.3 released",
+    "Terminal settings: 1) dark 2) light",
+]
+
+FRAGMENTS = [
+    "❯ 1. Yes",
+    "2. No",
+    "[3] Maybe",
+    "4) Later",
+    "(y/n)",
+    "(YES/no)",
+    "[Y/n]",
+    "[y/N]",
+    "[1/2]",
+    "(true/false)",
+    "true or false",
+    "terminal settings",
+    "configure terminal",
+    "login required",
+    "authenticate",
+    "sign in",
+    "redirect to login",
+    "Enter name:",
+    "type value:",
+    "Please enter path:",
+    "Do you want to continue?",
+    "Save?",
+    "ok",
+    "   ",
+    "\x1b[1mBold\x1b[0m",
+    "Processing 10.5 files",
+]
+
+
+@pytest.fixture
+def detector() -> ClaudePromptDetector:
+    return ClaudePromptDetector()
+
+
+def _assert_equivalent(detector: ClaudePromptDetector, content: str) -> None:
+    compiled = detector.detect_prompt(content)
+    sequential = detector._detect_sequential(detector._clean_content(content)) if content and len(content.strip()) >= 3 else None
+    assert compiled == sequential, content
+
+
+@pytest.mark.parametrize("content", GOLDEN_CONTENTS)
+def test_compiled_matches_sequential_detectors(detector: ClaudePromptDetector, content: str) -> None:
+    _assert_equivalent(detector, content)
+
+
+def test_compiled_matches_sequential_detectors_on_mixed_frames(detector: ClaudePromptDetector) -> None:
+    rng = random.Random(1234)
+    for _ in range(500):
+        parts = rng.choices(FRAGMENTS, k=rng.randint(1, 6))
+        separators = rng.choices(["\n", " ", "  ", ""], k=len(parts))
+        _assert_equivalent(detector, "".join(part + separator for part, separator in zip(parts, separators, strict=True)))
+
+
+def test_candidates_skip_families_without_anchors(detector: ClaudePromptDetector) -> None:
+    assert detector.matcher.candidates("Build finished in 12s") == []
+    assert detector.matcher.candidates("Please SIGN in, then answer (Y/N)\n1) a") == ["numbered_selection", "binary_choice", "login_redirect"]
+
+
+def test_every_pattern_match_contains_an_anchor(detector: ClaudePromptDetector) -> None:
+    patterns = detector.registry.patterns()
+    for content in GOLDEN_CONTENTS:
+        cleaned = detector._clean_content(content)
+        candidates = detector.matcher.candidates(cleaned)
+        for family in detector.family_detectors:
+            if any(pattern.regex.search(cleaned) for pattern in patterns[family]):
+                assert family in candidates, (family, content)
+
+
+def test_every_pattern_match_on_the_corpus_contains_one_of_its_anchors(detector: ClaudePromptDetector) -> None:
+    _, frames = load_corpus(Path(__file__).parents[3] / "data" / "prompt_benchmark" / "corpus_v1.jsonl")
+    anchored = [pattern for patterns in detector.registry.patterns().values() for pattern in patterns if pattern.anchors]
+    checked = 0
+    for frame in frames:
+        cleaned = detector._clean_content(frame.content)
+        for pattern in anchored:
+            anchor = re.compile("|".join(pattern.anchors), re.IGNORECASE)
+            for match in pattern.regex.finditer(cleaned):
+                assert anchor.search(match.group(0).casefold()), (pattern.id, frame.name, match.group(0))
+                checked += 1
+    assert checked
+
+
+def test_higher_priority_family_wins(detector: ClaudePromptDetector) -> None:
+    prompt_info = detector.detect_prompt("Please enter value (y/n): and sign in")
+
+    assert prompt_info is not None
+    assert prompt_info.type == PromptType.BINARY_CHOICE
@@ -0,0 +1,69 @@
+# Copyright notice.
+
+from unittest.mock import patch
+
+from libs.core.detection_cache import DetectionCache, fingerprint, get_detection_cache
+from libs.core.prompt_detector import ClaudePromptDetector, PromptType
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for memoised prompt detection results."""
+
+
+PROMPT = "Do you want to proceed?\n❯ 1. Yes\n  2. No"
+
+
+def test_repeated_screen_is_detected_once() -> None:
+    detector = ClaudePromptDetector(cache=DetectionCache())
+
+    with patch.object(detector, "_detect_region", wraps=detector._detect_region) as detect_region:
+        first = detector.detect_prompt(PROMPT)
+        second = detector.detect_prompt("\x1b[1m" + PROMPT + "\n\n")
+
+    assert first is second
+    assert first is not None
+    assert first.type == PromptType.NUMBERED_SELECTION
+    assert detect_region.call_count == 1
+    assert detector.cache.get_stats()["cache_hits"] == 1
+
+
+def test_no_prompt_results_are_cached() -> None:
+    detector = ClaudePromptDetector(cache=DetectionCache())
+
+    assert detector.detect_prompt("Working on it...") is None
+    assert detector.detect_prompt("Working on it...") is None
+
+    stats = detector.cache.get_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
+
+
+def test_cache_is_shared_across_detectors() -> None:
+    cache = DetectionCache()
+    ClaudePromptDetector(cache=cache).detect_prompt(PROMPT)
+
+    ClaudePromptDetector(cache=cache).detect_prompt(PROMPT)
+
+    assert cache.get_stats()["hit_rate"] == 0.5
+    assert ClaudePromptDetector().cache is get_detection_cache()
+
+
+def test_evictions_are_counted() -> None:
+    cache = DetectionCache(max_entries=2)
+    for text in ("a", "b", "c", "a"):
+        cache.get_or_compute(fingerprint(text), lambda text=text: text.upper())
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 2
+    assert stats["cache_size"] == 2
+    assert stats["cache_misses"] == 4
+
+
+def test_zero_size_disables_caching() -> None:
+    cache = DetectionCache(max_entries=0)
+    calls = []
+    for _ in range(2):
+        cache.get_or_compute(fingerprint("a"), lambda: calls.append(1))
+
+    assert len(calls) == 2
+    assert cache.get_stats()["cache_size"] == 0
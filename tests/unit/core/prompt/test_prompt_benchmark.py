@@ -0,0 +1,115 @@
+# Copyright notice.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from libs.core.prompt_benchmark import BenchmarkReport, compare_to_baseline, load_corpus, run_benchmark, score
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the prompt detection benchmark and its baseline gate."""
+
+
+CORPUS = Path(__file__).parents[3] / "data" / "prompt_benchmark" / "corpus_v1.jsonl"
+
+
+def _report(**overrides: object) -> BenchmarkReport:
+    fields = {
+        "corpus_version": "1",
+        "frames": 100,
+        "passes": 1,
+        "pass_seconds": 0.1,
+        "calibration_seconds": 0.02,
+        "stages": {"normalize": 10.0, "binary_choice": 5.0},
+        "accuracy": {"binary_choice": {"precision": 1.0, "recall": 0.5, "support": 2}},
+    }
+    fields.update(overrides)
+    return BenchmarkReport(**fields)  # type: ignore[arg-type]
+
+
+def test_score_per_type() -> None:
+    scores = score(["binary_choice", "binary_choice", "none", "text_input"], ["binary_choice", "none", "binary_choice", "none"])
+
+    assert scores["binary_choice"] == {"precision": 0.5, "recall": 0.5, "support": 2}
+    assert scores["none"] == {"precision": 0.0, "recall": 0.0, "support": 1}
+    # Never detected: precision is undefined
+    assert scores["text_input"] == {"precision": None, "recall": 0.0, "support": 1}
+
+
+def test_identical_report_passes() -> None:
+    report = _report()
+
+    assert compare_to_baseline(report, report.to_dict()) == []
+
+
+def test_slowdown_beyond_tolerance_regresses() -> None:
+    baseline = _report().to_dict()
+
+    regressions = compare_to_baseline(_report(pass_seconds=0.2, stages={"normalize": 20.0, "binary_choice": 5.0}), baseline)
+
+    assert any(regression.startswith("Throughput") for regression in regressions)
+    assert any("Stage normalize" in regression for regression in regressions)
+    assert not any("binary_choice" in regression for regression in regressions)
+
+
+def test_slower_machine_is_calibrated_away() -> None:
+    baseline = _report().to_dict()
+
+    report = _report(pass_seconds=0.2, calibration_seconds=0.04, stages={"normalize": 20.0, "binary_choice": 10.0})
+
+    assert compare_to_baseline(report, baseline) == []
+
+
+def test_tiny_stage_noise_is_ignored() -> None:
+    baseline = _report(stages={"true_false": 0.5}).to_dict()
+
+    assert compare_to_baseline(_report(stages={"true_false": 1.5}), baseline) == []
+
+
+def test_accuracy_drop_regresses() -> None:
+    baseline = _report().to_dict()
+
+    regressions = compare_to_baseline(_report(accuracy={"binary_choice": {"precision": None, "recall": 0.0, "support": 2}}), baseline)
+
+    assert regressions == ["Precision for binary_choice dropped from 1.00 to None", "Recall for binary_choice dropped from 0.50 to 0.00"]
+
+
+def test_corpus_version_mismatch_regresses() -> None:
+    regressions = compare_to_baseline(_report(corpus_version="2"), _report().to_dict())
+
+    assert len(regressions) == 1
+    assert "record a new baseline" in regressions[0]
+
+
+def test_load_corpus(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    records = [{"corpus_version": "7"}, {"name": "yn", "category": "shell", "expected": "binary_choice", "content": "Go? (y/n)"}, {"name": "idle", "expected": None, "content": "$ "}]
+    corpus.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    version, frames = load_corpus(corpus)
+
+    assert version == "7"
+    assert [(frame.name, frame.expected) for frame in frames] == [("yn", "binary_choice"), ("idle", "none")]
+
+
+@pytest.mark.parametrize("records", [[{"name": "no header", "content": ""}], [{"corpus_version": "1"}, {"expected": "maybe", "content": ""}]])
+def test_load_corpus_rejects_malformed_files(tmp_path: Path, records: list[dict[str, object]]) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="corpus"):
+        load_corpus(corpus)
+
+
+def test_run_benchmark_scores_the_shipped_corpus() -> None:
+    version, frames = load_corpus(CORPUS)
+
+    report = run_benchmark(frames, corpus_version=version, passes=1)
+
+    assert report.frames == len(frames)
+    assert report.frames_per_second > 0
+    assert {"normalize", "prescreen", "numbered_selection", "confirmation"} <= set(report.stages)
+    assert {frame.category for frame in frames} >= {"prompt", "idle", "scrollback", "ansi"}
+    assert report.accuracy["numbered_selection"]["recall"] == 1.0
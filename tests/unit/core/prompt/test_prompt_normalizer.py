@@ -0,0 +1,60 @@
+# Copyright notice.
+
+import random
+
+from libs.core.prompt_detector import ClaudePromptDetector, PromptType
+from libs.core.prompt_normalizer import PromptNormalizer
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for incremental normalisation of pane captures."""
+
+
+LINES = ["", " ", "  \t ", "a   b", "\x1b[31mred\x1b[0m", "\x1b[0m", "done\r", "❯ 1. Yes", "\x0c", "Continue?"]
+
+
+def test_normalize_matches_clean_content() -> None:
+    normalizer = PromptNormalizer(region_lines=0)
+    rng = random.Random(7)
+    for _ in range(2000):
+        content = "\n".join(rng.choices(LINES, k=rng.randint(0, 12)))
+        cleaned = ClaudePromptDetector._clean_content(content)
+
+        assert normalizer.normalize(content) == cleaned
+        for region_lines in (1, 2, 5):
+            expected = "\n".join(cleaned.split("\n")[-region_lines:]) if cleaned else ""
+            assert normalizer.prompt_region(content, region_lines) == expected
+
+
+def test_only_new_lines_are_cleaned() -> None:
+    normalizer = PromptNormalizer(region_lines=0)
+    frame = "\n".join(f"line {index}" for index in range(50))
+
+    normalizer.normalize(frame)
+    normalizer.normalize(frame + "\nnew line")
+
+    stats = normalizer.get_stats()
+    assert stats["lines_seen"] == 101
+    assert stats["lines_cleaned"] == 51
+    assert stats["hit_rate"] > 0.49
+
+
+def test_cache_is_bounded() -> None:
+    normalizer = PromptNormalizer(region_lines=0, max_cached_lines=10)
+
+    normalizer.normalize("\n".join(f"line {index}" for index in range(50)))
+
+    assert normalizer.get_stats()["cached_lines"] == 10
+
+
+def test_detection_only_sees_prompt_region() -> None:
+    detector = ClaudePromptDetector()
+    detector.normalizer.region_lines = 5
+    scrollback = "Do you want to continue? (y/n)\n" + "\n".join(f"output {index}" for index in range(10))
+
+    assert detector.detect_prompt(scrollback) is None
+
+    prompt_info = detector.detect_prompt(scrollback + "\nDo you want to proceed?\n❯ 1. Yes\n  2. No")
+    assert prompt_info is not None
+    assert prompt_info.type == PromptType.NUMBERED_SELECTION
+    assert prompt_info.question == "Do you want to proceed?"
@@ -0,0 +1,144 @@
+# Copyright notice.
+
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from libs.core.detection_cache import DetectionCache
+from libs.core.prompt_detector import ClaudePromptDetector, PromptType
+from libs.core.prompt_patterns import PromptPatternRegistry, load_pattern_pack
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for loadable prompt pattern packs."""
+
+
+# The patterns the detector had hard-coded before they moved to the default pack
+LEGACY_PATTERNS = {
+    "numbered_selection": [(r"❯?\s*(\d+)\.\s+(.+)", re.MULTILINE), (r"\[(\d+)\]\s+(.+)", re.MULTILINE), (r"(\d+)\)\s+(.+)", re.MULTILINE)],
+    "binary_choice": [(r"\(y/n\)", re.IGNORECASE), (r"\(yes/no\)", re.IGNORECASE), (r"\[Y/n\]", 0), (r"\[y/N\]", 0), (r"\[1/2\]", 0)],
+    "true_false": [(r"\(true/false\)", re.IGNORECASE), (r"\[true/false\]", re.IGNORECASE), (r"true\s+or\s+false", re.IGNORECASE)],
+    "terminal_settings": [(r"terminal\s+settings?", re.IGNORECASE), (r"configure\s+terminal", re.IGNORECASE), (r"terminal\s+preferences", re.IGNORECASE)],
+    "login_redirect": [(r"login\s+required", re.IGNORECASE), (r"authenticate", re.IGNORECASE), (r"sign\s+in", re.IGNORECASE), (r"redirect.*login", re.IGNORECASE)],
+    "text_input": [(r"Enter\s+(.+?):", re.IGNORECASE), (r"Type\s+(.+?):", re.IGNORECASE), (r"Input\s+(.+?):", re.IGNORECASE), (r"Please\s+enter\s+(.+?):", re.IGNORECASE)],
+    "question": [
+        (r"Do you want to (.+?)\?", re.IGNORECASE),
+        (r"Would you like to (.+?)\?", re.IGNORECASE),
+        (r"Should (.+?)\?", re.IGNORECASE),
+        (r"Shall (.+?)\?", re.IGNORECASE),
+        (r"(.+?)\?$", re.MULTILINE),
+    ],
+}
+
+CUSTOM_PACK = """
+name: custom
+patterns:
+  - id: binary.ab
+    type: binary_choice
+    regex: '\\(a/b\\)'
+    priority: 100
+    anchors: ['(a/b)']
+    options: [["a", "Accept"], ["b", "Block"]]
+  - id: login.sign_in
+    enabled: false
+"""
+
+
+def _registry(pack_dir: Path) -> PromptPatternRegistry:
+    return PromptPatternRegistry(pack_dir=pack_dir, reload_interval=0.0)
+
+
+def _detector(registry: PromptPatternRegistry) -> ClaudePromptDetector:
+    return ClaudePromptDetector(cache=DetectionCache(), registry=registry)
+
+
+def test_default_pack_reproduces_legacy_patterns(tmp_path: Path) -> None:
+    patterns = _registry(tmp_path).patterns()
+
+    for pattern_type, legacy in LEGACY_PATTERNS.items():
+        assert [(pattern.regex.pattern, pattern.regex.flags & ~re.UNICODE) for pattern in patterns[pattern_type]] == legacy
+
+
+def test_user_pack_adds_replaces_and_disables_patterns(tmp_path: Path) -> None:
+    (tmp_path / "custom.yaml").write_text(CUSTOM_PACK, encoding="utf-8")
+    detector = _detector(_registry(tmp_path))
+
+    prompt_info = detector.detect_prompt("Keep the change? (a/b)")
+
+    assert prompt_info is not None
+    assert prompt_info.type == PromptType.BINARY_CHOICE
+    assert prompt_info.options == [("a", "Accept"), ("b", "Block")]
+    assert detector.binary_patterns[0].id == "binary.ab"
+    assert "login.sign_in" not in [pattern.id for pattern in detector.login_patterns]
+    assert detector.registry.packs == ["default", "custom"]
+
+
+def test_invalid_user_pack_is_skipped(tmp_path: Path) -> None:
+    (tmp_path / "broken.yaml").write_text("patterns:\n  - id: bad\n    type: nonsense\n    regex: x\n", encoding="utf-8")
+
+    registry = _registry(tmp_path)
+
+    assert registry.packs == ["default"]
+    assert "unknown type" in registry.errors[str(tmp_path / "broken.yaml")]
+
+
+def test_numbered_patterns_need_two_groups(tmp_path: Path) -> None:
+    pack = tmp_path / "pack.yaml"
+    pack.write_text("patterns:\n  - id: numbered.one\n    type: numbered_selection\n    regex: '(\\d+)\\.'\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="two groups"):
+        load_pattern_pack(pack)
+
+
+def test_edited_pack_is_hot_reloaded(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    detector = _detector(registry)
+    assert detector.detect_prompt("Keep the change? (a/b)") is None
+
+    pack = tmp_path / "custom.yaml"
+    pack.write_text(CUSTOM_PACK, encoding="utf-8")
+    os.utime(pack, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+
+    prompt_info = detector.detect_prompt("Keep the change? (a/b)")
+
+    assert registry.generation == 2
+    assert prompt_info is not None
+    assert prompt_info.type == PromptType.BINARY_CHOICE
+
+
+def test_unchanged_packs_are_not_reloaded(tmp_path: Path) -> None:
+    registry = PromptPatternRegistry(pack_dir=tmp_path, reload_interval=60.0)
+
+    assert not registry.maybe_reload(now=time.monotonic() + 120)
+    assert registry.generation == 1
+
+
+def test_patterns_count_evaluations_hits_and_time(tmp_path: Path) -> None:
+    detector = _detector(_registry(tmp_path))
+
+    detector.detect_prompt("Do you want to continue? (y/n)")
+
+    stats = {pattern["id"]: pattern for pattern in detector.registry.get_stats()["patterns"]}
+    assert stats["binary.yn"]["evaluations"] == 1
+    assert stats["binary.yn"]["hits"] == 1
+    assert stats["binary.yn"]["total_ms"] > 0
+    # Types whose anchors are absent are never evaluated
+    assert stats["text_input.enter"]["evaluations"] == 0
+
+
+def test_user_pack_anchor_in_natural_case_still_matches(tmp_path: Path) -> None:
+    (tmp_path / "sso.yaml").write_text(
+        "name: sso\npatterns:\n  - id: login.sso\n    type: login_redirect\n    regex: 'Open SSO Portal'\n    priority: 100\n    anchors: ['Open SSO']\n",
+        encoding="utf-8",
+    )
+    detector = _detector(_registry(tmp_path))
+    content = "Open SSO Portal to continue"
+
+    prompt_info = detector.detect_prompt(content)
+
+    assert prompt_info is not None
+    assert prompt_info.type == PromptType.LOGIN_REDIRECT
+    assert prompt_info == detector._detect_sequential(detector._clean_content(content))
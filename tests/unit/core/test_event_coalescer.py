@@ -0,0 +1,83 @@
+# Copyright notice.
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.event_coalescer import CoalescedEvent, EventCoalescer
+from libs.core.executors import shutdown_executors
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for coalescing a monitor's activity and status events."""
+
+
+def test_latest_message_wins_within_window() -> None:
+    coalescer = EventCoalescer(window=1.0, pressure_window=10.0, pressure_threshold=0.5)
+
+    first = coalescer.offer("activity", "a", now=0.0)
+    held = [coalescer.offer("activity", message, now=0.1 * i) for i, message in enumerate("bcd", start=1)]
+
+    assert first == CoalescedEvent("activity", "a")
+    assert held == [None, None, None]
+    assert coalescer.flush(now=0.5) == []
+    assert coalescer.flush(now=1.0) == [CoalescedEvent("activity", "d", suppressed=2)]
+    assert coalescer.get_stats()["suppressed"] == 2
+
+
+def test_keys_are_coalesced_independently() -> None:
+    coalescer = EventCoalescer(window=1.0, pressure_window=10.0, pressure_threshold=0.5)
+
+    assert coalescer.offer("activity", "working", now=0.0) is not None
+    assert coalescer.offer("status:error", "boom", now=0.1) is not None
+    assert coalescer.offer("status:error", "boom again", now=0.2) is None
+    assert coalescer.flush(now=0.3, force=True) == [CoalescedEvent("status:error", "boom again")]
+
+
+def test_pressure_widens_window_and_marks_summaries() -> None:
+    coalescer = EventCoalescer(window=1.0, pressure_window=10.0, pressure_threshold=0.5)
+
+    coalescer.offer("activity", "a", now=0.0)
+    for i in range(5):
+        assert coalescer.offer("activity", f"update {i}", load=0.8, now=2.0 + i) is None
+
+    assert coalescer.flush(load=0.8, now=9.0) == []
+    assert coalescer.flush(load=0.8, now=10.0) == [CoalescedEvent("activity", "update 4", suppressed=4, summary=True)]
+
+
+def test_monitor_coalesces_waiting_activity() -> None:
+    event_bus = MagicMock()
+    event_bus.publish = AsyncMock(return_value=True)
+    event_bus.queue_load = 0.0
+    monitor = AsyncClaudeMonitor(SimpleNamespace(session_name="coalesce"), MagicMock(), MagicMock(), event_bus=event_bus)
+
+    async def flood() -> None:
+        for _ in range(20):
+            await monitor._publish_activity_event("⏳ Waiting for user input...", coalesce_key="waiting")
+        await monitor._flush_coalesced_events(force=True)
+
+    try:
+        asyncio.run(flood())
+    finally:
+        shutdown_executors()
+
+    published = [call.args[0].data for call in event_bus.publish.await_args_list]
+    assert len(published) == 2
+    assert published[-1]["suppressed"] == 18
+    assert monitor.status_manager.update_activity.call_count == 2
+
+
+def test_one_shot_activity_is_not_replaced_by_repeating_states(async_monitor: AsyncClaudeMonitor) -> None:
+    async def tick() -> None:
+        await async_monitor._publish_activity_event("📝 Content updated", coalesce_key="content")
+        await async_monitor._publish_activity_event("✅ Legacy auto-responded: 'y' to yes_no")
+        await async_monitor._publish_activity_event("⏳ Waiting for user input...", coalesce_key="waiting")
+        await async_monitor._publish_activity_event("📝 Content updated", coalesce_key="content")
+        await async_monitor._flush_coalesced_events(force=True)
+
+    asyncio.run(tick())
+
+    messages = [call.args[0] for call in async_monitor.status_manager.update_activity.call_args_list]
+    assert messages == ["📝 Content updated", "✅ Legacy auto-responded: 'y' to yes_no", "⏳ Waiting for user input...", "📝 Content updated"]
+    assert async_monitor._event_coalescer.get_stats()["suppressed"] == 0
@@ -0,0 +1,76 @@
+# Copyright notice.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from libs.core.executors import BoundedExecutor, get_executor, get_executor_stats, shutdown_executors
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the named blocking-work executors."""
+
+
+def test_queue_depth_and_wait_time_are_reported() -> None:
+    executor = BoundedExecutor("test", max_workers=1)
+    release = threading.Event()
+    try:
+        blocker = executor.submit(release.wait, 5)
+        queued = [executor.submit(time.sleep, 0) for _ in range(3)]
+        time.sleep(0.1)
+
+        stats = executor.get_stats()
+        assert stats["active"] == 1
+        assert stats["queue_depth"] == 3
+        assert stats["saturated"]
+
+        release.set()
+        blocker.result(5)
+        for future in queued:
+            future.result(5)
+
+        stats = executor.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] >= 3
+        assert stats["completed"] == 4
+        assert stats["max_wait_ms"] >= 100
+        assert not stats["saturated"]
+    finally:
+        executor.shutdown()
+
+
+def test_cancelled_work_leaves_the_queue() -> None:
+    executor = BoundedExecutor("test", max_workers=1)
+    release = threading.Event()
+    try:
+        executor.submit(release.wait, 5)
+        pending = executor.submit(time.sleep, 0)
+        assert pending.cancel()
+        assert executor.get_stats()["queue_depth"] == 0
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_run_awaits_the_result_on_a_named_thread() -> None:
+    executor = BoundedExecutor("detect", max_workers=2)
+    try:
+        name = asyncio.run(executor.run(lambda: threading.current_thread().name))
+        assert name.startswith("yesman-detect")
+    finally:
+        executor.shutdown()
+
+
+def test_named_executors_are_shared_and_sized_from_settings() -> None:
+    try:
+        executor = get_executor("tmux_io")
+        assert get_executor("tmux_io") is executor
+        assert executor.max_workers >= 1
+        assert "tmux_io" in get_executor_stats()
+        with pytest.raises(ValueError, match="Unknown executor"):
+            get_executor("nope")
+    finally:
+        shutdown_executors()
+    assert get_executor_stats() == {}
@@ -0,0 +1,98 @@
+# Copyright notice.
+
+import time
+
+import pytest
+
+from libs.core.instrumentation import NULL_SPAN, LatencyHistogram, SpanRecorder
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for span instrumentation."""
+
+
+def test_spans_record_monotonic_timings_without_probes() -> None:
+    recorder = SpanRecorder(enabled=True, probe_sample_rate=0.0)
+
+    for _ in range(3):
+        with recorder.span("capture"):
+            time.sleep(0.01)
+
+    metrics = recorder.get_metrics()["capture"]
+    assert metrics["sample_count"] == 3
+    assert metrics["average_ms"] >= 10
+    assert metrics["peak_ms"] >= metrics["median_ms"]
+    assert metrics["memory_sample_count"] == 0
+    assert metrics["cpu_sample_count"] == 0
+    assert recorder.get_stats()["probed_spans"] == 0
+
+
+def test_failures_are_counted() -> None:
+    recorder = SpanRecorder(enabled=True, probe_sample_rate=0.0)
+
+    with recorder.span("status") as span:
+        span.fail()
+    with pytest.raises(RuntimeError), recorder.span("status"):
+        raise RuntimeError
+    with recorder.span("status"):
+        pass
+
+    metrics = recorder.get_metrics()["status"]
+    assert metrics["error_count"] == 2
+    assert metrics["error_rate"] == pytest.approx(2 / 3)
+
+
+def test_error_rate_covers_the_sample_window() -> None:
+    recorder = SpanRecorder(enabled=True, probe_sample_rate=0.0, window=4)
+
+    for _ in range(10):
+        with recorder.span("capture") as span:
+            span.fail()
+    for _ in range(3):
+        with recorder.span("capture"):
+            pass
+
+    metrics = recorder.get_metrics()["capture"]
+    assert metrics["error_count"] == 10
+    assert metrics["sample_count"] == 4
+    assert metrics["error_rate"] == pytest.approx(1 / 4)
+
+
+def test_sampled_spans_probe_memory_and_cpu() -> None:
+    recorder = SpanRecorder(enabled=True, probe_sample_rate=1.0)
+
+    with recorder.span("detect"):
+        sum(range(100_000))
+
+    metrics = recorder.get_metrics()["detect"]
+    assert metrics["memory_sample_count"] == 1
+    assert metrics["cpu_sample_count"] == 1
+    assert recorder.get_stats()["probed_spans"] == 1
+
+
+def test_disabled_recorder_is_a_no_op() -> None:
+    recorder = SpanRecorder(enabled=False, probe_sample_rate=1.0)
+
+    with recorder.span("capture") as span:
+        span.fail()
+
+    assert recorder.span("capture") is NULL_SPAN
+    assert recorder.get_metrics() == {}
+    assert recorder.get_metrics(["capture"])["capture"]["sample_count"] == 0
+    assert recorder.get_stats()["spans"] == 0
+
+
+def test_latency_histogram_windows_and_buckets() -> None:
+    histogram = LatencyHistogram(windows=(60.0, 600.0))
+
+    histogram.record(5000.0, now=0.0)
+    for latency_ms in (100.0, 200.0, 300.0):
+        histogram.record(latency_ms, now=500.0)
+
+    snapshot = histogram.snapshot(now=520.0)
+    assert snapshot["count"] == 4
+    assert snapshot["buckets"]["<=100ms"] == 1
+    assert snapshot["buckets"]["<=250ms"] == 1
+    assert snapshot["buckets"]["<=5000ms"] == 1
+    assert snapshot["windows"]["60s"] == {"count": 3, "p50_ms": 200.0, "p95_ms": 300.0, "p99_ms": 300.0, "max_ms": 300.0}
+    assert snapshot["windows"]["600s"]["max_ms"] == 5000.0
@@ -0,0 +1,75 @@
+# Copyright notice.
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.pane_buffer import PaneContentView, PaneState
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the per-tick fast paths: unchanged frames and fused status checks."""
+
+
+def test_unchanged_frames_skip_detection_and_analysis(async_monitor: AsyncClaudeMonitor) -> None:
+    async def feed(*frames: str) -> None:
+        for frame in frames:
+            await async_monitor._process_content_async(frame)
+
+    asyncio.run(feed("working", "working", "working", "done"))
+
+    assert async_monitor.prompt_detector.detect_prompt.call_count == 2
+    assert async_monitor.prompt_detector.is_waiting_for_input.call_count == 2
+    assert async_monitor.adaptive_response.update_patterns.await_count == 2
+    assert async_monitor._analyze_automation_context.await_count == 2
+    assert (async_monitor._frames_processed, async_monitor._frames_skipped) == (4, 2)
+
+
+def test_unchanged_frame_reuses_last_prompt(async_monitor: AsyncClaudeMonitor) -> None:
+    prompt = SimpleNamespace(type=SimpleNamespace(value="yes_no"), question="Continue?", options=[], confidence=0.9)
+    async_monitor.prompt_detector.detect_prompt.return_value = prompt
+    async_monitor._handle_prompt_async = AsyncMock()
+
+    async def feed() -> None:
+        await async_monitor._process_content_async("Continue? (y/n)")
+        await async_monitor._process_content_async("Continue? (y/n)")
+
+    asyncio.run(feed())
+
+    async_monitor.prompt_detector.detect_prompt.assert_called_once()
+    assert [call.args[0] for call in async_monitor._handle_prompt_async.await_args_list] == [prompt, prompt]
+    assert async_monitor.waiting_for_input
+
+
+def test_status_check_uses_pane_state_from_capture(async_monitor: AsyncClaudeMonitor) -> None:
+    running = PaneContentView(tail=["> "], pane=PaneState(current_command="claude", pid=1, dead=False, activity=0))
+    exited = PaneContentView(tail=["$ "], pane=PaneState(current_command="claude", pid=1, dead=True, activity=0))
+
+    async def check() -> list[bool]:
+        return [await async_monitor._check_claude_status_async(running), await async_monitor._check_claude_status_async(exited)]
+
+    assert asyncio.run(check()) == [True, False]
+
+    async_monitor.process_controller.is_claude_running.assert_not_called()
+    assert (async_monitor._fused_status_checks, async_monitor._separate_status_checks) == (2, 0)
+
+
+def test_stream_without_pane_pipe_falls_back_to_polling(async_monitor: AsyncClaudeMonitor) -> None:
+    stream = MagicMock()
+    stream.stop = AsyncMock()
+    async_monitor._output_stream = stream
+    piped = PaneContentView(tail=["> "], pane=PaneState(current_command="claude", pid=1, dead=False, activity=0, piped=True))
+    unpiped = PaneContentView(tail=["> "], pane=PaneState(current_command="claude", pid=1, dead=False, activity=0, piped=False))
+
+    async def check() -> None:
+        await async_monitor._check_output_stream(piped)
+        assert async_monitor._output_stream is stream
+        await async_monitor._check_output_stream(unpiped)
+
+    asyncio.run(check())
+
+    # The pipe is gone, so one attached to the pane since must not be closed
+    stream.release_pipe.assert_called_once_with()
+    stream.stop.assert_awaited_once()
+    assert async_monitor._output_stream is None
@@ -0,0 +1,96 @@
+# Copyright notice.
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.executors import shutdown_executors
+from libs.core.monitor_replay import MonitorReplay, ReplayFrame, load_frames
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for replaying recorded pane frames through the monitor."""
+
+
+def _run(replay: MonitorReplay) -> object:
+    try:
+        return asyncio.run(replay.run())
+    finally:
+        shutdown_executors()
+
+
+def test_load_jsonl_trace(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        "\n".join(json.dumps(record) for record in [{"content": "a", "timestamp": 100.0}, {"content": "b", "timestamp": 100.5}, {"content": "c"}]),
+        encoding="utf-8",
+    )
+
+    frames = load_frames(trace)
+
+    assert [frame.content for frame in frames] == ["a", "b", "c"]
+    assert frames[0].offset == 0.0
+    assert frames[1].offset == 0.5
+    assert frames[2].offset > frames[1].offset
+
+
+def test_load_collector_directory(tmp_path: Path) -> None:
+    for name, timestamp, content in [("interaction_2", "2024-01-01T00:00:02+00:00", "second"), ("raw_1", "2024-01-01T00:00:00+00:00", "first")]:
+        (tmp_path / f"{name}.json").write_text(json.dumps({"timestamp": timestamp, "content": content}), encoding="utf-8")
+    (tmp_path / "unrelated.json").write_text("{}", encoding="utf-8")
+
+    frames = load_frames(tmp_path)
+
+    assert frames == [ReplayFrame("first", 0.0), ReplayFrame("second", 2.0)]
+
+
+def test_replay_reports_throughput_and_responses() -> None:
+    prompt = "Do you want to proceed?\n❯ 1. Yes\n  2. No"
+    frames = [ReplayFrame("Working on it..."), ReplayFrame("Working on it..."), ReplayFrame(prompt), ReplayFrame("Done")]
+
+    report = _run(MonitorReplay(frames))
+
+    assert report.frames == 4
+    assert report.skipped_frames == 1
+    assert report.responses == ["1"]
+    assert report.frames_per_second > 0
+    assert report.frame_latency_ms["p50_ms"] <= report.frame_latency_ms["max_ms"]
+    assert report.components["prompt_detection"]["sample_count"] == 3
+    assert report.components["content_capture"]["sample_count"] == 4
+
+
+def test_replay_paces_frames_by_speed() -> None:
+    frames = [ReplayFrame("one", 0.0), ReplayFrame("two", 0.2)]
+
+    started = time.perf_counter()
+    report = _run(MonitorReplay(frames, speed=2.0, auto_respond=False))
+
+    assert time.perf_counter() - started >= 0.1
+    assert report.elapsed_seconds >= 0.1
+    assert report.responses == []
+
+
+def test_replay_ignores_and_never_writes_the_users_learning_data(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    replay = MonitorReplay([ReplayFrame(f"Do you want to proceed? {index}\n❯ 1. Yes\n  2. No") for index in range(12)])
+    monitors: list[AsyncClaudeMonitor] = []
+    build_monitor = replay._build_monitor
+
+    def recording_build_monitor(*args: object) -> AsyncClaudeMonitor:
+        monitors.append(build_monitor(*args))  # type: ignore[arg-type]
+        return monitors[-1]
+
+    monkeypatch.setattr(replay, "_build_monitor", recording_build_monitor)
+
+    report = _run(replay)
+
+    assert report.responses == ["1"] * 12
+    analyzer = monitors[0].adaptive_response.analyzer
+    assert not monitors[0].adaptive_response.config.learning_enabled
+    assert analyzer.response_history == []
+    assert not analyzer.data_dir.exists()
+    assert not (tmp_path / ".scripton" / "yesman" / "ai_data").exists()
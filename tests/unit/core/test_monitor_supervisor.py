@@ -0,0 +1,213 @@
+# Copyright notice.
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from libs.core import claude_monitor_async
+from libs.core.async_event_bus import AsyncEventBus, Event, EventType
+from libs.core.claude_manager import _RESPONSE_SETTINGS, _SHARED_COMPONENTS, DashboardController
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.executors import shutdown_executors
+from libs.core.monitor_supervisor import MonitorSupervisor
+from libs.core.poll_scheduler import AdaptivePollScheduler
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the shared-loop monitor supervisor."""
+
+
+class _FakeMonitor:
+    def __init__(self) -> None:
+        self.is_running = False
+        self._loop_count = 0
+        self._poll_scheduler = AdaptivePollScheduler()
+        self.loop_threads: set[str] = set()
+        self.executor_threads: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    def get_loop_stats(self) -> dict[str, object]:
+        return {"loop_count": self._loop_count, "poll_interval": self._poll_scheduler.current_interval}
+
+    async def start_monitoring_async(self) -> bool:
+        self.is_running = True
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def stop_monitoring_async(self) -> bool:
+        self.is_running = False
+        if self._task is not None:
+            self._task.cancel()
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self.is_running:
+            self.loop_threads.add(threading.current_thread().name)
+            name = await loop.run_in_executor(None, lambda: (time.sleep(0.01), threading.current_thread().name)[1])
+            self.executor_threads.add(name)
+            self._loop_count += 1
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = MonitorSupervisor(max_workers=2)
+    yield supervisor
+    supervisor.shutdown()
+
+
+def test_monitors_share_one_loop_and_a_bounded_executor(supervisor: MonitorSupervisor) -> None:
+    threads_before = threading.active_count()
+    monitors = {f"s{i}": _FakeMonitor() for i in range(12)}
+    for name, monitor in monitors.items():
+        assert supervisor.start(name, monitor)
+
+    time.sleep(0.3)
+
+    assert threading.active_count() - threads_before <= 3
+    assert set().union(*(monitor.loop_threads for monitor in monitors.values())) == {"yesman-monitor-supervisor"}
+    executor_threads = set().union(*(monitor.executor_threads for monitor in monitors.values()))
+    assert 0 < len(executor_threads) <= 2
+    assert all(name.startswith("yesman-monitor_") for name in executor_threads)
+
+
+def test_start_stop_and_list(supervisor: MonitorSupervisor) -> None:
+    first = _FakeMonitor()
+    assert supervisor.start("alpha", first)
+    assert supervisor.start("beta", _FakeMonitor())
+
+    # A second monitor is refused while the first one runs
+    assert not supervisor.start("alpha", _FakeMonitor())
+    assert supervisor.get("alpha") is first
+
+    listed = supervisor.list_monitors()
+    assert [entry["session_name"] for entry in listed] == ["alpha", "beta"]
+    assert all(entry["running"] for entry in listed)
+    assert all(entry["poll_interval"] > 0 for entry in listed)
+
+    assert supervisor.stop("alpha")
+    assert not first.is_running
+    assert not supervisor.stop("alpha")
+    assert [entry["session_name"] for entry in supervisor.list_monitors()] == ["beta"]
+    assert supervisor.get_stats()["running_monitors"] == 1
+
+
+def test_stopped_monitor_can_be_replaced(supervisor: MonitorSupervisor) -> None:
+    first = _FakeMonitor()
+    supervisor.start("alpha", first)
+    first.is_running = False  # e.g. the monitor loop exited on its own
+
+    second = _FakeMonitor()
+    assert supervisor.start("alpha", second)
+    assert supervisor.get("alpha") is second
+
+
+def test_shutdown_stops_monitors_and_the_loop() -> None:
+    supervisor = MonitorSupervisor(max_workers=1)
+    monitor = _FakeMonitor()
+    supervisor.start("alpha", monitor)
+    assert supervisor.is_active
+
+    supervisor.shutdown()
+
+    assert not monitor.is_running
+    assert not supervisor.is_active
+    assert supervisor.list_monitors() == []
+
+
+@pytest.fixture
+def foreign_bus() -> Iterator[tuple[AsyncEventBus, asyncio.AbstractEventLoop]]:
+    """An event bus running on its own loop thread, like the API's bus on the uvicorn loop."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    bus = AsyncEventBus(worker_count=1)
+    asyncio.run_coroutine_threadsafe(bus.start(), loop).result(5)
+    yield bus, loop
+    asyncio.run_coroutine_threadsafe(bus.stop(timeout=2), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+    shutdown_executors()
+
+
+def test_events_published_from_the_supervisor_loop_are_handled_on_the_bus_loop(
+    supervisor: MonitorSupervisor, foreign_bus: tuple[AsyncEventBus, asyncio.AbstractEventLoop]
+) -> None:
+    bus, bus_loop = foreign_bus
+    handled_on: list[asyncio.AbstractEventLoop] = []
+    handled = threading.Event()
+
+    async def handler(event: Event) -> None:
+        handled_on.append(asyncio.get_running_loop())
+        handled.set()
+
+    bus.subscribe(EventType.CUSTOM, handler)
+
+    assert supervisor._call(bus.publish(Event(type=EventType.CUSTOM, data={}, timestamp=time.time(), source="test")))
+    assert handled.wait(5)
+    assert handled_on == [bus_loop]
+
+
+def test_monitor_unsubscribes_from_the_bus_when_stopped(
+    supervisor: MonitorSupervisor, foreign_bus: tuple[AsyncEventBus, asyncio.AbstractEventLoop]
+) -> None:
+    bus, _ = foreign_bus
+    subscribers = bus.get_subscriber_count(EventType.SYSTEM_SHUTDOWN)
+    monitor = AsyncClaudeMonitor(MagicMock(session_name="cycle"), MagicMock(), MagicMock(), event_bus=bus)
+    assert bus.get_subscriber_count(EventType.SYSTEM_SHUTDOWN) == subscribers
+    assert monitor.get_loop_stats()["loop_count"] == 0
+
+    for _ in range(3):
+        assert supervisor.start("cycle", monitor)
+        assert bus.get_subscriber_count(EventType.SYSTEM_SHUTDOWN) == subscribers + 1
+        assert supervisor.stop("cycle")
+        assert bus.get_subscriber_count(EventType.SYSTEM_SHUTDOWN) == subscribers
+
+
+def test_bus_shutdown_stops_the_monitor_on_its_own_loop(
+    supervisor: MonitorSupervisor, foreign_bus: tuple[AsyncEventBus, asyncio.AbstractEventLoop]
+) -> None:
+    bus, bus_loop = foreign_bus
+    monitor = AsyncClaudeMonitor(MagicMock(session_name="shutdown"), MagicMock(), MagicMock(), event_bus=bus)
+    stopped_on: list[asyncio.AbstractEventLoop] = []
+    stop_monitoring_async = monitor.stop_monitoring_async
+
+    async def recording_stop() -> bool:
+        stopped_on.append(asyncio.get_running_loop())
+        return await stop_monitoring_async()
+
+    monitor.stop_monitoring_async = recording_stop  # type: ignore[method-assign]
+    assert supervisor.start("shutdown", monitor)
+
+    asyncio.run_coroutine_threadsafe(bus.stop(timeout=2), bus_loop).result(10)
+
+    assert not monitor.is_running
+    assert stopped_on == [supervisor._loop]
+
+
+def test_supervised_monitor_is_built_with_the_controllers_components() -> None:
+    controller = DashboardController.__new__(DashboardController)
+    controller.session_manager = SimpleNamespace(session_name="shared")
+    controller.process_controller = MagicMock()
+    controller.status_manager = MagicMock()
+    controller.monitor = SimpleNamespace(**dict.fromkeys(_RESPONSE_SETTINGS, "Auto"), **{name: MagicMock() for name in _SHARED_COMPONENTS})
+    controller._supervised_monitor = None
+
+    # Building throwaway components would add a second log handler and reload learning data
+    with (
+        patch.object(claude_monitor_async, "ClaudeContentCollector") as content_collector,
+        patch.object(claude_monitor_async, "AdaptiveResponse") as adaptive_response,
+    ):
+        monitor = controller._get_supervised_monitor()
+
+    content_collector.assert_not_called()
+    adaptive_response.assert_not_called()
+    assert all(getattr(monitor, name) is getattr(controller.monitor, name) for name in _SHARED_COMPONENTS)
+    assert controller._get_supervised_monitor() is monitor
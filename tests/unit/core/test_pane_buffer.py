@@ -0,0 +1,174 @@
+# Copyright notice.
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from libs.core import pane_buffer
+from libs.core.pane_buffer import PaneBuffer, PaneContentView, PaneState, content_fingerprint
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for incremental pane capture."""
+
+
+class _FakePane:
+    """Scrolling terminal that answers the tmux commands used by PaneBuffer."""
+
+    pane_id = None  # forces the libtmux fallback path
+
+    def __init__(self, height: int = 4) -> None:
+        self.height = height
+        self.history: list[str] = []
+        self.screen: list[str] = []
+        self.activity = 0
+        self.captured_lines = 0
+        self.command = "claude"
+        self.dead = False
+        self.piped = False
+
+    def write(self, *lines: str) -> None:
+        for line in lines:
+            self.screen.append(line)
+            if len(self.screen) > self.height:
+                self.history.append(self.screen.pop(0))
+        self.activity = int(time.time())
+
+    def cmd(self, command: str, *args: str) -> SimpleNamespace:
+        if command == "display-message":
+            cursor_y = max(0, len(self.screen) - 1)
+            return SimpleNamespace(stdout=[f"{len(self.history)} {cursor_y} {self.height} 80 {self.activity} 4242 {int(self.dead)} {int(self.piped)} {self.command}"])
+        start = int(args[args.index("-S") + 1])
+        lines = self.history[len(self.history) + start :] if start < 0 else []
+        lines = lines + self.screen
+        self.captured_lines += len(lines)
+        return SimpleNamespace(stdout=lines)
+
+
+class TestPaneBuffer:
+    def test_idle_pane_skips_capture(self) -> None:
+        pane = _FakePane()
+        pane.write("$ claude")
+        pane.activity = 0
+        buffer = PaneBuffer("%1")
+
+        first = buffer.read(pane)
+        # The read after a change still fetches the tail speculatively
+        second = buffer.read(pane)
+        captured = pane.captured_lines
+        third = buffer.read(pane)
+
+        assert first.changed
+        assert not second.changed
+        assert not third.changed
+        assert third.tail == ["$ claude"]
+        assert pane.captured_lines == captured
+        assert buffer.get_stats()["skipped_reads"] == 2
+        assert buffer.get_stats()["wasted_captures"] == 1
+
+    def test_only_new_lines_are_reported(self) -> None:
+        pane = _FakePane(height=3)
+        pane.write("a", "b")
+        buffer = PaneBuffer("%1")
+        buffer.read(pane, tail_lines=10)
+
+        pane.write("c", "d", "e")
+        view = buffer.read(pane, tail_lines=10)
+
+        assert view.changed
+        assert view.new_lines == ["c", "d", "e"]
+        assert view.tail == ["a", "b", "c", "d", "e"]
+
+    def test_active_pane_is_read_in_one_batch(self) -> None:
+        pane = _FakePane(height=3)
+        pane.write("a", "b")
+        buffer = PaneBuffer("%1")
+        buffer.read(pane, tail_lines=10)
+        pane.write("c", "d", "e")
+
+        batches: list[int] = []
+
+        def run_pane_commands(pane: _FakePane, commands: list[tuple[str, ...]]) -> list[SimpleNamespace]:
+            batches.append(len(commands))
+            return [pane.cmd(*command) for command in commands]
+
+        with (
+            patch.object(pane_buffer, "run_pane_commands", run_pane_commands),
+            patch.object(pane_buffer, "run_pane_command", side_effect=AssertionError("second round-trip")),
+        ):
+            view = buffer.read(pane, tail_lines=10)
+
+        assert batches == [2]
+        assert view.new_lines == ["c", "d", "e"]
+        assert view.tail == ["a", "b", "c", "d", "e"]
+
+    @pytest.mark.parametrize("tail_lines", [2, 10])
+    def test_speculative_capture_matches_separate_capture(self, tail_lines: int) -> None:
+        views = []
+        for speculate in (True, False):
+            pane = _FakePane(height=3)
+            buffer = PaneBuffer("%1")
+            pane.write("a", "b")
+            buffer.read(pane, tail_lines=tail_lines)
+            pane.write(*"cdefg")
+            buffer._last_changed = speculate
+            views.append(buffer.read(pane, tail_lines=tail_lines))
+
+        assert views[0] == views[1]
+
+    def test_buffer_is_bounded(self) -> None:
+        pane = _FakePane(height=2)
+        buffer = PaneBuffer("%1", max_lines=5)
+        buffer.read(pane)
+
+        pane.write(*[str(i) for i in range(4)])
+        buffer.read(pane)
+        pane.write(*[str(i) for i in range(4, 8)])
+        view = buffer.read(pane, tail_lines=3)
+
+        assert buffer.get_stats()["buffered_lines"] == 5
+        assert view.tail == ["3", "4", "5", "6", "7"]
+
+    def test_probe_reports_pane_state(self) -> None:
+        pane = _FakePane()
+        pane.write("$ claude")
+        buffer = PaneBuffer("%1")
+
+        running = buffer.read(pane).pane
+        pane.command = "zsh"
+        pane.dead = True
+        pane.piped = True
+        exited = buffer.read(pane).pane
+
+        assert running == PaneState(current_command="claude", pid=4242, dead=False, activity=pane.activity, piped=False)
+        assert running.runs("Claude")
+        assert exited is not None
+        assert not exited.runs("claude")
+        assert exited.piped
+
+    def test_short_probe_has_no_pane_state(self) -> None:
+        pane = _FakePane()
+        pane.write("$ claude")
+        pane.cmd = lambda command, *args: SimpleNamespace(stdout=["0 0 4 80 0"] if command == "display-message" else ["$ claude"])
+
+        view = PaneBuffer("%1").read(pane)
+
+        assert view.tail == ["$ claude"]
+        assert view.pane is None
+
+
+def test_view_from_full_capture() -> None:
+    unchanged = PaneContentView.from_content("a\nb", "a\nb")
+    changed = PaneContentView.from_content("a\nb\nc", "a\nb")
+
+    assert not unchanged.changed
+    assert changed.new_lines == ["c"]
+    assert changed.content == "a\nb\nc"
+
+
+def test_content_fingerprint() -> None:
+    assert content_fingerprint("a\nb") == content_fingerprint("a\nb")
+    assert content_fingerprint("a\nb") != content_fingerprint("a\nc")
+    assert content_fingerprint("") != content_fingerprint("\n")
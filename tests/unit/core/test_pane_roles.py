@@ -0,0 +1,76 @@
+# Copyright notice.
+
+from dataclasses import replace
+from unittest.mock import patch
+
+from libs.core.pane_roles import PaneRole, PaneRoleIndex
+from libs.core.tmux_snapshot import PaneSnapshot, TmuxSnapshot
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the cached pane role index."""
+
+
+def _pane(pane_id: str, command: str, pid: int, session: str = "proj") -> PaneSnapshot:
+    return PaneSnapshot(
+        session_name=session,
+        window_index="0",
+        window_name="main",
+        pane_index=pane_id.lstrip("%"),
+        pane_id=pane_id,
+        pid=pid,
+        command=command,
+        dead=False,
+        active=False,
+        activity=0,
+        history_size=0,
+        cursor_y=0,
+        height=24,
+    )
+
+
+class TestPaneRoleIndex:
+    def test_roles_are_detected_from_command_then_content(self) -> None:
+        snapshot = TmuxSnapshot(panes=[_pane("%1", "zsh", 10), _pane("%2", "node", 20), _pane("%3", "yesman", 30)])
+        index = PaneRoleIndex()
+
+        with patch("libs.core.pane_roles.capture_panes", return_value={"%2": ["╭ Welcome to Claude Code"]}) as capture:
+            roles = index.resolve(snapshot)
+
+        capture.assert_called_once_with(None, ["%1", "%2"])
+        assert roles["%1"].role is PaneRole.SHELL
+        assert roles["%2"].role is PaneRole.CLAUDE
+        assert roles["%3"].role is PaneRole.CONTROLLER
+
+    def test_only_changed_panes_are_reprobed(self) -> None:
+        shell, claude = _pane("%1", "zsh", 10), _pane("%2", "claude", 20)
+        index = PaneRoleIndex()
+        with patch("libs.core.pane_roles.capture_panes", return_value={}):
+            index.resolve(TmuxSnapshot(panes=[shell, claude]))
+
+        # Claude was started in the shell pane: its command changed
+        restarted = TmuxSnapshot(panes=[replace(shell, command="claude"), claude])
+        with patch("libs.core.pane_roles.capture_panes") as capture:
+            roles = index.resolve(restarted)
+
+        capture.assert_not_called()
+        assert roles["%1"].role is PaneRole.CLAUDE
+        assert index.get_stats()["hits"] == 1
+        assert index.get_stats()["command_probes"] == 3
+
+    def test_find_returns_first_claude_pane_of_session(self) -> None:
+        snapshot = TmuxSnapshot(panes=[_pane("%1", "claude", 10, session="other"), _pane("%2", "zsh", 20), _pane("%3", "claude", 30)])
+        index = PaneRoleIndex()
+
+        with patch("libs.core.pane_roles.capture_panes", return_value={}):
+            entry = index.find(snapshot, "proj", PaneRole.CLAUDE)
+
+        assert entry is not None
+        assert entry.pane_id == "%3"
+
+    def test_panes_that_disappear_are_dropped(self) -> None:
+        index = PaneRoleIndex()
+        index.resolve(TmuxSnapshot(panes=[_pane("%1", "claude", 10)]))
+        index.resolve(TmuxSnapshot(panes=[_pane("%2", "claude", 20)]))
+
+        assert index.get_stats()["entries"] == 1
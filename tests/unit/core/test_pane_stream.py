@@ -0,0 +1,135 @@
+# Copyright notice.
+
+import os
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from libs.core import pane_stream
+from libs.core.executors import shutdown_executors
+from libs.core.pane_stream import PaneOutputStream
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for pipe-pane output streaming."""
+
+
+class _Pane:
+    pane_id = "%7"
+
+
+class _FakeTmux:
+    """Records pane commands and tracks whether the pane has a pipe."""
+
+    def __init__(self, piped: bool = False) -> None:
+        self.piped = piped
+        self.commands: list[tuple[str, ...]] = []
+
+    def __call__(self, pane: object, *args: str) -> SimpleNamespace:
+        self.commands.append(args)
+        if args[0] == "display-message":
+            return SimpleNamespace(stdout=["1" if self.piped else "0"])
+        if args[0] == "pipe-pane":
+            self.piped = len(args) > 1
+        return SimpleNamespace(stdout=[])
+
+    @property
+    def pipe_commands(self) -> list[tuple[str, ...]]:
+        return [command for command in self.commands if command[0] == "pipe-pane"]
+
+
+@pytest.fixture(autouse=True)
+def _executors() -> Iterator[None]:
+    yield
+    shutdown_executors()
+
+
+@pytest.fixture
+def tmux() -> Iterator[_FakeTmux]:
+    fake = _FakeTmux()
+    with patch.object(pane_stream, "run_pane_command", fake):
+        yield fake
+
+
+@pytest.mark.asyncio
+async def test_output_written_to_fifo_wakes_waiter(tmux: _FakeTmux) -> None:
+    stream = PaneOutputStream(_Pane(), debounce=0)
+    assert await stream.start()
+
+    command = tmux.pipe_commands[0]
+    assert command[:3] == ("pipe-pane", "-o", "-O")
+    assert stream._fifo_path is not None
+    assert stream._fifo_path in command[3]
+
+    assert not await stream.wait_for_output(0.05)
+
+    # Stand in for the `cat` that tmux would run
+    with open(stream._fifo_path, "wb", buffering=0) as fifo:
+        fifo.write(b"\x1b[1mDo you want to proceed?\x1b[0m\r\n")
+
+    assert await stream.wait_for_output(1.0)
+    assert stream.get_stats()["bytes_received"] > 0
+    assert stream.wakeups == 1
+
+    directory = stream._directory
+    await stream.stop()
+
+    assert tmux.pipe_commands[-1] == ("pipe-pane",)
+    assert not tmux.piped
+    assert not stream.is_active
+    assert directory is not None
+    assert not os.path.exists(directory)
+
+
+@pytest.mark.asyncio
+async def test_panes_without_tmux_id_are_not_streamed() -> None:
+    stream = PaneOutputStream(object())
+
+    assert not await stream.start()
+    assert not stream.is_active
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tmux")
+async def test_continuous_output_wakes_no_faster_than_min_interval() -> None:
+    stream = PaneOutputStream(_Pane(), debounce=0, min_interval=0.2)
+    assert await stream.start()
+
+    # A spinner keeps the pane busy between every wakeup
+    stream._on_data(1)
+    assert await stream.wait_for_output(1.0)
+    woke_at = time.monotonic()
+    stream._on_data(1)
+    assert await stream.wait_for_output(1.0)
+
+    assert time.monotonic() - woke_at >= 0.2
+    await stream.stop()
+
+
+@pytest.mark.asyncio
+async def test_pane_with_a_pipe_of_its_own_is_not_streamed(tmux: _FakeTmux) -> None:
+    tmux.piped = True
+    stream = PaneOutputStream(_Pane())
+
+    assert not await stream.start()
+    await stream.stop()
+
+    assert tmux.pipe_commands == []
+    assert tmux.piped
+
+
+@pytest.mark.asyncio
+async def test_pipe_attached_after_ours_closed_is_left_alone(tmux: _FakeTmux) -> None:
+    stream = PaneOutputStream(_Pane())
+    assert await stream.start()
+
+    # Our cat exited and the user piped the pane to a log file
+    stream.release_pipe()
+    tmux.piped = True
+    await stream.stop()
+
+    assert len(tmux.pipe_commands) == 1
+    assert tmux.piped
@@ -0,0 +1,62 @@
+# Copyright notice.
+
+from libs.core.poll_scheduler import AdaptivePollScheduler
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the adaptive monitor poll cadence."""
+
+
+def _scheduler() -> AdaptivePollScheduler:
+    return AdaptivePollScheduler(fast_interval=0.25, interval=1.0, max_interval=8.0, backoff=2.0)
+
+
+def test_idle_content_backs_off_up_to_the_ceiling() -> None:
+    scheduler = _scheduler()
+
+    intervals = [scheduler.observe("idle") for _ in range(6)]
+
+    assert intervals == [2.0, 4.0, 8.0, 8.0, 8.0, 8.0]
+    assert scheduler.idle_wakeups == 6
+    assert scheduler.active_wakeups == 0
+
+
+def test_content_change_drops_to_the_fast_interval() -> None:
+    scheduler = _scheduler()
+    for _ in range(5):
+        scheduler.observe("idle")
+
+    assert scheduler.observe("new output") == 0.25
+    # Backs off again from the fast interval once the pane settles
+    assert scheduler.observe("new output") == 0.5
+    assert scheduler.get_stats()["active_wakeups"] == 1
+
+
+def test_forming_prompt_and_sent_response_keep_polling_fast() -> None:
+    scheduler = _scheduler()
+    for _ in range(5):
+        scheduler.observe("idle")
+
+    assert scheduler.observe("idle", prompt_active=True) == 0.25
+    assert scheduler.observe("idle") == 0.5
+
+    scheduler.note_response()
+    assert scheduler.observe("idle") == 0.25
+    assert scheduler.observe("idle") == 0.5
+
+    stats = scheduler.get_stats()
+    assert stats["wakeups"] == 9
+    assert stats["active_wakeups"] == 2
+    assert stats["current_interval"] == 0.5
+
+
+def test_unanswered_prompt_backs_off_once_the_content_settles() -> None:
+    scheduler = _scheduler()
+    scheduler.observe("working")
+
+    assert scheduler.observe("Continue? (y/n)", prompt_active=True) == 0.25
+    intervals = [scheduler.observe("Continue? (y/n)", prompt_active=True) for _ in range(5)]
+
+    assert intervals == [0.5, 1.0, 2.0, 4.0, 8.0]
+    # A prompt still forming keeps polling fast through its content changes
+    assert scheduler.observe("Continue? (y/n) [default", prompt_active=True) == 0.25
@@ -0,0 +1,84 @@
+# Copyright notice.
+
+import subprocess
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from libs.core.models import TaskPhase
+from libs.core.process_sampler import ChildProcess, ProcessSampler, ProcessStats
+from libs.core.progress_tracker import ProgressAnalyzer
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the batched pane process sampler."""
+
+
+@pytest.fixture
+def shell_with_child() -> Iterator[subprocess.Popen[bytes]]:
+    process = subprocess.Popen(["sh", "-c", "sleep 30; true"])
+    # Give the shell time to fork its child
+    deadline = time.monotonic() + 5
+    sampler = ProcessSampler()
+    while time.monotonic() < deadline and not sampler.sample([process.pid]).get(process.pid, ProcessStats(pid=0)).descendants:
+        time.sleep(0.05)
+    yield process
+    process.kill()
+    process.wait()
+
+
+class TestProcessSampler:
+    def test_tree_is_aggregated_under_root(self, shell_with_child: subprocess.Popen[bytes]) -> None:
+        sampler = ProcessSampler()
+
+        stats = sampler.sample([shell_with_child.pid, None])[shell_with_child.pid]
+
+        assert stats.process_count == 2
+        assert stats.has_process("sleep")
+        assert stats.foreground_cmdline == ("sleep", "30")
+        assert stats.memory_mb > 0
+
+    def test_process_objects_are_reused_across_samples(self, shell_with_child: subprocess.Popen[bytes]) -> None:
+        sampler = ProcessSampler()
+
+        first = sampler.sample([shell_with_child.pid])[shell_with_child.pid]
+        tracked = dict(sampler._tracked)
+        sampler.sample([shell_with_child.pid])
+
+        # The first sample only primes the CPU counters
+        assert first.cpu_percent == 0.0
+        assert all(sampler._tracked[pid] is tracked[pid] for pid in tracked)
+        assert all(entry.samples == 2 for entry in sampler._tracked.values())
+
+    def test_missing_pids_are_omitted(self) -> None:
+        sampler = ProcessSampler()
+        process = subprocess.Popen(["true"])
+        process.wait()
+
+        assert sampler.sample([process.pid]) == {}
+        assert sampler.get_stats()["tracked_processes"] == 0
+
+
+class TestProgressFromProcesses:
+    def test_new_child_processes_count_as_commands(self) -> None:
+        analyzer = ProgressAnalyzer()
+        stats = ProcessStats(
+            pid=100,
+            descendants=(
+                ChildProcess(pid=101, create_time=1.0, name="claude"),
+                ChildProcess(pid=102, create_time=2.0, name="bash", cmdline=("bash", "-c", "pytest -q")),
+                ChildProcess(pid=103, create_time=3.0, name="pytest", cmdline=("python", "-m", "pytest", "-q")),
+            ),
+        )
+
+        progress = analyzer.analyze_process_activity("proj", [stats])
+        assert progress is not None
+        task = progress.get_current_task()
+        assert task is not None
+        assert task.commands_executed == 1
+        assert task.phase == TaskPhase.TESTING
+
+        # Processes already seen are not counted again
+        analyzer.analyze_process_activity("proj", [stats])
+        assert task.commands_executed == 1
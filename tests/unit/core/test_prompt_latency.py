@@ -0,0 +1,48 @@
+# Copyright notice.
+
+import asyncio
+import time
+
+from libs.core.claude_monitor_async import AsyncClaudeMonitor
+from libs.core.prompt_detector import PromptInfo, PromptType
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for prompt-to-keystroke latency tracking."""
+
+
+def test_latency_runs_from_first_prompt_frame_to_send_keys(async_monitor: AsyncClaudeMonitor) -> None:
+    prompt = PromptInfo(type=PromptType.BINARY_CHOICE, question="Continue?", options=[("y", "Yes"), ("n", "No")], context="", confidence=0.9, metadata={})
+    async_monitor.prompt_detector.detect_prompt.return_value = prompt
+
+    async def run() -> None:
+        # The prompt is on screen for two frames before auto-responding is enabled
+        async_monitor._frame_captured_at = time.monotonic()
+        await async_monitor._process_content_async("Continue? (y/n)")
+        await asyncio.sleep(0.05)
+        async_monitor._frame_captured_at = time.monotonic()
+        await async_monitor._process_content_async("Continue? (y/n) ")
+        async_monitor.is_auto_next_enabled = True
+        await async_monitor._process_content_async("Continue? (y/n)  ")
+
+    asyncio.run(run())
+
+    stats = async_monitor.get_prompt_latency_stats()
+    async_monitor.process_controller.send_input.assert_called_once_with("y")
+    assert stats["all"]["count"] == 1
+    assert stats["all"]["windows"]["60s"]["p50_ms"] >= 50
+    assert list(stats["by_type"]) == ["binary_choice"]
+
+
+def test_prompt_that_leaves_the_screen_resets_the_measurement(async_monitor: AsyncClaudeMonitor) -> None:
+    prompt = PromptInfo(type=PromptType.BINARY_CHOICE, question="Continue?", options=[], context="", confidence=0.9, metadata={})
+    async_monitor.prompt_detector.detect_prompt.side_effect = [prompt, None]
+
+    async def run() -> None:
+        await async_monitor._process_content_async("Continue? (y/n)")
+        await async_monitor._process_content_async("answered by hand")
+
+    asyncio.run(run())
+
+    assert async_monitor._prompt_seen_at is None
+    assert async_monitor.get_prompt_latency_stats()["all"]["count"] == 0
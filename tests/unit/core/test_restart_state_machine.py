@@ -0,0 +1,176 @@
+# Copyright notice.
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from libs.core.claude_process_controller import ClaudeProcessController, RestartResult
+from libs.core.executors import shutdown_executors
+from libs.core.settings import settings
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the asynchronous Claude restart state machine."""
+
+
+class _FakeSessionManager:
+    """Pane where Claude exits after ``exit_after`` Ctrl+C presses and prints its banner on launch.
+
+    ``clear`` only empties the screen after ``clear_lag`` more captures, like a
+    shell that has not run it yet, and then pushes the old screen into the
+    scrollback (tmux ``scroll-on-clear`` without E3). If ``launches`` is False
+    the launch command fails and the shell prints ``banner``.
+    """
+
+    session_name = "restart"
+
+    def __init__(
+        self,
+        exit_after: int = 2,
+        ignores_interrupt: bool = False,
+        banner: str = "✻ Welcome to Claude Code!",
+        clear_lag: int = 0,
+        launches: bool = True,
+    ) -> None:
+        self.exit_after = exit_after
+        self.ignores_interrupt = ignores_interrupt
+        self.banner = banner
+        self.clear_lag = clear_lag
+        self.launches = launches
+        self.command = "claude"
+        # The old Claude screen, which matches the banner pattern
+        self.content = "✻ Welcome to Claude Code!\n> \n  ? for shortcuts"
+        self.history = ""
+        self.captures_until_clear: int | None = None
+        self.keys: list[str] = []
+
+    def get_claude_pane(self) -> object:
+        return self
+
+    def send_keys(self, keys: str) -> None:
+        self.keys.append(keys)
+        if keys == "C-c" and not self.ignores_interrupt and self.keys.count("C-c") >= self.exit_after:
+            self.command = "zsh"
+        elif keys == "C-d":
+            self.command = "zsh"
+        elif keys == "clear":
+            self.captures_until_clear = self.clear_lag
+        elif keys.startswith("claude"):
+            self.command = "claude" if self.launches else "zsh"
+            self.content = self.banner
+
+    def get_current_command(self) -> str:
+        return self.command
+
+    def capture_visible_content(self) -> str:
+        if self.captures_until_clear is not None:
+            if self.captures_until_clear <= 0:
+                self.history += self.content
+                self.content = ""
+                self.captures_until_clear = None
+            else:
+                self.captures_until_clear -= 1
+        return self.content
+
+    def capture_pane_content(self) -> str:
+        return self.history + self.capture_visible_content()
+
+    def clear_history(self) -> None:
+        self.keys.append("<clear-history>")
+        self.history = ""
+
+
+@pytest.fixture(autouse=True)
+def _fast_restart(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.monitoring, "restart_poll_interval", 0.01)
+    monkeypatch.setattr(settings.monitoring, "restart_exit_timeout", 0.2)
+    monkeypatch.setattr(settings.monitoring, "restart_startup_timeout", 0.2)
+
+
+def _restart(session_manager: _FakeSessionManager) -> RestartResult:
+    controller = ClaudeProcessController(session_manager, MagicMock())
+    try:
+        return asyncio.run(controller.restart_claude_pane_async())
+    finally:
+        shutdown_executors()
+
+
+def test_restart_moves_on_once_claude_exits() -> None:
+    session_manager = _FakeSessionManager()
+
+    started = time.perf_counter()
+    result = _restart(session_manager)
+
+    assert result.success
+    assert time.perf_counter() - started < 0.5
+    assert session_manager.keys == ["C-c", "C-c", "clear", "<clear-history>", "claude"]
+    assert list(result.phases) == ["interrupt", "exit", "clear", "launch", "confirm"]
+    assert result.duration >= sum(result.phases.values())
+
+
+def test_restart_falls_back_to_ctrl_d() -> None:
+    session_manager = _FakeSessionManager(ignores_interrupt=True)
+
+    result = _restart(session_manager)
+
+    assert result.success
+    assert "C-d" in session_manager.keys
+
+
+def test_restart_fails_when_claude_will_not_exit() -> None:
+    session_manager = _FakeSessionManager(ignores_interrupt=True)
+    session_manager.send_keys = session_manager.keys.append  # type: ignore[method-assign]
+
+    result = _restart(session_manager)
+
+    assert not result.success
+    assert result.failed_phase == "exit"
+    assert "claude" not in session_manager.keys
+
+
+def test_restart_fails_without_banner() -> None:
+    result = _restart(_FakeSessionManager(banner="zsh: command not found: claude"))
+
+    assert not result.success
+    assert result.failed_phase == "confirm"
+    assert result.phases["confirm"] >= 0.2
+
+
+def test_restart_launches_only_after_the_old_banner_is_cleared() -> None:
+    session_manager = _FakeSessionManager(clear_lag=3)
+
+    result = _restart(session_manager)
+
+    assert result.success
+    assert session_manager.keys == ["C-c", "C-c", "clear", "<clear-history>", "claude"]
+
+
+def test_banner_pushed_into_scrollback_by_clear_does_not_block_restart() -> None:
+    session_manager = _FakeSessionManager(clear_lag=1)
+    session_manager.clear_history = lambda: None  # type: ignore[method-assign]
+
+    result = _restart(session_manager)
+
+    # The old banner is still in the scrollback, but only the screen counts
+    assert "? for shortcuts" in session_manager.history
+    assert result.success
+
+
+def test_restart_fails_when_the_old_banner_stays_after_clear() -> None:
+    session_manager = _FakeSessionManager(clear_lag=1000)
+
+    result = _restart(session_manager)
+
+    assert not result.success
+    assert result.failed_phase == "clear"
+    assert "claude" not in session_manager.keys
+
+
+def test_failed_launch_is_not_confirmed_by_the_old_banner() -> None:
+    # The old screen is still up when the launch fails
+    result = _restart(_FakeSessionManager(clear_lag=2, launches=False, banner="✻ Welcome to Claude Code!\nzsh: command not found: claude"))
+
+    assert not result.success
+    assert result.failed_phase == "confirm"
@@ -0,0 +1,158 @@
+# Copyright notice.
+
+import copy
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import libtmux
+import pytest
+from tmuxp.workspace.builder import WorkspaceBuilder
+from tmuxp.workspace.loader import expand
+
+from libs.core.session_setup import SETUP_PHASES, SessionSetupService
+from libs.tmux_manager import TmuxManager, _RecordingWorkspaceBuilder
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for concurrent session setup."""
+
+
+class _FakeTmuxManager:
+    def __init__(self, sessions: list[str], fail: set[str] | None = None, delay: float = 0.05) -> None:
+        self.templates_path = Path()
+        self.sessions = sessions
+        self.fail = fail or set()
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def load_projects(self) -> dict[str, Any]:
+        return {"sessions": {name: {"override": {"session_name": name}} for name in self.sessions}}
+
+    def create_session_from_config(self, config_dict: dict[str, Any], timings: dict[str, float] | None = None) -> bool:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # Later sessions finish first to exercise output ordering
+            time.sleep(self.delay * (len(self.sessions) - self.sessions.index(config_dict["session_name"])))
+            if config_dict["session_name"] in self.fail:
+                msg = "build exploded"
+                raise RuntimeError(msg)
+            if timings is not None:
+                timings["tmux_build"] = 0.01
+                timings["startup_commands"] = 0.02
+            return True
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestConcurrentSetup:
+    def test_sessions_build_concurrently_with_ordered_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        manager = _FakeTmuxManager(["alpha", "beta", "gamma", "delta"])
+        service = SessionSetupService(manager)
+
+        assert service.setup_sessions(workers=4) == (4, 0)
+
+        output = capsys.readouterr().out
+        created = [output.index(f"Successfully created session: {name}") for name in manager.sessions]
+        assert created == sorted(created)
+        assert manager.max_active > 1
+
+    def test_failures_are_isolated(self) -> None:
+        manager = _FakeTmuxManager(["alpha", "beta", "gamma"], fail={"beta"})
+        service = SessionSetupService(manager)
+
+        assert service.setup_sessions(workers=3) == (2, 1)
+        assert not service.last_report["sessions"]["beta"]["success"]
+        assert service.last_report["sessions"]["gamma"]["success"]
+
+    def test_report_breaks_time_down_by_phase(self) -> None:
+        manager = _FakeTmuxManager(["alpha", "beta"], delay=0)
+        service = SessionSetupService(manager)
+
+        service.setup_sessions(workers=1)
+
+        report = service.last_report
+        assert report["workers"] == 1
+        assert set(SETUP_PHASES) <= set(report["phases"])
+        assert report["phases"]["startup_commands"] == pytest.approx(0.04)
+        assert report["sessions"]["alpha"]["duration"] > 0
+
+
+class TestStartupCommands:
+    def test_startup_commands_are_sent_after_build(self) -> None:
+        config = {
+            "windows": [
+                {
+                    "window_name": "main",
+                    "panes": [
+                        {"shell_command": [{"cmd": "cd src"}, {"cmd": "claude", "enter": False}]},
+                        {"shell_command": []},
+                    ],
+                },
+            ],
+        }
+        deferred = TmuxManager._defer_startup_commands(config)
+        window_config = config["windows"][0]
+        first, second = window_config["panes"]
+
+        assert first["shell_command"] == []
+
+        pane = MagicMock()
+        TmuxManager._send_startup_commands([(pane, first, window_config), (MagicMock(), second, window_config)], deferred)
+
+        assert [call.args[0] for call in pane.send_keys.call_args_list] == ["cd src", "claude"]
+        assert pane.send_keys.call_args_list[1].kwargs["enter"] is False
+
+    @pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux is not installed")
+    def test_deferred_commands_match_what_the_builder_sends(self, tmp_path: Path) -> None:
+        config = expand(
+            {
+                "session_name": "startup-contract",
+                "windows": [
+                    {
+                        "window_name": "main",
+                        "panes": [
+                            {"shell_command": ["cd src", {"cmd": "claude", "enter": False}]},
+                            {"shell_command": ["git status"], "suppress_history": True, "enter": False},
+                        ],
+                    },
+                    {"window_name": "logs", "suppress_history": False, "panes": [{"shell_command": ["tail -f log"]}]},
+                ],
+            },
+            cwd=tmp_path,
+        )
+        server = libtmux.Server(socket_name=f"yesman-test-{os.getpid()}")
+
+        def sent_keys(build: Any) -> list[tuple[Any, ...]]:
+            sent: list[tuple[Any, ...]] = []
+
+            def send_keys(pane: libtmux.Pane, cmd: str, **kwargs: Any) -> None:
+                sent.append((pane.window.window_name, pane.pane_index, cmd, kwargs.get("suppress_history"), kwargs.get("enter")))
+
+            with patch.object(libtmux.Pane, "send_keys", send_keys):
+                build(copy.deepcopy(config))
+            server.kill_session("startup-contract")
+            return sent
+
+        def deferred_build(session_config: dict[str, Any]) -> None:
+            deferred = TmuxManager._defer_startup_commands(session_config)
+            builder = _RecordingWorkspaceBuilder(session_config, server=server)
+            builder.build()
+            TmuxManager._send_startup_commands(builder.created_panes, deferred)
+
+        try:
+            expected = sent_keys(lambda session_config: WorkspaceBuilder(session_config, server=server).build())
+            assert sent_keys(deferred_build) == expected
+        finally:
+            server.kill()
+
+        assert [entry[2] for entry in expected] == ["cd src", "claude", "git status", "tail -f log"]
@@ -0,0 +1,101 @@
+# Copyright notice.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from libs.core.session_teardown import SessionTeardownService
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for concurrent session teardown."""
+
+
+class _FakeKiller:
+    def __init__(self, delay: float = 0.05, fail: set[str] | None = None, hang: set[str] | None = None) -> None:
+        self.delay = delay
+        self.fail = fail or set()
+        self.hang = hang or set()
+        self.release = threading.Event()
+        self.killed: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, session_name: str) -> None:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if session_name in self.hang:
+                self.release.wait(5)
+            time.sleep(self.delay)
+            if session_name in self.fail:
+                msg = f"can't find session: {session_name}"
+                raise RuntimeError(msg)
+            with self._lock:
+                self.killed.append(session_name)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_sessions_are_torn_down_concurrently_within_the_worker_bound() -> None:
+    killer = _FakeKiller(delay=0.1)
+    service = SessionTeardownService(kill_session=killer, max_workers=3, deadline=5)
+    names = [f"s{i}" for i in range(6)]
+
+    started = time.monotonic()
+    results = service.teardown_sessions(names)
+    elapsed = time.monotonic() - started
+
+    assert [result.session_name for result in results] == names
+    assert all(result.success for result in results)
+    assert sorted(killer.killed) == names
+    assert killer.max_active == 3
+    assert elapsed < 0.5
+
+
+def test_failures_are_isolated_per_session() -> None:
+    killer = _FakeKiller(fail={"b"})
+    results = SessionTeardownService(kill_session=killer, max_workers=4, deadline=5).teardown_sessions(["a", "b", "c"])
+
+    by_name = {result.session_name: result for result in results}
+    assert by_name["a"].success
+    assert by_name["c"].success
+    assert not by_name["b"].success
+    assert "can't find session" in by_name["b"].error
+
+
+def test_sessions_past_the_deadline_are_reported_as_timed_out() -> None:
+    killer = _FakeKiller(delay=0.01, hang={"slow"})
+    service = SessionTeardownService(kill_session=killer, max_workers=2, deadline=0.3)
+
+    started = time.monotonic()
+    results = service.teardown_sessions(["fast", "slow"])
+    elapsed = time.monotonic() - started
+    killer.release.set()
+
+    assert elapsed < 1.0
+    fast, slow = results
+    assert fast.success
+    assert not fast.timed_out
+    assert slow.timed_out
+    assert not slow.success
+    assert "did not finish" in slow.error
+
+
+def test_controllers_are_stopped_before_their_session_is_killed() -> None:
+    calls: list[str] = []
+    manager = MagicMock()
+    manager.controllers = {"with-controller": object()}
+    manager.remove_controller.side_effect = lambda name: calls.append(f"stop:{name}")
+
+    def kill(name: str) -> None:
+        calls.append(f"kill:{name}")
+
+    results = SessionTeardownService(kill_session=kill, claude_manager=manager, max_workers=1, deadline=5).teardown_sessions(["with-controller", "plain"])
+
+    assert calls == ["stop:with-controller", "kill:with-controller", "kill:plain"]
+    assert results[0].controller_stopped
+    assert not results[1].controller_stopped
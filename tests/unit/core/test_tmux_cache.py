@@ -0,0 +1,78 @@
+# Copyright notice.
+
+from unittest.mock import patch
+
+from libs.core.tmux_cache import TmuxQueryCache
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the shared tmux query cache."""
+
+
+class TestTmuxQueryCache:
+    def test_hits_and_misses_are_counted(self) -> None:
+        cache = TmuxQueryCache(ttl=60)
+        calls = []
+
+        def compute() -> list[str]:
+            calls.append(1)
+            return ["main"]
+
+        assert cache.get_or_compute("session_list", compute) == ["main"]
+        assert cache.get_or_compute("session_list", compute) == ["main"]
+
+        stats = cache.get_stats()
+        assert len(calls) == 1
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = TmuxQueryCache(ttl=5)
+        with patch("libs.core.tmux_cache.time.monotonic", return_value=100.0):
+            cache.put("session_info:a", {"exists": True})
+        with patch("libs.core.tmux_cache.time.monotonic", return_value=106.0):
+            assert cache.get("session_info:a") is None
+
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_lru_eviction(self) -> None:
+        cache = TmuxQueryCache(ttl=60, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidation_discards_in_flight_results(self) -> None:
+        cache = TmuxQueryCache(ttl=60)
+
+        def compute_during_teardown() -> str:
+            # A teardown lands while this query is still running
+            cache.invalidate()
+            return "pre-teardown view"
+
+        assert cache.get_or_compute("session_list", compute_during_teardown) == "pre-teardown view"
+        assert cache.get("session_list") is None
+        assert cache.get_stats()["generation"] == 1
+
+    def test_prefix_invalidation_keeps_other_entries(self) -> None:
+        cache = TmuxQueryCache(ttl=60)
+        cache.put("tmux_snapshot:default", "snapshot")
+        cache.put("session_list", ["main"])
+
+        cache.invalidate("tmux_snapshot:")
+
+        assert cache.get("tmux_snapshot:default") is None
+        assert cache.get("session_list") == ["main"]
+
+    def test_cleanup_removes_expired_entries(self) -> None:
+        cache = TmuxQueryCache(ttl=60)
+        cache.put("short", 1, ttl=0)
+        cache.put("long", 2)
+
+        assert cache.cleanup_expired() == 1
+        assert cache.get_stats()["cache_size"] == 1
@@ -0,0 +1,193 @@
+# Copyright notice.
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from libs.core import tmux_control
+from libs.core.tmux_control import (
+    CONTROL_SESSION_NAME,
+    ControlModeResult,
+    TmuxControlClient,
+    _PendingReply,
+    quote_argument,
+    run_pane_command,
+    run_pane_commands,
+    send_pane_keys,
+)
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the tmux control-mode backend."""
+
+
+class _FakeProcess:
+    """Minimal stand-in for a ``tmux -C`` subprocess."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self.stdout = iter(line + "\n" for line in lines)
+        self.stdin = Mock()
+
+    @staticmethod
+    def poll() -> None:
+        return None
+
+
+class TestQuoteArgument:
+    def test_safe_arguments_are_unquoted(self) -> None:
+        assert quote_argument("capture-pane") == "capture-pane"
+        assert quote_argument("%12") == "%12"
+        assert quote_argument("-50") == "-50"
+
+    def test_special_characters_are_single_quoted(self) -> None:
+        assert quote_argument("#{pane_pid}") == "'#{pane_pid}'"
+        assert quote_argument("$1") == "'$1'"
+        assert quote_argument("it's") == "'it'\\''s'"
+        assert quote_argument("") == "''"
+
+    def test_newlines_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="newlines"):
+            quote_argument("a\nb")
+
+
+class TestControlSession:
+    def test_client_attaches_to_its_own_session(self) -> None:
+        client = TmuxControlClient(socket_name="work")
+
+        with patch.object(tmux_control.subprocess, "Popen", side_effect=OSError) as popen:
+            assert not client.start()
+
+        # Attaching to a user session would mark it attached
+        assert popen.call_args.args[0] == ["tmux", "-L", "work", "-C", "new-session", "-A", "-s", CONTROL_SESSION_NAME, "cat"]
+
+    def test_only_the_control_session_is_private(self) -> None:
+        assert tmux_control.is_control_session(CONTROL_SESSION_NAME)
+        assert not tmux_control.is_control_session("main")
+
+
+class TestReplyDemultiplexing:
+    def test_replies_complete_pending_commands_in_order(self) -> None:
+        client = TmuxControlClient()
+        client._process = _FakeProcess([
+            "%begin 1 100 0",  # implicit new-session block
+            "%end 1 100 0",
+            "%session-changed $0 main",
+            "%begin 1 101 1",
+            "bash",
+            "%end 1 101 1",
+            "%begin 1 102 1",
+            "can't find pane: %99",
+            "%error 1 102 1",
+        ])
+        first, second = _PendingReply(), _PendingReply()
+        client._pending.extend([first, second])
+
+        client._read_loop()
+
+        assert first.result == ControlModeResult(stdout=["bash"], stderr=[], returncode=0)
+        assert second.result is not None
+        assert second.result.returncode == 1
+        assert second.result.stderr == ["can't find pane: %99"]
+
+    def test_end_marker_inside_output_does_not_close_block(self) -> None:
+        client = TmuxControlClient()
+        client._process = _FakeProcess([
+            "%begin 1 200 1",
+            "%end 9 999 1",
+            "%end 1 200 1",
+        ])
+        pending = _PendingReply()
+        client._pending.append(pending)
+
+        client._read_loop()
+
+        assert pending.result is not None
+        assert pending.result.stdout == ["%end 9 999 1"]
+
+    def test_connection_loss_releases_waiters(self) -> None:
+        client = TmuxControlClient()
+        client._process = _FakeProcess(["%begin 1 300 1"])
+        pending = _PendingReply()
+        client._pending.append(pending)
+
+        client._read_loop()
+
+        assert pending.done.is_set()
+        assert pending.result is None
+        assert not client.is_alive
+
+    def test_notifications_reach_listeners_outside_blocks(self) -> None:
+        client = TmuxControlClient()
+        client._process = _FakeProcess([
+            "%sessions-changed",
+            "%begin 1 400 1",
+            "%window-add @9",  # command output, not a notification
+            "%end 1 400 1",
+            "%window-add @3",
+        ])
+        client._pending.append(_PendingReply())
+        received: list[str] = []
+        client.add_notification_listener(received.append)
+        client.add_notification_listener(Mock(side_effect=RuntimeError("boom")))
+
+        client._read_loop()
+
+        assert received == ["%sessions-changed", "%window-add @3", "%exit"]
+
+
+class TestFallback:
+    def test_run_pane_command_falls_back_to_libtmux(self) -> None:
+        pane = Mock()
+        pane.cmd.return_value.stdout = ["claude"]
+
+        with patch.object(tmux_control, "get_control_client", return_value=None):
+            result = run_pane_command(pane, "display-message", "-p", "#{pane_current_command}")
+
+        pane.cmd.assert_called_once_with("display-message", "-p", "#{pane_current_command}")
+        assert result.stdout == ["claude"]
+
+    def test_run_pane_command_uses_control_client(self) -> None:
+        pane = Mock(pane_id="%3")
+        client = Mock()
+        client.cmd.return_value = ControlModeResult(stdout=["bash"])
+
+        with patch.object(tmux_control, "get_control_client", return_value=client):
+            result = run_pane_command(pane, "display-message", "-p", "#{pane_current_command}")
+
+        client.cmd.assert_called_once_with("display-message", "-t", "%3", "-p", "#{pane_current_command}")
+        pane.cmd.assert_not_called()
+        assert result.stdout == ["bash"]
+
+    def test_run_pane_commands_pipelines_through_control_client(self) -> None:
+        pane = Mock(pane_id="%3")
+        client = Mock()
+        client.cmd_many.return_value = [ControlModeResult(stdout=["0 0"]), ControlModeResult(stdout=["$ "])]
+
+        with patch.object(tmux_control, "get_control_client", return_value=client):
+            results = run_pane_commands(pane, [("display-message", "-p", "x"), ("capture-pane", "-p")])
+
+        client.cmd_many.assert_called_once_with([("display-message", "-t", "%3", "-p", "x"), ("capture-pane", "-t", "%3", "-p")])
+        pane.cmd.assert_not_called()
+        assert [result.stdout for result in results] == [["0 0"], ["$ "]]
+
+    def test_send_pane_keys_falls_back_on_control_error(self) -> None:
+        pane = Mock(pane_id="%3")
+        client = Mock()
+        client.cmd.side_effect = tmux_control.TmuxControlError("down")
+
+        with patch.object(tmux_control, "get_control_client", return_value=client):
+            send_pane_keys(pane, "C-c")
+
+        pane.send_keys.assert_called_once_with("C-c", enter=True)
+
+    def test_cmd_many_writes_batch_once(self) -> None:
+        client = TmuxControlClient()
+        client._process = _FakeProcess([])
+        client._process.stdin.write.side_effect = lambda data: [
+            client._complete_next(ControlModeResult(stdout=[str(i)])) for i in range(data.count("\n"))
+        ]
+
+        results = client.cmd_many([("display-message", "-p", "a"), ("display-message", "-p", "b")])
+
+        client._process.stdin.write.assert_called_once_with("display-message -p a\ndisplay-message -p b\n")
+        assert [result.stdout for result in results] == [["0"], ["1"]]
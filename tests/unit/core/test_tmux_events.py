@@ -0,0 +1,155 @@
+# Copyright notice.
+
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from libs.core import tmux_events
+from libs.core.async_event_bus import AsyncEventBus, Event, EventType
+from libs.core.executors import shutdown_executors
+from libs.core.tmux_control import CONTROL_SESSION_NAME
+from libs.core.tmux_events import TMUX_EVENT_TYPES, TmuxEventListener, parse_sessions
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the tmux control-mode notification to event bus bridge."""
+
+
+class _FakeControlClient:
+    """Stand-in for the shared ``tmux -C`` client."""
+
+    def __init__(self) -> None:
+        self.is_alive = True
+        self.listeners: list[Callable[[str], None]] = []
+
+    def add_notification_listener(self, listener: Callable[[str], None]) -> None:
+        self.listeners.append(listener)
+
+    def remove_notification_listener(self, listener: Callable[[str], None]) -> None:
+        self.listeners.remove(listener)
+
+    def notify(self, line: str) -> None:
+        for listener in list(self.listeners):
+            listener(line)
+
+
+class _FakeServer:
+    """Answers ``list-sessions`` from a mutable session table."""
+
+    def __init__(self, sessions: dict[str, str]) -> None:
+        self.sessions = sessions
+
+    def __call__(self, server: object, *args: str) -> SimpleNamespace:
+        assert args[0] == "list-sessions"
+        return SimpleNamespace(stdout=[f"{session_id}|{name}" for session_id, name in self.sessions.items()], stderr=[])
+
+
+async def _settle() -> None:
+    """Let call_soon_threadsafe callbacks, resyncs and publishes run."""
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+
+
+def test_parse_sessions_skips_malformed_lines() -> None:
+    assert parse_sessions(["$0|main", "$1|a|b", "garbage"]) == {"$0": "main", "$1": "a|b"}
+
+
+class TestTmuxEventListener:
+    @pytest.fixture(autouse=True)
+    def _executors(self):  # noqa: ANN202
+        yield
+        shutdown_executors()
+
+    @pytest.fixture
+    def client(self) -> _FakeControlClient:
+        return _FakeControlClient()
+
+    @pytest.fixture
+    def server(self) -> _FakeServer:
+        return _FakeServer({"$0": "main"})
+
+    @pytest.fixture
+    def patched(self, client: _FakeControlClient, server: _FakeServer):  # noqa: ANN201
+        with patch.object(tmux_events, "get_control_client", return_value=client), patch.object(tmux_events, "run_server_command", server):
+            yield
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched")
+    async def test_sessions_changed_is_diffed_into_created_and_destroyed(self, client: _FakeControlClient, server: _FakeServer) -> None:
+        bus = AsyncEventBus()
+        await bus.start()
+        received: list[Event] = []
+
+        async def handler(event: Event) -> None:  # noqa: RUF029
+            received.append(event)
+
+        for event_type in TMUX_EVENT_TYPES:
+            bus.subscribe(event_type, handler)
+
+        listener = TmuxEventListener(event_bus=bus)
+        assert await listener.start()
+        assert listener.is_active
+
+        # The control client's own session is not a user session
+        server.sessions = {"$1": "proj", "$2": CONTROL_SESSION_NAME}
+        client.notify("%sessions-changed")
+        await _settle()
+        await listener.stop()
+        await bus.stop(timeout=1)
+
+        assert {(event.type, event.data["session_name"]) for event in received} == {
+            (EventType.SESSION_CREATED, "proj"),
+            (EventType.SESSION_DESTROYED, "main"),
+        }
+        assert listener.get_stats()["events_published"] == 2
+        assert client.listeners == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched")
+    async def test_window_and_rename_notifications(self, client: _FakeControlClient) -> None:
+        listener = TmuxEventListener()
+        emitted: list = []
+        assert await listener.start()
+
+        with patch.object(listener, "_emit", emitted.append):
+            client.notify("%session-renamed $0 new name")
+            client.notify("%unlinked-window-close @4")
+            client.notify("%window-add @2")
+            client.notify("%window-renamed @2 sleep")
+            client.notify("%layout-change @2 b25d,80x24,0,0,0 b25d,80x24,0,0,0 *")
+            client.notify("%output %1 hello")
+            await _settle()
+
+        assert [(e.event_type, e.session_name, e.window_id) for e in emitted] == [
+            (EventType.SESSION_RENAMED, "new name", ""),
+            (EventType.WINDOW_CHANGED, "", "@4"),
+            (EventType.WINDOW_CHANGED, "", "@2"),
+        ]
+        assert listener.get_stats()["ignored_notifications"] == 3
+        await listener.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched")
+    async def test_exit_marks_listener_inactive_and_restart_reattaches(self, client: _FakeControlClient) -> None:
+        listener = TmuxEventListener()
+        assert await listener.start()
+
+        client.is_alive = False
+        client.notify("%exit")
+        await _settle()
+        assert not listener.is_active
+
+        client.is_alive = True
+        assert await listener.start()
+        assert len(client.listeners) == 1
+        await listener.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_fails_without_control_mode(self) -> None:
+        with patch.object(tmux_events, "get_control_client", return_value=None):
+            listener = TmuxEventListener()
+            assert not await listener.start()
+        assert not listener.is_active
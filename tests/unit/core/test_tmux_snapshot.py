@@ -0,0 +1,109 @@
+# Copyright notice.
+
+from unittest.mock import Mock, patch
+
+from libs.core import tmux_snapshot
+from libs.core.tmux_control import CONTROL_SESSION_NAME, ControlModeResult
+from libs.core.tmux_snapshot import (
+    FIELD_SEPARATOR,
+    TmuxSnapshot,
+    capture_panes,
+    get_fleet_snapshot,
+    invalidate_fleet_snapshot,
+    parse_snapshot,
+)
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the one-shot tmux fleet snapshot."""
+
+
+def _row(session: str, window: str, pane_id: str, command: str = "bash", pid: str = "100") -> str:
+    return FIELD_SEPARATOR.join([session, window, "main", "0", pane_id, pid, command, "0", "1", "1700000000", "10", "5", "24"])
+
+
+class TestParseSnapshot:
+    def test_rows_are_parsed_and_grouped(self) -> None:
+        snapshot = parse_snapshot([
+            _row("proj", "0", "%1", "claude"),
+            _row("proj", "1", "%2"),
+            _row("proj", "1", "%3"),
+            _row("other", "0", "%4", pid=""),
+        ])
+
+        assert snapshot.session_names == {"proj", "other"}
+        assert list(snapshot.session_windows("proj")) == ["0", "1"]
+        assert [pane.pane_id for pane in snapshot.session_windows("proj")["1"]] == ["%2", "%3"]
+
+        pane = snapshot.get_pane("%1")
+        assert pane is not None
+        assert pane.command == "claude"
+        assert pane.pid == 100
+        assert pane.activity == 1700000000
+        assert pane.history_size == 10
+        assert pane.cursor_y == 5
+        assert not pane.dead
+        assert snapshot.get_pane("%4").pid is None
+
+    def test_malformed_lines_are_skipped(self) -> None:
+        snapshot = parse_snapshot(["no server running on /tmp/tmux-0/default", _row("proj", "0", "%1")])
+
+        assert [pane.pane_id for pane in snapshot.panes] == ["%1"]
+        assert not snapshot.has_session("missing")
+
+    def test_control_session_is_not_part_of_the_fleet(self) -> None:
+        snapshot = parse_snapshot([_row(CONTROL_SESSION_NAME, "0", "%0", "cat"), _row("proj", "0", "%1")])
+
+        assert snapshot.session_names == {"proj"}
+
+
+class TestCapturePanes:
+    def test_control_mode_pipelines_one_batch(self) -> None:
+        client = Mock()
+        client.cmd_many.return_value = [
+            ControlModeResult(stdout=["one", ""]),
+            ControlModeResult(stderr=["can't find pane: %9"], returncode=1),
+        ]
+
+        with patch.object(tmux_snapshot, "get_control_client", return_value=client):
+            captured = capture_panes(None, ["%1", "%9"], start=-20)
+
+        client.cmd_many.assert_called_once_with([
+            ("capture-pane", "-p", "-t", "%1", "-S", "-20"),
+            ("capture-pane", "-p", "-t", "%9", "-S", "-20"),
+        ])
+        assert captured == {"%1": ["one"]}
+
+    def test_fallback_chains_commands_in_one_invocation(self) -> None:
+        server = Mock()
+        server.cmd.return_value.stdout = [
+            "__yesman_capture__ %1",
+            "first",
+            "",
+            "__yesman_capture__ %2",
+            "second",
+        ]
+
+        with patch.object(tmux_snapshot, "get_control_client", return_value=None):
+            captured = capture_panes(server, ["%1", "%2"])
+
+        server.cmd.assert_called_once()
+        args = server.cmd.call_args.args
+        assert args.count(";") == 3
+        assert captured == {"%1": ["first"], "%2": ["second"]}
+
+
+class TestSharedSnapshot:
+    def teardown_method(self) -> None:
+        invalidate_fleet_snapshot()
+
+    def test_snapshot_is_reused_within_ttl(self) -> None:
+        with patch.object(tmux_snapshot, "take_snapshot", side_effect=lambda server: TmuxSnapshot()) as take:
+            first = get_fleet_snapshot(None, max_age=60)
+            second = get_fleet_snapshot(None, max_age=60)
+            invalidate_fleet_snapshot()
+            third = get_fleet_snapshot(None, max_age=60)
+
+        assert first is second
+        assert third is not first
+        assert take.call_count == 2
@@ -0,0 +1,22 @@
+# Copyright notice.
+
+from unittest.mock import MagicMock, patch
+
+from libs.core.settings import settings
+from libs.dashboard.tui_dashboard import LatencyView
+
+# Copyright (c) 2024 Yesman Claude Project
+# Licensed under the MIT License
+"""Tests for the TUI latency view, which reads monitor latency from the API."""
+
+
+def test_latency_is_fetched_from_the_api() -> None:
+    response = MagicMock()
+    response.json.return_value = {"sessions": {"alpha": {"all": {}, "by_type": {}}}}
+
+    with patch("libs.dashboard.tui_dashboard.requests.get", return_value=response) as get:
+        sessions = LatencyView.fetch_latency()
+
+    assert sessions == {"alpha": {"all": {}, "by_type": {}}}
+    get.assert_called_once_with(f"http://{settings.api.host}:{settings.api.port}/api/controllers/prompt-latency", timeout=LatencyView.REQUEST_TIMEOUT)
+    response.raise_for_status.assert_called_once()